@@ -0,0 +1,252 @@
+# dashboard/case_catalog.py
+"""
+Persistent case catalog.
+
+An SQLite database (``case_catalog/catalog.sqlite3``) with one row per case:
+the serialized ``Case`` plus the columns listings filter and sort on
+(status, last update, file count, size, defendants, quality score).
+
+Each row carries a cheap signature of the case's sources (case folder,
+processing manifest and output folder stats), so ``DataManager`` can start
+from the catalog and rebuild only cases whose signature changed instead of
+walking every case folder and parsing every manifest.
+
+Listings use keyset (cursor) pagination on ``(sort column, case_id)``, so
+page N costs the same as page 1 however many cases accumulate.
+"""
+
+import os
+import json
+import base64
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .models import Case, CaseStatus
+
+logger = logging.getLogger(__name__)
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'case_catalog', 'catalog.sqlite3')
+
+SCHEMA_VERSION = 1
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Public sort key -> column
+SORT_KEYS = {
+    'last_updated': 'last_updated',
+    'name': 'name_sort',
+    'status': 'status',
+    'file_count': 'file_count',
+    'size': 'size_bytes',
+    'quality_score': 'quality_score',
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS cases (
+    case_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_sort TEXT NOT NULL,
+    status TEXT NOT NULL,
+    last_updated TEXT NOT NULL,
+    file_count INTEGER NOT NULL DEFAULT 0,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    defendants TEXT NOT NULL DEFAULT '[]',
+    quality_score REAL,
+    signature TEXT,
+    case_json TEXT NOT NULL,
+    cataloged_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cases_status ON cases (status);
+CREATE INDEX IF NOT EXISTS cases_last_updated ON cases (last_updated, case_id);
+CREATE INDEX IF NOT EXISTS cases_name ON cases (name_sort, case_id);
+"""
+
+DOCUMENT_EXTENSIONS = ('.pdf', '.docx', '.txt')
+
+
+def document_count(case: Case) -> int:
+    """Files the grid counts as documents"""
+    return len([f for f in case.files
+                if f.name.endswith(DOCUMENT_EXTENSIONS) and not f.name.startswith('.')])
+
+
+def encode_cursor(values: List[Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    if not isinstance(values, list) or len(values) != 4:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+class CaseCatalog:
+    """SQLite-backed catalog of cases for fast startup and paginated listings."""
+
+    def __init__(self, path: str = CATALOG_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(_SCHEMA)
+            row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None:
+                conn.execute("INSERT INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+                conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _execute(self, sql: str, params: Iterable = (), many: bool = False):
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                if many:
+                    conn.executemany(sql, params)
+                else:
+                    conn.execute(sql, tuple(params))
+
+    def _query(self, sql: str, params: Iterable = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._connection().execute(sql, tuple(params)).fetchall()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # -- writes -----------------------------------------------------------
+
+    @staticmethod
+    def _row(case: Case, signature: Optional[str], defendants: List[str],
+             quality_score: Optional[float]) -> Tuple:
+        return (
+            case.id,
+            case.name,
+            case.name.lower(),
+            case.status.value,
+            case.last_updated.isoformat(),
+            document_count(case),
+            sum(f.size_bytes for f in case.files),
+            json.dumps(defendants),
+            quality_score,
+            signature,
+            case.json(),
+            datetime.now().isoformat(),
+        )
+
+    def upsert_many(self, entries: Iterable[Tuple[Case, Optional[str], List[str], Optional[float]]]):
+        """Insert or replace ``(case, signature, defendants, quality_score)`` rows in one transaction"""
+        rows = [self._row(*entry) for entry in entries]
+        if rows:
+            self._execute('INSERT OR REPLACE INTO cases VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                          rows, many=True)
+
+    def upsert(self, case: Case, signature: Optional[str] = None,
+               defendants: Optional[List[str]] = None, quality_score: Optional[float] = None):
+        self.upsert_many([(case, signature, defendants or [], quality_score)])
+
+    def remove(self, case_ids: Iterable[str]):
+        self._execute('DELETE FROM cases WHERE case_id = ?', [(case_id,) for case_id in case_ids], many=True)
+
+    # -- reads ------------------------------------------------------------
+
+    def load(self, case_ids: Optional[List[str]] = None) -> Dict[str, Tuple[Case, Optional[str], List[str], Optional[float]]]:
+        """Cataloged cases (all, or just ``case_ids``) as ``case_id -> (case, signature, defendants, quality_score)``"""
+        sql = 'SELECT case_id, case_json, signature, defendants, quality_score FROM cases'
+        params = []
+        if case_ids is not None:
+            sql += f" WHERE case_id IN ({', '.join('?' for _ in case_ids)})"
+            params = list(case_ids)
+        entries = {}
+        for row in self._query(sql, params):
+            try:
+                case = Case.parse_raw(row['case_json'])
+            except Exception as e:
+                logger.warning(f"Dropping unreadable catalog entry {row['case_id']}: {e}")
+                continue
+            entries[row['case_id']] = (case, row['signature'], json.loads(row['defendants']),
+                                       row['quality_score'])
+        return entries
+
+    def list_page(self, statuses: Optional[List[CaseStatus]] = None, defendant: Optional[str] = None,
+                  sort: str = 'last_updated', order: str = 'desc', limit: int = DEFAULT_PAGE_SIZE,
+                  cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        One page of case rows.
+
+        Returns ``{'items': [...], 'next_cursor': str | None, 'total': int}``;
+        pass ``next_cursor`` back to get the following page. Rows with no
+        value for the sort column (e.g. unscored cases) sort last.
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {sort}")
+        if order not in ('asc', 'desc'):
+            raise ValueError(f"Unknown sort order: {order}")
+        column = SORT_KEYS[sort]
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+        clauses, params = [], []
+        if statuses:
+            clauses.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            params += [status.value for status in statuses]
+        if defendant:
+            clauses.append('LOWER(defendants) LIKE ?')
+            params.append(f'%{defendant.lower()}%')
+        filter_where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        total = self._query(f'SELECT COUNT(*) FROM cases {filter_where}', params)[0][0]
+
+        # NULLs sort last in both directions: (is_null, value, case_id)
+        null_key = f'({column} IS NULL)'
+        direction = 'DESC' if order == 'desc' else 'ASC'
+        comparison = '<' if order == 'desc' else '>'
+        if cursor:
+            cursor_sort, cursor_order, position, case_id = decode_cursor(cursor)
+            if (cursor_sort, cursor_order) != (sort, order):
+                raise ValueError("Cursor does not match the requested sort")
+            is_null, value = position
+            if is_null:
+                clauses.append(f'({null_key} AND case_id {comparison} ?)')
+                params.append(case_id)
+            else:
+                clauses.append(f'({null_key} OR {column} {comparison} ? OR ({column} = ? AND case_id {comparison} ?))')
+                params += [value, value, case_id]
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+
+        rows = self._query(
+            f'SELECT case_id, status, last_updated, file_count, size_bytes, defendants, quality_score, '
+            f'{column} AS sort_value, {null_key} AS sort_null FROM cases {where} '
+            f'ORDER BY {null_key} ASC, {column} {direction}, case_id {direction} LIMIT ?',
+            params + [limit + 1])
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor([sort, order, [bool(last['sort_null']), last['sort_value']],
+                                         last['case_id']])
+        items = [{
+            'case_id': row['case_id'],
+            'status': row['status'],
+            'last_updated': row['last_updated'],
+            'file_count': row['file_count'],
+            'size_bytes': row['size_bytes'],
+            'defendants': json.loads(row['defendants']),
+            'quality_score': row['quality_score']
+        } for row in rows]
+        return {'items': items, 'next_cursor': next_cursor, 'total': total}
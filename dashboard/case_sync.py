@@ -0,0 +1,21 @@
+# dashboard/case_sync.py
+"""
+Delta case sync for the dashboard.
+
+The engine lives in ``satori_common.case_sync`` so the standalone isync
+tool runs the same code; this module adds a ``CachedDrive`` that counts
+drive-tree cache lookups in the dashboard's metrics.
+"""
+
+from satori_common import case_sync
+from satori_common.case_sync import DEFAULT_TREE_TTL, RemoteDrive
+
+from .metrics import CACHE_REQUESTS
+
+
+class CachedDrive(case_sync.CachedDrive):
+    """``satori_common.case_sync.CachedDrive`` reporting to ``CACHE_REQUESTS``."""
+
+    def __init__(self, drive: RemoteDrive, ttl: float = DEFAULT_TREE_TTL):
+        super().__init__(drive, ttl,
+                         on_lookup=lambda result: CACHE_REQUESTS.inc(cache='drive_tree', result=result))
@@ -1,126 +1,313 @@
 import os
-import json
+import threading
 from datetime import datetime
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
+from .case_catalog import CaseCatalog
+from .dir_snapshot import DirSnapshot, EntryInfo, snapshot
+from .shared_state import EventBus
+from .manifest_store import manifest_store, MANIFEST_FILENAME
+from .metrics import SCAN_SECONDS, CASES_TOTAL
 from .models import Case, FileMetadata, CaseStatus, FileProcessingResult, FileProcessingStatus, CaseProgress
+from satori_schema import serialization
+
+DOCUMENT_TEXTS_FILENAME = 'document_texts.jsonl'  # written by Tiger's hydrated-json command
+
+# Event bus channel on which workers announce catalog changes to each other
+CASES_CHANNEL = 'cases'
+
+# Statuses that only exist while a background task runs; a cataloged case left
+# in one of these by a restart is rebuilt from its manifest
+TRANSIENT_STATUSES = (CaseStatus.PROCESSING, CaseStatus.GENERATING)
+
+
+def _stat_key(path: str) -> str:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return '-'
+    return f'{stat.st_mtime_ns}:{stat.st_size}'
+
+
+def _entry_key(entry: Optional[EntryInfo]) -> str:
+    """``_stat_key`` from a snapshot entry that was stat'ed during the listing"""
+    return f'{entry.mtime_ns}:{entry.size}' if entry is not None else '-'
+
 
 class DataManager:
-    def __init__(self, case_directory: str, output_directory: str):
+    def __init__(self, case_directory: str, output_directory: str, catalog: Optional[CaseCatalog] = None,
+                 event_bus: Optional[EventBus] = None):
         self.case_directory = case_directory
         self.output_directory = output_directory
+        self.catalog = catalog
+        self.event_bus = event_bus
         self.cases: List[Case] = []
+        self._signatures: Dict[str, Optional[str]] = {}
+        self._details: Dict[str, Tuple[List[str], Optional[float]]] = {}
+        self._listeners: List[Callable[[List[str]], None]] = []
+        self._lock = threading.RLock()
+        if catalog is not None:
+            self._load_catalog()
+            if event_bus is not None:
+                event_bus.subscribe(CASES_CHANNEL, self._on_cases_event)
         self.scan_cases()
 
-    def scan_cases(self):
-        """Scans the case directory and updates the list of cases."""
+    def _load_catalog(self):
+        """Start from the persisted catalog; scan_cases then rebuilds only what changed."""
+        try:
+            entries = self.catalog.load()
+        except Exception as e:
+            print(f"Could not load case catalog, rebuilding from folders: {e}")
+            return
+        for case_id, (case, signature, defendants, quality_score) in entries.items():
+            self.cases.append(case)
+            self._signatures[case_id] = None if case.status in TRANSIENT_STATUSES else signature
+            self._details[case_id] = (defendants, quality_score)
+        print(f"Loaded {len(self.cases)} cases from catalog.")
+
+    def _on_cases_event(self, message: dict):
+        """Another worker changed the catalog: pick up its version of those cases."""
+        if message.get('origin') == self.event_bus.worker_id:
+            return
+        payload = message.get('payload') or {}
+        self.reload_cases(payload.get('changed') or [], payload.get('removed') or [])
+
+    def reload_cases(self, case_ids: List[str], removed: List[str] = ()):
+        """Replace in-memory cases with their catalog entries."""
+        entries = self.catalog.load(case_ids) if case_ids else {}
+        with self._lock:
+            positions = {case.id: i for i, case in enumerate(self.cases)}
+            for case_id, (case, signature, defendants, quality_score) in entries.items():
+                if case_id in positions:
+                    self.cases[positions[case_id]] = case
+                else:
+                    self.cases.append(case)
+                self._signatures[case_id] = signature
+                self._details[case_id] = (defendants, quality_score)
+            if removed:
+                removed = set(removed)
+                self.cases = [case for case in self.cases if case.id not in removed]
+                for case_id in removed:
+                    self._signatures.pop(case_id, None)
+                    self._details.pop(case_id, None)
+        CASES_TOTAL.set(len(self.cases))
+        if entries or removed:
+            self._notify(list(entries) + list(removed))
+
+    def _signature(self, folder_path: str, folder_name: str, folder: Optional[EntryInfo] = None,
+                   outputs: Optional[DirSnapshot] = None) -> str:
+        """
+        Cheap change marker for a case: case folder, manifest and output folder stats.
+
+        A full scan passes the folder's entry and a snapshot of the output
+        directory, so only the manifest needs a stat of its own.
+        """
+        if outputs is not None:
+            output_key = _entry_key(outputs.get(folder_name))
+        else:
+            output_key = _stat_key(os.path.join(self.output_directory, folder_name))
+        return '|'.join((
+            _entry_key(folder) if folder is not None else _stat_key(folder_path),
+            _stat_key(os.path.join(folder_path, MANIFEST_FILENAME)),
+            output_key,
+        ))
+
+    def scan_cases(self, force: bool = False):
+        """
+        Scans the case directory and updates the list of cases.
+
+        Cases whose folder, manifest and output folder are unchanged since
+        the last scan (or since they were cataloged) are kept as they are;
+        ``force`` rebuilds every case from disk.
+        """
         print(f"Scanning directory: {self.case_directory}")
-        updated_cases = []
-        for folder_name in os.listdir(self.case_directory):
-            folder_path = os.path.join(self.case_directory, folder_name)
-            if os.path.isdir(folder_path):
-                case = self._create_case_from_folder(folder_path, folder_name)
+        with self._lock, SCAN_SECONDS.time():
+            known = {case.id: case for case in self.cases}
+            updated_cases = []
+            changed = []
+            signatures = {}
+            outputs = snapshot(self.output_directory, stat_files=False, stat_dirs=True)
+            # Hidden folders are upload staging areas, not cases
+            for entry in snapshot(self.case_directory, stat_files=False, stat_dirs=True).dirs(
+                    lambda name: not name.startswith('.')):
+                signature = self._signature(entry.path, entry.name, entry, outputs)
+                case = known.get(entry.name)
+                if force or case is None or self._signatures.get(entry.name) != signature:
+                    case = self._create_case_from_folder(entry.path, entry.name)
+                    changed.append(case)
                 updated_cases.append(case)
-        self.cases = updated_cases
-        print(f"Scan complete. Found {len(self.cases)} cases.")
+                signatures[entry.name] = signature
+            removed = set(known) - set(signatures)
+            self.cases = updated_cases
+            self._signatures = signatures
+            self._record_changes(changed, removed)
+        CASES_TOTAL.set(len(self.cases))
+        print(f"Scan complete. Found {len(self.cases)} cases ({len(changed)} rebuilt).")
+
+    def refresh_case(self, case_id: str):
+        """Rebuild one case from disk (or drop it if its folder is gone)."""
+        folder_path = os.path.join(self.case_directory, case_id)
+        with self._lock:
+            index = next((i for i, case in enumerate(self.cases) if case.id == case_id), None)
+            if not os.path.isdir(folder_path):
+                if index is not None:
+                    del self.cases[index]
+                    self._signatures.pop(case_id, None)
+                    self._record_changes([], [case_id])
+                return
+            signature = self._signature(folder_path, case_id)
+            case = self._create_case_from_folder(folder_path, case_id)
+            if index is None:
+                self.cases.append(case)
+            else:
+                self.cases[index] = case
+            self._signatures[case_id] = signature
+            self._record_changes([case], [])
+        CASES_TOTAL.set(len(self.cases))
+
+    def refresh_path(self, path: str):
+        """Bring the case owning a changed path up to date (file watcher hook)."""
+        case_id = None
+        for root in (self.case_directory, self.output_directory):
+            relative = os.path.relpath(os.path.abspath(path), os.path.abspath(root))
+            if not relative.startswith(os.pardir) and relative != os.curdir:
+                case_id = relative.split(os.sep)[0]
+                break
+        if case_id is None or case_id.startswith('.'):
+            self.scan_cases()
+        else:
+            self.refresh_case(case_id)
+
+    def _case_details(self, case: Case) -> Tuple[List[str], Optional[float]]:
+        """Defendant names and mean document quality score from a case's Tiger output."""
+        defendants = []
+        if case.hydrated_json_path:
+            try:
+                parties = serialization.load(case.hydrated_json_path).get('parties') or {}
+                defendants = [d.get('name') for d in parties.get('defendants') or [] if d.get('name')]
+            except (OSError, ValueError, AttributeError) as e:
+                print(f"Could not read defendants for {case.id}: {e}")
+
+        scores = []
+        texts_path = os.path.join(self.output_directory, case.id, DOCUMENT_TEXTS_FILENAME)
+        if os.path.exists(texts_path):
+            try:
+                with open(texts_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        score = serialization.loads(line).get('quality_score') if line.strip() else None
+                        if isinstance(score, (int, float)):
+                            scores.append(score)
+            except (OSError, ValueError) as e:
+                print(f"Could not read quality scores for {case.id}: {e}")
+        return defendants, (sum(scores) / len(scores) if scores else None)
+
+    def add_listener(self, callback: Callable[[List[str]], None]):
+        """Call ``callback(case_ids)`` whenever cases change, are added or removed."""
+        self._listeners.append(callback)
+
+    def _notify(self, case_ids: List[str]):
+        for callback in list(self._listeners):
+            try:
+                callback(case_ids)
+            except Exception as e:
+                print(f"Case change listener failed: {e}")
+
+    def _details_for(self, case: Case, refresh: bool) -> Tuple[List[str], Optional[float]]:
+        if refresh or case.id not in self._details:
+            self._details[case.id] = self._case_details(case)
+        return self._details[case.id]
+
+    def _record_changes(self, changed: List[Case], removed=(), refresh_details: bool = True):
+        """Tell listeners, the catalog and the other workers about changed or removed cases."""
+        if not (changed or removed):
+            return
+        self._notify([case.id for case in changed] + list(removed))
+        if self.catalog is None:
+            return
+        try:
+            self.catalog.upsert_many(
+                (case, self._signatures.get(case.id), *self._details_for(case, refresh_details))
+                for case in changed)
+            if removed:
+                self.catalog.remove(removed)
+        except Exception as e:
+            print(f"Error updating case catalog: {e}")
+            return
+        if self.event_bus is not None:
+            self.event_bus.publish(CASES_CHANNEL, {'changed': [case.id for case in changed],
+                                                   'removed': list(removed)})
 
     def _create_case_from_folder(self, folder_path: str, folder_name: str) -> Case:
         """Creates a Case object from a folder path with smart state recovery."""
         files = []
-        last_updated = datetime.fromtimestamp(os.path.getmtime(folder_path))
-        for item_name in os.listdir(folder_path):
-            item_path = os.path.join(folder_path, item_name)
-            if os.path.isfile(item_path):
-                if (item_name == 'processing_manifest.txt' or 
-                    item_name.startswith('.') or 
-                    item_name.lower().endswith('.ds_store')):
-                    continue
-                file_stat = os.stat(item_path)
-                file_last_modified = datetime.fromtimestamp(file_stat.st_mtime)
-                if file_last_modified > last_updated:
-                    last_updated = file_last_modified
-                files.append(FileMetadata(
-                    name=item_name,
-                    path=item_path,
-                    last_modified=file_last_modified,
-                    size_bytes=file_stat.st_size
-                ))
+        listing = snapshot(folder_path, stat_self=True)
+        last_updated = datetime.fromtimestamp(listing.mtime_ns / 1e9)
+        for item in listing.files():
+            if (item.name == 'processing_manifest.txt' or
+                item.name.startswith('.') or
+                item.name.lower().endswith('.ds_store')):
+                continue
+            file_last_modified = item.modified_at
+            if file_last_modified > last_updated:
+                last_updated = file_last_modified
+            files.append(FileMetadata(
+                name=item.name,
+                path=item.path,
+                last_modified=file_last_modified,
+                size_bytes=item.size
+            ))
         
         # Smart state recovery from manifest file
         progress = CaseProgress()
         status = CaseStatus.NEW
         hydrated_json_path = None
         file_processing_results = []
-        file_status_dict = {}  # Track latest status for each file
         
-        manifest_path = os.path.join(folder_path, 'processing_manifest.txt')
-        if os.path.exists(manifest_path):
-            try:
-                with open(manifest_path, 'r') as f:
-                    lines = f.readlines()
-                    
-                    # Read case status from first line only (O(1) efficiency)
-                    if lines:
-                        first_line = lines[0].strip()
-                        if first_line and first_line.startswith('CASE_STATUS|'):
-                            parts = first_line.split('|')
-                            if len(parts) >= 2:
-                                try:
-                                    status_str = parts[1].strip()
-                                    # Map manifest status values to enum values
-                                    status_map = {
-                                        'PENDING_REVIEW': CaseStatus.PENDING_REVIEW,
-                                        'COMPLETE': CaseStatus.COMPLETE,
-                                        'PROCESSING': CaseStatus.PROCESSING,
-                                        'ERROR': CaseStatus.ERROR,
-                                        'NEW': CaseStatus.NEW
-                                    }
-                                    status = status_map.get(status_str, CaseStatus.NEW)
-                                    if status_str not in status_map:
-                                        print(f"CRITICAL: Unknown status '{status_str}' in manifest. Defaulting to NEW.")
-                                except Exception as e:
-                                    print(f"CRITICAL: Failed to parse status '{parts[1]}': {e}. Defaulting to NEW.")
-                                    pass # Keep default status if invalid
-                    
-                    # Process file entries from lines 2+ only
-                    for line in lines[1:]:  # Skip first line (case status)
-                        parts = line.strip().split('|')
-                        if not parts or len(parts) < 2:
-                            continue
-                        
-                        # Process per-file status entries
-                        filename, file_status_str = parts[0], parts[1]
-                        status_map = {
-                            'success': FileProcessingStatus.SUCCESS,
-                            'error': FileProcessingStatus.ERROR,
-                            'processing': FileProcessingStatus.PROCESSING
-                        }
-                        file_status = status_map.get(file_status_str, FileProcessingStatus.PENDING)
-                        # Keep only the latest status for each file
-                        file_status_dict[filename] = FileProcessingResult(name=filename, status=file_status)
-                
-                # Convert file status dictionary to list with latest status only
-                file_processing_results = list(file_status_dict.values())
-                
-                # Update progress based on final status
-                if status == CaseStatus.PENDING_REVIEW:
-                    progress.classified = True
-                    progress.extracted = True
-                elif status == CaseStatus.COMPLETE:
-                    progress.classified = True
-                    progress.extracted = True
-                    progress.reviewed = True
-                    progress.generated = True
+        try:
+            manifest = manifest_store.read(folder_path)
+            
+            if manifest.case_status:
+                # Map manifest status values to enum values
+                status_map = {
+                    'PENDING_REVIEW': CaseStatus.PENDING_REVIEW,
+                    'COMPLETE': CaseStatus.COMPLETE,
+                    'PROCESSING': CaseStatus.PROCESSING,
+                    'ERROR': CaseStatus.ERROR,
+                    'NEW': CaseStatus.NEW
+                }
+                status = status_map.get(manifest.case_status, CaseStatus.NEW)
+                if manifest.case_status not in status_map:
+                    print(f"CRITICAL: Unknown status '{manifest.case_status}' in manifest. Defaulting to NEW.")
+            
+            # The index already holds only the latest status for each file
+            file_status_map = {
+                'success': FileProcessingStatus.SUCCESS,
+                'error': FileProcessingStatus.ERROR,
+                'processing': FileProcessingStatus.PROCESSING
+            }
+            file_processing_results = [
+                FileProcessingResult(name=entry.filename,
+                                     status=file_status_map.get(entry.status, FileProcessingStatus.PENDING))
+                for entry in manifest.files.values()
+            ]
+            
+            # Update progress based on final status
+            if status == CaseStatus.PENDING_REVIEW:
+                progress.classified = True
+                progress.extracted = True
+            elif status == CaseStatus.COMPLETE:
+                progress.classified = True
+                progress.extracted = True
+                progress.reviewed = True
+                progress.generated = True
 
-            except Exception as e:
-                print(f"Error parsing manifest for {folder_name}: {e}")
+        except Exception as e:
+            print(f"Error parsing manifest for {folder_name}: {e}")
 
         # Find hydrated JSON path regardless of status
-        case_output_dir = os.path.join(self.output_directory, folder_name)
-        if os.path.exists(case_output_dir):
-            for output_file in os.listdir(case_output_dir):
-                if output_file.endswith('.json') and 'hydrated' in output_file.lower():
-                    hydrated_json_path = os.path.join(case_output_dir, output_file)
-                    break
+        hydrated = snapshot(os.path.join(self.output_directory, folder_name), stat_files=False).files(
+            lambda name: name.endswith('.json') and 'hydrated' in name.lower())
+        if hydrated:
+            hydrated_json_path = hydrated[0].path
         
         return Case(
             id=folder_name,
@@ -136,6 +323,22 @@ class DataManager:
     def get_all_cases(self) -> List[Case]:
         return self.cases
 
+    def list_cases(self, statuses: Optional[List[CaseStatus]] = None, defendant: Optional[str] = None,
+                   sort: str = 'last_updated', order: str = 'desc', limit: int = 50,
+                   cursor: Optional[str] = None) -> dict:
+        """
+        One page of cases from the catalog, as ``{'cases', 'next_cursor', 'total'}``.
+
+        Raises ValueError for an unknown sort key or a bad cursor.
+        """
+        if self.catalog is None:
+            raise RuntimeError("Case listing requires a case catalog")
+        page = self.catalog.list_page(statuses=statuses, defendant=defendant, sort=sort,
+                                      order=order, limit=limit, cursor=cursor)
+        by_id = {case.id: case for case in self.cases}
+        cases = [by_id[item['case_id']] for item in page['items'] if item['case_id'] in by_id]
+        return {'cases': cases, 'items': page['items'], 'next_cursor': page['next_cursor'], 'total': page['total']}
+
     def get_case_by_id(self, case_id: str) -> Case | None:
         case_id = case_id.lower()
         for case in self.cases:
@@ -147,7 +350,9 @@ class DataManager:
         case = self.get_case_by_id(case_id)
         if case:
             case.status = status
-            # The manifest is the single source of truth. No need to write a separate status file.
+            # The manifest is the single source of truth. No need to write a separate status file;
+            # the catalog copy is only kept in step for listings and the next startup.
+            self._record_changes([case])
             print(f"Updated status for case '{case_id}' to '{status.value}' in memory.")
         else:
             print(f"Could not find case '{case_id}' to update status.")
@@ -160,6 +365,7 @@ class DataManager:
                 for file in case.files
                 if file.name.lower().endswith(('.pdf', '.docx', '.txt'))
             ]
+            self._record_changes([case], refresh_details=False)
     
     def update_file_processing_status(self, case_id: str, filename: str, status: FileProcessingStatus, 
                                      error_message: str = None, processing_time: float = None):
@@ -172,5 +378,6 @@ class DataManager:
                     result.error_message = error_message
                     result.processing_time_seconds = processing_time
                     print(f"Updated file '{filename}' status to '{status.value}' for case '{case_id}'")
+                    self._record_changes([case], refresh_details=False)
                     return
             print(f"File '{filename}' not found in processing results for case '{case_id}'")
\ No newline at end of file
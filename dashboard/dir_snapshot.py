@@ -0,0 +1,154 @@
+# dashboard/dir_snapshot.py
+"""
+Single-pass directory snapshots.
+
+``snapshot(path)`` lists a directory once with ``os.scandir`` and keeps each
+entry's type (from the directory listing itself, no syscall) and, for
+files, the result of one ``DirEntry.stat()``. Callers then filter, sort and
+read sizes/mtimes from the snapshot instead of following ``os.listdir``
+with ``isfile``/``isdir``/``stat``/``getmtime`` per entry — three or four
+round trips each, which is what hurts on network or FUSE-mounted case
+folders.
+
+Snapshots compare cheaply: ``diff`` matches entries by name and treats a
+changed ``(inode, size, mtime_ns)`` as a modification.
+"""
+
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class EntryInfo:
+    """One directory entry. Size and times are only filled in for stat'ed entries."""
+    name: str
+    path: str
+    is_dir: bool
+    is_file: bool
+    size: int = 0
+    mtime_ns: int = 0
+    ctime_ns: int = 0
+    inode: int = 0
+
+    @property
+    def key(self) -> Tuple[int, int, int]:
+        return (self.inode, self.size, self.mtime_ns)
+
+    @property
+    def mtime(self) -> float:
+        return self.mtime_ns / 1e9
+
+    @property
+    def modified_at(self) -> datetime:
+        return datetime.fromtimestamp(self.mtime)
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.ctime_ns / 1e9)
+
+
+@dataclass(frozen=True)
+class SnapshotDiff:
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+
+@dataclass(frozen=True)
+class DirSnapshot:
+    """Entries of one directory, by name. A missing directory gives an empty snapshot."""
+    path: str
+    entries: Dict[str, EntryInfo]
+    exists: bool = True
+    mtime_ns: int = 0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def __iter__(self) -> Iterator[EntryInfo]:
+        return iter(self.entries.values())
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, name: str) -> Optional[EntryInfo]:
+        return self.entries.get(name)
+
+    def files(self, predicate: Callable[[str], bool] = None) -> List[EntryInfo]:
+        """Regular files (optionally whose name matches ``predicate``), sorted by name"""
+        return sorted((e for e in self.entries.values()
+                       if e.is_file and (predicate is None or predicate(e.name))),
+                      key=lambda e: e.name)
+
+    def dirs(self, predicate: Callable[[str], bool] = None) -> List[EntryInfo]:
+        """Subdirectories (optionally whose name matches ``predicate``), sorted by name"""
+        return sorted((e for e in self.entries.values()
+                       if e.is_dir and (predicate is None or predicate(e.name))),
+                      key=lambda e: e.name)
+
+    def latest_dir(self) -> Optional[EntryInfo]:
+        """Subdirectory with the greatest name, e.g. the newest ``YYYY-MM-DD`` folder"""
+        dirs = self.dirs()
+        return dirs[-1] if dirs else None
+
+    def diff(self, newer: 'DirSnapshot') -> SnapshotDiff:
+        """What changed from this snapshot to ``newer``"""
+        old, new = self.entries, newer.entries
+        return SnapshotDiff(
+            added=sorted(name for name in new if name not in old),
+            removed=sorted(name for name in old if name not in new),
+            modified=sorted(name for name, entry in new.items()
+                            if name in old and old[name].key != entry.key),
+        )
+
+
+def _entry_info(entry: os.DirEntry, stat: bool) -> EntryInfo:
+    is_dir = entry.is_dir()
+    is_file = entry.is_file()
+    if not stat:
+        return EntryInfo(entry.name, entry.path, is_dir, is_file)
+    st = entry.stat()
+    return EntryInfo(entry.name, entry.path, is_dir, is_file,
+                     st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino)
+
+
+def snapshot(path: str, stat_files: bool = True, stat_dirs: bool = False,
+             stat_self: bool = False) -> DirSnapshot:
+    """
+    List ``path`` once.
+
+    Files are stat'ed by default, subdirectories only with ``stat_dirs``
+    (their type comes free from the listing). ``stat_self`` also records the
+    directory's own mtime. Symlinks are followed, as ``os.path.isfile`` did.
+    """
+    entries = {}
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns if stat_self else 0
+        with os.scandir(path) as iterator:
+            for entry in iterator:
+                try:
+                    is_dir = entry.is_dir()
+                    entries[entry.name] = _entry_info(entry, stat_dirs if is_dir else stat_files)
+                except OSError:
+                    continue  # vanished or unreadable between listing and stat
+    except (FileNotFoundError, NotADirectoryError):
+        return DirSnapshot(path, {}, exists=False)
+    return DirSnapshot(path, entries, mtime_ns=mtime_ns)
+
+
+def walk_files(path: str) -> Iterator[Tuple[str, EntryInfo]]:
+    """Every file below ``path`` as ``(path relative to it, entry)``, depth first"""
+    pending = ['']
+    while pending:
+        relative = pending.pop()
+        for entry in snapshot(os.path.join(path, relative) if relative else path, stat_files=False):
+            entry_relative = os.path.join(relative, entry.name) if relative else entry.name
+            if entry.is_dir:
+                pending.append(entry_relative)
+            elif entry.is_file:
+                yield entry_relative, entry
@@ -0,0 +1,324 @@
+# dashboard/edit_journal.py
+"""
+Append-only journal of attorney edits to a case's complaint.
+
+Each case gets ``complaint_edits.journal`` in its output folder. Records are
+
+    EDIT {"version": 3, "kind": "delta", "size": 412, ...}\\n
+    <size bytes of zlib-compressed payload>\\n
+
+A ``snapshot`` payload is the full document; a ``delta`` payload is the list
+of changed spans against the previous version, computed over HTML tag
+boundaries so single-line markup from the browser still diffs well. Version
+0 is the complaint as generated. A full snapshot is written every
+``SNAPSHOT_INTERVAL`` versions, and whenever the complaint on disk no longer
+matches the journal (Monkey regenerated it), so rebuilding any version only
+replays a bounded chain.
+
+Appends take an exclusive ``flock``; ``save_edit`` also replaces the
+complaint file under it and appends the edit only once the file is saved.
+Headers are indexed in memory and the index is advanced from the last byte
+offset read, so counting edits never re-reads payloads.
+"""
+
+import os
+import re
+import json
+import zlib
+import fcntl
+import difflib
+import hashlib
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+JOURNAL_FILENAME = 'complaint_edits.journal'
+LOCK_FILENAME = '.complaint_edits.lock'
+LEGACY_BACKUP_FILENAME = 'complaint_original.html'
+LEGACY_EDITS_FILENAME = 'atty_notes_edits.txt'
+
+RECORD_PREFIX = b'EDIT '
+SNAPSHOT_INTERVAL = 25
+
+_TOKEN_PATTERN = re.compile(r'(?<=>)|(?<=\n)')
+
+
+def _tokens(text: str) -> List[str]:
+    """Split after every tag close and newline; ''.join(tokens) == text."""
+    return [token for token in _TOKEN_PATTERN.split(text) if token]
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def compute_delta(previous: str, current: str) -> List[list]:
+    """Changed spans as ``[start, end, replacement_tokens]`` against ``previous``'s tokens."""
+    old_tokens, new_tokens = _tokens(previous), _tokens(current)
+    # Edits are usually local; only diff the span between the common prefix and suffix
+    prefix = 0
+    limit = min(len(old_tokens), len(new_tokens))
+    while prefix < limit and old_tokens[prefix] == new_tokens[prefix]:
+        prefix += 1
+    suffix = 0
+    while (suffix < limit - prefix and
+           old_tokens[len(old_tokens) - 1 - suffix] == new_tokens[len(new_tokens) - 1 - suffix]):
+        suffix += 1
+    old_middle = old_tokens[prefix:len(old_tokens) - suffix]
+    new_middle = new_tokens[prefix:len(new_tokens) - suffix]
+
+    matcher = difflib.SequenceMatcher(None, old_middle, new_middle)
+    return [[prefix + i1, prefix + i2, new_middle[j1:j2]]
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != 'equal']
+
+
+def apply_delta(previous: str, delta: List[list]) -> str:
+    tokens = _tokens(previous)
+    out, cursor = [], 0
+    for start, end, replacement in delta:
+        out.extend(tokens[cursor:start])
+        out.extend(replacement)
+        cursor = end
+    out.extend(tokens[cursor:])
+    return ''.join(out)
+
+
+def _replace_file(path: str, content: str):
+    """Write ``content`` to a temp file next to ``path`` and rename it into place."""
+    fd, temp_path = tempfile.mkstemp(prefix='.complaint_', suffix='.html', dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+@dataclass
+class JournalIndex:
+    """Parsed record headers plus the byte offset parsing stopped at."""
+    mtime_ns: int = 0
+    offset: int = 0
+    records: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def edit_count(self) -> int:
+        return sum(1 for record in self.records if record.get('edit')) + \
+            sum(record.get('legacy_edits', 0) for record in self.records)
+
+    @property
+    def latest(self) -> Optional[Dict[str, Any]]:
+        return self.records[-1] if self.records else None
+
+
+class EditJournalStore:
+    """Locked, append-only complaint edit journals with a cached header index."""
+
+    def __init__(self, snapshot_interval: int = SNAPSHOT_INTERVAL):
+        self.snapshot_interval = snapshot_interval
+        self._indexes: Dict[str, JournalIndex] = {}
+        self._index_lock = threading.Lock()
+        self._path_locks: Dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def journal_path(case_dir: str) -> str:
+        return os.path.join(case_dir, JOURNAL_FILENAME)
+
+    def _thread_lock(self, case_dir: str) -> threading.Lock:
+        with self._index_lock:
+            return self._path_locks.setdefault(os.path.abspath(case_dir), threading.Lock())
+
+    @contextmanager
+    def _locked(self, case_dir: str):
+        """Serialize writers across threads (in-process) and processes (flock)."""
+        with self._thread_lock(case_dir):
+            os.makedirs(case_dir, exist_ok=True)
+            lock_fd = os.open(os.path.join(case_dir, LOCK_FILENAME), os.O_CREAT | os.O_RDWR, 0o644)
+            try:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                fcntl.flock(lock_fd, fcntl.LOCK_UN)
+                os.close(lock_fd)
+
+    # --- Reading ---
+
+    def read(self, case_dir: str) -> JournalIndex:
+        """Return the header index, parsing only records appended since the last call."""
+        path = self.journal_path(case_dir)
+        key = os.path.abspath(case_dir)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            with self._index_lock:
+                self._indexes.pop(key, None)
+            return JournalIndex()
+
+        with self._index_lock:
+            cached = self._indexes.get(key)
+        if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.offset == stat.st_size:
+            return cached
+
+        index = cached if cached is not None and cached.offset <= stat.st_size else JournalIndex()
+        index = self._parse(path, index)
+        index.mtime_ns = stat.st_mtime_ns
+        with self._index_lock:
+            self._indexes[key] = index
+        return index
+
+    @staticmethod
+    def _parse(path: str, index: JournalIndex) -> JournalIndex:
+        records = list(index.records)
+        offset = index.offset
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            while True:
+                line = f.readline()
+                if not line.endswith(b'\n') or not line.startswith(RECORD_PREFIX):
+                    break  # end of file, or a torn append from a crashed writer
+                header = json.loads(line[len(RECORD_PREFIX):])
+                header['offset'] = f.tell()
+                f.seek(header['size'] + 1, os.SEEK_CUR)
+                if f.tell() > os.fstat(f.fileno()).st_size:
+                    break
+                records.append(header)
+                offset = f.tell()
+        return JournalIndex(offset=offset, records=records)
+
+    def edit_count(self, case_dir: str) -> int:
+        return self.read(case_dir).edit_count
+
+    def versions(self, case_dir: str) -> List[Dict[str, Any]]:
+        """Record headers (without payload offsets) in version order."""
+        return [{k: v for k, v in record.items() if k not in ('offset', 'size')}
+                for record in self.read(case_dir).records]
+
+    def _payload(self, case_dir: str, record: Dict[str, Any]):
+        with open(self.journal_path(case_dir), 'rb') as f:
+            f.seek(record['offset'])
+            return json.loads(zlib.decompress(f.read(record['size'])).decode('utf-8'))
+
+    def reconstruct(self, case_dir: str, version: int) -> str:
+        """Rebuild the complaint as it was at ``version``."""
+        records = self.read(case_dir).records
+        if not 0 <= version < len(records):
+            raise KeyError(f"No complaint version {version}")
+        start = version
+        while records[start]['kind'] != 'snapshot':
+            start -= 1
+        content = self._payload(case_dir, records[start])
+        for record in records[start + 1:version + 1]:
+            content = apply_delta(content, self._payload(case_dir, record))
+        if _sha256(content) != records[version]['sha256']:
+            raise ValueError(f"Complaint version {version} failed checksum verification")
+        return content
+
+    # --- Writing ---
+
+    def save_edit(self, case_dir: str, complaint_path: str, new_content: str,
+                  user_id: str, change_summary: str) -> Dict[str, Any]:
+        """
+        Replace the complaint at ``complaint_path`` with ``new_content`` and journal the edit.
+
+        The current complaint is read, replaced (temp file + ``os.replace``) and
+        journaled under the journal lock, and the edit record is appended only
+        once the new file is in place, so the journal never holds a version
+        that was not saved and concurrent saves cannot interleave.
+
+        Returns:
+            The header of the appended edit record, plus ``journal_created``
+        """
+        with self._locked(case_dir):
+            with open(complaint_path, 'r', encoding='utf-8') as f:
+                previous_content = f.read()
+            file_name = os.path.basename(complaint_path)
+            timestamp = datetime.now().isoformat()
+            journal_created = self._sync_base_locked(case_dir, previous_content, file_name, timestamp)
+            _replace_file(complaint_path, new_content)
+            header = self._append_edit_locked(case_dir, previous_content, new_content, {
+                'timestamp': timestamp, 'file': file_name, 'edit': True,
+                'user': user_id, 'summary': change_summary
+            })
+            header['journal_created'] = journal_created
+            return header
+
+    def _sync_base_locked(self, case_dir: str, current_content: str, file_name: str, timestamp: str) -> bool:
+        """
+        Make the journal's latest version match the complaint on disk.
+
+        Returns:
+            True when the journal was created (seeded with version 0)
+        """
+        index = self.read(case_dir)
+        if not index.records:
+            self._seed_locked(case_dir, current_content, file_name, timestamp)
+            return True
+        if index.latest['sha256'] != _sha256(current_content):
+            # The complaint was regenerated (or changed outside the dashboard)
+            self._append_locked(case_dir, 'snapshot', current_content, {
+                'timestamp': timestamp, 'file': file_name, 'edit': False,
+                'summary': 'Complaint regenerated'
+            })
+        return False
+
+    def _append_edit_locked(self, case_dir: str, previous_content: str, new_content: str,
+                            fields: Dict[str, Any]) -> Dict[str, Any]:
+        index = self.read(case_dir)
+        since_snapshot = len(index.records) - 1 - max(
+            i for i, record in enumerate(index.records) if record['kind'] == 'snapshot')
+        kind = 'snapshot' if since_snapshot + 1 >= self.snapshot_interval else 'delta'
+        payload = new_content if kind == 'snapshot' else compute_delta(previous_content, new_content)
+        return self._append_locked(case_dir, kind, new_content, fields, payload=payload)
+
+    def _seed_locked(self, case_dir: str, current_content: str, file_name: str, timestamp: str):
+        """Write version 0, importing the legacy full-copy backup when one exists."""
+        backup_path = os.path.join(case_dir, LEGACY_BACKUP_FILENAME)
+        if not os.path.exists(backup_path):
+            self._append_locked(case_dir, 'snapshot', current_content, {
+                'timestamp': timestamp, 'file': file_name, 'edit': False, 'summary': 'Original complaint'
+            })
+            return
+
+        with open(backup_path, 'r', encoding='utf-8') as f:
+            original = f.read()
+        self._append_locked(case_dir, 'snapshot', original, {
+            'timestamp': timestamp, 'file': LEGACY_BACKUP_FILENAME, 'edit': False, 'summary': 'Original complaint'
+        })
+        legacy_edits = 0
+        edits_path = os.path.join(case_dir, LEGACY_EDITS_FILENAME)
+        if os.path.exists(edits_path):
+            with open(edits_path, 'r', encoding='utf-8') as f:
+                legacy_edits = f.read().count("COMPLAINT EDIT -")
+        if legacy_edits or original != current_content:
+            self._append_locked(case_dir, 'delta', current_content, {
+                'timestamp': timestamp, 'file': file_name, 'edit': False,
+                'summary': 'Imported earlier edits', 'legacy_edits': legacy_edits
+            }, payload=compute_delta(original, current_content))
+
+    def _append_locked(self, case_dir: str, kind: str, content: str, fields: Dict[str, Any],
+                       payload: Any = None) -> Dict[str, Any]:
+        index = self.read(case_dir)
+        data = zlib.compress(json.dumps(content if payload is None else payload).encode('utf-8'), 6)
+        header = dict(fields, version=len(index.records), kind=kind, sha256=_sha256(content), size=len(data))
+        record = RECORD_PREFIX + json.dumps(header, sort_keys=True).encode('utf-8') + b'\n' + data + b'\n'
+
+        path = self.journal_path(case_dir)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            # Drop a torn tail left by a crashed writer before appending
+            if os.fstat(fd).st_size > index.offset:
+                os.ftruncate(fd, index.offset)
+            os.write(fd, record)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        return header
+
+
+# Shared instance used by the complaint editor endpoints
+edit_journal = EditJournalStore()
@@ -23,10 +23,12 @@ class CaseChangeHandler(FileSystemEventHandler):
         if '.case_status.json' in event.src_path:
             return
 
-        # This is a simple approach. A more robust solution would handle
-        # different event types (created, modified, deleted) more specifically.
         print(f"Detected file system event: {event.event_type} on {event.src_path}")
-        self.data_manager.scan_cases()
+        # Only the case owning the path is rebuilt (both ends of a move)
+        self.data_manager.refresh_path(event.src_path)
+        dest_path = getattr(event, 'dest_path', None)
+        if dest_path:
+            self.data_manager.refresh_path(dest_path)
         
         # Add event to queue instead of immediate broadcast to prevent race conditions
         if self.connection_manager:
@@ -0,0 +1,149 @@
+# dashboard/fragment_push.py
+"""
+Server-push of case HTML fragments.
+
+The status badge, action buttons and file-status list for a case used to be
+polled per case by every client. ``FragmentPublisher`` renders them once
+when a case changes, keeps the latest HTML per ``(case, fragment)`` with a
+version number, and hands back only the fragments whose HTML actually
+changed, addressed to the WebSocket clients subscribed to that case.
+
+Clients subscribe over ``/ws``:
+
+    {"type": "subscribe", "case_ids": ["youssef", ...] | ["*"], "cursor": "..."}
+    {"type": "unsubscribe", "case_ids": [...]}          (omit case_ids for all)
+
+and receive
+
+    {"type": "fragments", "cursor": "...", "fragments": [
+        {"case_id": ..., "fragment": "status" | "actions" | "files",
+         "html": ... | null (case removed), "version": n}, ...]}
+
+The cursor from the last message is sent back on reconnect, so only
+fragments that changed while the client was away are resent. Versions are
+per worker; a cursor from another worker (or a restart) gets a full resync
+of the subscribed cases.
+"""
+
+import os
+import time
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+ALL_CASES = '*'
+
+FragmentRenderer = Callable[[Any], str]
+
+
+class FragmentPublisher:
+    """Tracks rendered fragments per case and who is subscribed to them."""
+
+    def __init__(self, renderers: Dict[str, FragmentRenderer], get_case: Callable[[str], Any],
+                 list_case_ids: Callable[[], List[str]]):
+        self.renderers = renderers
+        self.get_case = get_case
+        self.list_case_ids = list_case_ids
+        self.epoch = f'{os.getpid()}.{int(time.time())}'
+        self._version = 0
+        # (case_id, fragment) -> (version, digest, html); html None marks a removed case
+        self._fragments: Dict[Tuple[str, str], Tuple[int, str, Optional[str]]] = {}
+        self._subscriptions: Dict[Any, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    # -- cursors ----------------------------------------------------------
+
+    def cursor(self) -> str:
+        return f'{self.epoch}:{self._version}'
+
+    def _since(self, cursor: Optional[str]) -> int:
+        """Version a client has seen; 0 (everything) for foreign or bad cursors"""
+        if not cursor:
+            return 0
+        epoch, _, version = cursor.rpartition(':')
+        if epoch != self.epoch or not version.isdigit():
+            return 0
+        return int(version)
+
+    # -- rendering --------------------------------------------------------
+
+    def _render(self, case_ids: Iterable[str]) -> List[dict]:
+        """Re-render fragments for cases; returns those whose HTML changed. Caller holds the lock."""
+        changed = []
+        for case_id in case_ids:
+            case = self.get_case(case_id)
+            for name, renderer in self.renderers.items():
+                key = (case_id, name)
+                html = renderer(case) if case is not None else None
+                digest = hashlib.sha1(html.encode('utf-8')).hexdigest() if html is not None else ''
+                previous = self._fragments.get(key)
+                if previous is not None and previous[1] == digest:
+                    continue
+                if previous is None and html is None:
+                    continue  # never seen, already gone
+                self._version += 1
+                self._fragments[key] = (self._version, digest, html)
+                changed.append(self._fragment(case_id, name))
+        return changed
+
+    def _fragment(self, case_id: str, name: str) -> dict:
+        version, _, html = self._fragments[(case_id, name)]
+        return {'case_id': case_id, 'fragment': name, 'html': html, 'version': version}
+
+    def _message(self, fragments: List[dict]) -> dict:
+        return {'type': 'fragments', 'cursor': self.cursor(), 'fragments': fragments}
+
+    # -- subscriptions ----------------------------------------------------
+
+    def has_subscribers(self) -> bool:
+        return bool(self._subscriptions)
+
+    def subscribe(self, client: Any, case_ids: List[str], cursor: Optional[str] = None) -> dict:
+        """
+        Add cases to a client's subscription.
+
+        Returns the resync message: current fragments of those cases that
+        are newer than ``cursor``.
+        """
+        since = self._since(cursor)
+        with self._lock:
+            subscribed = self._subscriptions.setdefault(client, set())
+            subscribed.update(case_ids)
+            if ALL_CASES in case_ids:
+                targets = {case_id for case_id, _ in self._fragments} | set(self.list_case_ids())
+            else:
+                targets = set(case_ids)
+            self._render(sorted(targets))
+            fragments = [self._fragment(case_id, name)
+                         for (case_id, name) in sorted(self._fragments)
+                         if case_id in targets and self._fragments[(case_id, name)][0] > since]
+            return self._message(fragments)
+
+    def unsubscribe(self, client: Any, case_ids: Optional[List[str]] = None):
+        with self._lock:
+            if case_ids is None:
+                self._subscriptions.pop(client, None)
+            elif client in self._subscriptions:
+                self._subscriptions[client].difference_update(case_ids)
+
+    def publish_changes(self, case_ids: Iterable[str]) -> Dict[Any, dict]:
+        """
+        Render changed cases and address the changed fragments.
+
+        Returns ``client -> message`` for each subscribed client with at
+        least one changed fragment. Nothing is rendered while no client is
+        subscribed; ``subscribe`` catches up.
+        """
+        with self._lock:
+            if not self._subscriptions:
+                return {}
+            changed = self._render(sorted(set(case_ids)))
+            if not changed:
+                return {}
+            deliveries = {}
+            for client, subscribed in self._subscriptions.items():
+                fragments = [f for f in changed
+                             if ALL_CASES in subscribed or f['case_id'] in subscribed]
+                if fragments:
+                    deliveries[client] = self._message(fragments)
+            return deliveries
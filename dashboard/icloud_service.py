@@ -13,6 +13,8 @@ from pathlib import Path
 import tempfile
 import shutil
 
+from satori_common.case_sync import PyiCloudDrive, RemoteDrive
+
 logger = logging.getLogger(__name__)
 
 class iCloudService:
@@ -337,6 +339,28 @@ class iCloudService:
                 'error': f'Could not sync case folder "{case_name}": {str(e)}'
             }
     
+    def get_drive(self, email: Optional[str] = None) -> Optional[RemoteDrive]:
+        """
+        Drive API over the saved session, for delta case sync
+        
+        Returns None when pyicloud is not installed or the session cannot be
+        reused without interactive 2FA; callers fall back to icloudpd.
+        """
+        account = email or self.account
+        if not account:
+            return None
+        
+        try:
+            from pyicloud import PyiCloudService
+            api = PyiCloudService(apple_id=account, cookie_directory=str(self.cookie_directory))
+            if api.requires_2fa:
+                logger.warning("iCloud session requires 2FA; drive API unavailable")
+                return None
+            return PyiCloudDrive(api.drive)
+        except Exception as e:
+            logger.warning(f"iCloud drive API unavailable, using icloudpd sync: {e}")
+            return None
+    
     def clear_session(self):
         """
         Clear stored session cookies (forces fresh authentication)
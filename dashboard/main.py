@@ -2,7 +2,6 @@ import os
 import json
 import logging
 import hashlib
-import glob
 import shutil
 import subprocess
 from datetime import datetime, timedelta
@@ -22,27 +21,65 @@ from .models import CaseStatus
 from . import service_runner
 from .sync_manager import SyncManager
 from .upload_service import StandaloneCaseUploader
+from . import metrics
+from .edit_journal import edit_journal, JOURNAL_FILENAME
+from .review_state import review_state, PatchError, VersionConflict, escape_pointer as _escape_pointer
+from .search_index import SearchIndex, FACET_FIELDS
+from .case_catalog import CaseCatalog, SORT_KEYS
+from .fragment_push import FragmentPublisher
+from .dir_snapshot import EntryInfo, snapshot, walk_files
+from .shared_state import (SessionStore, MemorySessionStore, EventBus, create_session_store,
+                           create_event_bus, acquire_leader)
+from satori_schema import serialization
 
 # Document parsing removed - Tiger service handles all document processing
 
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with the shared (orjson when available) serializer"""
+
+    def render(self, content) -> bytes:
+        return serialization.dumps_bytes(content, pretty=False)
+
 # --- WebSocket Connection Manager ---
+WEBSOCKET_CHANNEL = 'websocket'
+
 class ConnectionManager:
-    """Manages WebSocket connections for real-time event broadcasting"""
+    """Manages WebSocket connections for real-time event broadcasting
+    
+    With an event bus attached, broadcasts are published on the bus and every
+    worker sends them to its own connections on its own event loop.
+    """
     
-    def __init__(self):
+    def __init__(self, event_bus: EventBus = None):
         self.active_connections: List[WebSocket] = []
         self.logger = logging.getLogger(__name__)
+        self.event_bus = event_bus
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        if event_bus is not None:
+            event_bus.subscribe(WEBSOCKET_CHANNEL, self._on_bus_event)
+    
+    def attach_loop(self, loop: asyncio.AbstractEventLoop):
+        """Event loop that owns this worker's WebSocket connections"""
+        self.loop = loop
+    
+    def _on_bus_event(self, message: dict):
+        if self.loop is None or self.loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self._send_to_local(message['payload']), self.loop)
     
     async def connect(self, websocket: WebSocket):
         """Accept a new WebSocket connection"""
         await websocket.accept()
         self.active_connections.append(websocket)
+        metrics.WEBSOCKET_CONNECTIONS.set(len(self.active_connections))
         self.logger.info(f"New WebSocket connection. Total connections: {len(self.active_connections)}")
     
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection"""
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
+            metrics.WEBSOCKET_CONNECTIONS.set(len(self.active_connections))
             self.logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
     
     async def send_personal_message(self, message: str, websocket: WebSocket):
@@ -54,22 +91,30 @@ class ConnectionManager:
             self.disconnect(websocket)
     
     async def broadcast_event(self, event_data: dict):
-        """Broadcast an event to all connected WebSocket clients"""
+        """Broadcast an event to all connected WebSocket clients (on every worker)"""
+        if self.event_bus is not None and self.loop is not None:
+            self.event_bus.publish(WEBSOCKET_CHANNEL, event_data)
+            return
+        await self._send_to_local(event_data)
+    
+    async def _send_to_local(self, event_data: dict):
+        """Send an event to this worker's WebSocket clients"""
         if not self.active_connections:
             self.logger.debug("No active WebSocket connections for broadcasting")
             return
         
-        message = json.dumps(event_data)
+        message = serialization.dumps(event_data, pretty=False)
         self.logger.debug(f"Broadcasting event to {len(self.active_connections)} connections: {event_data.get('type', 'unknown')}")
         
         # Send to all connections, remove failed ones
         disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception as e:
-                self.logger.warning(f"Failed to send message to connection: {e}")
-                disconnected.append(connection)
+        with metrics.WEBSOCKET_BROADCAST_SECONDS.time():
+            for connection in self.active_connections:
+                try:
+                    await connection.send_text(message)
+                except Exception as e:
+                    self.logger.warning(f"Failed to send message to connection: {e}")
+                    disconnected.append(connection)
         
         # Clean up disconnected connections
         for connection in disconnected:
@@ -79,50 +124,46 @@ class ConnectionManager:
 class SessionManager:
     """Simple session management for dashboard authentication"""
     
-    def __init__(self):
-        self.sessions = {}  # session_id -> user_info
+    def __init__(self, store: SessionStore = None):
+        self.store = store or MemorySessionStore()  # session_id -> user_info
         self.session_timeout = timedelta(hours=8)  # 8 hour session timeout
         
     def create_session(self, username: str) -> str:
         """Create a new session and return session ID"""
         session_id = secrets.token_urlsafe(32)
-        self.sessions[session_id] = {
+        self.store.put(session_id, {
             'username': username,
             'created_at': datetime.now(),
             'last_access': datetime.now()
-        }
+        })
         return session_id
     
     def get_session(self, session_id: str) -> Optional[dict]:
         """Get session info if valid, None if expired or not found"""
-        if not session_id or session_id not in self.sessions:
+        if not session_id:
             return None
             
-        session = self.sessions[session_id]
+        session = self.store.get(session_id)
+        if session is None:
+            return None
         
         # Check if session has expired
         if datetime.now() - session['last_access'] > self.session_timeout:
-            del self.sessions[session_id]
+            self.store.delete(session_id)
             return None
             
         # Update last access time
         session['last_access'] = datetime.now()
+        self.store.put(session_id, session)
         return session
     
     def delete_session(self, session_id: str):
         """Delete a session"""
-        if session_id in self.sessions:
-            del self.sessions[session_id]
+        self.store.delete(session_id)
     
     def cleanup_expired_sessions(self):
         """Remove expired sessions"""
-        now = datetime.now()
-        expired_sessions = [
-            session_id for session_id, session in self.sessions.items()
-            if now - session['last_access'] > self.session_timeout
-        ]
-        for session_id in expired_sessions:
-            del self.sessions[session_id]
+        self.store.delete_idle(datetime.now() - self.session_timeout)
 
 # --- Authentication ---
 # User accounts - Username: Password
@@ -214,8 +255,8 @@ if (typeof document !== 'undefined') {{
         logging.error(f"❌ Failed to generate version.js: {e}")
         return False
 
-# Global session manager
-session_manager = SessionManager()
+# Global session manager (shared across workers when DASHBOARD_STATE_BACKEND=shared)
+session_manager = SessionManager(create_session_store())
 
 # Global cache for grid state - prevents unnecessary DOM updates
 _grid_cache = {
@@ -259,10 +300,23 @@ THEMES_DIR = os.path.join(STATIC_DIR, "themes")
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "outputs")
 
 # --- Global Instances ---
-data_manager = DataManager(CASE_DIRECTORY, OUTPUT_DIR)
-connection_manager = ConnectionManager()
+event_bus = create_event_bus()
+case_catalog = CaseCatalog()
+data_manager = DataManager(CASE_DIRECTORY, OUTPUT_DIR, catalog=case_catalog, event_bus=event_bus)
+connection_manager = ConnectionManager(event_bus)
 source_file_watcher = FileWatcher(CASE_DIRECTORY, data_manager, connection_manager)
 output_file_watcher = FileWatcher(OUTPUT_DIR, data_manager, connection_manager)
+search_index = SearchIndex()
+
+def sync_search_index():
+    """Index new or changed cases in the background (unchanged cases are skipped)"""
+    def task():
+        try:
+            result = search_index.sync_cases(data_manager.get_all_cases(), OUTPUT_DIR)
+            logger.info(f"Search index synced: {result}")
+        except Exception as e:
+            logger.error(f"Search index sync failed: {e}")
+    threading.Thread(target=task, daemon=True).start()
 
 # --- Application Lifecycle ---
 @asynccontextmanager
@@ -272,14 +326,28 @@ async def lifespan(app: FastAPI):
     # Generate version.js file on startup
     generate_version_file()
     
-    source_watcher_thread = threading.Thread(target=source_file_watcher.start, daemon=True)
-    output_watcher_thread = threading.Thread(target=output_file_watcher.start, daemon=True)
-    source_watcher_thread.start()
-    output_watcher_thread.start()
+    event_bus.start()
+    connection_manager.attach_loop(asyncio.get_running_loop())
+    
+    # With several workers only one watches the filesystem and backfills the
+    # search index; the others follow its catalog changes over the event bus
+    leader_lock = acquire_leader("watchers")
+    if leader_lock:
+        source_watcher_thread = threading.Thread(target=source_file_watcher.start, daemon=True)
+        output_watcher_thread = threading.Thread(target=output_file_watcher.start, daemon=True)
+        source_watcher_thread.start()
+        output_watcher_thread.start()
+        sync_search_index()
     yield
     print("Stopping application...")
-    source_file_watcher.stop()
-    output_file_watcher.stop()
+    if leader_lock:
+        source_file_watcher.stop()
+        output_file_watcher.stop()
+        leader_lock.close()
+    review_state.flush_all()
+    search_index.close()
+    case_catalog.close()
+    event_bus.close()
 
 app = FastAPI(
     lifespan=lifespan,
@@ -304,18 +372,36 @@ async def websocket_endpoint(websocket: WebSocket):
             data = await websocket.receive_text()
             logger.debug(f"Received WebSocket message: {data}")
             
+            # Fragment subscriptions: {"type": "subscribe" | "unsubscribe", "case_ids": [...], "cursor": ...}
+            try:
+                message = serialization.loads(data)
+            except ValueError:
+                message = None
+            if isinstance(message, dict) and message.get("type") == "subscribe":
+                case_ids = [str(case_id).lower() for case_id in message.get("case_ids") or []]
+                resync = fragment_publisher.subscribe(websocket, case_ids, message.get("cursor"))
+                await websocket.send_text(serialization.dumps(resync, pretty=False))
+                continue
+            if isinstance(message, dict) and message.get("type") == "unsubscribe":
+                case_ids = message.get("case_ids")
+                fragment_publisher.unsubscribe(
+                    websocket, [str(case_id).lower() for case_id in case_ids] if case_ids is not None else None)
+                continue
+            
             # Echo back as heartbeat confirmation
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(serialization.dumps({
                 "type": "heartbeat",
                 "timestamp": datetime.now().isoformat(),
                 "message": "Connection active"
-            }))
+            }, pretty=False))
     except WebSocketDisconnect:
         connection_manager.disconnect(websocket)
         logger.info("WebSocket client disconnected")
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
         connection_manager.disconnect(websocket)
+    finally:
+        fragment_publisher.unsubscribe(websocket)
 
 # Tiger service event receiver endpoint
 @app.post("/api/processing-events")
@@ -425,25 +511,124 @@ async def generate_attorney_template_docx(request: Request):
         logger.error(f"Error generating DOCX: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error generating DOCX: {str(e)}")
 
+def _parse_statuses(statuses: Optional[List[str]]) -> List[CaseStatus]:
+    """Accept status names (PENDING_REVIEW) or values (Pending Review), case-insensitively"""
+    lookup = {}
+    for status in CaseStatus:
+        lookup[status.name.lower()] = status
+        lookup[status.value.lower()] = status
+    parsed = []
+    for raw in statuses or []:
+        for name in raw.split(','):
+            name = name.strip().lower()
+            if not name:
+                continue
+            if name not in lookup:
+                raise HTTPException(status_code=400, detail=f"Unknown status: {name}")
+            parsed.append(lookup[name])
+    return parsed
+
+def _list_cases_page(status, defendant, sort, order, limit, cursor):
+    """One catalog page of cases plus the pagination headers shared by the listing endpoints"""
+    try:
+        page = data_manager.list_cases(statuses=_parse_statuses(status), defendant=defendant,
+                                       sort=sort, order=order, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    headers = {"X-Total-Count": str(page["total"])}
+    if page["next_cursor"]:
+        headers["X-Next-Cursor"] = page["next_cursor"]
+    return page["cases"], headers
+
 @app.get("/api/cases")
-async def get_cases():
-    return data_manager.get_all_cases()
+def get_cases(
+    status: Optional[List[str]] = Query(None, description="Filter by status; repeat or comma-separate"),
+    defendant: Optional[str] = Query(None, description="Filter by defendant name (substring)"),
+    sort: Optional[str] = Query(None, description=f"One of: {', '.join(SORT_KEYS)}"),
+    order: Literal["asc", "desc"] = "desc",
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+):
+    """
+    List cases from the case catalog.
+
+    Without parameters every case is returned, as before. With any listing
+    parameter the result is one page (50 by default); the body stays a list
+    and the total and next-page cursor come back in the X-Total-Count and
+    X-Next-Cursor headers.
+    """
+    if not any((status, defendant, sort, limit, cursor)):
+        return data_manager.get_all_cases()
+    cases, headers = _list_cases_page(status, defendant, sort or "last_updated", order, limit or 50, cursor)
+    return JSONResponse(content=[json.loads(case.json()) for case in cases], headers=headers)
 
 @app.post("/api/refresh")
 async def refresh_cases():
     """Force a manual refresh of case data and progress states"""
     try:
-        data_manager.scan_cases()
+        data_manager.scan_cases(force=True)
         clear_grid_cache()  # Clear cache to force UI update
+        sync_search_index()
         return {"message": "Cases refreshed successfully", "timestamp": datetime.now().isoformat()}
     except Exception as e:
         logger.error(f"Error refreshing cases: {e}")
         raise HTTPException(status_code=500, detail="Failed to refresh cases")
 
+@app.get("/api/search")
+def search_cases(
+    q: Optional[str] = Query(None, description="Full-text query; quote phrases, end a word with * for prefix"),
+    plaintiff: Optional[str] = None,
+    defendant: Optional[str] = None,
+    defendant_type: Optional[str] = None,
+    court: Optional[str] = None,
+    case_number: Optional[str] = None,
+    claim: Optional[str] = None,
+    selected_claim: Optional[str] = None,
+    damage_category: Optional[str] = None,
+    kind: Optional[Literal["case", "document"]] = None,
+    doc_type: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[str] = Query(None, description="Earliest case date (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, description="Latest case date (YYYY-MM-DD)"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+):
+    """Ranked, paginated search across all cases' documents and hydrated data
+
+    Plain ``def`` so FastAPI runs the SQLite query in its threadpool.
+    """
+    filters = {
+        "plaintiff": plaintiff, "defendant": defendant, "defendant_type": defendant_type,
+        "court": court, "case_number": case_number, "claim": claim,
+        "selected_claim": selected_claim, "damage_category": damage_category,
+    }
+    try:
+        return search_index.search(
+            q, filters, kind=kind, doc_type=doc_type, status=status,
+            date_from=date_from, date_to=date_to, page=page, page_size=page_size)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        # e.g. an SQLite build without FTS5
+        logger.error(f"Search failed: {e}")
+        raise HTTPException(status_code=503, detail="Search is unavailable")
+
+@app.get("/api/search/facets/{field}")
+def search_facet_values(field: str, prefix: str = "", limit: int = Query(20, ge=1, le=100)):
+    """Known values of a search field, most common first (for filter suggestions)"""
+    if field not in FACET_FIELDS:
+        raise HTTPException(status_code=404, detail=f"Unknown search field: {field}")
+    return {"field": field, "values": search_index.facet_values(field, prefix, limit)}
+
 @app.get("/api/version")
 async def get_version():
     return {"version": APP_VERSION}
 
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus text exposition, including snapshots spooled by Tiger/Monkey runs"""
+    return Response(content=metrics.render_latest(), media_type="text/plain; version=0.0.4")
+
 @app.get("/api/changelog")
 async def get_changelog():
     """Serve the changelog content for display in settings."""
@@ -486,8 +671,7 @@ async def validate_case_timeline(case_id: str):
     
     try:
         # Load hydrated JSON to access timeline data
-        with open(case.hydrated_json_path, 'r') as f:
-            case_data = json.load(f)
+        case_data, _ = review_state.get(case.hydrated_json_path)
         
         timeline = case_data.get('case_timeline', {})
         if not timeline:
@@ -561,55 +745,90 @@ async def validate_case_timeline(case_id: str):
         logging.error(f"Timeline validation error for case {case_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Timeline validation failed: {str(e)}")
 
+def _get_review_case(case_id: str):
+    case = data_manager.get_case_by_id(case_id)
+    if not case or not case.hydrated_json_path:
+        raise HTTPException(status_code=404, detail="Data still processing please try again in a few mins")
+
+    if not os.path.exists(case.hydrated_json_path):
+        raise HTTPException(status_code=404, detail="Hydrated JSON file not found")
+    return case
+
+
+def _apply_review_patch(case, build_operations, expected_version):
+    """Apply a patch to the cached hydrated JSON, mapping store errors to HTTP errors."""
+    try:
+        return review_state.apply_from(case.hydrated_json_path, build_operations, expected_version)
+    except VersionConflict as e:
+        raise HTTPException(status_code=409, detail={"message": str(e), "version": e.current})
+    except PatchError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid patch: {str(e)}")
+
+
+@app.patch("/api/cases/{case_id}/review")
+async def patch_review_state(case_id: str, request: Request):
+    """Apply JSON-Patch operations ({"patch": [...], "version": n}) to a case's hydrated JSON."""
+    try:
+        data = await request.json()
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(e)}")
+
+    operations = data.get('patch')
+    if not isinstance(operations, list):
+        raise HTTPException(status_code=400, detail="Request body must contain a 'patch' list")
+
+    case = _get_review_case(case_id)
+    version = _apply_review_patch(case, lambda case_data: operations, data.get('version'))
+    case.progress.reviewed = True
+    return {"success": True, "version": version, "operations_applied": len(operations)}
+
+
 @app.post("/api/cases/{case_id}/legal-claims")
 async def update_legal_claims(case_id: str, request: Request):
     """Update legal claim selections for a case."""
     try:
         data = await request.json()
         selections = data.get('selections', [])
-        
-        # Load existing hydrated JSON
-        case = data_manager.get_case_by_id(case_id)
-        if not case or not case.hydrated_json_path:
-            raise HTTPException(status_code=404, detail="Data still processing please try again in a few mins")
-        
-        if not os.path.exists(case.hydrated_json_path):
-            raise HTTPException(status_code=404, detail="Hydrated JSON file not found")
-        
-        with open(case.hydrated_json_path, 'r') as f:
-            case_data = json.load(f)
-        
-        # Update selections in causes of action
-        if 'causes_of_action' not in case_data:
-            raise HTTPException(status_code=400, detail="No causes of action found in case data")
-        
-        # Apply selections
+        case = _get_review_case(case_id)
         selections_applied = 0
-        for selection in selections:
-            cause_index = selection['cause_index']
-            claim_index = selection['claim_index'] 
-            selected = selection['selected']
-            
-            # Validate indices
-            if cause_index < len(case_data['causes_of_action']):
-                cause = case_data['causes_of_action'][cause_index]
-                if 'legal_claims' in cause and claim_index < len(cause['legal_claims']):
-                    cause['legal_claims'][claim_index]['selected'] = selected
-                    selections_applied += 1
-        
-        # Save updated JSON
-        with open(case.hydrated_json_path, 'w') as f:
-            json.dump(case_data, f, indent=2)
-        
+
+        def build_operations(case_data):
+            nonlocal selections_applied
+            if 'causes_of_action' not in case_data:
+                raise HTTPException(status_code=400, detail="No causes of action found in case data")
+
+            operations = []
+            for selection in selections:
+                cause_index = selection['cause_index']
+                claim_index = selection['claim_index']
+                selected = selection['selected']
+
+                # Validate indices
+                if cause_index < len(case_data['causes_of_action']):
+                    cause = case_data['causes_of_action'][cause_index]
+                    if 'legal_claims' in cause and claim_index < len(cause['legal_claims']):
+                        operations.append({
+                            "op": "add",
+                            "path": f"/causes_of_action/{cause_index}/legal_claims/{claim_index}/selected",
+                            "value": selected
+                        })
+                        selections_applied += 1
+            return operations
+
+        version = _apply_review_patch(case, build_operations, data.get('version'))
+
         # Mark case as reviewed when legal claims are saved
         case.progress.reviewed = True
-        
+
         return {
-            "success": True, 
+            "success": True,
             "message": f"Legal claim selections updated ({selections_applied} claims)",
-            "selections_applied": selections_applied
+            "selections_applied": selections_applied,
+            "version": version
         }
-        
+
+    except HTTPException:
+        raise
     except json.JSONDecodeError as e:
         raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(e)}")
     except Exception as e:
@@ -623,62 +842,61 @@ async def update_damage_selections(case_id: str, request: Request):
     try:
         data = await request.json()
         selections = data.get('selections', {})
-        
-        # Load existing hydrated JSON
-        case = data_manager.get_case_by_id(case_id)
-        if not case or not case.hydrated_json_path:
-            raise HTTPException(status_code=404, detail="Data still processing please try again in a few mins")
-        
-        if not os.path.exists(case.hydrated_json_path):
-            raise HTTPException(status_code=404, detail="Hydrated JSON file not found")
-        
-        with open(case.hydrated_json_path, 'r') as f:
-            case_data = json.load(f)
-        
-        # Update selections in damages
-        if 'damages' not in case_data:
-            raise HTTPException(status_code=400, detail="No damages found in case data")
-        
-        damages_data = case_data['damages']
+        case = _get_review_case(case_id)
         selections_applied = 0
-        
-        # Update structured damages
-        if 'structured_damages' in damages_data:
-            for damage in damages_data['structured_damages']:
+
+        def build_operations(case_data):
+            nonlocal selections_applied
+            if 'damages' not in case_data:
+                raise HTTPException(status_code=400, detail="No damages found in case data")
+
+            damages_data = case_data['damages']
+            categorized = damages_data.get('categorized_damages', {})
+            operations = []
+
+            # Update structured damages
+            for damage_index, damage in enumerate(damages_data.get('structured_damages', [])):
                 category = damage.get('category')
-                if category in selections:
+                if category in selections and category in categorized:
                     # Find the matching damage by category and type
                     for index, selected in selections[category].items():
                         index = int(index)
-                        if 'categorized_damages' in damages_data and category in damages_data['categorized_damages']:
-                            if index < len(damages_data['categorized_damages'][category]):
-                                target_damage = damages_data['categorized_damages'][category][index]
-                                if (damage.get('type') == target_damage.get('type') and 
-                                    damage.get('entity') == target_damage.get('entity')):
-                                    damage['selected'] = selected
-                                    target_damage['selected'] = selected
-                                    selections_applied += 1
-        
-        # Update categorized damages
-        if 'categorized_damages' in damages_data:
+                        if index < len(categorized[category]):
+                            target_damage = categorized[category][index]
+                            if (damage.get('type') == target_damage.get('type') and
+                                damage.get('entity') == target_damage.get('entity')):
+                                operations.append({
+                                    "op": "add",
+                                    "path": f"/damages/structured_damages/{damage_index}/selected",
+                                    "value": selected
+                                })
+                                selections_applied += 1
+
+            # Update categorized damages
             for category, category_selections in selections.items():
-                if category in damages_data['categorized_damages']:
+                if category in categorized:
                     for index_str, selected in category_selections.items():
                         index = int(index_str)
-                        if index < len(damages_data['categorized_damages'][category]):
-                            damages_data['categorized_damages'][category][index]['selected'] = selected
+                        if index < len(categorized[category]):
+                            operations.append({
+                                "op": "add",
+                                "path": f"/damages/categorized_damages/{_escape_pointer(category)}/{index}/selected",
+                                "value": selected
+                            })
                             selections_applied += 1
-        
-        # Save updated JSON
-        with open(case.hydrated_json_path, 'w') as f:
-            json.dump(case_data, f, indent=2)
-        
+            return operations
+
+        version = _apply_review_patch(case, build_operations, data.get('version'))
+
         return {
             "success": True,
             "message": f"Damage selections updated ({selections_applied} damages)",
-            "selections_applied": selections_applied
+            "selections_applied": selections_applied,
+            "version": version
         }
-        
+
+    except HTTPException:
+        raise
     except json.JSONDecodeError as e:
         raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(e)}")
     except Exception as e:
@@ -697,6 +915,13 @@ async def process_case(case_id: str):
 
     print(f"🐅 BACKEND: Case {case_id} found, current status: {case.status}")
     
+    start_case_processing(case)
+    return {"message": f"Processing started for case {case_id}"}
+
+def start_case_processing(case):
+    """Mark a case as PROCESSING and run Tiger extraction on a background thread"""
+    case_id = case.id
+    
     # Simple processing flow - Tiger handles all validation and document processing
     # Set status to PROCESSING immediately
     data_manager.update_case_status(case_id, CaseStatus.PROCESSING)
@@ -724,10 +949,19 @@ async def process_case(case_id: str):
             
             # Step 4: Mark extraction complete
             case.hydrated_json_path = generated_json_path
+            # Tiger rewrote the file; drop any cached review state for it
+            if generated_json_path:
+                review_state.discard(generated_json_path)
             case.progress.extracted = True
             data_manager.update_case_status(case_id, CaseStatus.PENDING_REVIEW)
             print(f"🐅 BACKEND: Case {case_id} processing completed successfully - status: PENDING_REVIEW")
 
+            try:
+                search_index.index_case_outputs(case_id, case_output_dir, generated_json_path,
+                                                case.name, CaseStatus.PENDING_REVIEW.value)
+            except Exception as e:
+                logger.error(f"Search indexing failed for {case_id}: {e}")
+
             # Broadcast the completion event
             try:
                 event_data = {
@@ -762,8 +996,11 @@ async def process_case(case_id: str):
             except Exception as broadcast_error:
                 print(f"Error broadcasting processing error event: {broadcast_error}")
 
-    threading.Thread(target=background_task).start()
-    return {"message": f"Processing started for case {case_id}"}
+    def tracked_task():
+        with metrics.PROCESSING_IN_FLIGHT.track_inprogress():
+            background_task()
+
+    threading.Thread(target=tracked_task).start()
 
 @app.get("/api/cases/{case_id}/manifest")
 async def get_case_manifest(case_id: str):
@@ -795,9 +1032,9 @@ async def get_case_data(case_id: str):
     if not os.path.exists(case.hydrated_json_path):
         raise HTTPException(status_code=404, detail="Hydrated JSON file not found at path.")
 
-    with open(case.hydrated_json_path, 'r') as f:
-        data = json.load(f)
-    return JSONResponse(content=data)
+    # Cached encoding of the current version; no copy, no re-serialization per request
+    body, version = review_state.get_json(case.hydrated_json_path)
+    return Response(content=body, media_type="application/json", headers={"X-Review-Version": str(version)})
 
 @app.get("/api/cases/{case_id}/review_data")
 async def get_case_review_data(case_id: str):
@@ -810,8 +1047,7 @@ async def get_case_review_data(case_id: str):
     if not os.path.exists(case.hydrated_json_path):
         raise HTTPException(status_code=404, detail="Hydrated JSON file not found at path.")
 
-    with open(case.hydrated_json_path, 'r') as f:
-        data = json.load(f)
+    data, _ = review_state.get(case.hydrated_json_path)
 
     def format_data(d):
         if isinstance(d, list):
@@ -822,7 +1058,7 @@ async def get_case_review_data(case_id: str):
             return d.replace('"', '')
         return d
 
-    return JSONResponse(content=format_data(data))
+    return FastJSONResponse(content=format_data(data))
 
 
 
@@ -838,14 +1074,9 @@ async def get_case_file_status(case_id: str):
 
 
 # HTMX HTML Fragment Endpoints
-@app.get("/api/cases/{case_id}/file-status-html")
-async def get_case_file_status_html(case_id: str):
-    """Return HTML fragment for file status icons - used by HTMX polling"""
-    from fastapi.responses import HTMLResponse
-    
-    case = data_manager.get_case_by_id(case_id)
-    if not case:
-        raise HTTPException(status_code=404, detail="Case not found")
+def render_file_status_fragment(case) -> str:
+    """HTML for a case's file status icons"""
+    case_id = case.id
     
     # Generate file status HTML
     def get_file_icon(file_name: str, file_index: int) -> str:
@@ -897,18 +1128,20 @@ async def get_case_file_status_html(case_id: str):
     if not file_items_html:
         file_items_html = '<div class="text-sm text-gray-500">No files found</div>'
     
-    return HTMLResponse(content=file_items_html)
+    return file_items_html
 
 
-@app.get("/api/cases/{case_id}/status-html")
-async def get_case_status_html(case_id: str):
-    """Return HTML fragment for case status badge - used by HTMX polling"""
-    from fastapi.responses import HTMLResponse
-    
+@app.get("/api/cases/{case_id}/file-status-html")
+async def get_case_file_status_html(case_id: str):
+    """Return HTML fragment for file status icons - used by HTMX polling (or pushed over /ws)"""
     case = data_manager.get_case_by_id(case_id)
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
-    
+    return HTMLResponse(content=render_file_status_fragment(case))
+
+
+def render_status_fragment(case) -> str:
+    """HTML for a case's status badge"""
     # Generate status badge HTML based on case status
     status_map = {
         CaseStatus.NEW: ("bg-blue-100 text-blue-800", "New"),
@@ -921,20 +1154,43 @@ async def get_case_status_html(case_id: str):
     
     status_class, status_text = status_map.get(case.status, ("bg-gray-100 text-gray-800", "Unknown"))
     
-    html = f'<span class="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium {status_class}">{status_text}</span>'
-    
-    return HTMLResponse(content=html)
+    return f'<span class="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium {status_class}">{status_text}</span>'
+
+
+@app.get("/api/cases/{case_id}/status-html")
+async def get_case_status_html(case_id: str):
+    """Return HTML fragment for case status badge - used by HTMX polling (or pushed over /ws)"""
+    case = data_manager.get_case_by_id(case_id)
+    if not case:
+        raise HTTPException(status_code=404, detail="Case not found")
+    return HTMLResponse(content=render_status_fragment(case))
 
 
 @app.get("/api/cases/grid-html")
-async def get_cases_grid_html(request: Request):
-    """Return HTML fragment for cases grid - ONLY if data changed (delta-based)"""
+def get_cases_grid_html(
+    request: Request,
+    status: Optional[List[str]] = Query(None),
+    defendant: Optional[str] = None,
+    sort: Optional[str] = None,
+    order: Literal["asc", "desc"] = "desc",
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    cursor: Optional[str] = None,
+):
+    """Return HTML fragment for cases grid - ONLY if data changed (delta-based)
+
+    Accepts the same filter, sort and cursor parameters as /api/cases.
+    """
     global _grid_cache
     
-    cases = data_manager.get_all_cases()
+    page_headers = {}
+    if any((status, defendant, sort, limit, cursor)):
+        cases, page_headers = _list_cases_page(status, defendant, sort or "last_updated", order, limit or 50, cursor)
+    else:
+        cases = data_manager.get_all_cases()
     
     # Calculate hash of current case data to detect changes
-    case_data_for_hash = []
+    # (the query is part of it, so a different page or filter is never a 304)
+    case_data_for_hash = [str(request.query_params)]
     for case in cases:
         file_count = 0
         if case.files:
@@ -974,15 +1230,18 @@ async def get_cases_grid_html(request: Request):
         _grid_cache['last_content'] and
         len(_grid_cache['last_content']) > 0):
         print("DEBUG: Returning 304 - content unchanged")
+        metrics.CACHE_REQUESTS.inc(cache='grid_html', result='hit')
         return Response(
             status_code=304,
             headers={
                 "X-Content-Changed": "false",
-                "Cache-Control": "no-cache"
+                "Cache-Control": "no-cache",
+                **page_headers
             }
         )
     
     # Generate new content only if data changed
+    metrics.CACHE_REQUESTS.inc(cache='grid_html', result='miss')
     grid_html = ""
     for case in cases:
         status_class_map = {
@@ -1059,20 +1318,14 @@ async def get_cases_grid_html(request: Request):
         content=grid_html,
         headers={
             "X-Content-Changed": "true",
-            "Cache-Control": "no-cache"
+            "Cache-Control": "no-cache",
+            **page_headers
         }
     )
 
 
-@app.get("/api/cases/{case_id}/actions-html")
-async def get_case_actions_html(case_id: str):
-    """Return HTML fragment for case action buttons - used by HTMX polling"""
-    from fastapi.responses import HTMLResponse
-    
-    case = data_manager.get_case_by_id(case_id)
-    if not case:
-        raise HTTPException(status_code=404, detail="Case not found")
-    
+def render_actions_fragment(case) -> str:
+    """HTML for a case's action buttons"""
     base_button_classes = "w-full text-center px-4 py-3 rounded-lg font-semibold focus:outline-none focus:ring-2 focus:ring-offset-2"
     
     # Generate action button based on case status
@@ -1104,7 +1357,35 @@ async def get_case_actions_html(case_id: str):
     else:  # GENERATING or other states
         action_button = f'''<button id="{case.id}_button" class="{base_button_classes} bg-gray-400 text-white cursor-not-allowed" disabled>{case.status.value.replace('_', ' ').title()}...</button>'''
     
-    return HTMLResponse(content=action_button)
+    return action_button
+
+
+@app.get("/api/cases/{case_id}/actions-html")
+async def get_case_actions_html(case_id: str):
+    """Return HTML fragment for case action buttons - used by HTMX polling (or pushed over /ws)"""
+    case = data_manager.get_case_by_id(case_id)
+    if not case:
+        raise HTTPException(status_code=404, detail="Case not found")
+    return HTMLResponse(content=render_actions_fragment(case))
+
+
+# --- Server-push of the fragments above ---
+fragment_publisher = FragmentPublisher(
+    {"status": render_status_fragment, "actions": render_actions_fragment, "files": render_file_status_fragment},
+    data_manager.get_case_by_id,
+    lambda: [case.id for case in data_manager.get_all_cases()]
+)
+
+def push_case_fragments(case_ids: List[str]):
+    """Send changed fragments to subscribed clients (DataManager change listener; any thread)"""
+    loop = connection_manager.loop
+    if loop is None or loop.is_closed() or not fragment_publisher.has_subscribers():
+        return
+    for websocket, message in fragment_publisher.publish_changes(case_ids).items():
+        asyncio.run_coroutine_threadsafe(
+            connection_manager.send_personal_message(serialization.dumps(message, pretty=False), websocket), loop)
+
+data_manager.add_listener(push_case_fragments)
 
 
 @app.post("/api/cases/{case_id}/generate-complaint")
@@ -1121,6 +1402,9 @@ async def generate_complaint_html(case_id: str):
             case_output_dir = os.path.join(OUTPUT_DIR, case_id)
             os.makedirs(case_output_dir, exist_ok=True)
             
+            # Monkey reads the file, so persist pending review selections first
+            review_state.flush(case.hydrated_json_path)
+
             # Run monkey service to generate complaint
             monkey_output = service_runner.run_monkey_generation(case.hydrated_json_path, case_output_dir, data_manager, case_id)
             
@@ -1169,9 +1453,8 @@ async def generate_summons_documents(case_id: str):
         try:
             print(f"🏛️ BACKEND: Starting summons generation for case {case_id}")
             
-            # Load case data from hydrated JSON
-            with open(case.hydrated_json_path, 'r') as f:
-                case_data = json.load(f)
+            # Monkey reads the file, so persist pending review selections first
+            review_state.flush(case.hydrated_json_path)
             
             # Create output directory for summons
             case_output_dir = os.path.join(OUTPUT_DIR, case_id)
@@ -1199,8 +1482,7 @@ async def generate_summons_documents(case_id: str):
 
     try:
         # Load case data from hydrated JSON to get defendants count
-        with open(case.hydrated_json_path, 'r') as f:
-            case_data = json.load(f)
+        case_data, _ = review_state.get(case.hydrated_json_path)
         defendants = case_data.get('parties', {}).get('defendants', [])
         
         # Run summons generation in background thread
@@ -1229,23 +1511,15 @@ async def check_summons_status(case_id: str):
     if not os.path.exists(summons_dir):
         return {"exists": False, "files": [], "count": 0, "last_generated": None}
     
-    # Get list of summons files
-    summons_files = [f for f in os.listdir(summons_dir) if f.endswith('.html')]
-    summons_files.sort()  # Ensure consistent ordering
+    # Get list of summons files (sorted by name for consistent ordering)
+    summons_entries = snapshot(summons_dir).files(lambda name: name.endswith('.html'))
+    summons_files = [entry.name for entry in summons_entries]
     
     # Get the most recent modification time from all summons files
     last_generated = None
-    if summons_files:
-        most_recent_time = 0
-        for file in summons_files:
-            file_path = os.path.join(summons_dir, file)
-            if os.path.exists(file_path):
-                file_time = os.path.getmtime(file_path)
-                if file_time > most_recent_time:
-                    most_recent_time = file_time
-        
-        if most_recent_time > 0:
-            last_generated = datetime.fromtimestamp(most_recent_time).isoformat()
+    if summons_entries:
+        most_recent = max(summons_entries, key=lambda entry: entry.mtime_ns)
+        last_generated = most_recent.modified_at.isoformat()
     
     return {
         "exists": len(summons_files) > 0,
@@ -1268,7 +1542,7 @@ async def check_last_complaint(case_id: str):
         return {"exists": False, "path": None, "generated_at": None}
     
     # Find the most recent date directory
-    date_dirs = [d for d in os.listdir(complaint_dir) if os.path.isdir(os.path.join(complaint_dir, d))]
+    date_dirs = [d.name for d in snapshot(complaint_dir, stat_files=False).dirs()]
     if not date_dirs:
         return {"exists": False, "path": None, "generated_at": None}
     
@@ -1321,7 +1595,7 @@ async def get_complaint_html(case_id: str):
         raise HTTPException(status_code=404, detail="No complaint generated yet")
     
     # Find the most recent date directory
-    date_dirs = [d for d in os.listdir(complaint_dir) if os.path.isdir(os.path.join(complaint_dir, d))]
+    date_dirs = [d.name for d in snapshot(complaint_dir, stat_files=False).dirs()]
     if not date_dirs:
         raise HTTPException(status_code=404, detail="No complaint generated yet")
     
@@ -1401,13 +1675,14 @@ async def serve_complaint_document(case_id: str, download: bool = False):
         
         if complaint_dir:
             # Find the most recent date directory
-            date_dirs = [d for d in os.listdir(complaint_dir) if os.path.isdir(os.path.join(complaint_dir, d))]
+            date_dirs = [d.name for d in snapshot(complaint_dir, stat_files=False).dirs()]
             if date_dirs:
                 latest_date = sorted(date_dirs, reverse=True)[0]
                 complaint_folder = os.path.join(complaint_dir, latest_date)
                 
                 # Look for PDF files specifically
-                all_files = os.listdir(complaint_folder)
+                listing = snapshot(complaint_folder)
+                all_files = [entry.name for entry in listing]
                 
                 # First look for standardized name: complaint_<case_id>.pdf
                 standardized_name = f"complaint_{case_id}.pdf"
@@ -1425,7 +1700,7 @@ async def serve_complaint_document(case_id: str, download: bool = False):
                 pdf_files = [f for f in all_files if f.startswith("complaint") and f.endswith(".pdf")]
                 if pdf_files:
                     # Found PDF file(s), serve the most recent one
-                    latest_pdf = sorted(pdf_files, key=lambda x: os.path.getmtime(os.path.join(complaint_folder, x)), reverse=True)[0]
+                    latest_pdf = max(pdf_files, key=lambda x: listing.get(x).mtime_ns)
                     pdf_path = os.path.join(complaint_folder, latest_pdf)
                     
                     if os.path.exists(pdf_path):
@@ -1460,7 +1735,7 @@ async def serve_complaint_document(case_id: str, download: bool = False):
         raise HTTPException(status_code=404, detail="No complaint generated yet")
     
     # Find the most recent date directory
-    date_dirs = [d for d in os.listdir(complaint_dir) if os.path.isdir(os.path.join(complaint_dir, d))]
+    date_dirs = [d.name for d in snapshot(complaint_dir, stat_files=False).dirs()]
     if not date_dirs:
         raise HTTPException(status_code=404, detail="No complaint generated yet")
     
@@ -2158,13 +2433,25 @@ async def upload_page(user: dict = Depends(get_current_user)):
     return FileResponse(upload_html_path)
 
 @app.post("/api/upload/cases")
-async def upload_cases(file: UploadFile = File(...), user: dict = Depends(get_current_user)):
-    """Process case file upload"""
+async def upload_cases(file: UploadFile = File(...), auto_process: bool = Query(False),
+                       user: dict = Depends(get_current_user)):
+    """Process case file upload, optionally queuing each case for Tiger as soon as it lands"""
     if not user:
         raise HTTPException(status_code=401, detail="Authentication required")
     
+    def on_case_ready(case_info: dict):
+        # Only the landed case (and the backup of the one it replaced) changed
+        data_manager.refresh_case(case_info["name"])
+        if case_info.get("backup_name"):
+            data_manager.refresh_case(case_info["backup_name"])
+        clear_grid_cache()
+        case = data_manager.get_case_by_id(case_info["name"])
+        if auto_process and case:
+            print(f"📦 UPLOAD: Queuing uploaded case {case.id} for processing")
+            start_case_processing(case)
+    
     uploader = StandaloneCaseUploader(CASE_DIRECTORY)
-    return await uploader.process_upload(file)
+    return await uploader.process_upload(file, case_ready_callback=on_case_ready)
 
 # --- Frontend Serving ---
 
@@ -2278,7 +2565,7 @@ async def get_complaint_content(case_id: str):
         raise HTTPException(status_code=404, detail="No complaint generated yet")
     
     # Find the most recent date directory
-    date_dirs = [d for d in os.listdir(complaint_dir) if os.path.isdir(os.path.join(complaint_dir, d))]
+    date_dirs = [d.name for d in snapshot(complaint_dir, stat_files=False).dirs()]
     if not date_dirs:
         raise HTTPException(status_code=404, detail="No complaint generated yet")
     
@@ -2317,7 +2604,7 @@ async def get_complaint_content(case_id: str):
     # Check if there's already an edits file
     case_dir = os.path.join(OUTPUT_DIR, case_id)
     edits_file = os.path.join(case_dir, "atty_notes_edits.txt")
-    has_edits = os.path.exists(edits_file)
+    has_edits = edit_journal.edit_count(case_dir) > 0 or os.path.exists(edits_file)
     
     # Read the complaint content
     try:
@@ -2357,7 +2644,7 @@ async def save_complaint_edits(case_id: str, request: Request):
             raise HTTPException(status_code=404, detail="No complaint generated yet")
         
         # Find the most recent date directory and complaint file
-        date_dirs = [d for d in os.listdir(complaint_dir) if os.path.isdir(os.path.join(complaint_dir, d))]
+        date_dirs = [d.name for d in snapshot(complaint_dir, stat_files=False).dirs()]
         if not date_dirs:
             raise HTTPException(status_code=404, detail="No complaint generated yet")
         
@@ -2382,60 +2669,35 @@ async def save_complaint_edits(case_id: str, request: Request):
         latest_complaint = sorted(complaint_files, key=version_key, reverse=True)[0]
         complaint_path = os.path.join(complaint_folder, latest_complaint)
         
-        # Create backup of original if it doesn't exist
         case_dir = os.path.join(OUTPUT_DIR, case_id)
         os.makedirs(case_dir, exist_ok=True)
-        backup_path = os.path.join(case_dir, "complaint_original.html")
         
-        backup_created = False
-        if not os.path.exists(backup_path):
-            try:
-                with open(complaint_path, 'r', encoding='utf-8') as src:
-                    original_content = src.read()
-                with open(backup_path, 'w', encoding='utf-8') as dst:
-                    dst.write(original_content)
-                backup_created = True
-                logger.info(f"Created backup of original complaint: {backup_path}")
-            except Exception as e:
-                logger.error(f"Error creating backup: {str(e)}")
-                raise HTTPException(status_code=500, detail="Error creating backup")
-        
-        # Save the edited content to the complaint file
+        # Save the edited complaint and journal it as a compressed delta against the version on disk
         try:
-            with open(complaint_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            journal_entry = edit_journal.save_edit(case_dir, complaint_path, html_content, user_id, change_summary)
             logger.info(f"Saved edited complaint: {complaint_path}")
         except Exception as e:
-            logger.error(f"Error saving complaint: {str(e)}")
+            logger.error(f"Error saving complaint edit: {str(e)}")
             raise HTTPException(status_code=500, detail="Error saving complaint file")
+        journal_file = edit_journal.journal_path(case_dir)
+        timestamp = journal_entry['timestamp']
         
-        # Create/update the delta tracking file
+        # Append a human-readable entry to the edits log
         edits_file = os.path.join(case_dir, "atty_notes_edits.txt")
-        timestamp = datetime.now().isoformat()
-        
         try:
-            # Read existing edits if any
-            existing_content = ""
-            if os.path.exists(edits_file):
-                with open(edits_file, 'r', encoding='utf-8') as f:
-                    existing_content = f.read()
-            
-            # Append new edit entry
             edit_entry = f"""
 COMPLAINT EDIT - {timestamp}
 {'=' * 50}
 Original file: {os.path.basename(complaint_path)}
-Backup file: complaint_original.html
+Journal: {JOURNAL_FILENAME} (version {journal_entry['version']})
 User: {user_id}
 Change summary: {change_summary}
 
 Last edited: {timestamp}
 
 """
-            
-            # Write updated edits file
-            with open(edits_file, 'w', encoding='utf-8') as f:
-                f.write(existing_content + edit_entry)
+            with open(edits_file, 'a', encoding='utf-8') as f:
+                f.write(edit_entry)
             
             logger.info(f"Updated delta tracking file: {edits_file}")
             
@@ -2445,17 +2707,51 @@ Last edited: {timestamp}
         
         return {
             "success": True,
-            "files_updated": [complaint_path, edits_file],
-            "backup_created": backup_path if backup_created else None,
+            "files_updated": [complaint_path, journal_file, edits_file],
+            "backup_created": journal_file if journal_entry['journal_created'] else None,
+            "version": journal_entry['version'],
             "timestamp": timestamp
         }
         
+    except HTTPException:
+        raise
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON")
     except Exception as e:
         logger.error(f"Error saving complaint edits: {str(e)}")
         raise HTTPException(status_code=500, detail="Error saving complaint edits")
 
+@app.get("/api/cases/{case_id}/complaint-versions")
+async def list_complaint_versions(case_id: str):
+    """List journaled complaint versions (version 0 is the generated complaint)"""
+    case = data_manager.get_case_by_id(case_id)
+    if not case:
+        raise HTTPException(status_code=404, detail="Case not found")
+    
+    case_dir = os.path.join(OUTPUT_DIR, case_id)
+    return {
+        "case_id": case_id,
+        "edit_count": edit_journal.edit_count(case_dir),
+        "versions": edit_journal.versions(case_dir)
+    }
+
+@app.get("/api/cases/{case_id}/complaint-versions/{version}")
+async def get_complaint_version(case_id: str, version: int):
+    """Reconstruct the complaint HTML as it was at a journaled version"""
+    case = data_manager.get_case_by_id(case_id)
+    if not case:
+        raise HTTPException(status_code=404, detail="Case not found")
+    
+    case_dir = os.path.join(OUTPUT_DIR, case_id)
+    try:
+        html_content = edit_journal.reconstruct(case_dir, version)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Complaint version {version} not found")
+    except ValueError as e:
+        logger.error(f"Error reconstructing complaint version {version} for {case_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Complaint version is corrupted")
+    return HTMLResponse(content=html_content)
+
 @app.get("/api/cases/{case_id}/packet-data")
 async def get_legal_packet_data(case_id: str):
     """Get comprehensive legal packet data including source files, generated documents, and processing metadata"""
@@ -2476,7 +2772,8 @@ async def get_legal_packet_data(case_id: str):
         source_dir = os.path.join(CASE_DIRECTORY, case_id)
         
         # Collect generated documents
-        if os.path.exists(case_dir):
+        outputs = snapshot(case_dir)
+        if outputs.exists:
             # Check for complaint documents
             complaint_dir = os.path.join(case_dir, f"complaint_{case_id}.html")
             if os.path.exists(complaint_dir):
@@ -2487,42 +2784,34 @@ async def get_legal_packet_data(case_id: str):
             # Check for summons documents in summons subdirectory
             summons_dir = os.path.join(case_dir, "summons")
             if os.path.exists(summons_dir):
-                summons_pattern = os.path.join(summons_dir, "summons_*.html")
-                summons_files = glob.glob(summons_pattern)
-                # Sort files to ensure consistent ordering (same as summons page)
-                summons_files.sort()
+                # Sorted by name to ensure consistent ordering (same as summons page)
+                summons_files = snapshot(summons_dir).files(
+                    lambda name: name.startswith("summons_") and name.endswith(".html"))
                 for index, summons_file in enumerate(summons_files):
-                    if os.path.isfile(summons_file):
-                        summons_info = get_file_info(summons_file, "summons")
-                        if summons_info:
-                            # Use clean URL pattern matching the summons page: /summons/{case_id}/{index}.html
-                            summons_info["view_url"] = f"/summons/{case_id}/{index}.html"
-                            packet_data["generated_documents"].append(summons_info)
+                    summons_info = get_file_info(summons_file.path, "summons", entry=summons_file)
+                    if summons_info:
+                        # Use clean URL pattern matching the summons page: /summons/{case_id}/{index}.html
+                        summons_info["view_url"] = f"/summons/{case_id}/{index}.html"
+                        packet_data["generated_documents"].append(summons_info)
             
             # Check for hydrated JSON files
-            json_pattern = os.path.join(case_dir, "hydrated_FCRA_*.json")
-            json_files = glob.glob(json_pattern)
+            json_files = outputs.files(lambda name: name.startswith("hydrated_FCRA_") and name.endswith(".json"))
             for json_file in json_files:
-                if os.path.isfile(json_file):
-                    json_info = get_file_info(json_file, "hydrated_json")
-                    if json_info:
-                        # Add proper view URL for new static serving endpoint
-                        json_info["view_url"] = f"/view-file/{case_id}/generated/{os.path.basename(json_file)}"
-                        packet_data["generated_documents"].append(json_info)
-        
-        # Collect source documents
-        if os.path.exists(source_dir):
-            for file_name in os.listdir(source_dir):
-                file_path = os.path.join(source_dir, file_name)
-                # Hide system files and processing manifest from user view
-                if (os.path.isfile(file_path) and 
-                    not file_name.startswith('.') and 
-                    file_name != 'processing_manifest.txt'):
-                    source_info = get_file_info(file_path, "source", include_sync_info=True)
-                    if source_info:
-                        # Add proper view URL for new static serving endpoint
-                        source_info["view_url"] = f"/view-file/{case_id}/source/{file_name}"
-                        packet_data["source_documents"].append(source_info)
+                json_info = get_file_info(json_file.path, "hydrated_json", entry=json_file)
+                if json_info:
+                    # Add proper view URL for new static serving endpoint
+                    json_info["view_url"] = f"/view-file/{case_id}/generated/{json_file.name}"
+                    packet_data["generated_documents"].append(json_info)
+        
+        # Collect source documents, hiding system files and processing manifest from user view
+        source_files = snapshot(source_dir).files(
+            lambda name: not name.startswith('.') and name != 'processing_manifest.txt')
+        for source_file in source_files:
+            source_info = get_file_info(source_file.path, "source", include_sync_info=True, entry=source_file)
+            if source_info:
+                # Add proper view URL for new static serving endpoint
+                source_info["view_url"] = f"/view-file/{case_id}/source/{source_file.name}"
+                packet_data["source_documents"].append(source_info)
         
         # Collect processing data
         packet_data["processing_data"] = {
@@ -2551,7 +2840,7 @@ def get_document_info(doc_dir: str, doc_type: str, case_id: str):
         if not os.path.exists(processed_dir):
             return None
             
-        date_dirs = [d for d in os.listdir(processed_dir) if os.path.isdir(os.path.join(processed_dir, d))]
+        date_dirs = [d.name for d in snapshot(processed_dir, stat_files=False).dirs()]
         if not date_dirs:
             return None
             
@@ -2559,7 +2848,8 @@ def get_document_info(doc_dir: str, doc_type: str, case_id: str):
         latest_dir = os.path.join(processed_dir, latest_date)
         
         # Find the latest version of the document
-        doc_files = [f for f in os.listdir(latest_dir) if f.startswith(doc_type)]
+        listing = snapshot(latest_dir)
+        doc_files = [entry.name for entry in listing if entry.name.startswith(doc_type)]
         if not doc_files:
             return None
             
@@ -2576,18 +2866,12 @@ def get_document_info(doc_dir: str, doc_type: str, case_id: str):
             return 0
         
         latest_doc = sorted(doc_files, key=version_key, reverse=True)[0]
-        doc_path = os.path.join(latest_dir, latest_doc)
+        doc_entry = listing.get(latest_doc)
+        doc_path = doc_entry.path
         
-        # Get file stats
-        file_stat = os.stat(doc_path)
-        
-        # Check for edits
-        case_dir = os.path.dirname(os.path.dirname(doc_dir))
-        edits_file = os.path.join(case_dir, "atty_notes_edits.txt")
-        edit_count = 0
-        if os.path.exists(edits_file):
-            with open(edits_file, 'r', encoding='utf-8') as f:
-                edit_count = f.read().count("COMPLAINT EDIT -")
+        # Check for edits (cached journal index, no payload reads)
+        case_dir = os.path.dirname(doc_dir)
+        edit_count = edit_journal.edit_count(case_dir) if doc_type == "complaint" else 0
         
         # Clean up display name - remove .html extension for complaints
         display_name = f"{doc_type}_{case_id}.html"
@@ -2598,9 +2882,9 @@ def get_document_info(doc_dir: str, doc_type: str, case_id: str):
             "name": display_name,
             "type": doc_type,
             "path": f"/complaint/{case_id}" if doc_type == "complaint" else doc_path,
-            "size": file_stat.st_size,
-            "created_at": datetime.fromtimestamp(file_stat.st_ctime).isoformat(),
-            "modified_at": datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
+            "size": doc_entry.size,
+            "created_at": doc_entry.created_at.isoformat(),
+            "modified_at": doc_entry.modified_at.isoformat(),
             "edit_count": edit_count if doc_type == "complaint" else 0
         }
         
@@ -2608,12 +2892,16 @@ def get_document_info(doc_dir: str, doc_type: str, case_id: str):
         logger.error(f"Error getting document info for {doc_dir}: {str(e)}")
         return None
 
-def get_file_info(file_path: str, file_type: str, include_sync_info: bool = False):
-    """Get information about a file"""
+def get_file_info(file_path: str, file_type: str, include_sync_info: bool = False,
+                  entry: Optional[EntryInfo] = None):
+    """Get information about a file; pass its snapshot ``entry`` to skip the stat"""
     import urllib.parse
     try:
-        file_stat = os.stat(file_path)
-        file_name = os.path.basename(file_path)
+        if entry is None:
+            stat = os.stat(file_path)
+            entry = EntryInfo(os.path.basename(file_path), file_path, False, True,
+                              stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino)
+        file_name = entry.name
         
         # Determine file type from extension if not provided
         if file_type == "source":
@@ -2639,15 +2927,15 @@ def get_file_info(file_path: str, file_type: str, include_sync_info: bool = Fals
             "name": display_name,
             "type": file_type,
             "path": file_path,
-            "size": file_stat.st_size,
-            "modified_at": datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
+            "size": entry.size,
+            "modified_at": entry.modified_at.isoformat(),
         }
         
         if include_sync_info:
             # For source documents, created time represents sync time
-            info["synced_at"] = datetime.fromtimestamp(file_stat.st_ctime).isoformat()
+            info["synced_at"] = entry.created_at.isoformat()
         else:
-            info["created_at"] = datetime.fromtimestamp(file_stat.st_ctime).isoformat()
+            info["created_at"] = entry.created_at.isoformat()
         
         return info
         
@@ -2687,13 +2975,10 @@ async def download_legal_packet(case_id: str):
             source_dir = os.path.join(CASE_DIRECTORY, case_id)
             
             # Add source documents (exclude system files)
-            if os.path.exists(source_dir):
-                for file_name in os.listdir(source_dir):
-                    file_path = os.path.join(source_dir, file_name)
-                    if (os.path.isfile(file_path) and 
-                        not file_name.startswith('.') and 
-                        file_name != 'processing_manifest.txt'):
-                        zip_file.write(file_path, f"source_documents/{file_name}")
+            source_files = snapshot(source_dir, stat_files=False).files(
+                lambda name: not name.startswith('.') and name != 'processing_manifest.txt')
+            for source_file in source_files:
+                zip_file.write(source_file.path, f"source_documents/{source_file.name}")
             
             # FIRST: Add standardized PDF from case folder (NEW: standardized approach)
             standardized_pdf_path = os.path.join(source_dir, f"{case_id}_complaint.pdf")
@@ -2701,20 +2986,15 @@ async def download_legal_packet(case_id: str):
                 zip_file.write(standardized_pdf_path, f"generated_documents/{case_id}_complaint.pdf")
             
             # Add generated documents from case directory
-            if os.path.exists(case_dir):
-                for root, dirs, files in os.walk(case_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        # Calculate relative path from case_dir
-                        rel_path = os.path.relpath(file_path, case_dir)
-                        zip_file.write(file_path, f"generated_documents/{rel_path}")
+            for rel_path, generated_file in walk_files(case_dir):
+                zip_file.write(generated_file.path, f"generated_documents/{rel_path}")
             
             # FALLBACK: Add PDFs from complex output directory structure
             # First check the Dashboard output directory (where new PDFs are generated)
             dashboard_complaint_dir = os.path.join(case_dir, f"complaint_{case_id}.html", "processed")
             if os.path.exists(dashboard_complaint_dir):
                 # Find the most recent date directory
-                date_dirs = [d for d in os.listdir(dashboard_complaint_dir) if os.path.isdir(os.path.join(dashboard_complaint_dir, d))]
+                date_dirs = [d.name for d in snapshot(dashboard_complaint_dir, stat_files=False).dirs()]
                 if date_dirs:
                     latest_date = sorted(date_dirs, reverse=True)[0]
                     complaint_folder = os.path.join(dashboard_complaint_dir, latest_date)
@@ -2734,7 +3014,7 @@ async def download_legal_packet(case_id: str):
             monkey_output_dir = os.path.join(os.path.dirname(__file__), "..", "monkey", "outputs", "monkey", "processed")
             if os.path.exists(monkey_output_dir):
                 # Find the most recent date directory
-                date_dirs = [d for d in os.listdir(monkey_output_dir) if os.path.isdir(os.path.join(monkey_output_dir, d))]
+                date_dirs = [d.name for d in snapshot(monkey_output_dir, stat_files=False).dirs()]
                 if date_dirs:
                     latest_date = sorted(date_dirs, reverse=True)[0]
                     complaint_folder = os.path.join(monkey_output_dir, latest_date)
@@ -2774,12 +3054,8 @@ async def sync_packet_to_icloud(case_id: str):
     
     try:
         # Mock sync implementation - in real version this would sync to iCloud
-        files_synced = 0
         case_dir = os.path.join(OUTPUT_DIR, case_id)
-        
-        if os.path.exists(case_dir):
-            for root, dirs, files in os.walk(case_dir):
-                files_synced += len(files)
+        files_synced = sum(1 for _ in walk_files(case_dir))
         
         logger.info(f"Mock sync to iCloud for case {case_id}: {files_synced} files")
         
@@ -0,0 +1,340 @@
+# dashboard/manifest_store.py
+"""
+Processing manifest storage.
+
+The manifest (``processing_manifest.txt``) lives in each case folder:
+
+    CASE_STATUS|status|timestamp|null|null|null|null      <- fixed-width line 1
+    filename|status|start_time|end_time|file_size|processing_time_ms|error_message
+    ...
+
+Line 1 is padded to a fixed width so status flips overwrite it in place
+instead of rewriting the file. File entries are append-only; field values
+are escaped so multi-line errors or stray ``|`` characters can never split a
+record. Writers take an exclusive ``flock`` on a sidecar lock file, full
+rewrites (legacy upgrade, compaction) go through temp file + rename, and a
+parsed index is kept in memory per case and advanced incrementally from the
+last byte offset read.
+"""
+
+import os
+import fcntl
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .metrics import CACHE_REQUESTS
+
+MANIFEST_FILENAME = 'processing_manifest.txt'
+LOCK_FILENAME = '.processing_manifest.lock'
+
+STATUS_PREFIX = b'CASE_STATUS|'
+STATUS_LINE_WIDTH = 96  # bytes, including the trailing newline
+
+# Compact once the log holds this many superseded entries
+COMPACTION_THRESHOLD = 256
+
+_ESCAPES = [('\\', '\\\\'), ('\r', '\\r'), ('\n', '\\n'), ('|', '\\x7c')]
+
+
+def _escape(value) -> str:
+    if value is None:
+        return 'null'
+    text = str(value)
+    for raw, escaped in _ESCAPES:
+        text = text.replace(raw, escaped)
+    return text
+
+
+def _unescape(text: str) -> Optional[str]:
+    if text == 'null':
+        return None
+    if '\\' not in text:
+        return text
+    out = []
+    i = 0
+    while i < len(text):
+        if text.startswith('\\x7c', i):
+            out.append('|')
+            i += 4
+        elif text.startswith('\\n', i):
+            out.append('\n')
+            i += 2
+        elif text.startswith('\\r', i):
+            out.append('\r')
+            i += 2
+        elif text.startswith('\\\\', i):
+            out.append('\\')
+            i += 2
+        else:
+            out.append(text[i])
+            i += 1
+    return ''.join(out)
+
+
+@dataclass
+class ManifestEntry:
+    """Latest processing record for a single file."""
+    filename: str
+    status: str
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    file_size: Optional[int] = None
+    processing_time_ms: Optional[int] = None
+    error_message: Optional[str] = None
+
+    def to_line(self) -> bytes:
+        fields = [self.filename, self.status, self.start_time, self.end_time,
+                  self.file_size, self.processing_time_ms, self.error_message]
+        return ('|'.join(_escape(value) for value in fields) + '\n').encode('utf-8')
+
+    @classmethod
+    def from_line(cls, line: str) -> Optional['ManifestEntry']:
+        parts = line.rstrip('\r\n').split('|')
+        if len(parts) < 2 or not parts[0]:
+            return None
+        parts += ['null'] * (7 - len(parts))
+        values = [_unescape(part) for part in parts[:7]]
+
+        def as_int(value):
+            try:
+                return int(value) if value is not None else None
+            except ValueError:
+                return None
+
+        return cls(
+            filename=values[0],
+            status=values[1] or '',
+            start_time=values[2],
+            end_time=values[3],
+            file_size=as_int(values[4]),
+            processing_time_ms=as_int(values[5]),
+            error_message=values[6]
+        )
+
+
+@dataclass
+class ManifestIndex:
+    """Parsed view of one case manifest."""
+    case_status: Optional[str] = None
+    status_timestamp: Optional[str] = None
+    files: Dict[str, ManifestEntry] = field(default_factory=dict)
+    entry_count: int = 0
+    # Bookkeeping for incremental reads
+    offset: int = 0
+    inode: Optional[int] = None
+    mtime_ns: int = 0
+    status_line_width: int = 0
+
+    @property
+    def stale_entries(self) -> int:
+        return self.entry_count - len(self.files)
+
+
+class ManifestStore:
+    """Locked, append-only access to case processing manifests with a cached index."""
+
+    def __init__(self):
+        self._indexes: Dict[str, ManifestIndex] = {}
+        self._index_lock = threading.Lock()
+        self._path_locks: Dict[str, threading.Lock] = {}
+
+    # --- Paths and locking ---
+
+    @staticmethod
+    def manifest_path(case_path: str) -> str:
+        return os.path.join(case_path, MANIFEST_FILENAME)
+
+    def _thread_lock(self, case_path: str) -> threading.Lock:
+        with self._index_lock:
+            return self._path_locks.setdefault(os.path.abspath(case_path), threading.Lock())
+
+    @contextmanager
+    def _locked(self, case_path: str):
+        """Serialize writers across threads (in-process) and processes (flock)."""
+        with self._thread_lock(case_path):
+            lock_fd = os.open(os.path.join(case_path, LOCK_FILENAME), os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                fcntl.flock(lock_fd, fcntl.LOCK_UN)
+                os.close(lock_fd)
+
+    # --- Reading ---
+
+    def read(self, case_path: str) -> ManifestIndex:
+        """Return the parsed manifest, only reading bytes appended since the last call."""
+        manifest_path = self.manifest_path(case_path)
+        key = os.path.abspath(case_path)
+        try:
+            stat = os.stat(manifest_path)
+        except FileNotFoundError:
+            with self._index_lock:
+                self._indexes.pop(key, None)
+            return ManifestIndex()
+
+        with self._index_lock:
+            index = self._indexes.get(key)
+
+        if index is None or index.inode != stat.st_ino or stat.st_size < index.offset:
+            index = self._parse(manifest_path, ManifestIndex(inode=stat.st_ino))
+        elif stat.st_size != index.offset or stat.st_mtime_ns != index.mtime_ns:
+            # Appended entries and/or an in-place status flip
+            index = self._parse(manifest_path, index)
+        else:
+            CACHE_REQUESTS.inc(cache='manifest_index', result='hit')
+            return index
+
+        CACHE_REQUESTS.inc(cache='manifest_index', result='miss')
+        index.mtime_ns = stat.st_mtime_ns
+        with self._index_lock:
+            self._indexes[key] = index
+        return index
+
+    def read_case_status(self, case_path: str) -> Optional[str]:
+        return self.read(case_path).case_status
+
+    @staticmethod
+    def _parse_status_line(line: bytes):
+        if not line.startswith(STATUS_PREFIX):
+            return None, None
+        parts = line.decode('utf-8', errors='replace').strip().split('|')
+        status = _unescape(parts[1].strip()) if len(parts) >= 2 else None
+        timestamp = parts[2].strip() if len(parts) >= 3 and parts[2] != 'null' else None
+        return status or None, timestamp
+
+    def _parse(self, manifest_path: str, index: ManifestIndex) -> ManifestIndex:
+        with open(manifest_path, 'rb') as f:
+            first_line = f.readline()
+            index.case_status, index.status_timestamp = self._parse_status_line(first_line)
+            index.status_line_width = len(first_line) if first_line.startswith(STATUS_PREFIX) else 0
+
+            if index.offset == 0:
+                # Full parse; a legacy file without a status line starts with an entry
+                index.offset = index.status_line_width
+            f.seek(index.offset)
+
+            for raw_line in f:
+                if not raw_line.endswith(b'\n'):
+                    # Partial write in progress; pick it up on the next read
+                    break
+                index.offset += len(raw_line)
+                entry = ManifestEntry.from_line(raw_line.decode('utf-8', errors='replace'))
+                if entry:
+                    index.files[entry.filename] = entry
+                    index.entry_count += 1
+        return index
+
+    # --- Writing ---
+
+    def update_case_status(self, case_path: str, status: str):
+        """Overwrite the fixed-width status line in place."""
+        timestamp = datetime.now().isoformat()
+        line = self._format_status_line(status, timestamp)
+        manifest_path = self.manifest_path(case_path)
+
+        with self._locked(case_path):
+            index = self.read(case_path)
+            if not os.path.exists(manifest_path):
+                self._atomic_write(case_path, [line])
+            elif index.status_line_width == STATUS_LINE_WIDTH:
+                fd = os.open(manifest_path, os.O_WRONLY)
+                try:
+                    os.pwrite(fd, line, 0)
+                finally:
+                    os.close(fd)
+            else:
+                # Legacy or missing status line: rewrite once in the fixed-width layout
+                entries = [entry.to_line() for entry in self._read_all_entries(manifest_path)]
+                self._atomic_write(case_path, [line] + entries)
+
+            self.read(case_path)
+
+    def append_entry(self, case_path: str, filename: str, status: str, start_time: str = None,
+                     end_time: str = None, file_size: int = None, processing_time: int = None,
+                     error_message: str = None):
+        self.append_entries(case_path, [ManifestEntry(
+            filename=filename, status=status, start_time=start_time, end_time=end_time,
+            file_size=file_size, processing_time_ms=processing_time, error_message=error_message
+        )])
+
+    def append_entries(self, case_path: str, entries: List[ManifestEntry]):
+        """Append file entries under one lock and one write."""
+        if not entries:
+            return
+        manifest_path = self.manifest_path(case_path)
+
+        with self._locked(case_path):
+            if not os.path.exists(manifest_path):
+                self._atomic_write(case_path, [self._format_status_line('NEW', datetime.now().isoformat())])
+
+            payload = b''.join(entry.to_line() for entry in entries)
+            fd = os.open(manifest_path, os.O_WRONLY | os.O_APPEND)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+
+            index = self.read(case_path)
+            if index.stale_entries >= COMPACTION_THRESHOLD:
+                self._compact_locked(case_path, index)
+
+    def clear(self, case_path: str):
+        with self._locked(case_path):
+            manifest_path = self.manifest_path(case_path)
+            if os.path.exists(manifest_path):
+                os.remove(manifest_path)
+            with self._index_lock:
+                self._indexes.pop(os.path.abspath(case_path), None)
+
+    def compact(self, case_path: str):
+        """Drop superseded entries, keeping the latest record per file."""
+        with self._locked(case_path):
+            index = self.read(case_path)
+            if index.stale_entries:
+                self._compact_locked(case_path, index)
+
+    def _compact_locked(self, case_path: str, index: ManifestIndex):
+        status_line = self._format_status_line(index.case_status or 'NEW',
+                                               index.status_timestamp or datetime.now().isoformat())
+        self._atomic_write(case_path, [status_line] + [entry.to_line() for entry in index.files.values()])
+        self.read(case_path)
+
+    def _read_all_entries(self, manifest_path: str) -> List[ManifestEntry]:
+        entries = []
+        with open(manifest_path, 'rb') as f:
+            for raw_line in f:
+                if raw_line.startswith(STATUS_PREFIX):
+                    continue
+                entry = ManifestEntry.from_line(raw_line.decode('utf-8', errors='replace'))
+                if entry:
+                    entries.append(entry)
+        return entries
+
+    def _atomic_write(self, case_path: str, lines: List[bytes]):
+        fd, temp_path = tempfile.mkstemp(prefix='.manifest_', dir=case_path)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.manifest_path(case_path))
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def _format_status_line(status: str, timestamp: str) -> bytes:
+        line = f"CASE_STATUS|{_escape(status)}|{timestamp}|null|null|null|null".encode('utf-8')
+        if len(line) > STATUS_LINE_WIDTH - 1:
+            raise ValueError(f"Status line too long: {status}")
+        return line.ljust(STATUS_LINE_WIDTH - 1) + b'\n'
+
+
+# Shared instance used by the service runner and data manager
+manifest_store = ManifestStore()
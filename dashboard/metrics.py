@@ -0,0 +1,84 @@
+# dashboard/metrics.py
+"""
+Prometheus-style metrics for the dashboard.
+
+The registry itself is ``satori_common.metrics``, shared with Tiger and
+Monkey. They run as short-lived subprocesses, so each run drops a JSON
+snapshot in METRICS_SPOOL_DIR (passed via SATORI_METRICS_DIR) and the
+/metrics endpoint folds any pending snapshots into this registry before
+rendering.
+"""
+
+import os
+import threading
+import logging
+from typing import Dict
+
+from satori_schema import serialization
+from satori_common.metrics import METRICS_DIR_ENV, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+# Global registry for the dashboard process
+registry = MetricsRegistry('dashboard')
+
+METRICS_SPOOL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'metrics_spool')
+
+WEBSOCKET_CONNECTIONS = registry.gauge(
+    'dashboard_websocket_connections', 'Open WebSocket connections')
+WEBSOCKET_BROADCAST_SECONDS = registry.histogram(
+    'dashboard_websocket_broadcast_seconds', 'Time to fan one event out to all WebSocket clients')
+SCAN_SECONDS = registry.histogram(
+    'dashboard_case_scan_seconds', 'DataManager.scan_cases duration')
+CASES_TOTAL = registry.gauge(
+    'dashboard_cases', 'Cases known to the data manager')
+CACHE_REQUESTS = registry.counter(
+    'dashboard_cache_requests_total', 'Cache lookups by cache and result', ('cache', 'result'))
+PROCESSING_IN_FLIGHT = registry.gauge(
+    'dashboard_cases_processing', 'Cases currently running through Tiger/Monkey')
+SUBPROCESS_SECONDS = registry.histogram(
+    'dashboard_subprocess_seconds', 'Wall time of Tiger/Monkey subprocess runs', ('service', 'command'))
+
+
+def subprocess_env() -> Dict[str, str]:
+    """Environment for Tiger/Monkey subprocesses so they spool their metrics here"""
+    return {**os.environ, METRICS_DIR_ENV: METRICS_SPOOL_DIR}
+
+
+_collect_lock = threading.Lock()
+
+
+def collect_snapshots(directory: str = METRICS_SPOOL_DIR) -> int:
+    """Merge and remove subprocess snapshots; returns the number consumed"""
+    with _collect_lock:
+        return _collect_snapshots_locked(directory)
+
+
+def _collect_snapshots_locked(directory: str) -> int:
+    try:
+        names = [name for name in os.listdir(directory)
+                 if name.endswith('.json') and not name.startswith('.')]
+    except FileNotFoundError:
+        return 0
+
+    consumed = 0
+    for name in sorted(names):
+        path = os.path.join(directory, name)
+        try:
+            snapshot = serialization.load(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable metrics snapshot {name}: {e}")
+        else:
+            registry.merge_snapshot(snapshot)
+            consumed += 1
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    return consumed
+
+
+def render_latest() -> str:
+    collect_snapshots()
+    return registry.render()
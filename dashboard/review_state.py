@@ -0,0 +1,421 @@
+# dashboard/review_state.py
+"""
+In-memory review state for hydrated JSON files.
+
+Review clicks (legal claim and damage checkboxes) arrive as JSON-Patch style
+operations (RFC 6902 ``add``/``replace``/``remove``/``test``) and are applied
+to a cached copy of the case's hydrated JSON under a per-case lock. Every
+applied patch bumps a version number that clients can send back for
+optimistic concurrency. The file itself is written behind: a debounce timer
+coalesces bursts of patches into one atomic temp-file + rename, with a
+maximum delay so a steady stream of clicks still reaches disk. The encoded
+JSON is cached per version, so repeated reads and the write-behind share
+one serialization.
+
+With several dashboard workers (``shared_backend_enabled``) there is no
+write-behind: each worker would hold its own dirty copy and version. Instead
+every patch reloads, applies and writes through under an ``flock`` on a lock
+file next to the hydrated JSON, and the version lives on disk in a sidecar
+(``.<name>.review-version``) so all workers report the same number.
+"""
+
+import os
+import copy
+import time
+import fcntl
+import tempfile
+import threading
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from satori_schema import serialization
+
+from .shared_state import shared_backend_enabled
+
+logger = logging.getLogger(__name__)
+
+DEBOUNCE_SECONDS = 0.5
+MAX_WRITE_DELAY_SECONDS = 5.0
+
+
+class PatchError(ValueError):
+    """A patch operation could not be applied."""
+
+
+class VersionConflict(Exception):
+    """The client's version does not match the current document version."""
+
+    def __init__(self, expected: int, current: int):
+        super().__init__(f"Version conflict: expected {expected}, current {current}")
+        self.expected = expected
+        self.current = current
+
+
+# --- JSON Pointer / JSON Patch ---
+
+def _parse_pointer(path: str) -> List[str]:
+    if path == '':
+        return []
+    if not path.startswith('/'):
+        raise PatchError(f"Invalid JSON pointer: {path!r}")
+    return [token.replace('~1', '/').replace('~0', '~') for token in path[1:].split('/')]
+
+
+def escape_pointer(token: str) -> str:
+    """Escape one JSON Pointer reference token."""
+    return token.replace('~', '~0').replace('/', '~1')
+
+
+def _list_index(container: list, token: str, allow_end: bool = False) -> int:
+    if token == '-' and allow_end:
+        return len(container)
+    if not token.isdigit() or (token != '0' and token.startswith('0')):
+        raise PatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise PatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _resolve_parent(document: Any, tokens: List[str]) -> Tuple[Any, str]:
+    if not tokens:
+        raise PatchError("Operations on the document root are not supported")
+    target = document
+    for token in tokens[:-1]:
+        if isinstance(target, dict):
+            if token not in target:
+                raise PatchError(f"Path not found: /{'/'.join(tokens)}")
+            target = target[token]
+        elif isinstance(target, list):
+            target = target[_list_index(target, token)]
+        else:
+            raise PatchError(f"Path not found: /{'/'.join(tokens)}")
+    return target, tokens[-1]
+
+
+def _apply_operation(document: Any, operation: Dict[str, Any]):
+    """Apply one operation in place and return a callable that undoes it."""
+    op = operation.get('op')
+    if 'path' not in operation:
+        raise PatchError("Patch operation is missing 'path'")
+    parent, token = _resolve_parent(document, _parse_pointer(operation['path']))
+
+    if op == 'test':
+        if isinstance(parent, dict):
+            current = parent.get(token, PatchError)
+        else:
+            current = parent[_list_index(parent, token)]
+        if current != operation.get('value'):
+            raise PatchError(f"Test failed at {operation['path']}")
+        return lambda: None
+
+    if op in ('add', 'replace'):
+        if 'value' not in operation:
+            raise PatchError(f"'{op}' operation is missing 'value'")
+        value = operation['value']
+        if isinstance(parent, dict):
+            if op == 'replace' and token not in parent:
+                raise PatchError(f"Path not found: {operation['path']}")
+            had_value = token in parent
+            previous = parent.get(token)
+            parent[token] = value
+
+            def undo():
+                if had_value:
+                    parent[token] = previous
+                else:
+                    parent.pop(token, None)
+            return undo
+        if isinstance(parent, list):
+            index = _list_index(parent, token, allow_end=(op == 'add'))
+            if op == 'add':
+                parent.insert(index, value)
+                return lambda: parent.pop(index)
+            previous = parent[index]
+            parent[index] = value
+
+            def undo():
+                parent[index] = previous
+            return undo
+        raise PatchError(f"Path not found: {operation['path']}")
+
+    if op == 'remove':
+        if isinstance(parent, dict):
+            if token not in parent:
+                raise PatchError(f"Path not found: {operation['path']}")
+            previous = parent.pop(token)
+
+            def undo():
+                parent[token] = previous
+            return undo
+        if isinstance(parent, list):
+            index = _list_index(parent, token)
+            previous = parent.pop(index)
+            return lambda: parent.insert(index, previous)
+        raise PatchError(f"Path not found: {operation['path']}")
+
+    raise PatchError(f"Unsupported patch operation: {op!r}")
+
+
+def apply_patch(document: Any, operations: List[Dict[str, Any]]):
+    """Apply operations in place; all of them or none (earlier ones are rolled back)."""
+    undo_stack = []
+    try:
+        for operation in operations:
+            undo_stack.append(_apply_operation(document, operation))
+    except (PatchError, KeyError, TypeError, IndexError) as e:
+        for undo in reversed(undo_stack):
+            undo()
+        if isinstance(e, PatchError):
+            raise
+        raise PatchError(str(e)) from e
+
+
+# --- Review state store ---
+
+@dataclass
+class _ReviewDocument:
+    path: str
+    data: Any
+    version: int = 0
+    mtime_ns: int = 0
+    dirty_since: Optional[float] = None
+    lock: threading.RLock = field(default_factory=threading.RLock)
+    timer: Optional[threading.Timer] = None
+    encoded: Optional[Tuple[int, bytes]] = None  # (version, JSON bytes)
+
+
+class ReviewStateStore:
+    """Per-case cached hydrated JSON with patch application and write-behind."""
+
+    def __init__(self, debounce_seconds: float = DEBOUNCE_SECONDS,
+                 max_write_delay_seconds: float = MAX_WRITE_DELAY_SECONDS,
+                 shared: bool = False):
+        self.debounce_seconds = debounce_seconds
+        self.max_write_delay_seconds = max_write_delay_seconds
+        self.shared = shared
+        self._documents: Dict[str, _ReviewDocument] = {}
+        self._documents_lock = threading.Lock()
+
+    def _document(self, path: str, refresh: bool = True) -> _ReviewDocument:
+        key = os.path.abspath(path)
+        with self._documents_lock:
+            document = self._documents.get(key)
+            if document is None:
+                document = self._documents[key] = _ReviewDocument(path=key, data=None)
+        if refresh:
+            with document.lock:
+                if self.shared:
+                    with self._file_lock(document):
+                        self._refresh_shared(document)
+                else:
+                    self._refresh(document)
+        return document
+
+    # --- Shared (multi-worker) mode ---
+
+    @staticmethod
+    def _sidecar(document: _ReviewDocument, suffix: str) -> str:
+        directory, name = os.path.split(document.path)
+        return os.path.join(directory, f'.{name}.{suffix}')
+
+    @contextmanager
+    def _file_lock(self, document: _ReviewDocument):
+        """Exclusive lock shared by every worker touching this hydrated JSON."""
+        with open(self._sidecar(document, 'review-lock'), 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _disk_version(self, document: _ReviewDocument, mtime_ns: int) -> int:
+        """
+        Version recorded on disk. The sidecar holds ``<version> <mtime_ns>`` as of
+        the last dashboard write; a different file mtime means the JSON was
+        rewritten elsewhere (e.g. Tiger reprocessing), which counts as a new version.
+        """
+        try:
+            with open(self._sidecar(document, 'review-version')) as f:
+                version, written_mtime_ns = (int(value) for value in f.read().split())
+        except (OSError, ValueError):
+            return 0
+        return version if written_mtime_ns == mtime_ns else version + 1
+
+    def _refresh_shared(self, document: _ReviewDocument):
+        """Reload if another worker (or process) changed the file. Caller holds the file lock."""
+        mtime_ns = os.stat(document.path).st_mtime_ns
+        if document.data is None or mtime_ns != document.mtime_ns:
+            document.data = serialization.load(document.path)
+            document.encoded = None
+            document.mtime_ns = mtime_ns
+        document.version = self._disk_version(document, mtime_ns)
+
+    def _write_through(self, document: _ReviewDocument):
+        """Persist the document and its version now. Caller holds the file lock."""
+        try:
+            self._atomic_write(document.path, self._encoded(document))
+            document.mtime_ns = os.stat(document.path).st_mtime_ns
+            self._atomic_write(self._sidecar(document, 'review-version'),
+                               f'{document.version} {document.mtime_ns}'.encode())
+        except Exception:
+            # Reload from disk next time rather than serve an unsaved copy
+            document.data = None
+            raise
+
+    # --- Single-worker mode ---
+
+    def _refresh(self, document: _ReviewDocument):
+        """(Re)load from disk unless we hold unsaved changes."""
+        if document.dirty_since is not None:
+            return
+        mtime_ns = os.stat(document.path).st_mtime_ns
+        if document.data is not None and mtime_ns == document.mtime_ns:
+            return
+        document.data = serialization.load(document.path)
+        document.encoded = None
+        if document.mtime_ns:
+            # Rewritten outside the dashboard (e.g. Tiger reprocessing)
+            document.version += 1
+        document.mtime_ns = mtime_ns
+
+    @staticmethod
+    def _encoded(document: _ReviewDocument) -> bytes:
+        """Serialized document for its current version. Caller holds the lock."""
+        if document.encoded is None or document.encoded[0] != document.version:
+            document.encoded = (document.version, serialization.dumps_bytes(document.data))
+        return document.encoded[1]
+
+    def get_json(self, path: str) -> Tuple[bytes, int]:
+        """Return the current document as JSON bytes (no copy) and its version."""
+        document = self._document(path)
+        with document.lock:
+            return self._encoded(document), document.version
+
+    def get(self, path: str) -> Tuple[Any, int]:
+        """Return a deep copy of the current document and its version."""
+        document = self._document(path)
+        with document.lock:
+            return copy.deepcopy(document.data), document.version
+
+    def read(self, path: str, reader):
+        """Run ``reader(data)`` against the live document under its lock (no copy)."""
+        document = self._document(path)
+        with document.lock:
+            return reader(document.data), document.version
+
+    def version(self, path: str) -> int:
+        return self._document(path).version
+
+    def apply(self, path: str, operations: List[Dict[str, Any]], expected_version: Optional[int] = None) -> int:
+        """
+        Apply a patch and schedule a write-behind flush.
+
+        Raises:
+            VersionConflict: ``expected_version`` is stale
+            PatchError: an operation failed (nothing is applied)
+
+        Returns:
+            The new document version
+        """
+        return self.apply_from(path, lambda data: operations, expected_version)
+
+    def apply_from(self, path: str, build_operations, expected_version: Optional[int] = None) -> int:
+        """
+        Like ``apply``, but the patch is built by ``build_operations(data)`` under the
+        case lock, so selections can be validated against the current document.
+        """
+        if self.shared:
+            document = self._document(path, refresh=False)
+            with document.lock, self._file_lock(document):
+                self._refresh_shared(document)
+                if expected_version is not None and expected_version != document.version:
+                    raise VersionConflict(expected_version, document.version)
+                operations = build_operations(document.data)
+                if not operations:
+                    return document.version
+                apply_patch(document.data, operations)
+                document.version += 1
+                self._write_through(document)
+                return document.version
+
+        document = self._document(path)
+        with document.lock:
+            if expected_version is not None and expected_version != document.version:
+                raise VersionConflict(expected_version, document.version)
+            operations = build_operations(document.data)
+            if not operations:
+                return document.version
+            apply_patch(document.data, operations)
+            document.version += 1
+            if document.dirty_since is None:
+                document.dirty_since = time.monotonic()
+            self._schedule_flush(document)
+            return document.version
+
+    def _schedule_flush(self, document: _ReviewDocument):
+        if document.timer is not None:
+            document.timer.cancel()
+        overdue = time.monotonic() - document.dirty_since >= self.max_write_delay_seconds
+        delay = 0 if overdue else self.debounce_seconds
+        document.timer = threading.Timer(delay, self._flush_document, args=(document,))
+        document.timer.daemon = True
+        document.timer.start()
+
+    def _flush_document(self, document: _ReviewDocument):
+        with document.lock:
+            if document.dirty_since is None:
+                return
+            try:
+                self._atomic_write(document.path, self._encoded(document))
+            except Exception as e:
+                logger.error(f"Failed to persist review state for {document.path}: {e}")
+                return
+            document.mtime_ns = os.stat(document.path).st_mtime_ns
+            document.dirty_since = None
+            document.timer = None
+
+    def flush(self, path: str):
+        """Persist pending changes for one file now (e.g. before Monkey reads it)."""
+        key = os.path.abspath(path)
+        with self._documents_lock:
+            document = self._documents.get(key)
+        if document is not None:
+            with document.lock:
+                if document.timer is not None:
+                    document.timer.cancel()
+                self._flush_document(document)
+
+    def flush_all(self):
+        with self._documents_lock:
+            paths = list(self._documents)
+        for path in paths:
+            self.flush(path)
+
+    def discard(self, path: str):
+        """Forget a cached document, dropping unsaved changes (the file was regenerated)."""
+        key = os.path.abspath(path)
+        with self._documents_lock:
+            document = self._documents.pop(key, None)
+        if document is not None and document.timer is not None:
+            document.timer.cancel()
+
+    @staticmethod
+    def _atomic_write(path: str, data: bytes):
+        fd, temp_path = tempfile.mkstemp(prefix='.review_', suffix='.tmp', dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+# Shared instance used by the review endpoints
+review_state = ReviewStateStore(shared=shared_backend_enabled())
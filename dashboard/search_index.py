@@ -0,0 +1,521 @@
+# dashboard/search_index.py
+"""
+Cross-case search index.
+
+An SQLite database (``search_index/cases.sqlite3``) with two parts:
+
+* ``entries`` — an FTS5 table with one row per extracted document (from
+  Tiger's ``document_texts.jsonl``) and one per case summarising the
+  hydrated JSON (parties, claims, damages, narrative), ranked with bm25.
+* ``facets`` — structured ``(case_id, field, value)`` rows for plaintiff,
+  defendant, court, case number, claim citation, damage category and dates,
+  so "every case where Capital One is a defendant" is an index lookup. Dates
+  are stored as ISO ``YYYY-MM-DD`` so range filters compare correctly;
+  values that don't parse as a date are left out.
+
+A case is re-indexed in a single transaction when its hydrated JSON or
+document texts change (tracked by mtime and size); a status change alone only
+updates the case row. Reprocessing one case never touches the others, and
+queries never scan case folders.
+"""
+
+import os
+import re
+import json
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'search_index', 'cases.sqlite3')
+DOCUMENT_TEXTS_FILENAME = 'document_texts.jsonl'  # written by Tiger's hydrated-json command
+
+# Bumped when stored rows change meaning; an older index is cleared and rebuilt
+SCHEMA_VERSION = 2
+MAX_PAGE_SIZE = 100
+
+# bm25 column weights for (title, body)
+TITLE_WEIGHT = 5.0
+BODY_WEIGHT = 1.0
+
+FACET_FIELDS = ('plaintiff', 'defendant', 'defendant_type', 'court', 'case_number',
+                'claim', 'selected_claim', 'damage_category', 'date')
+
+# Filename patterns used to classify documents (mirrors Tiger's document types)
+_DOCUMENT_TYPES = [
+    ('denial_letter', ('denial', 'adverse_action', 'adverse-action')),
+    ('dispute_correspondence', ('dispute', 'challenge')),
+    ('notice_letter', ('notice', 'notification')),
+    ('application_document', ('application', 'request')),
+    ('legal_filing', ('summons', 'complaint')),
+    ('account_statement', ('statement', 'account')),
+    ('attorney_notes', ('atty_notes', 'attorney_notes')),
+    ('correspondence', ('correspondence', 'letter')),
+]
+
+_FTS_OPERATORS = {'AND', 'OR', 'NOT', 'NEAR'}
+
+# Date formats found in hydrated JSON (filing_details.date is "%B %d, %Y")
+_DATE_FORMATS = ('%m/%d/%Y', '%m-%d-%Y', '%m/%d/%y', '%B %d, %Y', '%b %d, %Y',
+                 '%B %d %Y', '%b %d %Y', '%d %B %Y', '%d %b %Y')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS cases (
+    case_id TEXT PRIMARY KEY,
+    case_name TEXT,
+    status TEXT,
+    source_signature TEXT,
+    indexed_at TEXT
+);
+CREATE TABLE IF NOT EXISTS facets (
+    case_id TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    value_norm TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS facets_lookup ON facets (field, value_norm);
+CREATE INDEX IF NOT EXISTS facets_case ON facets (case_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries USING fts5(
+    case_id UNINDEXED,
+    kind UNINDEXED,
+    source UNINDEXED,
+    doc_type UNINDEXED,
+    title,
+    body,
+    tokenize = 'porter unicode61'
+);
+"""
+
+
+def normalize_value(value: str) -> str:
+    """Lower-cased, punctuation-free form used for facet matching."""
+    return ' '.join(re.findall(r'\w+', value.lower()))
+
+
+def normalize_date(value: Any) -> Optional[str]:
+    """ISO ``YYYY-MM-DD`` form of a date string, or None if it doesn't parse."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).date().isoformat()
+    except ValueError:
+        pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def document_type(file_name: str) -> str:
+    name = file_name.lower()
+    for doc_type, terms in _DOCUMENT_TYPES:
+        if any(term in name for term in terms):
+            return doc_type
+    return 'unknown'
+
+
+def fts_query(text: str) -> Optional[str]:
+    """
+    Turn user input into a safe FTS5 query.
+
+    Quoted phrases are kept as phrases, other words become quoted terms
+    (implicitly AND-ed), and a trailing ``*`` keeps prefix matching. FTS5
+    operators and syntax typed by the user are dropped.
+    """
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', text):
+        if phrase:
+            tokens = re.findall(r'\w+', phrase)
+            if tokens:
+                terms.append('"' + ' '.join(tokens) + '"')
+        else:
+            tokens = [token for token in re.findall(r'\w+', word) if token not in _FTS_OPERATORS]
+            terms.extend(f'"{token}"' for token in tokens)
+            if tokens and word.endswith('*'):
+                terms[-1] += '*'
+    return ' '.join(terms) or None
+
+
+def _file_signature(path: Optional[str]) -> str:
+    if not path:
+        return '-'
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return '-'
+    return f'{stat.st_mtime_ns}:{stat.st_size}'
+
+
+def _strings(value: Any) -> Iterable[str]:
+    """Every string leaf of a JSON value."""
+    if isinstance(value, str):
+        if value.strip():
+            yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+
+
+def extract_facets(hydrated: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Structured ``(field, value)`` pairs from a hydrated JSON document."""
+    facets = []
+
+    def add(field: str, value: Any):
+        if isinstance(value, str) and value.strip():
+            facets.append((field, value.strip()))
+
+    def add_date(*values: Any):
+        # First value that parses; raw dates in mixed formats don't compare
+        for value in values:
+            date = normalize_date(value)
+            if date:
+                facets.append(('date', date))
+                return
+
+    parties = hydrated.get('parties') or {}
+    add('plaintiff', (parties.get('plaintiff') or {}).get('name'))
+    for defendant in parties.get('defendants') or []:
+        add('defendant', defendant.get('name'))
+        if defendant.get('short_name') and defendant.get('short_name') != defendant.get('name'):
+            add('defendant', defendant.get('short_name'))
+        add('defendant_type', defendant.get('type'))
+
+    case_information = hydrated.get('case_information') or {}
+    add('court', case_information.get('court_name'))
+    add('court', case_information.get('court_district'))
+    add('case_number', case_information.get('case_number'))
+
+    for cause in hydrated.get('causes_of_action') or []:
+        for claim in cause.get('legal_claims') or []:
+            add('claim', claim.get('citation'))
+            if claim.get('selected'):
+                add('selected_claim', claim.get('citation'))
+
+    damages = hydrated.get('damages') or {}
+    for damage in damages.get('structured_damages') or []:
+        add('damage_category', damage.get('category'))
+
+    timeline = hydrated.get('case_timeline') or {}
+    for key in ('discovery_date', 'dispute_date', 'filing_date'):
+        add_date(timeline.get(key))
+    for event in timeline.get('document_dates') or []:
+        if isinstance(event, dict):
+            add_date(event.get('parsed_date'), event.get('date'))
+    for key in ('date', 'signature_date'):
+        add_date((hydrated.get('filing_details') or {}).get(key))
+
+    # Same value from several places counts once
+    return list(dict.fromkeys(facets))
+
+
+def case_summary(hydrated: Dict[str, Any]) -> Tuple[str, str]:
+    """Title and body text for a case's own full-text row."""
+    parties = hydrated.get('parties') or {}
+    names = [(parties.get('plaintiff') or {}).get('name') or '']
+    names += [d.get('name') or '' for d in parties.get('defendants') or []]
+    title = ' '.join(name for name in names if name)
+
+    damages = hydrated.get('damages') or {}
+    sections = [
+        hydrated.get('case_information'),
+        hydrated.get('preliminary_statement'),
+        hydrated.get('factual_background'),
+        [cause.get('title') for cause in hydrated.get('causes_of_action') or []],
+        [claim.get('description') for cause in hydrated.get('causes_of_action') or []
+         for claim in cause.get('legal_claims') or [] if claim.get('selected')],
+        damages.get('structured_damages'),
+        (damages.get('actual_damages') or {}).get('specific_denials'),
+    ]
+    body = '\n'.join(text for section in sections for text in _strings(section))
+    return title, body
+
+
+def read_document_texts(path: str) -> List[Dict[str, Any]]:
+    """Records from a ``document_texts.jsonl`` file (missing file: none)."""
+    records = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        logger.warning(f"Skipping malformed line in {path}")
+    except FileNotFoundError:
+        pass
+    return records
+
+
+class SearchIndex:
+    """SQLite FTS5 index over all cases' extracted text and hydrated JSON."""
+
+    def __init__(self, path: str = INDEX_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(_SCHEMA)
+            row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None or row['value'] != str(SCHEMA_VERSION):
+                # Dropping the cases' source signatures makes the next sync re-index them
+                conn.execute('DELETE FROM cases')
+                conn.execute('DELETE FROM facets')
+                conn.execute('DELETE FROM entries')
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+                conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            conn = self._connection()
+            try:
+                conn.execute('BEGIN')
+                yield conn
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+
+    def _query(self, sql: str, params: Iterable = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._connection().execute(sql, tuple(params)).fetchall()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # -- indexing ---------------------------------------------------------
+
+    def index_case(self, case_id: str, hydrated: Optional[Dict[str, Any]],
+                   documents: List[Dict[str, Any]], case_name: str = None,
+                   status: str = None, source_signature: str = None):
+        """Replace everything indexed for ``case_id``."""
+        facets = extract_facets(hydrated) if hydrated else []
+        rows = []
+        if hydrated:
+            title, body = case_summary(hydrated)
+            rows.append((case_id, 'case', '', 'case', title, body))
+        for record in documents:
+            if record.get('text'):
+                file_name = record.get('file_name') or ''
+                rows.append((case_id, 'document', file_name, document_type(file_name),
+                             file_name, record['text']))
+
+        with self._transaction() as conn:
+            self._delete(conn, case_id)
+            conn.execute('INSERT INTO cases VALUES (?, ?, ?, ?, ?)',
+                         (case_id, case_name or case_id, status, source_signature,
+                          datetime.now().isoformat()))
+            conn.executemany('INSERT INTO facets VALUES (?, ?, ?, ?)',
+                             [(case_id, field, value, normalize_value(value)) for field, value in facets])
+            conn.executemany('INSERT INTO entries (case_id, kind, source, doc_type, title, body) '
+                             'VALUES (?, ?, ?, ?, ?, ?)', rows)
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, case_id: str):
+        conn.execute('DELETE FROM cases WHERE case_id = ?', (case_id,))
+        conn.execute('DELETE FROM facets WHERE case_id = ?', (case_id,))
+        conn.execute('DELETE FROM entries WHERE case_id = ?', (case_id,))
+
+    def set_status(self, case_id: str, status: Optional[str]):
+        with self._transaction() as conn:
+            conn.execute('UPDATE cases SET status = ? WHERE case_id = ?', (status, case_id))
+
+    def remove_case(self, case_id: str):
+        with self._transaction() as conn:
+            self._delete(conn, case_id)
+
+    def index_case_outputs(self, case_id: str, case_output_dir: str,
+                           hydrated_json_path: Optional[str] = None,
+                           case_name: str = None, status: str = None,
+                           force: bool = False) -> bool:
+        """
+        Index a case from its output folder if its sources changed.
+
+        Returns True when the case was (re)indexed.
+        """
+        texts_path = os.path.join(case_output_dir, DOCUMENT_TEXTS_FILENAME)
+        signature = f'{_file_signature(hydrated_json_path)}|{_file_signature(texts_path)}'
+        if not force:
+            row = self._query('SELECT source_signature, status FROM cases WHERE case_id = ?', (case_id,))
+            if row and row[0]['source_signature'] == signature:
+                if row[0]['status'] != status:
+                    self.set_status(case_id, status)
+                return False
+
+        hydrated = None
+        if hydrated_json_path:
+            try:
+                with open(hydrated_json_path, 'r', encoding='utf-8') as f:
+                    hydrated = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read hydrated JSON for {case_id}: {e}")
+
+        self.index_case(case_id, hydrated, read_document_texts(texts_path),
+                        case_name=case_name, status=status, source_signature=signature)
+        return True
+
+    def sync_cases(self, cases, output_dir: str) -> Dict[str, int]:
+        """
+        Bring the index in line with the dashboard's cases.
+
+        Unchanged cases cost one stat per source file; cases no longer on
+        disk are removed.
+        """
+        indexed = 0
+        seen = set()
+        for case in cases:
+            seen.add(case.id)
+            status = getattr(case.status, 'value', case.status)
+            try:
+                if self.index_case_outputs(case.id, os.path.join(output_dir, case.id),
+                                           case.hydrated_json_path, case.name, status):
+                    indexed += 1
+            except Exception as e:
+                logger.error(f"Search indexing failed for {case.id}: {e}")
+
+        stale = [row['case_id'] for row in self._query('SELECT case_id FROM cases')
+                 if row['case_id'] not in seen]
+        for case_id in stale:
+            self.remove_case(case_id)
+        return {'indexed': indexed, 'removed': len(stale), 'total': len(seen)}
+
+    # -- querying ---------------------------------------------------------
+
+    def search(self, q: Optional[str] = None, filters: Optional[Dict[str, str]] = None,
+               kind: Optional[str] = None, doc_type: Optional[str] = None,
+               status: Optional[str] = None, date_from: Optional[str] = None,
+               date_to: Optional[str] = None, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
+        """
+        Ranked, paginated search.
+
+        ``q`` is full text; ``filters`` maps facet fields to values that must
+        appear (substring match on the normalized value, e.g.
+        ``{'defendant': 'capital one'}``). Without ``q`` the matching cases
+        are returned, most recently indexed first.
+        """
+        page = max(1, page)
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+
+        case_clauses = []
+        params: List[Any] = []
+        for field, value in (filters or {}).items():
+            if field not in FACET_FIELDS:
+                raise ValueError(f"Unknown search field: {field}")
+            if value:
+                case_clauses.append('c.case_id IN (SELECT case_id FROM facets '
+                                    'WHERE field = ? AND value_norm LIKE ?)')
+                params += [field, f'%{normalize_value(value)}%']
+        if status:
+            case_clauses.append('c.status = ?')
+            params.append(status)
+        if date_from or date_to:
+            clause = "c.case_id IN (SELECT case_id FROM facets WHERE field = 'date'"
+            for bound, operator in ((date_from, '>='), (date_to, '<=')):
+                if not bound:
+                    continue
+                date = normalize_date(bound)
+                if date is None:
+                    raise ValueError(f"Invalid date: {bound}")
+                clause += f' AND value {operator} ?'
+                params.append(date)
+            case_clauses.append(clause + ')')
+
+        match = fts_query(q) if q else None
+        if match is None:
+            return self._search_cases(case_clauses, params, page, page_size)
+
+        clauses = ['entries MATCH ?'] + case_clauses
+        params = [match] + params
+        if kind:
+            clauses.append('e.kind = ?')
+            params.append(kind)
+        if doc_type:
+            clauses.append('e.doc_type = ?')
+            params.append(doc_type)
+
+        where = ' AND '.join(clauses)
+        base = f'FROM entries e JOIN cases c ON c.case_id = e.case_id WHERE {where}'
+        try:
+            total = self._query(f'SELECT COUNT(*) {base}', params)[0][0]
+            rows = self._query(
+                f"SELECT e.case_id, c.case_name, c.status, e.kind, e.source, e.doc_type, "
+                f"bm25(entries, {TITLE_WEIGHT}, {BODY_WEIGHT}) AS score, "
+                f"snippet(entries, 5, '<mark>', '</mark>', '…', 24) AS snippet "
+                f"{base} ORDER BY score LIMIT ? OFFSET ?",
+                params + [page_size, (page - 1) * page_size])
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query: {e}")
+
+        return {
+            'query': q,
+            'total': total,
+            'page': page,
+            'page_size': page_size,
+            'results': [{
+                'case_id': row['case_id'],
+                'case_name': row['case_name'],
+                'status': row['status'],
+                'kind': row['kind'],
+                'source': row['source'] or None,
+                'doc_type': row['doc_type'],
+                'score': round(-row['score'], 6),
+                'snippet': row['snippet']
+            } for row in rows]
+        }
+
+    def _search_cases(self, clauses: List[str], params: List[Any],
+                      page: int, page_size: int) -> Dict[str, Any]:
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        total = self._query(f'SELECT COUNT(*) FROM cases c {where}', params)[0][0]
+        rows = self._query(f'SELECT c.case_id, c.case_name, c.status FROM cases c {where} '
+                           f'ORDER BY c.indexed_at DESC LIMIT ? OFFSET ?',
+                           params + [page_size, (page - 1) * page_size])
+        return {
+            'query': None,
+            'total': total,
+            'page': page,
+            'page_size': page_size,
+            'results': [{
+                'case_id': row['case_id'],
+                'case_name': row['case_name'],
+                'status': row['status'],
+                'kind': 'case',
+                'source': None,
+                'doc_type': 'case',
+                'score': None,
+                'snippet': None
+            } for row in rows]
+        }
+
+    def facet_values(self, field: str, prefix: str = '', limit: int = 20) -> List[Dict[str, Any]]:
+        """Most common values of a facet field (for filter suggestions)."""
+        if field not in FACET_FIELDS:
+            raise ValueError(f"Unknown search field: {field}")
+        rows = self._query('SELECT value, COUNT(DISTINCT case_id) AS cases FROM facets '
+                           'WHERE field = ? AND value_norm LIKE ? GROUP BY value_norm '
+                           'ORDER BY cases DESC, value LIMIT ?',
+                           (field, f'{normalize_value(prefix)}%', limit))
+        return [{'value': row['value'], 'cases': row['cases']} for row in rows]
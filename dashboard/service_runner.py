@@ -6,6 +6,10 @@ import threading
 import time
 from datetime import datetime
 
+from .dir_snapshot import snapshot
+from .manifest_store import manifest_store, ManifestEntry
+from .metrics import SUBPROCESS_SECONDS, subprocess_env
+
 # Get the absolute path of the project root by going up two directories
 # from this file's location (dashboard/service_runner.py -> dashboard/ -> TM/)
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -20,22 +24,23 @@ def write_manifest_entry(case_path: str, filename: str, status: str, start_time:
     Write a processing entry to the manifest file.
     Format: filename|status|start_time|end_time|file_size|processing_time_ms|error_message
     """
-    manifest_path = os.path.join(case_path, 'processing_manifest.txt')
-    
-    # Convert None values to 'null' for consistency
-    def format_value(value):
-        return 'null' if value is None else str(value)
-    
-    entry = f"{filename}|{status}|{format_value(start_time)}|{format_value(end_time)}|{format_value(file_size)}|{format_value(processing_time)}|{format_value(error_message)}\n"
-    
     print(f"📝 MANIFEST: Writing entry - {filename}: {status}")
     
     try:
-        with open(manifest_path, 'a') as f:
-            f.write(entry)
+        manifest_store.append_entry(case_path, filename, status, start_time, end_time,
+                                    file_size, processing_time, error_message)
     except Exception as e:
         print(f"❌ MANIFEST: Error writing entry: {e}")
 
+def write_manifest_entries(case_path: str, entries: list):
+    """Write several ManifestEntry records with a single locked append."""
+    print(f"📝 MANIFEST: Writing {len(entries)} entries")
+    
+    try:
+        manifest_store.append_entries(case_path, entries)
+    except Exception as e:
+        print(f"❌ MANIFEST: Error writing entries: {e}")
+
 def get_file_size(file_path: str) -> int:
     """Get file size in bytes, return 0 if file doesn't exist"""
     try:
@@ -44,63 +49,27 @@ def get_file_size(file_path: str) -> int:
         return 0
 
 def update_case_status(case_path: str, status: str):
-    """Update case status on first line of manifest file with O(1) efficiency"""
-    manifest_path = os.path.join(case_path, 'processing_manifest.txt')
-    timestamp = datetime.now().isoformat()
-    
-    # Format: CASE_STATUS|status|timestamp|null|null|null|null
-    status_line = f"CASE_STATUS|{status}|{timestamp}|null|null|null|null\n"
-    
+    """Update case status on the fixed-width first line of the manifest, in place"""
     print(f"📝 MANIFEST: Updating case status to {status}")
     
     try:
-        # If file doesn't exist, create with status line only
-        if not os.path.exists(manifest_path):
-            with open(manifest_path, 'w') as f:
-                f.write(status_line)
-            return
-        
-        # Read all lines, replace first line, write back
-        with open(manifest_path, 'r') as f:
-            lines = f.readlines()
-        
-        # Replace first line or create if empty
-        if not lines:
-            lines = [status_line]
-        else:
-            lines[0] = status_line
-        
-        with open(manifest_path, 'w') as f:
-            f.writelines(lines)
-            
+        manifest_store.update_case_status(case_path, status)
     except Exception as e:
         print(f"❌ MANIFEST: Error updating case status: {e}")
 
 def read_case_status(case_path: str) -> str:
-    """Read case status from first line of manifest file with O(1) efficiency"""
-    manifest_path = os.path.join(case_path, 'processing_manifest.txt')
-    
+    """Read case status from the cached manifest index"""
     try:
-        with open(manifest_path, 'r') as f:
-            first_line = f.readline().strip()
-            if first_line and first_line.startswith('CASE_STATUS|'):
-                parts = first_line.split('|')
-                if len(parts) >= 2:
-                    return parts[1]
-        return 'NEW'  # Default status if no valid status found
-    except FileNotFoundError:
-        return 'NEW'  # Default status if file doesn't exist
+        return manifest_store.read_case_status(case_path) or 'NEW'
     except Exception as e:
         print(f"❌ MANIFEST: Error reading case status: {e}")
         return 'NEW'
 
 def clear_manifest(case_path: str):
     """Clear the manifest file at the start of processing"""
-    manifest_path = os.path.join(case_path, 'processing_manifest.txt')
     try:
-        if os.path.exists(manifest_path):
-            os.remove(manifest_path)
-            print(f"📝 MANIFEST: Cleared existing manifest")
+        manifest_store.clear(case_path)
+        print(f"📝 MANIFEST: Cleared existing manifest")
     except Exception as e:
         print(f"❌ MANIFEST: Error clearing manifest: {e}")
 
@@ -152,20 +121,17 @@ def run_tiger_extraction(case_path: str, output_dir: str, data_manager=None, cas
     # Initialize case status as PROCESSING (first line)
     update_case_status(case_path, 'PROCESSING')
 
-    # Get list of files to process and write initial manifest entries
-    files_to_process = []
-    if os.path.exists(case_path):
-        for file in os.listdir(case_path):
-            if file.endswith(('.pdf', '.docx', '.txt')) and not file.startswith('.'):
-                files_to_process.append(file)
+    # Get list of files to process (with their sizes, from one listing) and write initial manifest entries
+    file_sizes = {entry.name: entry.size for entry in snapshot(case_path).files(
+        lambda name: name.endswith(('.pdf', '.docx', '.txt')) and not name.startswith('.'))}
+    files_to_process = list(file_sizes)
     
     # Write initial processing entries with timestamps and file sizes
     start_time = datetime.now().isoformat()
-    for file_name in files_to_process:
-        file_path = os.path.join(case_path, file_name)
-        file_size = get_file_size(file_path)
-        write_manifest_entry(case_path, file_name, 'processing', start_time, 
-                           file_size=file_size)
+    write_manifest_entries(case_path, [
+        ManifestEntry(file_name, 'processing', start_time, file_size=file_sizes[file_name])
+        for file_name in files_to_process
+    ])
 
     # Record overall processing start time
     overall_start_time = time.time()
@@ -180,7 +146,8 @@ def run_tiger_extraction(case_path: str, output_dir: str, data_manager=None, cas
     
     print(f"🐅 TIGER: Running command: {' '.join(command)}")
     
-    result = subprocess.run(command, capture_output=True, text=True)
+    with SUBPROCESS_SECONDS.time(service='tiger', command='hydrated-json'):
+        result = subprocess.run(command, capture_output=True, text=True, env=subprocess_env())
 
     # Calculate overall processing time
     overall_processing_time = int((time.time() - overall_start_time) * 1000)  # Convert to ms
@@ -191,10 +158,12 @@ def run_tiger_extraction(case_path: str, output_dir: str, data_manager=None, cas
         print(result.stderr)
         
         # Write error entries for all files
-        for file_name in files_to_process:
-            write_manifest_entry(case_path, file_name, 'error', start_time, end_time,
-                               processing_time=overall_processing_time, 
-                               error_message=str(result.stderr))
+        write_manifest_entries(case_path, [
+            ManifestEntry(file_name, 'error', start_time, end_time,
+                          processing_time_ms=overall_processing_time,
+                          error_message=str(result.stderr))
+            for file_name in files_to_process
+        ])
         
         raise Exception(f"Tiger service failed with exit code {result.returncode}")
 
@@ -202,11 +171,12 @@ def run_tiger_extraction(case_path: str, output_dir: str, data_manager=None, cas
     print(result.stdout)
 
     # Write success entries for all files
-    for file_name in files_to_process:
-        file_path = os.path.join(case_path, file_name)
-        file_size = get_file_size(file_path)
-        write_manifest_entry(case_path, file_name, 'success', start_time, end_time,
-                           file_size=file_size, processing_time=overall_processing_time)
+    write_manifest_entries(case_path, [
+        ManifestEntry(file_name, 'success', start_time, end_time,
+                      file_size=file_sizes[file_name],
+                      processing_time_ms=overall_processing_time)
+        for file_name in files_to_process
+    ])
 
     # Write the overall case status to the manifest (first line)
     update_case_status(case_path, 'PENDING_REVIEW')
@@ -238,12 +208,14 @@ def run_monkey_generation(json_path: str, output_dir: str, data_manager=None, ca
     
     print(f"Running command: {' '.join(cmd)}")
     
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        cwd=os.path.dirname(MONKEY_SCRIPT_PATH)
-    )
+    with SUBPROCESS_SECONDS.time(service='monkey', command='build-complaint'):
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(MONKEY_SCRIPT_PATH),
+            env=subprocess_env()
+        )
 
     if result.returncode != 0:
         raise RuntimeError(f"Monkey service failed: {result.stderr}")
@@ -279,12 +251,14 @@ def run_summons_generation(json_path: str, output_dir: str, data_manager=None, c
     
     print(f"Running summons command: {' '.join(cmd)}")
     
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        cwd=os.path.dirname(MONKEY_SCRIPT_PATH)
-    )
+    with SUBPROCESS_SECONDS.time(service='monkey', command='generate-summons'):
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(MONKEY_SCRIPT_PATH),
+            env=subprocess_env()
+        )
 
     if result.returncode != 0:
         raise RuntimeError(f"Monkey summons generation failed: {result.stderr}")
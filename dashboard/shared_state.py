@@ -0,0 +1,327 @@
+# dashboard/shared_state.py
+"""
+State shared between dashboard worker processes.
+
+Running uvicorn with several workers needs three things that used to live
+in one process's memory:
+
+* sessions — ``SqliteSessionStore`` keeps them in
+  ``shared_state/sessions.sqlite3`` so a login on one worker is valid on all;
+* events — ``UnixSocketEventBus`` fans each published event out to every
+  worker over Unix datagram sockets (one per worker in a per-install
+  directory, no broker process), so WebSocket clients connected to any
+  worker see every broadcast, and workers learn about case changes made by
+  the others (case state itself is shared through the case catalog);
+* one-off duties — ``acquire_leader`` hands the file watchers and index
+  backfill to a single worker via an ``flock``.
+
+``DASHBOARD_STATE_BACKEND=shared`` selects these backends; it is implied
+when uvicorn runs with ``WEB_CONCURRENCY`` > 1. The default ``memory``
+backends keep single-process behaviour (``MemorySessionStore``,
+``InMemoryEventBus``).
+"""
+
+import os
+import fcntl
+import socket
+import sqlite3
+import hashlib
+import logging
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from satori_schema import serialization
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_DIR = os.path.dirname(os.path.abspath(__file__))
+STATE_DIR = os.path.join(DASHBOARD_DIR, 'shared_state')
+SESSIONS_PATH = os.path.join(STATE_DIR, 'sessions.sqlite3')
+
+# Unix socket paths are limited to ~108 bytes, so sockets live under /tmp in
+# a directory named after this install rather than inside the dashboard
+EVENTS_DIR = os.path.join(tempfile.gettempdir(),
+                          'satori-dashboard-' + hashlib.sha1(DASHBOARD_DIR.encode()).hexdigest()[:12])
+
+# Largest event sent between workers (well under Linux's datagram limit)
+MAX_EVENT_BYTES = 64 * 1024
+
+
+def shared_backend_enabled() -> bool:
+    backend = os.getenv('DASHBOARD_STATE_BACKEND', '').lower()
+    if backend:
+        return backend == 'shared'
+    try:
+        return int(os.getenv('WEB_CONCURRENCY', '1')) > 1
+    except ValueError:
+        return False
+
+
+# --- Sessions ---
+
+class SessionStore(ABC):
+    """Storage for ``session_id -> {'username', 'created_at', 'last_access'}``."""
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    def put(self, session_id: str, session: dict):
+        pass
+
+    @abstractmethod
+    def delete(self, session_id: str):
+        pass
+
+    @abstractmethod
+    def delete_idle(self, cutoff: datetime) -> int:
+        """Delete sessions last accessed before ``cutoff``; returns how many"""
+        pass
+
+
+class MemorySessionStore(SessionStore):
+    def __init__(self):
+        self.sessions: Dict[str, dict] = {}
+
+    def get(self, session_id: str) -> Optional[dict]:
+        session = self.sessions.get(session_id)
+        return dict(session) if session else None
+
+    def put(self, session_id: str, session: dict):
+        self.sessions[session_id] = dict(session)
+
+    def delete(self, session_id: str):
+        self.sessions.pop(session_id, None)
+
+    def delete_idle(self, cutoff: datetime) -> int:
+        idle = [sid for sid, session in self.sessions.items() if session['last_access'] < cutoff]
+        for session_id in idle:
+            del self.sessions[session_id]
+        return len(idle)
+
+
+class SqliteSessionStore(SessionStore):
+    """Sessions in an SQLite file every worker on the host opens."""
+
+    def __init__(self, path: str = SESSIONS_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS sessions ('
+                         'session_id TEXT PRIMARY KEY, username TEXT NOT NULL, '
+                         'created_at TEXT NOT NULL, last_access TEXT NOT NULL)')
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, session_id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT username, created_at, last_access FROM sessions WHERE session_id = ?',
+                (session_id,)).fetchone()
+        if row is None:
+            return None
+        return {
+            'username': row[0],
+            'created_at': datetime.fromisoformat(row[1]),
+            'last_access': datetime.fromisoformat(row[2])
+        }
+
+    def put(self, session_id: str, session: dict):
+        with self._lock, self._connection() as conn:
+            conn.execute('INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?)',
+                         (session_id, session['username'], session['created_at'].isoformat(),
+                          session['last_access'].isoformat()))
+
+    def delete(self, session_id: str):
+        with self._lock, self._connection() as conn:
+            conn.execute('DELETE FROM sessions WHERE session_id = ?', (session_id,))
+
+    def delete_idle(self, cutoff: datetime) -> int:
+        with self._lock, self._connection() as conn:
+            return conn.execute('DELETE FROM sessions WHERE last_access < ?', (cutoff.isoformat(),)).rowcount
+
+
+# --- Events ---
+
+EventCallback = Callable[[dict], None]
+
+
+class EventBus(ABC):
+    """
+    Publish/subscribe between workers.
+
+    Events are JSON-serializable dicts published on a channel; every
+    subscriber on every worker (including the publisher's) receives them.
+    Callbacks run on a bus thread and must hand off to an event loop
+    themselves if they need one.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[EventCallback]] = {}
+        self.worker_id = os.getpid()
+
+    def subscribe(self, channel: str, callback: EventCallback):
+        self._subscribers.setdefault(channel, []).append(callback)
+
+    def _deliver(self, message: dict):
+        for callback in list(self._subscribers.get(message.get('channel'), [])):
+            try:
+                callback(message)
+            except Exception as e:
+                logger.error(f"Event subscriber failed on {message.get('channel')}: {e}")
+
+    def _message(self, channel: str, payload: dict) -> dict:
+        return {'channel': channel, 'origin': self.worker_id, 'payload': payload}
+
+    @abstractmethod
+    def publish(self, channel: str, payload: dict):
+        pass
+
+    def start(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class InMemoryEventBus(EventBus):
+    """Single-process stand-in: delivers synchronously to local subscribers."""
+
+    def publish(self, channel: str, payload: dict):
+        self._deliver(self._message(channel, payload))
+
+
+class UnixSocketEventBus(EventBus):
+    """
+    Fan-out over Unix datagram sockets, one per worker in ``directory``.
+
+    Publishing sends the event to every socket in the directory, this
+    worker's included, so all deliveries go through the same receiver
+    thread. Sockets of workers that died are removed when a send to them is
+    refused.
+    """
+
+    def __init__(self, directory: str = EVENTS_DIR):
+        super().__init__()
+        self.directory = directory
+        self.path = os.path.join(directory, f'{self.worker_id}.sock')
+        self._socket: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._socket is not None:
+            return
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(self.path)
+        self._socket = sock
+        self._thread = threading.Thread(target=self._receive_loop, name='event-bus', daemon=True)
+        self._thread.start()
+        logger.info(f"Event bus listening on {self.path}")
+
+    def _receive_loop(self):
+        sock = self._socket
+        while True:
+            try:
+                data = sock.recv(MAX_EVENT_BYTES)
+            except OSError:
+                return  # closed
+            if not data:
+                return
+            try:
+                message = serialization.loads(data)
+            except ValueError:
+                logger.warning("Dropping malformed event bus message")
+                continue
+            self._deliver(message)
+
+    def _peers(self) -> List[str]:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return [os.path.join(self.directory, name) for name in names if name.endswith('.sock')]
+
+    def publish(self, channel: str, payload: dict):
+        message = self._message(channel, payload)
+        if self._socket is None:
+            self._deliver(message)
+            return
+        data = serialization.dumps_bytes(message, pretty=False)
+        if len(data) > MAX_EVENT_BYTES:
+            logger.warning(f"Event on {channel} is {len(data)} bytes; delivering to this worker only")
+            self._deliver(message)
+            return
+
+        sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            for peer in self._peers():
+                try:
+                    sender.sendto(data, peer)
+                except (ConnectionRefusedError, FileNotFoundError):
+                    if peer != self.path:
+                        logger.info(f"Removing stale event bus socket {peer}")
+                        try:
+                            os.unlink(peer)
+                        except OSError:
+                            pass
+                except OSError as e:
+                    logger.warning(f"Event bus send to {peer} failed: {e}")
+        finally:
+            sender.close()
+
+    def close(self):
+        if self._socket is None:
+            return
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+        self._socket = None
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+# --- Leader election ---
+
+def acquire_leader(name: str, directory: str = STATE_DIR):
+    """
+    Try to become the one worker that performs ``name``.
+
+    Returns an open lock file to keep for the worker's lifetime (the lock is
+    released when the process exits), or None if another worker holds it.
+    """
+    os.makedirs(directory, exist_ok=True)
+    lock_file = open(os.path.join(directory, f'{name}.lock'), 'w')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+# --- Factories ---
+
+def create_session_store() -> SessionStore:
+    return SqliteSessionStore() if shared_backend_enabled() else MemorySessionStore()
+
+
+def create_event_bus() -> EventBus:
+    return UnixSocketEventBus() if shared_backend_enabled() else InMemoryEventBus()
@@ -9,8 +9,8 @@ cd "$(dirname "$0")"
 # Activate the virtual environment
 source venv/bin/activate
 
-# Add project root to PYTHONPATH to allow for absolute imports
-export PYTHONPATH=$PYTHONPATH:$(dirname "$PWD")
+# Add project root (absolute imports) and shared-schema (satori_schema) to PYTHONPATH
+export PYTHONPATH=$PYTHONPATH:$(dirname "$PWD"):$(dirname "$PWD")/shared-schema
 
 
 echo "--- Starting services in the background ---"
@@ -20,8 +20,14 @@ npx tailwindcss -i ./static/css/input.css -o ./static/css/output.css --watch > /
 TAILWIND_PID=$!
 echo "Started CSS watcher in background."
 
+# Number of uvicorn workers; more than one needs the shared session/event backends
+WORKERS=${DASHBOARD_WORKERS:-1}
+if [ "$WORKERS" -gt 1 ]; then
+    export DASHBOARD_STATE_BACKEND=shared
+fi
+
 # Start the FastAPI server in the background using venv python
-venv/bin/python -m uvicorn dashboard.main:app --host 0.0.0.0 --port 8000 > start_server.log 2>&1 &
+venv/bin/python -m uvicorn dashboard.main:app --host 0.0.0.0 --port 8000 --workers "$WORKERS" > start_server.log 2>&1 &
 echo "Started FastAPI server in background."
 
 echo "--- Dashboard is running ---"
@@ -0,0 +1,121 @@
+// dashboard/static/js/fragment-push.js
+//
+// Keeps case fragments up to date from server pushes instead of polling.
+// Mark elements with the case and fragment they show:
+//
+//   <span data-push-case="youssef" data-push-fragment="status"></span>
+//   <div data-push-case="youssef" data-push-fragment="actions"></div>
+//   <div data-push-case="youssef" data-push-fragment="files"></div>
+//
+// and replace their `hx-trigger="every ..."` polling with a one-off load.
+// The script subscribes to the cases on the page over /ws, swaps in pushed
+// HTML, and on reconnect sends its last cursor so only missed changes are
+// resent. Call window.fragmentPush.refresh() after adding or removing
+// marked elements (e.g. after the grid re-renders).
+//
+// Pages that render cases themselves can instead call
+// window.fragmentPush.watch(['*']) and listen for `fragment:changed` events
+// on document (detail: {case_id, fragment, html, version}).
+
+(function () {
+    const RECONNECT_MIN_MS = 1000;
+    const RECONNECT_MAX_MS = 30000;
+
+    let socket = null;
+    let cursor = null;
+    let subscribed = new Set();
+    const watched = new Set();
+    let reconnectDelay = RECONNECT_MIN_MS;
+
+    function wantedCaseIds() {
+        const ids = new Set(watched);
+        document.querySelectorAll('[data-push-case]').forEach(el => {
+            ids.add(el.getAttribute('data-push-case').toLowerCase());
+        });
+        return ids;
+    }
+
+    function send(message) {
+        if (socket && socket.readyState === WebSocket.OPEN) {
+            socket.send(JSON.stringify(message));
+        }
+    }
+
+    // On reconnect the cursor limits the resync to what changed while away;
+    // cases that just appeared on the page need their current fragments
+    function refresh(resync = false) {
+        const wanted = wantedCaseIds();
+        const added = [...wanted].filter(id => !subscribed.has(id));
+        const removed = [...subscribed].filter(id => !wanted.has(id));
+        if (removed.length) {
+            send({ type: 'unsubscribe', case_ids: removed });
+        }
+        if (added.length) {
+            send({ type: 'subscribe', case_ids: added, cursor: resync ? cursor : null });
+        }
+        subscribed = wanted;
+    }
+
+    function applyFragments(message) {
+        cursor = message.cursor;
+        message.fragments.forEach(fragment => {
+            document.dispatchEvent(new CustomEvent('fragment:changed', { detail: fragment }));
+            const selector = `[data-push-case="${CSS.escape(fragment.case_id)}"][data-push-fragment="${fragment.fragment}"]`;
+            document.querySelectorAll(selector).forEach(el => {
+                if (fragment.html === null) {
+                    el.innerHTML = '';
+                    el.dispatchEvent(new CustomEvent('fragment:removed', { bubbles: true, detail: fragment }));
+                    return;
+                }
+                el.innerHTML = fragment.html;
+                if (window.htmx) {
+                    htmx.process(el);
+                }
+                if (window.feather) {
+                    feather.replace();
+                }
+            });
+        });
+    }
+
+    function connect() {
+        const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+        socket = new WebSocket(`${protocol}//${window.location.host}/ws`);
+
+        socket.onopen = () => {
+            reconnectDelay = RECONNECT_MIN_MS;
+            subscribed = new Set();
+            refresh(true);
+        };
+
+        socket.onmessage = (event) => {
+            let message;
+            try {
+                message = JSON.parse(event.data);
+            } catch (error) {
+                return;
+            }
+            if (message.type === 'fragments') {
+                applyFragments(message);
+            }
+        };
+
+        socket.onclose = () => {
+            setTimeout(connect, reconnectDelay);
+            reconnectDelay = Math.min(reconnectDelay * 2, RECONNECT_MAX_MS);
+        };
+    }
+
+    function watch(caseIds) {
+        caseIds.forEach(id => watched.add(id === '*' ? id : id.toLowerCase()));
+        refresh(false);
+    }
+
+    window.fragmentPush = { refresh: () => refresh(false), watch };
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', connect);
+    } else {
+        connect();
+    }
+})();
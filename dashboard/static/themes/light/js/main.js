@@ -7,8 +7,11 @@ import { renderVersion, showToast, renderCases, renderLoadingState } from './ui.
 import { initializeEventListeners, updateFilterCounts } from './eventHandlers.js';
 
 // --- State Management ---
-// This object will keep track of active polling intervals for each case
-const activePollers = {};
+// Pushed changes are batched for a moment so a burst reloads the grid once
+const PUSH_BATCH_MS = 300;
+let pendingChanges = new Map();  // caseId -> Set of changed fragment names
+let pushTimer = null;
+let processingCases = new Set();
 
 // --- Authentication and User Management ---
 async function loadUserInfo() {
@@ -136,53 +139,70 @@ function updateFileStatusInUI(caseId, fileStatus) {
 }
 
 /**
- * Starts a self-terminating polling mechanism to check the manifest for a processing case.
- * @param {string} caseId - The ID of the case to poll.
+ * Fetches a processing case's manifest once and updates its file status icons.
+ * @param {string} caseId - The ID of the case to refresh.
  */
-function startManifestPolling(caseId) {
-    // Prevent duplicate pollers for the same case
-    if (activePollers[caseId]) {
-        console.log(`📝 Polling already active for case ${caseId}.`);
-        return;
-    }
+async function refreshManifest(caseId) {
+    try {
+        const manifestContent = await getCaseManifest(caseId);
+        if (!manifestContent) return;
 
-    console.log(`🚀 Starting manifest polling for case ${caseId}.`);
+        const { fileStatus } = parseManifest(manifestContent);
+        updateFileStatusInUI(caseId, fileStatus);
+    } catch (error) {
+        console.error(`❌ Error refreshing manifest for case ${caseId}:`, error);
+    }
+}
 
-    activePollers[caseId] = setInterval(async () => {
-        try {
-            const manifestContent = await getCaseManifest(caseId);
-            if (!manifestContent) return;
+/**
+ * Applies a batch of pushed case changes: the grid is reloaded once when a
+ * case's status or actions changed, otherwise only the manifests of the
+ * changed processing cases are fetched.
+ */
+async function applyPushedChanges() {
+    const changes = pendingChanges;
+    pendingChanges = new Map();
+    pushTimer = null;
 
-            const { fileStatus, overallCaseStatus } = parseManifest(manifestContent);
-            updateFileStatusInUI(caseId, fileStatus);
+    const statusChanged = [...changes.values()].some(fragments => fragments.has('status') || fragments.has('actions'));
+    if (statusChanged) {
+        await loadCases();
+    }
+    changes.forEach((fragments, caseId) => {
+        if (processingCases.has(caseId)) {
+            refreshManifest(caseId);
+        }
+    });
+}
 
-            // Check if processing is complete for all files
-            const isProcessingFinished = !Object.values(fileStatus).some(f => f.status === 'processing');
-            
-            // Stop polling if the case is no longer processing or all files are done
-            // Check for terminal states: PENDING_REVIEW, COMPLETE, ERROR (anything except PROCESSING)
-            const isTerminalState = overallCaseStatus !== 'PROCESSING';
-            if (isTerminalState && isProcessingFinished) {
-                console.log(`✅ Processing finished for case ${caseId}. Final status: ${overallCaseStatus}. Stopping poller.`);
-                clearInterval(activePollers[caseId]);
-                delete activePollers[caseId];
-                // Once polling stops, refresh the entire case grid to get the final state
-                await loadCases();
-            }
-        } catch (error) {
-            console.error(`❌ Error during manifest polling for case ${caseId}:`, error);
-            clearInterval(activePollers[caseId]);
-            delete activePollers[caseId];
+/**
+ * Subscribes to pushed fragment changes for every case over /ws
+ * (see /static/js/fragment-push.js), replacing per-case manifest polling.
+ */
+function initializeCasePush() {
+    if (!window.fragmentPush) {
+        console.warn('⚠️ fragment-push.js not loaded; case updates will not be pushed.');
+        return;
+    }
+    document.addEventListener('fragment:changed', (event) => {
+        const { case_id: caseId, fragment } = event.detail;
+        if (!pendingChanges.has(caseId)) {
+            pendingChanges.set(caseId, new Set());
+        }
+        pendingChanges.get(caseId).add(fragment);
+        if (!pushTimer) {
+            pushTimer = setTimeout(applyPushedChanges, PUSH_BATCH_MS);
         }
-    }, 2000); // Poll every 2 seconds
+    });
+    window.fragmentPush.watch(['*']);
 }
 
-// Make the polling starter globally accessible for the process button's onclick handler
+// Make the manifest refresh globally accessible for the process button's onclick handler
 window.startProcessingWithManifest = function(caseId) {
     console.log(`▶️ User triggered processing for case ${caseId}.`);
-    // The button click in ui.js already calls the API.
-    // We just need to start polling here to update the UI.
-    startManifestPolling(caseId);
+    // The button click in ui.js already calls the API; later progress is pushed.
+    processingCases.add(caseId);
+    refreshManifest(caseId);
 };
 
 /**
@@ -196,14 +216,9 @@ async function loadCases() {
         renderCases(cases);
         updateFilterCounts();
         
-        // After rendering, check for any cases that are currently processing and start polling them.
-        // This handles cases that were already processing when the page was loaded/refreshed.
-        cases.forEach(caseData => {
-            if (caseData.status === 'Processing') {
-                console.log(`🔄 Case ${caseData.id} is in 'Processing' state. Initiating manifest polling.`);
-                startManifestPolling(caseData.id);
-            }
-        });
+        // Remember which cases are processing; pushed changes to them refresh their manifest
+        processingCases = new Set(cases.filter(caseData => caseData.status === 'Processing').map(caseData => caseData.id));
+        processingCases.forEach(caseId => refreshManifest(caseId));
         
     } catch (error) {
         console.error('❌ Failed to load cases:', error);
@@ -233,6 +248,7 @@ async function initialize() {
         
         renderLoadingState();
         await loadCases(); // Initial load
+        initializeCasePush();
         
         console.log('✅ Dashboard initialized successfully');
         
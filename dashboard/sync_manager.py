@@ -11,7 +11,12 @@ from pathlib import Path
 from datetime import datetime
 import shutil
 
+from satori_common.case_sync import (CaseSyncEngine, LocalDirectoryDrive, RemoteDrive,
+                                     DEFAULT_MAX_WORKERS, DEFAULT_TREE_TTL)
+
+from .dir_snapshot import snapshot
 from .icloud_service import iCloudService
+from .case_sync import CachedDrive
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +26,8 @@ class SyncManager:
     """
     
     def __init__(self, settings_path: str = "config/settings.json", 
-                 local_case_dir: str = "/Users/corelogic/satori-dev/TM/test-data/sync-test-cases"):
+                 local_case_dir: str = "/Users/corelogic/satori-dev/TM/test-data/sync-test-cases",
+                 drive: Optional[RemoteDrive] = None):
         self.settings_path = settings_path
         self.local_case_dir = local_case_dir
         
@@ -31,6 +37,15 @@ class SyncManager:
         cookie_directory = icloud_config.get('cookie_directory', './dashboard/icloud_session_data')
         
         self.icloud_service = iCloudService(cookie_directory=cookie_directory)
+        
+        # Delta sync source: an explicit drive, a locally synced iCloud Drive
+        # folder ('drive_path'), or the iCloud drive API once connected
+        if drive is None and icloud_config.get('drive_path'):
+            drive = LocalDirectoryDrive(icloud_config['drive_path'])
+        self.drive = drive
+        self.sync_workers = int(icloud_config.get('sync_workers', DEFAULT_MAX_WORKERS))
+        self.tree_cache_ttl = float(icloud_config.get('tree_cache_ttl', DEFAULT_TREE_TTL))
+        self._cached_drive: Optional[CachedDrive] = None
         self.last_sync_time = None
         self.sync_history = []
         self.last_test_time = None
@@ -182,37 +197,99 @@ class SyncManager:
         List all available case folders from iCloud
         """
         # First test connection
-        connection_result = self.test_connection()
-        if not connection_result['success']:
-            return connection_result
+        if self.drive is None:
+            connection_result = self.test_connection()
+            if not connection_result['success']:
+                return connection_result
         
         config = self.get_icloud_config()
         
-        # List case folders
-        result = self.icloud_service.list_case_folders(config['folder'])
+        # List case folders (one batched listing when a drive API is available)
+        engine = self._sync_engine()
+        if engine is not None:
+            result = self._list_case_folders_from_tree(engine, config['folder'])
+        else:
+            result = self.icloud_service.list_case_folders(config['folder'])
         
         if result['success']:
             # Add local sync status for each case
             for case_folder in result['case_folders']:
                 local_path = os.path.join(self.local_case_dir, case_folder['name'])
-                case_folder['local_exists'] = os.path.exists(local_path)
-                
-                if case_folder['local_exists']:
-                    local_files = os.listdir(local_path)
-                    case_folder['local_file_count'] = len([f for f in local_files if os.path.isfile(os.path.join(local_path, f))])
-                else:
-                    case_folder['local_file_count'] = 0
+                listing = snapshot(local_path, stat_files=False)
+                case_folder['local_exists'] = listing.exists
+                case_folder['local_file_count'] = len(listing.files())
         
         return result
     
-    def sync_case(self, case_name: str) -> Dict[str, Any]:
+    def _sync_engine(self) -> Optional[CaseSyncEngine]:
+        """
+        Delta sync engine, or None when no drive API is available
+        """
+        if self._cached_drive is None:
+            drive = self.drive or self.icloud_service.get_drive(self.get_icloud_config()['account'])
+            if drive is None:
+                return None
+            # Listings are kept across sync cycles; changed folders are re-listed by stamp
+            self._cached_drive = CachedDrive(drive, ttl=self.tree_cache_ttl)
+        return CaseSyncEngine(self._cached_drive, max_workers=self.sync_workers)
+    
+    def _record_sync(self, case_name: str, result: Dict[str, Any]):
+        """
+        Record a successful case sync in the history
+        """
+        sync_record = {
+            'case_name': case_name,
+            'timestamp': datetime.now().isoformat(),
+            'files_downloaded': len(result['downloaded_files']),
+            'files_unchanged': result.get('skipped_files', 0),
+            'bytes_downloaded': result.get('bytes_downloaded'),
+            'errors': len(result['errors']),
+            'local_target': result['local_target']
+        }
+        
+        self.sync_history.append(sync_record)
+        self.last_sync_time = datetime.now()
+        
+        logger.info(f"Successfully synced case '{case_name}' with {sync_record['files_downloaded']} files")
+    
+    def _list_case_folders_from_tree(self, engine: CaseSyncEngine, parent_folder: str) -> Dict[str, Any]:
+        """
+        Case folders with their file counts from the cached drive tree
+        """
+        try:
+            tree = engine.drive.list_tree(parent_folder)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Could not list case folders: {str(e)}'
+            }
+        
+        case_folders = [{
+            'name': name,
+            'file_count': len(listing.files),
+            'has_files': bool(listing.files)
+        } for name, listing in tree.items()]
+        
+        return {
+            'success': True,
+            'message': f'Found {len(case_folders)} potential case folders',
+            'parent_folder': parent_folder,
+            'case_folders': case_folders
+        }
+    
+    def sync_case(self, case_name: str, engine: Optional[CaseSyncEngine] = None,
+                  remote_files: Optional[list] = None) -> Dict[str, Any]:
         """
         Sync a specific case folder from iCloud to local directory
+        
+        Only new or changed files are downloaded when a drive API is
+        available; otherwise the whole folder is fetched through icloudpd.
         """
-        # Test connection first
-        connection_result = self.test_connection()
-        if not connection_result['success']:
-            return connection_result
+        # Test connection first (not needed for a local or injected drive)
+        if self.drive is None:
+            connection_result = self.test_connection()
+            if not connection_result['success']:
+                return connection_result
         
         config = self.get_icloud_config()
         
@@ -220,26 +297,19 @@ class SyncManager:
         local_target = os.path.join(self.local_case_dir, case_name)
         
         # Sync the case folder
-        result = self.icloud_service.sync_case_folder(
-            config['folder'], 
-            case_name, 
-            local_target
-        )
+        engine = engine or self._sync_engine()
+        if engine is not None:
+            result = engine.sync_case(config['folder'], case_name, local_target,
+                                      remote_files=remote_files)
+        else:
+            result = self.icloud_service.sync_case_folder(
+                config['folder'], 
+                case_name, 
+                local_target
+            )
         
         if result['success']:
-            # Record sync history
-            sync_record = {
-                'case_name': case_name,
-                'timestamp': datetime.now().isoformat(),
-                'files_downloaded': len(result['downloaded_files']),
-                'errors': len(result['errors']),
-                'local_target': local_target
-            }
-            
-            self.sync_history.append(sync_record)
-            self.last_sync_time = datetime.now()
-            
-            logger.info(f"Successfully synced case '{case_name}' with {sync_record['files_downloaded']} files")
+            self._record_sync(case_name, result)
         
         return result
     
@@ -247,6 +317,10 @@ class SyncManager:
         """
         Sync all available case folders from iCloud
         """
+        engine = self._sync_engine()
+        if engine is not None:
+            return self._sync_all_cases_delta(engine)
+        
         # List available cases
         cases_result = self.list_available_cases()
         if not cases_result['success']:
@@ -298,6 +372,53 @@ class SyncManager:
             'total_cases_found': len(case_folders)
         }
     
+    def _sync_all_cases_delta(self, engine: CaseSyncEngine) -> Dict[str, Any]:
+        """
+        Sync every case folder, downloading only new or changed files
+        """
+        config = self.get_icloud_config()
+        
+        try:
+            # One enumeration of the case tree per sync cycle
+            tree = engine.drive.list_tree(config['folder'], refresh=True)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f"Could not list case folders in '{config['folder']}': {str(e)}"
+            }
+        
+        synced_cases = []
+        errors = []
+        bytes_downloaded = 0
+        
+        for case_name, listing in tree.items():
+            sync_result = self.sync_case(case_name, engine=engine, remote_files=listing.files)
+            
+            if sync_result['success']:
+                bytes_downloaded += sync_result['bytes_downloaded']
+                if sync_result['downloaded_files']:
+                    synced_cases.append({
+                        'name': case_name,
+                        'files_downloaded': len(sync_result['downloaded_files']),
+                        'local_target': sync_result['local_target']
+                    })
+                errors.extend({'case': case_name, 'file': error['file'], 'error': error['error']}
+                              for error in sync_result['errors'])
+            else:
+                errors.append({
+                    'case': case_name,
+                    'error': sync_result['error']
+                })
+        
+        return {
+            'success': True,
+            'message': f'Synced {len(synced_cases)} cases',
+            'synced_cases': synced_cases,
+            'errors': errors,
+            'total_cases_found': len(tree),
+            'bytes_downloaded': bytes_downloaded
+        }
+    
     def get_sync_status(self) -> Dict[str, Any]:
         """
         Get current sync status and history
@@ -330,24 +451,21 @@ class SyncManager:
         cleaned_cases = []
         errors = []
         
-        for item in os.listdir(self.local_case_dir):
-            item_path = os.path.join(self.local_case_dir, item)
+        for entry in snapshot(self.local_case_dir, stat_files=False).dirs():
+            # Skip if in keep list
+            if keep_cases and entry.name in keep_cases:
+                continue
             
-            if os.path.isdir(item_path):
-                # Skip if in keep list
-                if keep_cases and item in keep_cases:
-                    continue
-                
-                try:
-                    shutil.rmtree(item_path)
-                    cleaned_cases.append(item)
-                    logger.info(f"Cleaned up local case directory: {item}")
-                except Exception as e:
-                    errors.append({
-                        'case': item,
-                        'error': str(e)
-                    })
-                    logger.error(f"Could not clean up case directory {item}: {e}")
+            try:
+                shutil.rmtree(entry.path)
+                cleaned_cases.append(entry.name)
+                logger.info(f"Cleaned up local case directory: {entry.name}")
+            except Exception as e:
+                errors.append({
+                    'case': entry.name,
+                    'error': str(e)
+                })
+                logger.error(f"Could not clean up case directory {entry.name}: {e}")
         
         return {
             'success': True,
@@ -23,8 +23,9 @@ class ZipSecurityValidator:
     """Standalone security validation for uploaded ZIP files"""
     
     # Security limits
-    MAX_FILE_SIZE = 50 * 1024 * 1024      # 50MB upload limit
-    MAX_EXTRACTED_SIZE = 100 * 1024 * 1024 # 100MB extracted limit
+    MAX_FILE_SIZE = 500 * 1024 * 1024      # 500MB upload limit (scanned-PDF archives)
+    MAX_EXTRACTED_SIZE = 1024 * 1024 * 1024 # 1GB extracted limit
+    MAX_COMPRESSION_RATIO = 100            # Per-member zip bomb guard
     MAX_FILES = 1000                       # Maximum files in ZIP
     MAX_PATH_LENGTH = 255                  # Maximum path length
     
@@ -79,6 +80,60 @@ class ZipSecurityValidator:
             
         return True, []
     
+    def validate_spooled_upload(self, zip_path: str, filename: str) -> Tuple[bool, List[str]]:
+        """
+        Validate an upload that has already been spooled to disk
+        
+        Only the local header and the central directory are inspected, so
+        nothing is decompressed here. Member CRCs are verified as each member
+        is streamed out during extraction.
+        
+        Args:
+            zip_path: Path to the spooled ZIP file
+            filename: Original filename
+            
+        Returns:
+            (is_valid, error_messages)
+        """
+        self.validation_errors = []
+        
+        if not self._validate_filename(filename):
+            return False, self.validation_errors
+        
+        try:
+            if not self.validate_upload_size(os.path.getsize(zip_path)):
+                return False, self.validation_errors
+            
+            with open(zip_path, 'rb') as f:
+                header = f.read(4)
+            if not self._validate_file_header(header):
+                return False, self.validation_errors
+            
+            if not self._validate_zip_structure(zip_path, verify_crc=False):
+                return False, self.validation_errors
+                
+        except Exception as e:
+            self.validation_errors.append(f"ZIP validation failed: {str(e)}")
+            return False, self.validation_errors
+        
+        return True, []
+    
+    def validate_upload_size(self, size: int) -> bool:
+        """Validate a byte count against the upload limit"""
+        if size > self.MAX_FILE_SIZE:
+            size_mb = size / (1024 * 1024)
+            limit_mb = self.MAX_FILE_SIZE / (1024 * 1024)
+            self.validation_errors.append(
+                f"File too large: {size_mb:.1f}MB exceeds {limit_mb}MB limit"
+            )
+            return False
+        return True
+    
+    def validate_header(self, header: bytes) -> bool:
+        """Validate the leading bytes of an upload stream"""
+        self.validation_errors = []
+        return self._validate_file_header(header)
+    
     def _validate_file_size(self, content: bytes) -> bool:
         """Validate file size is within limits"""
         if len(content) > self.MAX_FILE_SIZE:
@@ -119,15 +174,16 @@ class ZipSecurityValidator:
                 
         return True
     
-    def _validate_zip_structure(self, zip_path: str) -> bool:
+    def _validate_zip_structure(self, zip_path: str, verify_crc: bool = True) -> bool:
         """Validate ZIP internal structure and content"""
         try:
             with zipfile.ZipFile(zip_path, 'r') as zip_file:
-                # Test ZIP integrity
-                bad_file = zip_file.testzip()
-                if bad_file:
-                    self.validation_errors.append(f"Corrupt ZIP file: {bad_file}")
-                    return False
+                # Test ZIP integrity (decompresses every member)
+                if verify_crc:
+                    bad_file = zip_file.testzip()
+                    if bad_file:
+                        self.validation_errors.append(f"Corrupt ZIP file: {bad_file}")
+                        return False
                 
                 members = zip_file.namelist()
                 
@@ -151,6 +207,9 @@ class ZipSecurityValidator:
                 for member in members:
                     if not self._validate_zip_member(member):
                         return False
+                    
+                    if not self._validate_compression_ratio(zip_file.getinfo(member)):
+                        return False
                         
                     # Track case folders
                     if '/' in member:
@@ -196,6 +255,19 @@ class ZipSecurityValidator:
         
         return True
     
+    def _validate_compression_ratio(self, info: zipfile.ZipInfo) -> bool:
+        """Reject members whose declared sizes look like a zip bomb"""
+        if info.is_dir() or info.file_size < 1024 * 1024:
+            return True
+        
+        ratio = info.file_size / max(info.compress_size, 1)
+        if ratio > self.MAX_COMPRESSION_RATIO:
+            self.validation_errors.append(
+                f"Suspicious compression ratio ({ratio:.0f}:1) in {info.filename}"
+            )
+            return False
+        return True
+    
     def _check_zip_slip_safety(self, member_path: str) -> bool:
         """Prevent ZIP slip attacks"""
         # Normalize the path
@@ -99,11 +99,11 @@ class CaseUploader {
             errors.push('File must be a ZIP archive (.zip)');
         }
         
-        // Check file size (50MB limit)
-        const maxSize = 50 * 1024 * 1024; // 50MB
+        // Check file size (500MB limit)
+        const maxSize = 500 * 1024 * 1024; // 500MB
         if (file.size > maxSize) {
             const sizeMB = (file.size / (1024 * 1024)).toFixed(1);
-            errors.push(`File too large: ${sizeMB}MB exceeds 50MB limit`);
+            errors.push(`File too large: ${sizeMB}MB exceeds 500MB limit`);
         }
         
         // Check minimum size
@@ -3,18 +3,21 @@
 Standalone Case Upload Handler
 
 Provides secure, isolated case file upload processing with:
-- ZIP file validation and extraction
+- Chunked spooling of uploads to disk (the archive is never held in memory)
+- Central-directory ZIP validation and streaming per-case extraction
 - Integration with existing file watcher system
 - Comprehensive error handling and logging
 - Direct integration with test-data/sync-test-cases directory
 """
 
 import os
+import asyncio
+import hashlib
 import shutil
 import tempfile
 import zipfile
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Tuple
 import logging
 from datetime import datetime
 
@@ -27,6 +30,8 @@ logger = logging.getLogger(__name__)
 class StandaloneCaseUploader:
     """Self-contained case file upload processor"""
     
+    CHUNK_SIZE = 1024 * 1024  # 1MB read/write chunks
+    
     def __init__(self, target_directory: str):
         """
         Initialize uploader with target directory
@@ -43,12 +48,19 @@ class StandaloneCaseUploader:
         
         logger.info(f"Uploader initialized: target={self.target_dir}")
     
-    async def process_upload(self, zip_file: UploadFile) -> Dict[str, Any]:
+    async def process_upload(self, zip_file: UploadFile,
+                             case_ready_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Main upload processing pipeline
         
+        The upload is spooled to disk in chunks (never held in memory),
+        validated from its central directory, and each case folder is
+        stream-extracted into place with an atomic rename.
+        
         Args:
             zip_file: FastAPI UploadFile object
+            case_ready_callback: Optional hook called with each case's info
+                as soon as that case's files have landed in the target directory
             
         Returns:
             Dict with success status, messages, and extracted case names
@@ -59,13 +71,18 @@ class StandaloneCaseUploader:
         try:
             logger.info(f"Processing upload {upload_id}: {zip_file.filename}")
             
-            # Read file content
-            file_content = await zip_file.read()
-            logger.info(f"Upload {upload_id}: Read {len(file_content)} bytes")
+            # Create temporary directory for processing
+            temp_dir = tempfile.mkdtemp(prefix=f"upload_{upload_id}_")
+            logger.info(f"Upload {upload_id}: Created temp dir {temp_dir}")
+            
+            # Spool upload to disk while hashing
+            temp_zip_path = os.path.join(temp_dir, "upload.zip")
+            bytes_written, sha256 = await self._spool_upload(zip_file, temp_zip_path)
+            logger.info(f"Upload {upload_id}: Spooled {bytes_written} bytes (sha256={sha256})")
             
-            # Security validation
-            is_valid, errors = self.security_validator.validate_upload(
-                file_content, zip_file.filename
+            # Security validation (central directory only)
+            is_valid, errors = self.security_validator.validate_spooled_upload(
+                temp_zip_path, zip_file.filename
             )
             
             if not is_valid:
@@ -80,42 +97,23 @@ class StandaloneCaseUploader:
                     }
                 )
             
-            # Create temporary directory for processing
-            temp_dir = tempfile.mkdtemp(prefix=f"upload_{upload_id}_")
-            logger.info(f"Upload {upload_id}: Created temp dir {temp_dir}")
-            
-            # Save uploaded file temporarily
-            temp_zip_path = os.path.join(temp_dir, "upload.zip")
-            with open(temp_zip_path, 'wb') as f:
-                f.write(file_content)
-            
-            # Extract ZIP file safely
-            extract_dir = os.path.join(temp_dir, "extracted")
-            case_folders = self._extract_zip_safely(temp_zip_path, extract_dir)
-            
-            if not case_folders:
-                raise HTTPException(
-                    status_code=400,
-                    detail={
-                        "error": "No valid case folders found in ZIP",
-                        "details": ["ZIP must contain directories with legal documents"]
-                    }
-                )
-            
-            # Validate case structure
-            validated_cases = self._validate_case_structure(extract_dir, case_folders)
+            # Validate case structure without extracting
+            validated_cases = self._plan_case_extraction(temp_zip_path)
             
             if not validated_cases:
                 raise HTTPException(
                     status_code=400,
                     detail={
                         "error": "No valid cases found",
-                        "details": ["Case folders must contain legal documents (.pdf, .docx, .txt)"]
+                        "details": ["ZIP must contain case folders with legal documents (.pdf, .docx, .txt)"]
                     }
                 )
             
-            # Move cases to target directory
-            moved_cases = self._move_cases_to_target(extract_dir, validated_cases)
+            # Stream-extract each case straight into the target directory
+            moved_cases = await asyncio.to_thread(
+                self._extract_cases_to_target, temp_zip_path, validated_cases,
+                upload_id, case_ready_callback
+            )
             
             # Success response
             result = {
@@ -123,6 +121,8 @@ class StandaloneCaseUploader:
                 "message": f"Successfully uploaded {len(moved_cases)} case(s)",
                 "cases": moved_cases,
                 "upload_id": upload_id,
+                "sha256": sha256,
+                "size_bytes": bytes_written,
                 "timestamp": datetime.now().isoformat()
             }
             
@@ -152,149 +152,198 @@ class StandaloneCaseUploader:
                 except Exception as e:
                     logger.warning(f"Upload {upload_id}: Cleanup failed - {str(e)}")
     
-    def _extract_zip_safely(self, zip_path: str, extract_to: str) -> List[str]:
+    async def _spool_upload(self, zip_file: UploadFile, spool_path: str) -> Tuple[int, str]:
         """
-        Safely extract ZIP file with security checks
+        Copy the upload to disk in fixed-size chunks
         
         Args:
-            zip_path: Path to ZIP file
-            extract_to: Directory to extract to
+            zip_file: FastAPI UploadFile object
+            spool_path: Destination path for the spooled archive
             
         Returns:
-            List of extracted case folder names
+            (bytes_written, sha256_hexdigest)
         """
-        os.makedirs(extract_to, exist_ok=True)
-        case_folders = set()
+        digest = hashlib.sha256()
+        bytes_written = 0
         
-        try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_file:
-                for member in zip_file.namelist():
-                    # Security check for each member
-                    if not self.security_validator._check_zip_slip_safety(member):
-                        continue
-                    
-                    # Skip system files during extraction
-                    if self.security_validator._is_system_file(member):
-                        continue
-                        
-                    # Extract member safely
-                    member_path = os.path.join(extract_to, member)
-                    
-                    # Ensure parent directory exists
-                    os.makedirs(os.path.dirname(member_path), exist_ok=True)
-                    
-                    # Extract file
-                    if not member.endswith('/'):
-                        with zip_file.open(member) as source, open(member_path, 'wb') as target:
-                            shutil.copyfileobj(source, target)
-                    
-                    # Track case folders
-                    if '/' in member:
-                        case_folder = member.split('/')[0]
-                        if not case_folder.startswith('.'):
-                            case_folders.add(case_folder)
-            
-            logger.info(f"Extracted {len(case_folders)} case folders")
-            return sorted(list(case_folders))
-            
-        except Exception as e:
-            logger.error(f"ZIP extraction failed: {str(e)}")
-            raise Exception(f"Failed to extract ZIP file: {str(e)}")
+        with open(spool_path, 'wb') as target:
+            while True:
+                chunk = await zip_file.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                
+                # Reject non-ZIP uploads on the first chunk
+                if bytes_written == 0 and not self.security_validator.validate_header(chunk):
+                    self._reject(self.security_validator.validation_errors)
+                
+                bytes_written += len(chunk)
+                if not self.security_validator.validate_upload_size(bytes_written):
+                    self._reject(self.security_validator.validation_errors)
+                
+                digest.update(chunk)
+                target.write(chunk)
+        
+        if bytes_written == 0:
+            self._reject(["File too small to be a valid ZIP"])
+        
+        return bytes_written, digest.hexdigest()
     
-    def _validate_case_structure(self, extract_dir: str, case_folders: List[str]) -> List[Dict[str, Any]]:
+    def _reject(self, errors: List[str]):
+        """Raise the standard validation failure response"""
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "File validation failed",
+                "details": list(errors)
+            }
+        )
+    
+    def _plan_case_extraction(self, zip_path: str) -> List[Dict[str, Any]]:
         """
-        Validate extracted case folder structure
+        Group ZIP members by case folder using the central directory
         
         Args:
-            extract_dir: Directory containing extracted files
-            case_folders: List of case folder names
+            zip_path: Path to the spooled ZIP file
             
         Returns:
-            List of validated case information
+            List of validated case information with the members to extract
         """
-        validated_cases = []
+        cases: Dict[str, Dict[str, Any]] = {}
         
-        for case_name in case_folders:
-            case_path = os.path.join(extract_dir, case_name)
-            
-            if not os.path.isdir(case_path):
-                logger.warning(f"Skipping non-directory: {case_name}")
-                continue
-            
-            # Count legal documents
-            legal_files = []
-            try:
-                for file_name in os.listdir(case_path):
-                    file_path = os.path.join(case_path, file_name)
-                    if os.path.isfile(file_path):
-                        file_ext = Path(file_name).suffix.lower()
-                        if file_ext in self.security_validator.ALLOWED_EXTENSIONS:
-                            legal_files.append(file_name)
+        with zipfile.ZipFile(zip_path, 'r') as archive:
+            for info in archive.infolist():
+                member = info.filename
                 
-                if legal_files:
-                    case_info = {
-                        "name": case_name,
-                        "files": legal_files,
-                        "file_count": len(legal_files),
-                        "path": case_path
-                    }
-                    validated_cases.append(case_info)
-                    logger.info(f"Validated case '{case_name}': {len(legal_files)} files")
-                else:
-                    logger.warning(f"Case '{case_name}' has no legal documents")
-                    
-            except Exception as e:
-                logger.error(f"Error validating case '{case_name}': {str(e)}")
-                continue
+                # Security check for each member
+                if not self.security_validator._check_zip_slip_safety(member):
+                    continue
+                
+                # Skip system files and bare directory entries
+                if self.security_validator._is_system_file(member) or info.is_dir():
+                    continue
+                
+                if '/' not in member:
+                    continue
+                
+                case_name, relative_path = member.split('/', 1)
+                if not case_name or case_name.startswith('.'):
+                    continue
+                
+                case_info = cases.setdefault(case_name, {
+                    "name": case_name,
+                    "files": [],
+                    "members": []
+                })
+                case_info["members"].append(member)
+                
+                # Only top-level documents count towards the case
+                file_ext = Path(relative_path).suffix.lower()
+                if '/' not in relative_path and file_ext in self.security_validator.ALLOWED_EXTENSIONS:
+                    case_info["files"].append(relative_path)
+        
+        validated_cases = []
+        for case_name in sorted(cases):
+            case_info = cases[case_name]
+            if case_info["files"]:
+                case_info["file_count"] = len(case_info["files"])
+                validated_cases.append(case_info)
+                logger.info(f"Validated case '{case_name}': {case_info['file_count']} files")
+            else:
+                logger.warning(f"Case '{case_name}' has no legal documents")
         
         return validated_cases
     
-    def _move_cases_to_target(self, extract_dir: str, validated_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _extract_cases_to_target(self, zip_path: str, validated_cases: List[Dict[str, Any]], upload_id: str,
+                                 case_ready_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
         """
-        Move validated cases to target directory
+        Stream-extract validated cases into the target directory
+        
+        Each case is written to a hidden staging folder next to its final
+        location and renamed into place once all of its members are on disk,
+        so watchers never observe a half-extracted case.
         
         Args:
-            extract_dir: Directory containing extracted files
-            validated_cases: List of validated case information
+            zip_path: Path to the spooled ZIP file
+            validated_cases: Output of _plan_case_extraction
+            upload_id: Identifier used to name staging folders
+            case_ready_callback: Optional hook called once per landed case
             
         Returns:
             List of successfully moved cases
         """
         moved_cases = []
         
-        for case_info in validated_cases:
-            case_name = case_info["name"]
-            source_path = case_info["path"]
-            target_path = os.path.join(self.target_dir, case_name)
-            
-            try:
-                # Handle existing case directory
-                if os.path.exists(target_path):
-                    # Create backup name with timestamp
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    backup_name = f"{case_name}_backup_{timestamp}"
-                    backup_path = os.path.join(self.target_dir, backup_name)
-                    
-                    logger.info(f"Moving existing case '{case_name}' to backup: {backup_name}")
-                    shutil.move(target_path, backup_path)
-                
-                # Move new case to target
-                shutil.move(source_path, target_path)
+        with zipfile.ZipFile(zip_path, 'r') as archive:
+            for case_info in validated_cases:
+                case_name = case_info["name"]
+                staging_path = os.path.join(self.target_dir, f".{case_name}.upload_{upload_id}")
+                target_path = os.path.join(self.target_dir, case_name)
                 
-                # Update case info with final path
-                case_info["final_path"] = target_path
-                case_info["status"] = "moved"
-                moved_cases.append(case_info)
-                
-                logger.info(f"Successfully moved case '{case_name}' to {target_path}")
+                try:
+                    for member in case_info["members"]:
+                        self._stream_member(archive, member, staging_path, len(case_name) + 1)
+                    
+                    # Handle existing case directory
+                    backup_name = None
+                    if os.path.exists(target_path):
+                        # Create backup name with timestamp
+                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                        backup_name = f"{case_name}_backup_{timestamp}"
+                        backup_path = os.path.join(self.target_dir, backup_name)
+                        
+                        logger.info(f"Moving existing case '{case_name}' to backup: {backup_name}")
+                        os.rename(target_path, backup_path)
+                    
+                    # Atomically publish the new case
+                    os.rename(staging_path, target_path)
+                    
+                    moved_case = {
+                        "name": case_name,
+                        "files": case_info["files"],
+                        "file_count": case_info["file_count"],
+                        "final_path": target_path,
+                        "backup_name": backup_name,
+                        "status": "moved"
+                    }
+                    moved_cases.append(moved_case)
+                    logger.info(f"Successfully extracted case '{case_name}' to {target_path}")
+                    
+                except Exception as e:
+                    logger.error(f"Failed to extract case '{case_name}': {str(e)}")
+                    shutil.rmtree(staging_path, ignore_errors=True)
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Failed to move case '{case_name}': {str(e)}")
-                case_info["status"] = "failed"
-                case_info["error"] = str(e)
+                if case_ready_callback:
+                    try:
+                        case_ready_callback(moved_case)
+                    except Exception as e:
+                        logger.warning(f"Case ready callback failed for '{case_name}': {str(e)}")
         
         return moved_cases
     
+    def _stream_member(self, archive: zipfile.ZipFile, member: str, staging_path: str, prefix_length: int):
+        """
+        Copy a single ZIP member into the staging folder in chunks
+        
+        Args:
+            archive: Open ZipFile
+            member: Member name (``case_name/relative/path``)
+            staging_path: Case staging directory
+            prefix_length: Length of the ``case_name/`` prefix to strip
+        """
+        member_path = os.path.join(staging_path, member[prefix_length:])
+        
+        # Guard against anything that escapes the staging folder after joining
+        real_staging = os.path.realpath(staging_path)
+        if not os.path.realpath(member_path).startswith(real_staging + os.sep):
+            raise Exception(f"Unsafe member path: {member}")
+        
+        os.makedirs(os.path.dirname(member_path), exist_ok=True)
+        
+        # ZipExtFile verifies the CRC when the member is fully read
+        with archive.open(member) as source, open(member_path, 'wb') as target:
+            shutil.copyfileobj(source, target, self.CHUNK_SIZE)
+    
     def get_upload_stats(self) -> Dict[str, Any]:
         """Get upload service statistics"""
         try:
@@ -20,6 +20,8 @@ from datetime import datetime
 # Add shared schema to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared-schema'))
 
+from satori_common.case_sync import CachedDrive, CaseSyncEngine, PyiCloudDrive
+
 logger = logging.getLogger(__name__)
 
 class ModerniCloudService:
@@ -38,6 +40,7 @@ class ModerniCloudService:
         self.authenticated = False
         self.last_error = None
         self.api = None
+        self._drive_cache = None
         
         # Ensure cookie directory exists
         self.cookie_directory.mkdir(parents=True, exist_ok=True)
@@ -55,18 +58,18 @@ class ModerniCloudService:
         """
         try:
             # Import icloudpd components
-            print(f"= Importing icloudpd library...")
+            print(f"🔍 Importing icloudpd library...")
             from icloudpd.base import main as icloudpd_main
             from pyicloud import PyiCloudService
             from pyicloud.exceptions import PyiCloudException
             
-            print(f" icloudpd imported successfully")
+            print(f"✅ icloudpd imported successfully")
             
             # Check for existing session cookies
             cookie_file = self.cookie_directory / f"{email}.cookies"
             session_file = self.cookie_directory / f"{email}.session"
             
-            print(f"= Checking for existing session...")
+            print(f"🔍 Checking for existing session...")
             print(f"   Cookie file: {cookie_file}")
             print(f"   Session file: {session_file}")
             print(f"   Cookie exists: {cookie_file.exists()}")
@@ -74,7 +77,7 @@ class ModerniCloudService:
             
             # Try to use existing session first
             if cookie_file.exists() or session_file.exists():
-                print(f"= Found existing session, attempting reuse...")
+                print(f"📂 Found existing session, attempting reuse...")
                 try:
                     # Try to create PyiCloud service with session directory
                     self.api = PyiCloudService(
@@ -85,7 +88,7 @@ class ModerniCloudService:
                     # Test the connection
                     if hasattr(self.api, 'drive'):
                         test_result = self.api.drive.dir()
-                        print(f" Session reuse successful!")
+                        print(f"✅ Session reuse successful!")
                         self.authenticated = True
                         
                         return {
@@ -96,11 +99,11 @@ class ModerniCloudService:
                             'drive_accessible': True
                         }
                 except Exception as session_e:
-                    print(f" Session reuse failed: {session_e}")
-                    print(f"= Will attempt fresh authentication...")
+                    print(f"⚠️ Session reuse failed: {session_e}")
+                    print(f"🔄 Will attempt fresh authentication...")
             
             # Fresh authentication required
-            print(f"= Performing fresh authentication...")
+            print(f"🔐 Performing fresh authentication...")
             print(f"   Email: '{email}'")
             print(f"   Password: '{password}'")
             print(f"   Cookie directory: {self.cookie_directory}")
@@ -113,11 +116,11 @@ class ModerniCloudService:
                     cookie_directory=str(self.cookie_directory)
                 )
                 
-                print(f" PyiCloudService created with cookie support")
+                print(f"✅ PyiCloudService created with cookie support")
                 
                 # Check if 2FA is required
                 if self.api.requires_2fa:
-                    print(f"= 2FA required - this needs interactive input")
+                    print(f"🔐 2FA required - this needs interactive input")
                     return {
                         'success': False,
                         'error': 'Two-factor authentication required. Please run initial setup interactively.',
@@ -126,11 +129,11 @@ class ModerniCloudService:
                     }
                 
                 # Test drive access
-                print(f"= Testing drive access...")
+                print(f"🔍 Testing drive access...")
                 drive = self.api.drive
                 root_contents = drive.dir()
                 
-                print(f" Drive access successful - found {len(root_contents)} items")
+                print(f"✅ Drive access successful - found {len(root_contents)} items")
                 self.authenticated = True
                 self.last_error = None
                 
@@ -249,6 +252,8 @@ class ModerniCloudService:
     def list_case_folders(self, parent_folder: str) -> Dict[str, Any]:
         """
         List all potential case folders in parent directory
+        
+        All case folders are listed in one batched request and cached.
         """
         if not self.authenticated or not self.api:
             return {
@@ -257,48 +262,12 @@ class ModerniCloudService:
             }
         
         try:
-            drive = self.api.drive
-            current_dir = drive
-            
-            # Navigate to parent folder
-            if parent_folder and parent_folder != '/':
-                folder_parts = parent_folder.strip('/').split('/')
-                for part in folder_parts:
-                    if part:
-                        found = False
-                        for item in current_dir.dir():
-                            if item.name == part and item.type == 'folder':
-                                current_dir = item
-                                found = True
-                                break
-                        
-                        if not found:
-                            return {
-                                'success': False,
-                                'error': f'Parent folder "{parent_folder}" not found'
-                            }
-            
-            # List all folders (potential case folders)
-            contents = current_dir.dir()
-            case_folders = []
-            
-            for item in contents:
-                if item.type == 'folder':
-                    try:
-                        folder_contents = item.dir()
-                        file_count = len([f for f in folder_contents if f.type == 'file'])
-                        case_folders.append({
-                            'name': item.name,
-                            'file_count': file_count,
-                            'has_files': file_count > 0
-                        })
-                    except:
-                        case_folders.append({
-                            'name': item.name,
-                            'file_count': 0,
-                            'has_files': False,
-                            'access_error': True
-                        })
+            tree = self._cached_drive().list_tree(parent_folder or '/')
+            case_folders = [{
+                'name': name,
+                'file_count': len(listing.files),
+                'has_files': bool(listing.files)
+            } for name, listing in tree.items()]
             
             return {
                 'success': True,
@@ -307,15 +276,24 @@ class ModerniCloudService:
                 'case_folders': case_folders
             }
             
+        except FileNotFoundError:
+            return {
+                'success': False,
+                'error': f'Parent folder "{parent_folder}" not found'
+            }
         except Exception as e:
             return {
                 'success': False,
                 'error': f'Could not list case folders: {str(e)}'
             }
     
-    def sync_case_folder(self, parent_folder: str, case_name: str, local_target: str) -> Dict[str, Any]:
+    def sync_case_folder(self, parent_folder: str, case_name: str, local_target: str,
+                         max_workers: int = 4) -> Dict[str, Any]:
         """
-        Download all files from case folder to local directory
+        Download new or changed files from case folder to local directory
+
+        Unchanged files (per the folder's sync manifest) are skipped;
+        interrupted downloads resume from their partial file.
         """
         if not self.authenticated or not self.api:
             return {
@@ -323,90 +301,23 @@ class ModerniCloudService:
                 'error': 'Not authenticated with iCloud'
             }
         
-        try:
-            drive = self.api.drive
-            current_dir = drive
-            
-            # Navigate to parent folder
-            if parent_folder and parent_folder != '/':
-                folder_parts = parent_folder.strip('/').split('/')
-                for part in folder_parts:
-                    if part:
-                        found = False
-                        for item in current_dir.dir():
-                            if item.name == part and item.type == 'folder':
-                                current_dir = item
-                                found = True
-                                break
-                        
-                        if not found:
-                            return {
-                                'success': False,
-                                'error': f'Parent folder "{parent_folder}" not found'
-                            }
-            
-            # Find case folder
-            case_folder = None
-            for item in current_dir.dir():
-                if item.name == case_name and item.type == 'folder':
-                    case_folder = item
-                    break
-            
-            if not case_folder:
-                return {
-                    'success': False,
-                    'error': f'Case folder "{case_name}" not found'
-                }
-            
-            # Create local target directory
-            os.makedirs(local_target, exist_ok=True)
-            
-            # Download files
-            downloaded_files = []
-            errors = []
-            
-            for item in case_folder.dir():
-                if item.type == 'file':
-                    try:
-                        local_file_path = os.path.join(local_target, item.name)
-                        
-                        # Download file
-                        with item.open(stream=True) as response:
-                            with open(local_file_path, 'wb') as f:
-                                shutil.copyfileobj(response.raw, f)
-                        
-                        downloaded_files.append({
-                            'name': item.name,
-                            'size': os.path.getsize(local_file_path),
-                            'path': local_file_path
-                        })
-                        
-                    except Exception as e:
-                        errors.append({
-                            'file': item.name,
-                            'error': str(e)
-                        })
-            
-            return {
-                'success': True,
-                'message': f'Synced {len(downloaded_files)} files from "{case_name}"',
-                'case_name': case_name,
-                'downloaded_files': downloaded_files,
-                'errors': errors,
-                'local_target': local_target
-            }
-            
-        except Exception as e:
-            return {
-                'success': False,
-                'error': f'Could not sync case folder "{case_name}": {str(e)}'
-            }
+        engine = CaseSyncEngine(self._cached_drive(), max_workers=max_workers)
+        return engine.sync_case(parent_folder, case_name, local_target)
+    
+    def _cached_drive(self) -> CachedDrive:
+        """
+        Drive with folder listings cached by path and node ID for this session
+        """
+        if self._drive_cache is None or self._drive_cache.drive.drive is not self.api.drive:
+            self._drive_cache = CachedDrive(PyiCloudDrive(self.api.drive))
+        return self._drive_cache
     
     def disconnect(self):
         """
         Disconnect from iCloud (session cookies remain for reuse)
         """
         self.api = None
+        self._drive_cache = None
         self.authenticated = False
         self.last_error = None
         logger.info("Disconnected from iCloud (session cookies preserved)")
@@ -446,7 +357,7 @@ def main():
     Test the modern iCloud service implementation
     """
     print("=" * 80)
-    print("> Testing Modern iCloud Service Implementation")
+    print("🧪 Testing Modern iCloud Service Implementation")
     print("=" * 80)
     
     # Load credentials from settings
@@ -465,19 +376,19 @@ def main():
             print(f"L Missing credentials in settings file")
             return
         
-        print(f"= Email: {email}")
-        print(f"= Password: {password}")
-        print(f"= Cookie directory: {cookie_dir}")
+        print(f"📧 Email: {email}")
+        print(f"🔐 Password: {password}")
+        print(f"📂 Cookie directory: {cookie_dir}")
         
         # Test connection
         service = ModerniCloudService(cookie_directory=cookie_dir)
         result = service.connect(email, password)
         
-        print(f"\n= Connection Result:")
+        print(f"\n📊 Connection Result:")
         print(json.dumps(result, indent=2))
         
         if result['success']:
-            print(f"\n= Testing folder access...")
+            print(f"\n🔍 Testing folder access...")
             folder_result = service.test_folder_access('/LegalCases')
             print(json.dumps(folder_result, indent=2))
         
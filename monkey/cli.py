@@ -5,9 +5,9 @@ Command-line interface for the Monkey Document Builder Service
 
 import os
 import sys
-import json
 import argparse
 import logging
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Optional
@@ -17,10 +17,12 @@ from datetime import datetime
 
 # Add monkey directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from satori_schema import serialization
 from core.document_builder import MonkeyDocumentBuilder
 from core.validators import DocumentValidator
 from core.output_manager import OutputManager
 from core.html_engine import HtmlEngine
+from core.metrics import registry as metrics_registry, PDF_SECONDS, PDF_FAILURES
 
 class MonkeyCLI:
     """Command Line Interface for Monkey Document Builder Service"""
@@ -241,8 +243,7 @@ For more information, visit: https://github.com/satori-dev/beaver-builder
             return 1
         
         try:
-            with open(complaint_json, 'r') as f:
-                data = json.load(f)
+            data = serialization.load(complaint_json)
             
             html_engine = HtmlEngine()
             html_content = html_engine.render_template('case_review.html', data)
@@ -330,8 +331,18 @@ For more information, visit: https://github.com/satori-dev/beaver-builder
                         # Fallback: same directory as HTML
                         pdf_file_path = Path(actual_html_path).parent / "complaint.pdf"
                     
-                    # Generate PDF using browser service
-                    pdf_result = self._generate_pdf_from_html(actual_html_path, str(pdf_file_path))
+                    # Reuse the cached print when the complaint inputs are unchanged
+                    cache_key = result.package.complaint_cache_key
+                    cached_pdf = self.builder.render_cache.get_pdf(cache_key) if cache_key else None
+                    if cached_pdf:
+                        shutil.copyfile(cached_pdf, pdf_file_path)
+                        print(f"   ♻️  Complaint unchanged - reusing cached PDF")
+                        pdf_result = True
+                    else:
+                        # Generate PDF using browser service
+                        pdf_result = self._generate_pdf_from_html(actual_html_path, str(pdf_file_path))
+                        if pdf_result and cache_key:
+                            self.builder.render_cache.put_pdf(cache_key, str(pdf_file_path))
                     
                     if pdf_result:
                         try:
@@ -448,8 +459,7 @@ For more information, visit: https://github.com/satori-dev/beaver-builder
         
         try:
             # Load case data
-            with open(complaint_json, 'r') as f:
-                case_data = json.load(f)
+            case_data = serialization.load(complaint_json)
             
             # Import summons generator
             from core.summons_generator import generate_summons_documents
@@ -487,8 +497,7 @@ For more information, visit: https://github.com/satori-dev/beaver-builder
             # Load and validate data
             validator = DocumentValidator()
             
-            with open(complaint_json, 'r') as f:
-                data = json.load(f)
+            data = serialization.load(complaint_json)
             
             result = validator.validate_complaint_data(data)
             
@@ -652,17 +661,16 @@ For more information, visit: https://github.com/satori-dev/beaver-builder
                     return parts[2].lower()  # e.g., YOUSSEF from hydrated_FCRA_YOUSSEF_EMAN_20250714
             
             # Fallback: try to read from JSON content
-            with open(json_path, 'r') as f:
-                data = json.load(f)
-                tiger_metadata = data.get('tiger_metadata', {})
-                if tiger_metadata.get('case_id'):
-                    return tiger_metadata['case_id'].lower()
+            data = serialization.load(json_path)
+            tiger_metadata = data.get('tiger_metadata', {})
+            if tiger_metadata.get('case_id'):
+                return tiger_metadata['case_id'].lower()
+            
+            # Try to extract from plaintiff name
+            plaintiff = data.get('parties', {}).get('plaintiff', {})
+            if plaintiff.get('name'):
+                return plaintiff['name'].split()[0].lower()
                 
-                # Try to extract from plaintiff name
-                plaintiff = data.get('parties', {}).get('plaintiff', {})
-                if plaintiff.get('name'):
-                    return plaintiff['name'].split()[0].lower()
-                    
         except Exception as e:
             self.logger.warning(f"Could not extract case ID from {json_path}: {e}")
         
@@ -676,28 +684,36 @@ For more information, visit: https://github.com/satori-dev/beaver-builder
                 self.logger.warning("Browser PDF service not available")
                 return False
             
-            result = subprocess.run([
-                sys.executable, str(browser_service_path), 'single', html_file_path, pdf_file_path
-            ], capture_output=True, text=True, timeout=30)
+            with PDF_SECONDS.time(method='browser'):
+                result = subprocess.run([
+                    sys.executable, str(browser_service_path), 'single', html_file_path, pdf_file_path
+                ], capture_output=True, text=True, timeout=30)
             
             if result.returncode == 0 and Path(pdf_file_path).exists():
                 self.logger.info(f"PDF generated successfully: {pdf_file_path}")
                 return True
             else:
+                PDF_FAILURES.inc(method='browser')
                 self.logger.error(f"PDF generation failed: {result.stderr}")
                 return False
                 
         except subprocess.TimeoutExpired:
+            PDF_FAILURES.inc(method='browser')
             self.logger.error("PDF generation timed out")
             return False
         except Exception as e:
+            PDF_FAILURES.inc(method='browser')
             self.logger.error(f"PDF generation error: {str(e)}")
             return False
 
 def main():
     """Main CLI entry point"""
     cli = MonkeyCLI()
-    return cli.run()
+    try:
+        return cli.run()
+    finally:
+        # Hand metrics to the dashboard when it set SATORI_METRICS_DIR
+        metrics_registry.write_snapshot()
 
 if __name__ == "__main__":
     sys.exit(main())
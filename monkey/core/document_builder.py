@@ -13,11 +13,15 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass
 
+from satori_schema import serialization
+
 from .validators import DocumentValidator
 from .output_manager import OutputManager
 from .html_engine import HtmlEngine
 from .pdf_service import PdfService
 from .quality_validator import QualityValidator
+from .render_cache import RenderCache
+from .metrics import PDF_SECONDS, PDF_FAILURES, PACKAGE_BUILD_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +34,8 @@ class DocumentPackage:
     cover_sheet: Optional[str] = None
     exhibits: Optional[List[str]] = None
     metadata: Optional[Dict[str, Any]] = None
+    complaint_cache_key: Optional[str] = None
+    complaint_cached: bool = False
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -39,7 +45,9 @@ class DocumentPackage:
             'summons': self.summons,
             'cover_sheet': self.cover_sheet,
             'exhibits': self.exhibits or [],
-            'metadata': self.metadata or {}
+            'metadata': self.metadata or {},
+            'complaint_cache_key': self.complaint_cache_key,
+            'complaint_cached': self.complaint_cached
         }
 
 @dataclass
@@ -60,7 +68,7 @@ class GenerationResult:
 class MonkeyDocumentBuilder:
     """Main document builder for generating legal documents"""
     
-    def __init__(self, template_dir: str = None, output_manager: OutputManager = None, html_engine: HtmlEngine = None, pdf_service: PdfService = None, quality_validator: QualityValidator = None):
+    def __init__(self, template_dir: str = None, output_manager: OutputManager = None, html_engine: HtmlEngine = None, pdf_service: PdfService = None, quality_validator: QualityValidator = None, render_cache: RenderCache = None):
         """
         Initialize document builder
         
@@ -70,12 +78,14 @@ class MonkeyDocumentBuilder:
             html_engine: Instance of HtmlEngine
             pdf_service: Instance of PdfService
             quality_validator: Instance of QualityValidator
+            render_cache: Instance of RenderCache (defaults to <output base>/render_cache)
         """
         self.validator = DocumentValidator()
         self.output_manager = output_manager or OutputManager()
         self.html_engine = html_engine or HtmlEngine()
         self.pdf_service = pdf_service or PdfService()
         self.quality_validator = quality_validator or QualityValidator()
+        self.render_cache = render_cache or RenderCache(Path(self.output_manager.base_path) / "render_cache")
         self.logger = logging.getLogger(__name__)
         
         self.logger.info("Monkey Document Builder initialized")
@@ -91,8 +101,14 @@ class MonkeyDocumentBuilder:
         except Exception:
             return False
     
-    def _generate_pdf_from_html(self, html_file_path: str) -> Optional[str]:
-        """Generate PDF from HTML file using browser service"""
+    def _generate_pdf_from_html(self, html_file_path: str, cache_key: Optional[str] = None) -> Optional[str]:
+        """Generate PDF from HTML file using browser service, reusing a cached print when available"""
+        if cache_key:
+            cached_pdf = self.render_cache.get_pdf(cache_key)
+            if cached_pdf:
+                self.logger.info(f"Reusing cached PDF: {cached_pdf}")
+                return cached_pdf
+
         if not self.browser_pdf_available:
             self.logger.warning("Browser PDF service not available")
             return None
@@ -102,21 +118,27 @@ class MonkeyDocumentBuilder:
             pdf_file_path = html_file_path.replace('.html', '.pdf')
             
             # Call browser PDF service
-            result = subprocess.run([
-                sys.executable, str(browser_service_path), 'single', html_file_path, pdf_file_path
-            ], capture_output=True, text=True, timeout=30)
+            with PDF_SECONDS.time(method='browser'):
+                result = subprocess.run([
+                    sys.executable, str(browser_service_path), 'single', html_file_path, pdf_file_path
+                ], capture_output=True, text=True, timeout=30)
             
             if result.returncode == 0 and Path(pdf_file_path).exists():
                 self.logger.info(f"PDF generated successfully: {pdf_file_path}")
+                if cache_key:
+                    self.render_cache.put_pdf(cache_key, pdf_file_path)
                 return pdf_file_path
             else:
+                PDF_FAILURES.inc(method='browser')
                 self.logger.error(f"PDF generation failed: {result.stderr}")
                 return None
                 
         except subprocess.TimeoutExpired:
+            PDF_FAILURES.inc(method='browser')
             self.logger.error("PDF generation timed out")
             return None
         except Exception as e:
+            PDF_FAILURES.inc(method='browser')
             self.logger.error(f"PDF generation error: {str(e)}")
             return None
     
@@ -145,11 +167,10 @@ class MonkeyDocumentBuilder:
             if isinstance(complaint_json, str):
                 if Path(complaint_json).exists():
                     # It's a file path
-                    with open(complaint_json, 'r') as f:
-                        data = json.load(f)
+                    data = serialization.load(complaint_json)
                 else:
                     # It's JSON string
-                    data = json.loads(complaint_json)
+                    data = serialization.loads(complaint_json)
             else:
                 data = complaint_json.copy()
             
@@ -177,10 +198,12 @@ class MonkeyDocumentBuilder:
                 complaint_result = self._generate_complaint(data, format, template_override)
                 if complaint_result.success:
                     package.complaint = complaint_result.content
+                    package.complaint_cache_key = complaint_result.cache_key
+                    package.complaint_cached = complaint_result.cached
                     
                     # Generate PDF if requested and HTML was generated
                     if with_pdf and format == 'html' and hasattr(complaint_result, 'file_path'):
-                        pdf_path = self._generate_pdf_from_html(complaint_result.file_path)
+                        pdf_path = self._generate_pdf_from_html(complaint_result.file_path, complaint_result.cache_key)
                         if pdf_path:
                             package.complaint_pdf = pdf_path
                             self.logger.info("Complaint PDF generated successfully")
@@ -213,6 +236,7 @@ class MonkeyDocumentBuilder:
             package.metadata = self._generate_metadata(data, document_types)
             
             generation_time = (datetime.now() - start_time).total_seconds()
+            PACKAGE_BUILD_SECONDS.observe(generation_time)
             
             self.logger.info(f"Document package generated successfully in {generation_time:.2f} seconds")
             
@@ -245,6 +269,24 @@ class MonkeyDocumentBuilder:
             template_vars = self._prepare_template_variables(data)
             self.logger.info(f"Template variables: {json.dumps(template_vars, indent=2)}")
             
+            if format == 'html':
+                # Unchanged input, template chain and format reuse the last render
+                cache_key = self.render_cache.make_key(
+                    document='complaint',
+                    data=template_vars,
+                    template=self.html_engine.template_hash(template_name),
+                    format=format
+                )
+                cached_html = self.render_cache.get_html(cache_key)
+                if cached_html:
+                    self.logger.info(f"Render cache hit for {template_name}: {cached_html}")
+                    with open(cached_html, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                    return DocumentGenerationResult(success=True, content=content, file_path=cached_html,
+                                                    cache_key=cache_key, cached=True)
+            else:
+                cache_key = None
+
             # Render template
             html = self.html_engine.render_template(template_name, template_vars)
             
@@ -265,8 +307,11 @@ class MonkeyDocumentBuilder:
                     f.write(html)
                 
                 self.logger.info(f"HTML file saved for browser service: {file_path}")
+                if self.render_cache.enabled:
+                    self.render_cache.put_html(cache_key, html)
 
-            return DocumentGenerationResult(success=True, content=content, file_path=str(file_path) if file_path else None)
+            return DocumentGenerationResult(success=True, content=content, file_path=str(file_path) if file_path else None,
+                                            cache_key=cache_key)
             
         except Exception as e:
             self.logger.error(f"Error generating complaint: {e}")
@@ -400,6 +445,8 @@ class DocumentGenerationResult:
     content: str = ""
     file_path: Optional[str] = None
     errors: List[str] = None
+    cache_key: Optional[str] = None
+    cached: bool = False
     
     def __post_init__(self):
         if self.errors is None:
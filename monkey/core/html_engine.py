@@ -1,9 +1,13 @@
 """
 HTML Engine for rendering Jinja2 templates.
 """
+import hashlib
 import jinja2
+import jinja2.meta
 from pathlib import Path
 
+from .metrics import RENDER_SECONDS
+
 class HtmlEngine:
     def __init__(self, template_dir: str = None):
         if template_dir is None:
@@ -21,8 +25,29 @@ class HtmlEngine:
         """
         Renders a Jinja2 template with the given data.
         """
-        template = self.env.get_template(template_name)
-        return template.render(data)
+        with RENDER_SECONDS.time(template=template_name):
+            template = self.env.get_template(template_name)
+            return template.render(data)
+
+    def template_hash(self, template_name: str) -> str:
+        """
+        Returns a hash of a template's source and every template it extends,
+        includes or imports, so any edit to the chain changes the hash.
+        """
+        digest = hashlib.sha256()
+        pending, seen = [template_name], set()
+        while pending:
+            name = pending.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            source, _, _ = self.env.loader.get_source(self.env, name)
+            digest.update(name.encode('utf-8'))
+            digest.update(source.encode('utf-8'))
+            referenced = jinja2.meta.find_referenced_templates(self.env.parse(source))
+            # Dynamic references (None) can't be resolved statically
+            pending.extend(sorted(ref for ref in referenced if ref))
+        return digest.hexdigest()
 
     def list_templates(self, pattern: str = None) -> list:
         """
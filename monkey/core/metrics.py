@@ -0,0 +1,24 @@
+"""
+Metrics for Monkey Document Builder
+Render/PDF telemetry on the shared satori_common metrics registry
+"""
+
+from satori_common.metrics import MetricsRegistry
+
+# Global registry for the Monkey process
+registry = MetricsRegistry('monkey')
+
+RENDER_SECONDS = registry.histogram(
+    'monkey_render_seconds', 'Jinja2 template render time', ('template',))
+PDF_SECONDS = registry.histogram(
+    'monkey_pdf_seconds', 'HTML to PDF conversion time', ('method',))
+PDF_FAILURES = registry.counter(
+    'monkey_pdf_failures_total', 'Failed HTML to PDF conversions', ('method',))
+PACKAGE_BUILD_SECONDS = registry.histogram(
+    'monkey_package_build_seconds', 'End-to-end complaint package build time')
+SUMMONS_SECONDS = registry.histogram(
+    'monkey_summons_generation_seconds', 'Time to render all summons for a case')
+SUMMONS_GENERATED = registry.counter(
+    'monkey_summons_generated_total', 'Summons documents rendered')
+RENDER_CACHE_REQUESTS = registry.counter(
+    'monkey_render_cache_requests_total', 'Render cache lookups', ('document', 'result'))
@@ -4,10 +4,11 @@ Handles the creation and organization of output files and directories.
 """
 
 import os
-import json
 from pathlib import Path
 from typing import Dict, Any, List
 
+from satori_schema import serialization
+
 from .version_manager import VersionManager
 
 class OutputManager:
@@ -68,9 +69,7 @@ class OutputManager:
         """
         file_path = self.package_dir / f"{basename}.json"
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
-            
+        serialization.dump(metadata, file_path)
         return file_path
 
     def get_package_directory(self) -> Path:
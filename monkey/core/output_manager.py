@@ -4,12 +4,13 @@ Core Output Management System for Monkey
 Handles the organization, storage, and metadata of all generated documents.
 """
 
-import json
 import logging
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+from satori_schema import serialization
+
 class OutputManager:
     """
     Manages the output of generated documents, including file organization,
@@ -98,8 +99,7 @@ class OutputManager:
         metadata["success"] = success
 
         try:
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2)
+            serialization.dump(metadata, metadata_path)
             self.logger.info(f"Successfully saved metadata to {metadata_path}")
         except IOError as e:
             self.logger.error(f"Error saving metadata to {metadata_path}: {e}")
@@ -114,8 +114,7 @@ class OutputManager:
         """
         report_path = self.reports_path / f"{report_name}.json"
         try:
-            with open(report_path, "w", encoding="utf-8") as f:
-                json.dump(report_data, f, indent=2)
+            serialization.dump(report_data, report_path)
             self.logger.info(f"Successfully generated report to {report_path}")
         except IOError as e:
             self.logger.error(f"Error generating report to {report_path}: {e}")
@@ -3,9 +3,12 @@ PDF Service for converting HTML to PDF using a headless Chrome instance.
 """
 import asyncio
 import json
+import time
 import aiohttp
 from typing import Optional
 
+from .metrics import PDF_SECONDS, PDF_FAILURES
+
 class PdfService:
     def __init__(self, chrome_url: str = "http://localhost:9222"):
         """
@@ -42,6 +45,16 @@ class PdfService:
         Returns:
             The PDF content as bytes.
         """
+        start = time.perf_counter()
+        try:
+            return await self._render_to_pdf(html_content, options)
+        except Exception:
+            PDF_FAILURES.inc(method='devtools')
+            raise
+        finally:
+            PDF_SECONDS.observe(time.perf_counter() - start, method='devtools')
+
+    async def _render_to_pdf(self, html_content: str, options: Optional[dict]) -> bytes:
         browser_ws_url = await self._get_browser_ws_url()
         
         async with aiohttp.ClientSession() as session:
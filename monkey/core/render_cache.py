@@ -0,0 +1,146 @@
+"""
+Render Cache for Monkey
+
+Memoizes rendered documents by a hash of their inputs so repeated
+"Generate" clicks on an unchanged case reuse the existing HTML/PDF
+instead of re-rendering and re-printing.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .metrics import RENDER_CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+# Set MONKEY_RENDER_CACHE=0 to always re-render
+CACHE_ENV = 'MONKEY_RENDER_CACHE'
+
+
+def canonical_hash(value: Any) -> str:
+    """SHA-256 of the canonical JSON form of ``value`` (sorted keys, no whitespace)"""
+    payload = json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def file_hash(path: str) -> str:
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_enabled() -> bool:
+    return os.environ.get(CACHE_ENV, '1') != '0'
+
+
+def _atomic_write_text(path: Path, content: str):
+    fd, temp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class RenderCache:
+    """
+    Content-addressed store of rendered artifacts
+
+    Each entry is ``<key>.html`` with an optional ``<key>.pdf`` next to it,
+    where the key is the hash of everything that affects the output.
+    """
+
+    def __init__(self, cache_dir: str, enabled: Optional[bool] = None):
+        self.cache_dir = Path(cache_dir)
+        self.enabled = cache_enabled() if enabled is None else enabled
+
+    def make_key(self, **parts: Any) -> str:
+        """Build a cache key from named inputs (input JSON, template hash, settings...)"""
+        return canonical_hash(parts)
+
+    def get_html(self, key: str, document: str = 'complaint') -> Optional[str]:
+        """Path of the cached HTML for ``key``, or None on a miss"""
+        path = self.cache_dir / f"{key}.html"
+        hit = self.enabled and path.exists()
+        RENDER_CACHE_REQUESTS.inc(document=document, result='hit' if hit else 'miss')
+        return str(path) if hit else None
+
+    def get_pdf(self, key: str) -> Optional[str]:
+        """Path of the cached PDF for ``key``, or None if it was never printed"""
+        path = self.cache_dir / f"{key}.pdf"
+        return str(path) if self.enabled and path.exists() else None
+
+    def put_html(self, key: str, html: str) -> str:
+        """Store rendered HTML and return its path"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.html"
+        _atomic_write_text(path, html)
+        return str(path)
+
+    def put_pdf(self, key: str, pdf_path: str) -> Optional[str]:
+        """Copy a printed PDF into the cache; failures only cost a future re-print"""
+        if not self.enabled:
+            return None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            target = self.cache_dir / f"{key}.pdf"
+            if Path(pdf_path).resolve() == target.resolve():
+                return str(target)
+            temp_path = self.cache_dir / f".{key}.pdf.tmp"
+            shutil.copyfile(pdf_path, temp_path)
+            os.replace(temp_path, target)
+            return str(target)
+        except OSError as e:
+            logger.warning(f"Could not cache PDF {pdf_path}: {e}")
+            return None
+
+
+class ArtifactManifest:
+    """
+    Records the input hash behind each file in an output directory
+
+    Used where artifacts live at fixed names (one summons per defendant), so a
+    file is only rewritten when its own inputs changed.
+    """
+
+    MANIFEST_NAME = '.render_manifest.json'
+
+    def __init__(self, directory: str, enabled: Optional[bool] = None):
+        self.directory = Path(directory)
+        self.path = self.directory / self.MANIFEST_NAME
+        self.enabled = cache_enabled() if enabled is None else enabled
+        self.entries: Dict[str, str] = {}
+        if self.enabled and self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable render manifest {self.path}: {e}")
+
+    def is_current(self, filename: str, key: str, document: str = 'summons') -> bool:
+        """True when ``filename`` exists and was rendered from the same inputs"""
+        hit = (self.enabled and self.entries.get(filename) == key
+               and (self.directory / filename).exists())
+        RENDER_CACHE_REQUESTS.inc(document=document, result='hit' if hit else 'miss')
+        return hit
+
+    def record(self, filename: str, key: str):
+        self.entries[filename] = key
+
+    def save(self):
+        if not self.enabled:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _atomic_write_text(self.path, json.dumps(self.entries, indent=2, sort_keys=True))
@@ -16,6 +16,9 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional
 from jinja2 import Environment, FileSystemLoader, Template
 
+from .metrics import SUMMONS_SECONDS, SUMMONS_GENERATED
+from .render_cache import ArtifactManifest, canonical_hash, file_hash
+
 logger = logging.getLogger(__name__)
 
 class SummonsGenerator:
@@ -60,49 +63,70 @@ class SummonsGenerator:
             List of file paths to generated summons HTML files
         """
         try:
-            # Validate input data
-            if not self._validate_case_data(case_data):
-                raise ValueError("Invalid case data for summons generation")
-            
-            # Extract defendants list
-            defendants = case_data.get('parties', {}).get('defendants', [])
-            if not defendants:
-                raise ValueError("No defendants found in case data")
+            with SUMMONS_SECONDS.time():
+                return self._generate_summons_files(case_data, output_dir)
+        except Exception as e:
+            logger.error(f"Error generating summons documents: {str(e)}")
+            raise
+
+    def _generate_summons_files(self, case_data: Dict[str, Any], output_dir: str) -> List[str]:
+        # Validate input data
+        if not self._validate_case_data(case_data):
+            raise ValueError("Invalid case data for summons generation")
+        
+        # Extract defendants list
+        defendants = case_data.get('parties', {}).get('defendants', [])
+        if not defendants:
+            raise ValueError("No defendants found in case data")
+        
+        # Use output_dir directly (it should already point to the summons directory)
+        summons_dir = output_dir
+        os.makedirs(summons_dir, exist_ok=True)
+        
+        # Each summons is keyed by its own template data (which already carries the
+        # resolved defendant address and firm details) plus the template source
+        manifest = ArtifactManifest(summons_dir)
+        template_hash = file_hash(os.path.join(self.template_dir, self.template_file))
+        template = None
+        
+        generated_files = []
+        reused = 0
+        
+        # Generate individual summons for each defendant
+        for idx, defendant in enumerate(defendants):
+            summons_data = self._prepare_summons_data(case_data, defendant, idx)
             
-            # Load summons template
-            template = self._load_summons_template()
+            # Create filename for this defendant's summons
+            defendant_name_clean = self._clean_filename(defendant.get('name', f'defendant_{idx}'))
+            filename = f"summons_{defendant_name_clean}.html"
+            filepath = os.path.join(summons_dir, filename)
             
-            # Use output_dir directly (it should already point to the summons directory)
-            summons_dir = output_dir
-            os.makedirs(summons_dir, exist_ok=True)
+            render_key = canonical_hash({'data': summons_data, 'template': template_hash})
+            if manifest.is_current(filename, render_key):
+                generated_files.append(filepath)
+                reused += 1
+                logger.info(f"Summons unchanged for defendant: {defendant.get('name')} -> {filepath}")
+                continue
             
-            generated_files = []
+            # Load summons template on the first defendant that needs rendering
+            if template is None:
+                template = self._load_summons_template()
             
-            # Generate individual summons for each defendant
-            for idx, defendant in enumerate(defendants):
-                summons_data = self._prepare_summons_data(case_data, defendant, idx)
-                
-                # Render HTML using Jinja2
-                rendered_html = template.render(**summons_data)
-                
-                # Create filename for this defendant's summons
-                defendant_name_clean = self._clean_filename(defendant.get('name', f'defendant_{idx}'))
-                filename = f"summons_{defendant_name_clean}.html"
-                filepath = os.path.join(summons_dir, filename)
-                
-                # Write rendered HTML to file
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(rendered_html)
-                
-                generated_files.append(filepath)
-                logger.info(f"Generated summons for defendant: {defendant.get('name')} -> {filepath}")
+            # Render HTML using Jinja2
+            rendered_html = template.render(**summons_data)
             
-            logger.info(f"Successfully generated {len(generated_files)} summons documents")
-            return generated_files
+            # Write rendered HTML to file
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(rendered_html)
+            manifest.record(filename, render_key)
             
-        except Exception as e:
-            logger.error(f"Error generating summons documents: {str(e)}")
-            raise
+            generated_files.append(filepath)
+            SUMMONS_GENERATED.inc()
+            logger.info(f"Generated summons for defendant: {defendant.get('name')} -> {filepath}")
+        
+        manifest.save()
+        logger.info(f"Successfully generated {len(generated_files)} summons documents ({reused} unchanged)")
+        return generated_files
     
     def _validate_case_data(self, case_data: Dict[str, Any]) -> bool:
         """
@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
-from satori_schema.hydrated_json_schema import HydratedJSON
+from satori_schema.hydrated_json_schema import HYDRATED_JSON_VALIDATOR
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +58,7 @@ class DocumentValidator:
         
         try:
             # First, validate against the unified schema
-            HydratedJSON.model_validate(data)
+            HYDRATED_JSON_VALIDATOR.validate_python(data)
             
             # Additional Beaver-specific validation
             self._validate_beaver_specific_requirements(data, errors, warnings)
@@ -0,0 +1,78 @@
+"""
+Tests for render memoization.
+"""
+import os
+import tempfile
+import unittest
+
+from monkey.core.render_cache import RenderCache, ArtifactManifest, canonical_hash
+from monkey.core.summons_generator import SummonsGenerator
+
+
+def _case_data(defendants):
+    return {
+        'case_information': {'case_number': '1:25-cv-01987', 'court_district': 'EASTERN DISTRICT OF NEW YORK'},
+        'parties': {
+            'plaintiff': {'name': 'Eman Youssef'},
+            'defendants': [{'name': name} for name in defendants]
+        },
+        'plaintiff_counsel': {'name': 'Kevin Mallon', 'firm': 'Mallon Consumer Law Group, PLLC'}
+    }
+
+
+class TestRenderCache(unittest.TestCase):
+
+    def test_canonical_hash_ignores_key_order(self):
+        self.assertEqual(canonical_hash({'a': 1, 'b': [1, 2]}), canonical_hash({'b': [1, 2], 'a': 1}))
+        self.assertNotEqual(canonical_hash({'a': 1}), canonical_hash({'a': 2}))
+
+    def test_html_and_pdf_round_trip(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = RenderCache(os.path.join(temp_dir, 'cache'), enabled=True)
+            key = cache.make_key(data={'case': 1}, template='abc')
+            self.assertIsNone(cache.get_html(key))
+
+            cache.put_html(key, '<html></html>')
+            self.assertTrue(cache.get_html(key))
+            self.assertIsNone(cache.get_pdf(key))
+
+            pdf_path = os.path.join(temp_dir, 'complaint.pdf')
+            with open(pdf_path, 'wb') as f:
+                f.write(b'%PDF-1.4')
+            cache.put_pdf(key, pdf_path)
+            with open(cache.get_pdf(key), 'rb') as f:
+                self.assertEqual(f.read(), b'%PDF-1.4')
+
+    def test_manifest_requires_existing_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manifest = ArtifactManifest(temp_dir, enabled=True)
+            manifest.record('summons_a.html', 'k1')
+            manifest.save()
+
+            reloaded = ArtifactManifest(temp_dir, enabled=True)
+            self.assertFalse(reloaded.is_current('summons_a.html', 'k1'))
+            open(os.path.join(temp_dir, 'summons_a.html'), 'w').close()
+            self.assertTrue(reloaded.is_current('summons_a.html', 'k1'))
+            self.assertFalse(reloaded.is_current('summons_a.html', 'k2'))
+
+    def test_summons_rerenders_only_changed_defendant(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generator = SummonsGenerator()
+            files = generator.generate_summons_for_case(_case_data(['TD Bank, NA', 'Experian']), temp_dir)
+            for path in files:
+                with open(path, 'w') as f:
+                    f.write('marker')
+
+            # Same caption, one defendant's address changed
+            case_data = _case_data(['TD Bank, NA', 'Experian'])
+            case_data['parties']['defendants'][1]['address'] = {'street': '1 Main St', 'city': 'Allen', 'state': 'TX'}
+            files = generator.generate_summons_for_case(case_data, temp_dir)
+
+            with open(files[0]) as f:
+                self.assertEqual(f.read(), 'marker')
+            with open(files[1]) as f:
+                self.assertNotEqual(f.read(), 'marker')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,4 @@
+"""
+Satori Common
+Runtime utilities shared by Tiger, Monkey, the dashboard and isync that are not part of the schema
+"""
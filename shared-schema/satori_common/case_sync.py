@@ -0,0 +1,592 @@
+"""
+Delta synchronization of case folders from a remote drive.
+
+Each local case folder keeps a manifest (``.sync_manifest.json``) of the
+remote name, size, modified time and etag of every file it has synced. A
+sync lists the remote folder, compares it with the manifest and downloads
+only new or changed files over a bounded thread pool, so re-syncing
+unchanged cases costs one folder listing each.
+
+Downloads go to ``.<name>.<version>.part`` next to the target and are
+renamed into place once complete. The version token is derived from the
+remote metadata, so an interrupted transfer resumes from the bytes already
+on disk as long as the remote file has not changed since; stale partials are
+removed. Files deleted remotely are dropped from the manifest but never
+deleted locally.
+
+The remote side sits behind ``RemoteDrive``: ``PyiCloudDrive`` adapts the
+pyicloud Drive API and ``LocalDirectoryDrive`` serves a local directory (a
+Finder-synced iCloud Drive folder, or a fixture tree). ``CachedDrive`` wraps
+either with a TTL cache of folder listings keyed by path and node ID, so a
+sync cycle enumerates the case tree once (one batched request for all case
+folders) instead of walking from the root for every case.
+
+Shared by the dashboard's SyncManager and the standalone isync tool.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = '.sync_manifest.json'
+MANIFEST_VERSION = 1
+PART_SUFFIX = '.part'
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_TREE_TTL = 300  # seconds a cached folder listing is trusted
+CHUNK_BYTES = 1024 * 1024
+
+
+@dataclass
+class RemoteFile:
+    """Metadata for one file in a remote case folder."""
+    name: str
+    size: int
+    modified: Optional[str] = None
+    etag: Optional[str] = None
+    handle: Any = field(default=None, compare=False, repr=False)
+
+    def signature(self) -> Dict[str, Any]:
+        return {'size': self.size, 'modified': self.modified, 'etag': self.etag}
+
+    def version_token(self) -> str:
+        """Short stable token naming this version's partial download."""
+        raw = json.dumps(self.signature(), sort_keys=True).encode('utf-8')
+        return hashlib.sha1(raw).hexdigest()[:12]
+
+
+def normalize_path(folder_path: str) -> str:
+    """Canonical ``/a/b`` form of a drive path (``/`` for the root)."""
+    return '/' + '/'.join(part for part in folder_path.split('/') if part)
+
+
+def join_path(folder_path: str, name: str) -> str:
+    return normalize_path(f'{folder_path}/{name}')
+
+
+@dataclass
+class RemoteFolder:
+    """A sub-folder as it appears in its parent's listing."""
+    name: str
+    node_id: Optional[str] = None
+    stamp: Optional[str] = None  # changes with the folder's contents; None if unknown
+
+
+@dataclass
+class FolderListing:
+    """Direct children of one remote folder."""
+    path: str
+    node_id: Optional[str]
+    stamp: Optional[str]
+    folders: List[RemoteFolder]
+    files: List[RemoteFile]
+    fetched_at: float = field(default_factory=time.monotonic)
+
+
+class RemoteDrive(ABC):
+    """Minimal drive API needed to sync case folders."""
+
+    @abstractmethod
+    def list_folder(self, folder_path: str, node_id: Optional[str] = None) -> FolderListing:
+        """
+        List ``folder_path``; ``node_id`` lets drives that address folders by
+        ID skip resolving the path from the root.
+        """
+
+    @abstractmethod
+    def read_chunks(self, folder_path: str, remote_file: RemoteFile,
+                    offset: int = 0) -> Iterator[bytes]:
+        """Yield the file's bytes starting at ``offset``."""
+
+    def list_folders_batch(self, parent_path: str,
+                           folders: List[RemoteFolder]) -> List[FolderListing]:
+        """List several sub-folders of ``parent_path`` (one request where supported)."""
+        return [self.list_folder(join_path(parent_path, folder.name), folder.node_id)
+                for folder in folders]
+
+    def list_tree(self, parent_path: str, refresh: bool = False) -> Dict[str, FolderListing]:
+        """Listings of every sub-folder of ``parent_path``, keyed by folder name."""
+        parent = self.list_folder(parent_path)
+        listings = self.list_folders_batch(parent_path, parent.folders)
+        return {folder.name: listing for folder, listing in zip(parent.folders, listings)}
+
+    def list_folders(self, folder_path: str) -> List[str]:
+        """Names of the sub-folders of ``folder_path``."""
+        return [folder.name for folder in self.list_folder(folder_path).folders]
+
+    def list_files(self, folder_path: str) -> List[RemoteFile]:
+        """Files directly inside ``folder_path``."""
+        return self.list_folder(folder_path).files
+
+
+class LocalDirectoryDrive(RemoteDrive):
+    """Drive backed by a local directory tree."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, folder_path: str) -> str:
+        return os.path.join(self.root, folder_path.strip('/'))
+
+    def list_folder(self, folder_path: str, node_id: Optional[str] = None) -> FolderListing:
+        path = normalize_path(folder_path)
+        folders = []
+        files = []
+        with os.scandir(self._path(path)) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir():
+                    # A directory's mtime misses in-place file edits, so no stamp
+                    folders.append(RemoteFolder(name=entry.name, node_id=join_path(path, entry.name)))
+                elif entry.is_file():
+                    stat = entry.stat()
+                    files.append(RemoteFile(
+                        name=entry.name,
+                        size=stat.st_size,
+                        modified=datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                        etag=f'{stat.st_ino:x}-{stat.st_mtime_ns:x}',
+                    ))
+        return FolderListing(
+            path=path,
+            node_id=path,
+            stamp=None,
+            folders=sorted(folders, key=lambda f: f.name),
+            files=sorted(files, key=lambda f: f.name),
+        )
+
+    def read_chunks(self, folder_path: str, remote_file: RemoteFile,
+                    offset: int = 0) -> Iterator[bytes]:
+        with open(os.path.join(self._path(folder_path), remote_file.name), 'rb') as f:
+            f.seek(offset)
+            while True:
+                chunk = f.read(CHUNK_BYTES)
+                if not chunk:
+                    break
+                yield chunk
+
+
+class PyiCloudDrive(RemoteDrive):
+    """
+    Drive backed by pyicloud's ``api.drive`` service.
+
+    Folders are fetched by ``drivewsid`` through the same
+    ``retrieveItemDetailsInFolders`` call pyicloud's ``DriveNode`` uses,
+    which accepts many folders per request; that is what makes
+    ``list_folders_batch`` a single round trip. pyicloud's own node objects
+    cache their children forever, so they are only built for downloads.
+    """
+
+    ROOT_ID = 'FOLDER::com.apple.CloudDocs::root'
+
+    def __init__(self, drive):
+        self.drive = drive
+
+    def _retrieve(self, node_ids: List[str]) -> List[Dict[str, Any]]:
+        service = self.drive
+        response = service.session.post(
+            service._service_root + '/retrieveItemDetailsInFolders',
+            params=service.params,
+            data=json.dumps([{'drivewsid': node_id, 'partialData': False} for node_id in node_ids]),
+        )
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _item_name(item: Dict[str, Any]) -> str:
+        extension = item.get('extension')
+        return f"{item['name']}.{extension}" if extension else item['name']
+
+    def _listing(self, path: str, data: Dict[str, Any]) -> FolderListing:
+        folders = []
+        files = []
+        for item in data.get('items', []):
+            if item.get('type') == 'FOLDER':
+                folders.append(RemoteFolder(name=self._item_name(item), node_id=item.get('drivewsid'),
+                                            stamp=item.get('etag')))
+            elif item.get('type') == 'FILE':
+                files.append(RemoteFile(
+                    name=self._item_name(item),
+                    size=item.get('size') or 0,
+                    modified=item.get('dateModified'),
+                    etag=item.get('etag'),
+                    handle=item,
+                ))
+        return FolderListing(
+            path=path,
+            node_id=data.get('drivewsid'),
+            stamp=data.get('etag'),
+            folders=sorted(folders, key=lambda f: f.name),
+            files=sorted(files, key=lambda f: f.name),
+        )
+
+    def _resolve(self, path: str) -> str:
+        """Walk from the root to a folder's ID (one request per segment)."""
+        node_id = self.ROOT_ID
+        current = '/'
+        for part in path.strip('/').split('/'):
+            if not part:
+                continue
+            listing = self._listing(current, self._retrieve([node_id])[0])
+            match = next((folder for folder in listing.folders if folder.name == part), None)
+            if match is None:
+                raise FileNotFoundError(f'Folder "{part}" not found in "{current}"')
+            node_id, current = match.node_id, join_path(current, part)
+        return node_id
+
+    def list_folder(self, folder_path: str, node_id: Optional[str] = None) -> FolderListing:
+        path = normalize_path(folder_path)
+        node_id = node_id or self._resolve(path)
+        return self._listing(path, self._retrieve([node_id])[0])
+
+    def list_folders_batch(self, parent_path: str,
+                           folders: List[RemoteFolder]) -> List[FolderListing]:
+        if not folders:
+            return []
+        if any(folder.node_id is None for folder in folders):
+            return super().list_folders_batch(parent_path, folders)
+        by_id = {data.get('drivewsid'): data for data in self._retrieve([f.node_id for f in folders])}
+        return [self._listing(join_path(parent_path, folder.name), by_id[folder.node_id])
+                for folder in folders]
+
+    def read_chunks(self, folder_path: str, remote_file: RemoteFile,
+                    offset: int = 0) -> Iterator[bytes]:
+        from pyicloud.services.drive import DriveNode
+
+        item = remote_file.handle
+        if item is None:
+            item = next(f.handle for f in self.list_files(folder_path) if f.name == remote_file.name)
+        headers = {'Range': f'bytes={offset}-'} if offset else {}
+        with DriveNode(self.drive, item).open(stream=True, headers=headers) as response:
+            # Servers may ignore the range and send the whole file
+            skip = offset if offset and response.status_code != 206 else 0
+            for chunk in response.iter_content(CHUNK_BYTES):
+                if skip:
+                    if len(chunk) <= skip:
+                        skip -= len(chunk)
+                        continue
+                    chunk, skip = chunk[skip:], 0
+                yield chunk
+
+
+class CachedDrive(RemoteDrive):
+    """
+    Memoizes another drive's folder listings by path and node ID.
+
+    A listing is reused for ``ttl`` seconds. Whenever a parent listing is
+    fetched, each cached child whose stamp in it differs (or is unknown) is
+    dropped along with its subtree, so changed folders are re-listed even
+    before their TTL runs out. Paths are resolved through cached ancestors,
+    never by walking from the root twice. ``on_lookup`` is called with
+    ``'hit'`` or ``'miss'`` for each listing lookup (e.g. to count them).
+    """
+
+    def __init__(self, drive: RemoteDrive, ttl: float = DEFAULT_TREE_TTL,
+                 on_lookup: Optional[Callable[[str], None]] = None):
+        self.drive = drive
+        self.ttl = ttl
+        self.on_lookup = on_lookup or (lambda result: None)
+        self._listings: Dict[str, FolderListing] = {}
+        self._paths_by_id: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _is_fresh(self, listing: Optional[FolderListing]) -> bool:
+        return listing is not None and time.monotonic() - listing.fetched_at < self.ttl
+
+    def _store(self, listing: FolderListing):
+        with self._lock:
+            for folder in listing.folders:
+                child_path = join_path(listing.path, folder.name)
+                cached = self._listings.get(child_path)
+                if cached is not None and (folder.stamp is None or folder.stamp != cached.stamp):
+                    self._drop_subtree(child_path)
+            self._listings[listing.path] = listing
+            if listing.node_id:
+                self._paths_by_id[listing.node_id] = listing.path
+
+    def _drop_subtree(self, path: str):
+        prefix = path.rstrip('/') + '/'
+        for cached_path in [p for p in self._listings if p == path or p.startswith(prefix)]:
+            listing = self._listings.pop(cached_path)
+            self._paths_by_id.pop(listing.node_id, None)
+
+    def invalidate(self, folder_path: Optional[str] = None):
+        """Forget one folder's subtree, or everything."""
+        with self._lock:
+            if folder_path is None:
+                self._listings.clear()
+                self._paths_by_id.clear()
+            else:
+                self._drop_subtree(normalize_path(folder_path))
+
+    def path_for_node(self, node_id: str) -> Optional[str]:
+        """Path of a cached folder by its node ID."""
+        return self._paths_by_id.get(node_id)
+
+    def _child_node_id(self, path: str) -> Optional[str]:
+        if path == '/':
+            return None
+        parent_path, _, name = path.rpartition('/')
+        parent = self.list_folder(parent_path or '/')
+        for folder in parent.folders:
+            if folder.name == name:
+                return folder.node_id
+        raise FileNotFoundError(f'Folder "{name}" not found in "{parent.path}"')
+
+    def list_folder(self, folder_path: str, node_id: Optional[str] = None) -> FolderListing:
+        path = normalize_path(folder_path)
+        with self._lock:
+            listing = self._listings.get(path)
+        if self._is_fresh(listing):
+            self.on_lookup('hit')
+            return listing
+        self.on_lookup('miss')
+
+        if node_id is None:
+            node_id = listing.node_id if listing is not None else self._child_node_id(path)
+        listing = self.drive.list_folder(path, node_id)
+        self._store(listing)
+        return listing
+
+    def list_tree(self, parent_path: str, refresh: bool = False) -> Dict[str, FolderListing]:
+        """
+        Listings of every sub-folder of ``parent_path`` in at most two calls.
+
+        ``refresh`` re-lists the parent, which invalidates changed children;
+        those and any expired children are then fetched in one batch.
+        """
+        path = normalize_path(parent_path)
+        if refresh:
+            with self._lock:
+                listing = self._listings.get(path)
+                if listing is not None:
+                    listing.fetched_at = float('-inf')
+        parent = self.list_folder(path)
+
+        with self._lock:
+            stale = [folder for folder in parent.folders
+                     if not self._is_fresh(self._listings.get(join_path(path, folder.name)))]
+        for listing in self.drive.list_folders_batch(path, stale):
+            self._store(listing)
+
+        with self._lock:
+            return {folder.name: self._listings[join_path(path, folder.name)]
+                    for folder in parent.folders}
+
+    def read_chunks(self, folder_path: str, remote_file: RemoteFile,
+                    offset: int = 0) -> Iterator[bytes]:
+        return self.drive.read_chunks(folder_path, remote_file, offset)
+
+
+class CaseSyncEngine:
+    """Downloads new or changed files of case folders from a ``RemoteDrive``."""
+
+    def __init__(self, drive: RemoteDrive, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.drive = drive
+        self.max_workers = max(1, max_workers)
+
+    # -- manifest ---------------------------------------------------------
+
+    @staticmethod
+    def manifest_path(local_target: str) -> str:
+        return os.path.join(local_target, MANIFEST_FILENAME)
+
+    def load_manifest(self, local_target: str) -> Dict[str, Any]:
+        try:
+            with open(self.manifest_path(local_target), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable sync manifest in {local_target}: {e}")
+        return {'version': MANIFEST_VERSION, 'files': {}}
+
+    def save_manifest(self, local_target: str, manifest: Dict[str, Any]):
+        fd, tmp_path = tempfile.mkstemp(dir=local_target, prefix='.sync_manifest.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.manifest_path(local_target))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    # -- planning ---------------------------------------------------------
+
+    def plan(self, remote_files: List[RemoteFile], manifest: Dict[str, Any],
+             local_target: str) -> List[RemoteFile]:
+        """Remote files that are new, changed, or missing locally."""
+        known = manifest.get('files', {})
+        pending = []
+        for remote_file in remote_files:
+            entry = known.get(remote_file.name)
+            local_path = os.path.join(local_target, remote_file.name)
+            try:
+                local_size = os.path.getsize(local_path)
+            except OSError:
+                local_size = None
+            if (entry is None
+                    or {k: entry.get(k) for k in ('size', 'modified', 'etag')} != remote_file.signature()
+                    or local_size != remote_file.size):
+                pending.append(remote_file)
+        return pending
+
+    # -- transfer ---------------------------------------------------------
+
+    @staticmethod
+    def _part_path(local_target: str, remote_file: RemoteFile) -> str:
+        return os.path.join(local_target,
+                            f'.{remote_file.name}.{remote_file.version_token()}{PART_SUFFIX}')
+
+    @staticmethod
+    def _remove_stale_parts(local_target: str, names: List[str], keep: set):
+        prefixes = tuple(f'.{name}.' for name in names)
+        with os.scandir(local_target) as entries:
+            for entry in entries:
+                if (entry.name.endswith(PART_SUFFIX) and entry.name.startswith(prefixes)
+                        and entry.path not in keep):
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+
+    def _download(self, folder_path: str, remote_file: RemoteFile,
+                  local_target: str) -> Dict[str, Any]:
+        part_path = self._part_path(local_target, remote_file)
+        try:
+            offset = os.path.getsize(part_path)
+        except OSError:
+            offset = 0
+        if offset > remote_file.size:
+            os.unlink(part_path)
+            offset = 0
+
+        transferred = 0
+        if offset < remote_file.size or remote_file.size == 0:
+            with open(part_path, 'ab') as f:
+                for chunk in self.drive.read_chunks(folder_path, remote_file, offset):
+                    f.write(chunk)
+                    transferred += len(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+
+        size = os.path.getsize(part_path)
+        if size != remote_file.size:
+            raise IOError(f'incomplete download ({size} of {remote_file.size} bytes)')
+
+        local_path = os.path.join(local_target, remote_file.name)
+        os.replace(part_path, local_path)
+        return {
+            'name': remote_file.name,
+            'size': size,
+            'path': local_path,
+            'bytes_transferred': transferred,
+            'resumed_from': offset,
+        }
+
+    # -- public API -------------------------------------------------------
+
+    def sync_case(self, parent_folder: str, case_name: str, local_target: str,
+                  remote_files: Optional[List[RemoteFile]] = None) -> Dict[str, Any]:
+        """
+        Bring ``local_target`` up to date with ``parent_folder/case_name``.
+
+        ``remote_files`` may come from an earlier tree listing. Returns the
+        same shape as ``iCloudService.sync_case_folder`` plus
+        ``skipped_files``, ``bytes_downloaded`` and ``resumed_files``.
+        """
+        folder_path = join_path(parent_folder, case_name)
+        try:
+            if remote_files is None:
+                remote_files = self.drive.list_files(folder_path)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Could not list case folder "{case_name}": {str(e)}'
+            }
+
+        os.makedirs(local_target, exist_ok=True)
+        manifest = self.load_manifest(local_target)
+        manifest['remote_folder'] = folder_path
+        pending = self.plan(remote_files, manifest, local_target)
+
+        remote_names = {remote_file.name for remote_file in remote_files}
+        removed = [name for name in manifest['files'] if name not in remote_names]
+        for name in removed:
+            del manifest['files'][name]
+
+        self._remove_stale_parts(local_target, [f.name for f in pending],
+                                 {self._part_path(local_target, f) for f in pending})
+
+        downloaded_files = []
+        errors = []
+        lock = threading.Lock()
+
+        def record(remote_file: RemoteFile):
+            entry = remote_file.signature()
+            entry['synced_at'] = datetime.now().isoformat()
+            with lock:
+                manifest['files'][remote_file.name] = entry
+                # Saved per file so an interrupted sync keeps its progress
+                self.save_manifest(local_target, manifest)
+
+        if pending:
+            workers = min(self.max_workers, len(pending))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='case-sync') as pool:
+                futures = {pool.submit(self._download, folder_path, remote_file, local_target): remote_file
+                           for remote_file in pending}
+                for future in as_completed(futures):
+                    remote_file = futures[future]
+                    try:
+                        downloaded_files.append(future.result())
+                        record(remote_file)
+                    except Exception as e:
+                        logger.warning(f"Sync of {folder_path}/{remote_file.name} failed: {e}")
+                        errors.append({'file': remote_file.name, 'error': str(e)})
+        if (removed and not downloaded_files) or not os.path.exists(self.manifest_path(local_target)):
+            self.save_manifest(local_target, manifest)
+
+        downloaded_files.sort(key=lambda item: item['name'])
+        return {
+            'success': True,
+            'message': (f'Synced {len(downloaded_files)} files from "{case_name}" '
+                        f'({len(remote_files) - len(pending)} unchanged)'),
+            'case_name': case_name,
+            'downloaded_files': downloaded_files,
+            'skipped_files': len(remote_files) - len(pending),
+            'removed_remote_files': removed,
+            'bytes_downloaded': sum(item['bytes_transferred'] for item in downloaded_files),
+            'resumed_files': sum(1 for item in downloaded_files if item['resumed_from']),
+            'errors': errors,
+            'local_target': local_target
+        }
+
+    def sync_cases(self, parent_folder: str, local_root: str,
+                   case_names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Sync every case folder under ``parent_folder`` (or the given names).
+
+        The remote tree is listed once up front rather than once per case.
+        """
+        tree = self.drive.list_tree(parent_folder, refresh=True)
+        if case_names is None:
+            case_names = list(tree)
+        return [self.sync_case(parent_folder, case_name, os.path.join(local_root, case_name),
+                               remote_files=tree[case_name].files if case_name in tree else None)
+                for case_name in case_names]
@@ -0,0 +1,299 @@
+"""
+Prometheus-style Metrics Registry shared by Tiger, Monkey and the Dashboard
+Counters, gauges and histograms with text exposition and mergeable snapshots
+
+Each service keeps its own ``MetricsRegistry`` and metric definitions.
+Tiger and Monkey CLI runs write snapshots to $SATORI_METRICS_DIR, and the
+dashboard merges them into its registry.
+"""
+
+import os
+import time
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple, Any
+
+from satori_schema import serialization
+
+logger = logging.getLogger(__name__)
+
+# Seconds; extended past the Prometheus defaults to cover OCR of large PDFs
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# Environment variable naming a directory where CLI runs drop metric snapshots
+METRICS_DIR_ENV = 'SATORI_METRICS_DIR'
+
+
+def _label_key(labelnames: Tuple[str, ...], labels: Dict[str, Any]) -> Tuple[str, ...]:
+    return tuple(str(labels.get(name, '')) for name in labelnames)
+
+
+def _format_labels(labelnames: Tuple[str, ...], key: Tuple[str, ...], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(labelnames, key)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Common state for a labelled metric family"""
+
+    type_name = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _header(self) -> List[str]:
+        return [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.type_name}']
+
+
+class Counter(_Metric):
+    """Monotonically increasing value"""
+
+    type_name = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(self.labelnames, labels), 0.0)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}')
+        return lines
+
+    def samples(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [{'labels': list(key), 'value': value} for key, value in self._values.items()]
+
+    def merge(self, samples: List[Dict[str, Any]]):
+        with self._lock:
+            for sample in samples:
+                key = tuple(sample['labels'])
+                self._values[key] = self._values.get(key, 0.0) + sample['value']
+
+
+class Gauge(Counter):
+    """Value that can go up and down (queue depths, in-flight work)"""
+
+    type_name = 'gauge'
+
+    def set(self, value: float, **labels):
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    @contextmanager
+    def track_inprogress(self, **labels):
+        self.inc(1, **labels)
+        try:
+            yield
+        finally:
+            self.dec(1, **labels)
+
+    def merge(self, samples: List[Dict[str, Any]]):
+        # Last snapshot wins for point-in-time values
+        with self._lock:
+            for sample in samples:
+                self._values[tuple(sample['labels'])] = sample['value']
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observations with sum and count"""
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [bucket counts..., +Inf count], sum
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels):
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall-clock duration of the enclosed block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        return sum(self._counts.get(_label_key(self.labelnames, labels), []))
+
+    def sum(self, **labels) -> float:
+        return self._sums.get(_label_key(self.labelnames, labels), 0.0)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            for key in sorted(self._counts):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float('inf'),), self._counts[key]):
+                    cumulative += bucket_count
+                    le = f'le="{_format_value(bound)}"'
+                    lines.append(f'{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}')
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f'{self.name}_sum{labels} {_format_value(self._sums[key])}')
+                lines.append(f'{self.name}_count{labels} {cumulative}')
+        return lines
+
+    def samples(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [{'labels': list(key), 'counts': list(counts), 'sum': self._sums[key]}
+                    for key, counts in self._counts.items()]
+
+    def merge(self, samples: List[Dict[str, Any]]):
+        with self._lock:
+            for sample in samples:
+                if len(sample['counts']) != len(self.buckets) + 1:
+                    continue
+                key = tuple(sample['labels'])
+                counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+                for i, bucket_count in enumerate(sample['counts']):
+                    counts[i] += bucket_count
+                self._sums[key] = self._sums.get(key, 0.0) + sample['sum']
+
+
+class MetricsRegistry:
+    """Get-or-create registry of metric families with text exposition and snapshots"""
+
+    def __init__(self, component: str):
+        self.component = component
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Tuple[str, ...], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, tuple(labelnames), **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.type_name}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in sorted(metrics, key=lambda m: m.name):
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serializable dump that another process can merge"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            'component': self.component,
+            'pid': os.getpid(),
+            'timestamp': time.time(),
+            'metrics': [
+                {
+                    'name': metric.name,
+                    'type': metric.type_name,
+                    'help': metric.documentation,
+                    'labelnames': list(metric.labelnames),
+                    'buckets': list(getattr(metric, 'buckets', ())),
+                    'samples': metric.samples()
+                }
+                for metric in metrics
+            ]
+        }
+
+    def merge_snapshot(self, snapshot: Dict[str, Any]):
+        """Fold another process's snapshot into this registry"""
+        factories = {'counter': self.counter, 'gauge': self.gauge}
+        for family in snapshot.get('metrics', []):
+            labelnames = tuple(family.get('labelnames', ()))
+            try:
+                if family['type'] == 'histogram':
+                    metric = self.histogram(family['name'], family['help'], labelnames,
+                                            buckets=tuple(family['buckets']) or DEFAULT_BUCKETS)
+                else:
+                    metric = factories[family['type']](family['name'], family['help'], labelnames)
+                metric.merge(family['samples'])
+            except (KeyError, ValueError) as e:
+                logger.warning(f"Skipping metric family {family.get('name')}: {e}")
+
+    def write_snapshot(self, directory: Optional[str] = None) -> Optional[str]:
+        """
+        Atomically write a snapshot for the dashboard to collect
+
+        Args:
+            directory: Target directory; defaults to $SATORI_METRICS_DIR
+
+        Returns:
+            Path written, or None when no directory is configured
+        """
+        directory = directory or os.environ.get(METRICS_DIR_ENV)
+        if not directory:
+            return None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            file_name = f"{self.component}-{os.getpid()}-{time.time_ns()}.json"
+            # Atomic: written to a dot-prefixed temp file the collector skips
+            return serialization.dump(self.snapshot(), os.path.join(directory, file_name))
+        except Exception as e:
+            logger.warning(f"Failed to write metrics snapshot: {e}")
+            return None
+
+
+__all__ = ["DEFAULT_BUCKETS", "METRICS_DIR_ENV", "Counter", "Gauge", "Histogram", "MetricsRegistry"]
@@ -1,4 +1,5 @@
 print("--- SATORI SCHEMA VERSION 2.0 ---")
-from .hydrated_json_schema import HydratedJSON, validate_hydrated_json
+from .hydrated_json_schema import HydratedJSON, validate_hydrated_json, validate_hydrated_json_bytes
+from . import serialization
 
-__all__ = ["HydratedJSON", "validate_hydrated_json"]
+__all__ = ["HydratedJSON", "validate_hydrated_json", "validate_hydrated_json_bytes", "serialization"]
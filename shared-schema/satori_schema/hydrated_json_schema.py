@@ -4,8 +4,8 @@ This is the single source of truth for hydrated JSON format used by both Tiger a
 This schema is based on the ground truth example: test-data/test-json/ground_truth_complaint.json
 """
 
-from typing import Dict, Any, List, Optional
-from pydantic import BaseModel, Field
+from typing import Dict, Any, List, Optional, Union
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 class CaseInformation(BaseModel):
     court_name: str
@@ -85,6 +85,7 @@ class FilingDetails(BaseModel):
 class Metadata(BaseModel):
     tiger_case_id: str
     format_version: str
+    profile: Optional[Dict[str, Any]] = None  # Present only for `--profile` runs
 
 class HydratedJSON(BaseModel):
     case_information: CaseInformation
@@ -98,12 +99,23 @@ class HydratedJSON(BaseModel):
     filing_details: FilingDetails
     metadata: Metadata
 
+# Validator built once at import and reused for every document
+HYDRATED_JSON_VALIDATOR = TypeAdapter(HydratedJSON)
+
 def validate_hydrated_json(data: Dict[str, Any]) -> tuple[bool, Optional[Dict], Optional[List[str]]]:
     """Validates a dictionary against the HydratedJSON schema."""
     try:
-        HydratedJSON(**data)
+        HYDRATED_JSON_VALIDATOR.validate_python(data)
+        return True, None, None
+    except ValidationError as e:
+        return False, e.errors(), None
+
+def validate_hydrated_json_bytes(raw: Union[str, bytes]) -> tuple[bool, Optional[Dict], Optional[List[str]]]:
+    """Validates serialized hydrated JSON, parsing and validating in one pass."""
+    try:
+        HYDRATED_JSON_VALIDATOR.validate_json(raw)
         return True, None, None
-    except Exception as e:
+    except ValidationError as e:
         return False, e.errors(), None
 
-__all__ = ["HydratedJSON", "validate_hydrated_json"]
\ No newline at end of file
+__all__ = ["HydratedJSON", "HYDRATED_JSON_VALIDATOR", "validate_hydrated_json", "validate_hydrated_json_bytes"]
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+JSON serialization shared by Tiger, Monkey and the Dashboard
+Uses orjson (or msgspec) when installed, falling back to the standard library
+
+Files are written compact by default; pass ``pretty=True`` (or set
+SATORI_JSON_PRETTY=1) for indented output. SATORI_JSON_BACKEND=orjson|msgspec|json
+forces a backend. Values JSON can't represent are written as ``str(value)``,
+matching the ``json.dump(..., default=str)`` calls this replaces.
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+BACKEND_ENV = 'SATORI_JSON_BACKEND'
+PRETTY_ENV = 'SATORI_JSON_PRETTY'
+
+
+def _select_backend() -> str:
+    available = {'orjson': orjson is not None, 'msgspec': msgspec is not None, 'json': True}
+    requested = os.environ.get(BACKEND_ENV, '').strip().lower()
+    if available.get(requested):
+        return requested
+    return next(name for name in ('orjson', 'msgspec', 'json') if available[name])
+
+
+BACKEND = _select_backend()
+
+if orjson is not None:
+    # Datetimes and dataclasses go through default=str like the stdlib calls did
+    _ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME |
+                       orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_SERIALIZE_NUMPY)
+
+if msgspec is not None:
+    _MSGSPEC_ENCODER = msgspec.json.Encoder(enc_hook=str)
+    _MSGSPEC_SORTED_ENCODER = msgspec.json.Encoder(enc_hook=str, order='sorted')
+    _MSGSPEC_DECODER = msgspec.json.Decoder()
+
+
+def pretty_default() -> bool:
+    """Whether files are indented when the caller doesn't say"""
+    return os.environ.get(PRETTY_ENV, '').strip().lower() in ('1', 'true', 'yes')
+
+
+def _stdlib_dumps(obj: Any, pretty: bool, sort_keys: bool) -> bytes:
+    if pretty:
+        text = json.dumps(obj, indent=2, sort_keys=sort_keys, ensure_ascii=False, default=str)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), sort_keys=sort_keys, ensure_ascii=False, default=str)
+    return text.encode('utf-8')
+
+
+def dumps_bytes(obj: Any, pretty: bool = None, sort_keys: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes
+
+    Args:
+        obj: Value to serialize
+        pretty: Indent by two spaces; defaults to SATORI_JSON_PRETTY
+        sort_keys: Sort object keys
+    """
+    if pretty is None:
+        pretty = pretty_default()
+    if BACKEND == 'orjson':
+        option = _ORJSON_OPTIONS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=str, option=option)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the stdlib handles
+            return _stdlib_dumps(obj, pretty, sort_keys)
+    if BACKEND == 'msgspec':
+        data = (_MSGSPEC_SORTED_ENCODER if sort_keys else _MSGSPEC_ENCODER).encode(obj)
+        return msgspec.json.format(data, indent=2) if pretty else data
+    return _stdlib_dumps(obj, pretty, sort_keys)
+
+
+def dumps(obj: Any, pretty: bool = None, sort_keys: bool = False) -> str:
+    """Serialize to a JSON string (see ``dumps_bytes``)"""
+    return dumps_bytes(obj, pretty=pretty, sort_keys=sort_keys).decode('utf-8')
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """
+    Parse JSON text or bytes
+
+    Raises:
+        ValueError (json.JSONDecodeError) on malformed input, whatever the backend
+    """
+    if BACKEND == 'orjson':
+        return orjson.loads(data)
+    if BACKEND == 'msgspec':
+        try:
+            return _MSGSPEC_DECODER.decode(data)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), data if isinstance(data, str) else '', 0) from e
+    return json.loads(data)
+
+
+def dump(obj: Any, path: Union[str, Path], pretty: bool = None, sort_keys: bool = False) -> str:
+    """
+    Write ``obj`` to ``path`` atomically (temp file + rename)
+
+    Returns:
+        The path written
+    """
+    path = Path(path)
+    data = dumps_bytes(obj, pretty=pretty, sort_keys=sort_keys)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return str(path)
+
+
+def load(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file"""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+__all__ = ["BACKEND", "dumps", "dumps_bytes", "loads", "dump", "load", "pretty_default"]
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Unit tests for columnar batch scoring
+Tests that vectorized batch statistics match the per-document quality scoring
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the project root and shared-schema to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "shared-schema"))
+
+from app.config.settings import QualityThresholds
+from app.core.validators import QualityValidator
+from app.core.utils.batch_scoring import BatchScores
+from app.output.handlers import OutputManager
+
+
+class _Config:
+    quality = QualityThresholds()
+
+
+def make_metrics(rng):
+    """Quality metrics shaped like QualityValidator.validate_extraction output"""
+    indicators = {name: {'count': rng.randint(0, 6)}
+                  for name in ('legal_entities', 'addresses', 'phone_numbers', 'emails', 'dates')}
+    indicators.update({
+        'court_document': rng.random() < 0.5,
+        'summons': rng.random() < 0.3,
+        'complaint': rng.random() < 0.3,
+        'case_number': rng.random() < 0.5,
+    })
+    text_length = rng.choice([0, 50, 100, 199, 200, 999, 1000, 2500, 3000, 12000])
+    return {
+        'text_length': text_length,
+        'file_size_bytes': 100000,
+        'compression_ratio': rng.choice([0.0, 0.0005, 0.001, 0.02, 0.1, 0.15, 0.4]),
+        'readiness_score': rng.uniform(0, 100),
+        'legal_indicators': indicators,
+    }
+
+
+class TestBatchScores(unittest.TestCase):
+    """Test cases for BatchScores"""
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.validator = QualityValidator(_Config())
+        self.metrics = [make_metrics(rng) for _ in range(300)]
+        for metrics in self.metrics:
+            metrics['quality_score'] = self.validator._calculate_quality_score(
+                metrics['text_length'], metrics['compression_ratio'], metrics['legal_indicators'])
+            metrics['passes_threshold'] = self.validator._passes_quality_threshold(
+                metrics['text_length'], metrics['compression_ratio'])
+        self.scores = BatchScores.from_metrics(self.metrics)
+
+    def test_rescore_matches_per_document_scoring(self):
+        rescored = self.scores.rescore(_Config.quality)
+        for expected, actual in zip((m['quality_score'] for m in self.metrics), rescored):
+            self.assertAlmostEqual(expected, actual, places=9)
+
+    def test_thresholds_and_tiers_match_per_document(self):
+        passes = self.scores.passes_threshold(_Config.quality)
+        self.assertEqual(passes.tolist(), [m['passes_threshold'] for m in self.metrics])
+
+        quality = [m['quality_score'] for m in self.metrics]
+        self.assertEqual(self.scores.tier_counts(), {
+            'high_quality_count': len([s for s in quality if s >= 80]),
+            'medium_quality_count': len([s for s in quality if 50 <= s < 80]),
+            'low_quality_count': len([s for s in quality if s < 50]),
+        })
+
+    def test_report_statistics(self):
+        report = self.scores.report()
+        quality = sorted(m['quality_score'] for m in self.metrics)
+        stats = report['score_statistics']
+        self.assertEqual(report['total_documents'], 300)
+        self.assertAlmostEqual(stats['average'], sum(quality) / len(quality))
+        self.assertEqual((stats['min'], stats['max']), (quality[0], quality[-1]))
+        self.assertEqual(sum(stats['histogram']['counts']), 300)
+        self.assertLessEqual(stats['percentiles']['p10'], stats['percentiles']['p90'])
+        self.assertEqual(report['text_length_statistics']['total_characters'],
+                         sum(m['text_length'] for m in self.metrics))
+        self.assertEqual(report['legal_indicators']['court_documents'],
+                         len([m for m in self.metrics if m['legal_indicators']['court_document']]))
+
+    def test_per_file_view(self):
+        view = self.scores[3]
+        metrics = self.metrics[3]
+        self.assertEqual(view['text_length'], metrics['text_length'])
+        self.assertEqual(view['court_document'], metrics['legal_indicators']['court_document'])
+        self.assertEqual(view['addresses'], metrics['legal_indicators']['addresses']['count'])
+        self.assertEqual(len(list(self.scores.documents())), 300)
+
+    def test_results_without_metrics_are_skipped(self):
+        scores = BatchScores.from_results([
+            {'file_name': 'a.pdf', 'quality_metrics': self.metrics[0]},
+            {'file_name': 'b.pdf', 'quality_metrics': {}},
+        ])
+        self.assertEqual(scores.names, ['a.pdf'])
+        self.assertEqual(len(BatchScores.from_results([])), 0)
+
+
+class TestQualitySummary(unittest.TestCase):
+    """Test cases for OutputManager quality analysis"""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.manager = OutputManager()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_quality_summary_report(self):
+        rng = random.Random(3)
+        results = [{'file_name': f'{i}.pdf', 'quality_metrics': dict(make_metrics(rng), quality_score=i)}
+                   for i in range(0, 100, 5)]
+        analysis = self.manager._analyze_quality_metrics(results)
+        self.assertEqual(analysis['score_statistics']['high_quality_count'], 4)
+        self.assertEqual(analysis['score_statistics']['low_quality_count'], 10)
+
+        report_file = self.manager.save_quality_summary(results)
+        with open(report_file, encoding='utf-8') as f:
+            self.assertIn('## Legal Indicator Analysis', f.read())
+
+    def test_no_metrics(self):
+        self.assertIn('error', self.manager._analyze_quality_metrics([{'file_name': 'a.pdf'}]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the benchmark case generator and stub engine
+Tests that synthetic case folders are reproducible and readable offline
+"""
+
+import unittest
+import os
+import zipfile
+import tempfile
+from pathlib import Path
+
+# Add the project root to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.benchmarks.synthetic_cases import SyntheticCaseGenerator
+from app.engines.stub_engine import StubEngine
+
+
+class TestSyntheticCaseGenerator(unittest.TestCase):
+    """Test cases for SyntheticCaseGenerator"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.generator = SyntheticCaseGenerator(seed=42, report_pages=3)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _read_all(self, paths):
+        contents = {}
+        for path in paths:
+            with open(path, 'rb') as f:
+                contents[os.path.basename(path)] = f.read()
+        return contents
+
+    def test_same_seed_is_reproducible(self):
+        """The same seed and size produce byte-identical folders"""
+        first = self.generator.generate_case(os.path.join(self.temp_dir.name, 'a'), 8)
+        second = self.generator.generate_case(os.path.join(self.temp_dir.name, 'b'), 8)
+        self.assertEqual(self._read_all(first), self._read_all(second))
+
+    def test_tiers_are_cycled_after_attorney_notes(self):
+        """Attorney notes come first, then denial letters, summons and reports"""
+        paths = self.generator.generate_case(self.temp_dir.name, 7)
+        names = [os.path.basename(path) for path in paths]
+        self.assertEqual(names[0], 'Atty_Notes.txt')
+        self.assertTrue(names[1].startswith('Denial_Letter_'))
+        self.assertTrue(names[2].startswith('Summons_'))
+        self.assertTrue(names[3].startswith('Credit_Report_'))
+        self.assertTrue(names[4].startswith('Denial_Letter_'))
+
+    def test_docx_is_a_word_package(self):
+        """DOCX output contains a main document part"""
+        paths = self.generator.generate_case(self.temp_dir.name, 1, 'docx')
+        with zipfile.ZipFile(paths[0]) as docx:
+            document = docx.read('word/document.xml').decode('utf-8')
+        self.assertIn('CASE_NUMBER:', document)
+
+    def test_stub_engine_reads_synthetic_pdf(self):
+        """StubEngine extracts text and counts pages without Docling"""
+        paths = self.generator.generate_case(self.temp_dir.name, 4, 'pdf')
+        result = StubEngine().process_document(paths[3])
+        self.assertTrue(result.success)
+        self.assertEqual(result.metadata['page_count'], 3)
+        self.assertIn('CONSUMER DISCLOSURE', result.text)
+
+    def test_invalid_arguments(self):
+        """Unknown formats and empty cases are rejected"""
+        with self.assertRaises(ValueError):
+            self.generator.generate_case(self.temp_dir.name, 1, 'rtf')
+        with self.assertRaises(ValueError):
+            self.generator.generate_case(self.temp_dir.name, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
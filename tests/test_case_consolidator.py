@@ -285,7 +285,36 @@ class TestCaseConsolidator(unittest.TestCase):
         
         # Test non-matching names
         self.assertFalse(self.consolidator._names_similar('JANE DOE', 'JOHN SMITH'))
-    
+
+    def test_party_dedup_matches_pairwise_rules(self):
+        """Test that indexed deduplication merges into the first similar party"""
+        names = ['TD BANK, N.A.', 'EXPERIAN INFORMATION SOLUTIONS, INC.', 'J DOE',
+                 'EXPERIAN INFO SOLUTIONS INC', 'JANE DOE', 'BANK', 'CAPITAL ONE AUTO FINANCE GROUP',
+                 'TD BANK', 'MIDLAND CREDIT MANAGEMENT INC']
+        parties = []
+        for i, name in enumerate(names):
+            self.consolidator._add_party_with_dedup(
+                parties, {'name': name, 'confidence': 0.5, 'sources': [f'doc{i}.pdf']})
+
+        # Pairwise reference: each name merges into the first earlier party it is similar to
+        expected = []
+        for name in names:
+            if not any(self.consolidator._names_similar(name, kept) for kept in expected):
+                expected.append(name)
+
+        self.assertEqual([party['name'] for party in parties], expected)
+        self.assertEqual(sorted(parties[0]['sources']), ['doc0.pdf', 'doc5.pdf', 'doc7.pdf'])
+
+    def test_party_dedup_scales_to_many_furnishers(self):
+        """Test that many distinct furnishers are deduplicated without pairwise comparisons"""
+        parties = []
+        for i in range(2000):
+            self.consolidator._add_party_with_dedup(
+                parties, {'name': f'FURNISHER {i} COLLECTION SERVICES GROUP', 'confidence': 0.5, 'sources': ['report.pdf']})
+        index = self.consolidator._party_index(parties)
+        self.assertEqual(len(parties), 2000)
+        self.assertLess(len(index._similar_cache), 20000)
+
     def test_timeline_date_validation(self):
         """Test timeline date validation and error detection"""
         # Document with future date (should trigger error)
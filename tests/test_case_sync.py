@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Unit tests for delta case folder sync
+Tests manifest-based skipping, resumed downloads and listing caches against a local directory drive
+"""
+
+import os
+import time
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the project root and shared-schema to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "shared-schema"))
+
+from satori_common.case_sync import (
+    CachedDrive, CaseSyncEngine, LocalDirectoryDrive, MANIFEST_FILENAME, PART_SUFFIX
+)
+
+
+class StampedDrive(LocalDirectoryDrive):
+    """Local drive that reports folder stamps and counts listings"""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.stamps = {}
+        self.listed = []
+
+    def list_folder(self, folder_path, node_id=None):
+        listing = super().list_folder(folder_path, node_id)
+        self.listed.append(listing.path)
+        # Like iCloud etags: a folder's stamp is the same in its own and its parent's listing
+        listing.stamp = self.stamps.get(os.path.basename(listing.path), 'v1')
+        for folder in listing.folders:
+            folder.stamp = self.stamps.get(folder.name, 'v1')
+        return listing
+
+
+class TestCaseSyncEngine(unittest.TestCase):
+    """Test cases for CaseSyncEngine over LocalDirectoryDrive"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.remote = os.path.join(self.tmp.name, 'remote')
+        self.local = os.path.join(self.tmp.name, 'local', 'Doe')
+        self.case_dir = os.path.join(self.remote, 'Cases', 'Doe')
+        os.makedirs(self.case_dir)
+        self.files = {'complaint.pdf': b'%PDF' + b'x' * 5000, 'notes.txt': b'attorney notes\n' * 40}
+        for name, content in self.files.items():
+            self.write_remote(name, content)
+        self.engine = CaseSyncEngine(LocalDirectoryDrive(self.remote), max_workers=2)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_remote(self, name, content):
+        path = os.path.join(self.case_dir, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def sync(self):
+        return self.engine.sync_case('/Cases', 'Doe', self.local)
+
+    def read_local(self, name):
+        with open(os.path.join(self.local, name), 'rb') as f:
+            return f.read()
+
+    def test_first_sync_downloads_everything(self):
+        result = self.sync()
+        self.assertTrue(result['success'])
+        self.assertEqual([f['name'] for f in result['downloaded_files']], sorted(self.files))
+        self.assertEqual(result['bytes_downloaded'], sum(len(c) for c in self.files.values()))
+        for name, content in self.files.items():
+            self.assertEqual(self.read_local(name), content)
+        self.assertTrue(os.path.exists(os.path.join(self.local, MANIFEST_FILENAME)))
+
+    def test_resync_moves_no_bytes(self):
+        self.sync()
+        result = self.sync()
+        self.assertEqual(result['downloaded_files'], [])
+        self.assertEqual(result['bytes_downloaded'], 0)
+        self.assertEqual(result['skipped_files'], len(self.files))
+
+    def test_same_size_edit_is_downloaded_again(self):
+        self.sync()
+        path = self.write_remote('notes.txt', b'ATTORNEY NOTES\n' * 40)
+        future = time.time() + 10
+        os.utime(path, (future, future))
+
+        result = self.sync()
+        self.assertEqual([f['name'] for f in result['downloaded_files']], ['notes.txt'])
+        self.assertEqual(self.read_local('notes.txt'), b'ATTORNEY NOTES\n' * 40)
+
+    def test_resumes_from_partial_download(self):
+        remote_file = next(f for f in self.engine.drive.list_files('/Cases/Doe') if f.name == 'complaint.pdf')
+        os.makedirs(self.local)
+        part_path = self.engine._part_path(self.local, remote_file)
+        with open(part_path, 'wb') as f:
+            f.write(self.files['complaint.pdf'][:1000])
+
+        result = self.sync()
+        complaint = next(f for f in result['downloaded_files'] if f['name'] == 'complaint.pdf')
+        self.assertEqual(complaint['resumed_from'], 1000)
+        self.assertEqual(complaint['bytes_transferred'], len(self.files['complaint.pdf']) - 1000)
+        self.assertEqual(result['resumed_files'], 1)
+        self.assertEqual(self.read_local('complaint.pdf'), self.files['complaint.pdf'])
+        self.assertFalse([name for name in os.listdir(self.local) if name.endswith(PART_SUFFIX)])
+
+    def test_remote_delete_drops_manifest_entry_only(self):
+        self.sync()
+        os.remove(os.path.join(self.case_dir, 'notes.txt'))
+
+        result = self.sync()
+        self.assertEqual(result['removed_remote_files'], ['notes.txt'])
+        self.assertNotIn('notes.txt', self.engine.load_manifest(self.local)['files'])
+        self.assertEqual(self.read_local('notes.txt'), self.files['notes.txt'])
+
+
+class TestCachedDrive(unittest.TestCase):
+    """Test cases for CachedDrive listing reuse and stamp invalidation"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        for case_name in ('Doe', 'Roe'):
+            case_dir = os.path.join(self.tmp.name, 'Cases', case_name)
+            os.makedirs(case_dir)
+            with open(os.path.join(case_dir, 'notes.txt'), 'w') as f:
+                f.write(case_name)
+        self.drive = StampedDrive(self.tmp.name)
+        self.lookups = []
+        self.cached = CachedDrive(self.drive, on_lookup=self.lookups.append)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_unchanged_stamps_reuse_child_listings(self):
+        tree = self.cached.list_tree('/Cases')
+        self.assertEqual(sorted(tree), ['Doe', 'Roe'])
+        self.drive.listed.clear()
+
+        self.cached.list_tree('/Cases', refresh=True)
+        self.assertEqual(self.drive.listed, ['/Cases'])
+        self.cached.list_folder('/Cases/Doe')
+        self.assertEqual(self.drive.listed, ['/Cases'])
+        self.assertEqual(self.lookups[-1], 'hit')
+
+    def test_changed_stamp_relists_only_that_folder(self):
+        self.cached.list_tree('/Cases')
+        self.drive.listed.clear()
+        self.drive.stamps['Roe'] = 'v2'
+
+        self.cached.list_tree('/Cases', refresh=True)
+        self.assertEqual(self.drive.listed, ['/Cases', '/Cases/Roe'])
+
+    def test_invalidate_forgets_subtree(self):
+        self.cached.list_tree('/Cases')
+        self.drive.listed.clear()
+
+        self.cached.invalidate('/Cases/Doe')
+        self.cached.list_folder('/Cases/Doe')
+        self.assertEqual(self.drive.listed, ['/Cases/Doe'])
+
+
+if __name__ == '__main__':
+    unittest.main()
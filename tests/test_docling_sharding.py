@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Unit tests for page-range OCR in DoclingEngine
+Tests range planning, in-order stitching and whole-document fallback
+"""
+
+import unittest
+from unittest import mock
+from pathlib import Path
+
+# Add the project root to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.engines import docling_engine
+from app.engines.docling_engine import DoclingEngine, plan_page_ranges, stitch_pages
+
+
+class TestDoclingSharding(unittest.TestCase):
+    """Test cases for page-range conversion helpers"""
+
+    def test_plan_page_ranges_covers_every_page(self):
+        self.assertEqual(plan_page_ranges(45, 20), [(1, 20), (21, 40), (41, 45)])
+        self.assertEqual(plan_page_ranges(3, 20), [(1, 3)])
+
+    def test_stitch_pages_orders_and_indexes_pages(self):
+        text, pages = stitch_pages([(2, 'Page two\n'), (1, 'Page one')])
+        self.assertLess(text.index('<!-- page 1 -->'), text.index('<!-- page 2 -->'))
+        for info, expected in zip(pages, ['Page one', 'Page two']):
+            self.assertEqual(text[info['offset']:info['offset'] + info['chars']], expected)
+
+    def test_small_pdf_is_converted_whole(self):
+        engine = DoclingEngine(shard_min_pages=80, workers=4)
+        with mock.patch.object(docling_engine, '_pdf_page_count', return_value=10), \
+                mock.patch.object(engine, '_convert_sharded') as sharded, \
+                mock.patch.object(engine, '_convert_whole', return_value=('text', {})) as whole:
+            engine._convert('statement.pdf')
+        sharded.assert_not_called()
+        whole.assert_called_once_with('statement.pdf')
+
+    def test_shard_failure_falls_back_to_whole_document(self):
+        engine = DoclingEngine(shard_min_pages=80, workers=4)
+        with mock.patch.object(docling_engine, '_pdf_page_count', return_value=400), \
+                mock.patch.object(engine, '_convert_sharded', side_effect=RuntimeError('worker died')), \
+                mock.patch.object(engine, '_convert_whole', return_value=('text', {'page_count': 400})) as whole:
+            text, metadata = engine._convert('report.pdf')
+        whole.assert_called_once_with('report.pdf')
+        self.assertEqual(metadata['page_count'], 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
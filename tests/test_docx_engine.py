@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the streaming DOCX engine
+Tests document-order paragraphs and tables, merged cells and core properties
+"""
+
+import os
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+# Add the project root to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.engines.docx_engine import DocxEngine
+
+NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+DOCUMENT_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document {NS}><w:body>
+<w:p><w:r><w:t>CLIENT NAME:</w:t></w:r><w:r><w:tab/><w:t xml:space="preserve">Eman Youssef</w:t></w:r></w:p>
+<w:p><w:r><w:t xml:space="preserve">   </w:t></w:r></w:p>
+<w:p><w:hyperlink><w:r><w:t>Line one</w:t></w:r></w:hyperlink><w:r><w:br/><w:t>Line two</w:t><w:br w:type="page"/></w:r></w:p>
+<w:tbl>
+  <w:tr>
+    <w:tc><w:tcPr><w:gridSpan w:val="2"/></w:tcPr><w:p><w:r><w:t>Defendant</w:t></w:r></w:p></w:tc>
+    <w:tc><w:tcPr><w:vMerge w:val="restart"/></w:tcPr><w:p><w:r><w:t>Notes</w:t></w:r></w:p></w:tc>
+  </w:tr>
+  <w:tr>
+    <w:tc><w:p><w:r><w:t>TD Bank</w:t></w:r></w:p></w:tc>
+    <w:tc><w:p><w:r><w:t>Furnisher</w:t></w:r></w:p></w:tc>
+    <w:tc><w:tcPr><w:vMerge/></w:tcPr><w:p/></w:tc>
+  </w:tr>
+</w:tbl>
+<w:p><w:r><w:t>DAMAGES:</w:t></w:r></w:p>
+<w:sectPr/>
+</w:body></w:document>"""
+
+CORE_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"
+  xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:dcterms="http://purl.org/dc/terms/">
+<dc:title>Attorney Notes</dc:title><dc:creator>Kevin Mallon</dc:creator>
+<dcterms:created>2025-06-01T14:30:00Z</dcterms:created>
+</cp:coreProperties>"""
+
+
+class TestDocxEngine(unittest.TestCase):
+    """Test cases for DocxEngine"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'Atty_Notes.docx')
+        with zipfile.ZipFile(self.path, 'w') as archive:
+            archive.writestr('word/document.xml', DOCUMENT_XML)
+            archive.writestr('docProps/core.xml', CORE_XML)
+        self.engine = DocxEngine()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_text_in_document_order(self):
+        result = self.engine.extract_text(self.path)
+        self.assertTrue(result.success)
+        self.assertEqual(result.text.split('\n'), [
+            'CLIENT NAME:\tEman Youssef',
+            'Line one',
+            'Line two',
+            'Defendant | Notes',
+            'TD Bank | Furnisher',
+            'DAMAGES:',
+        ])
+
+    def test_metadata(self):
+        metadata = self.engine.extract_text(self.path).metadata
+        self.assertEqual(metadata['paragraph_count'], 3)
+        self.assertEqual(metadata['table_count'], 1)
+        self.assertEqual(metadata['title'], 'Attorney Notes')
+        self.assertEqual(metadata['author'], 'Kevin Mallon')
+        self.assertEqual(metadata['created'], '2025-06-01 14:30:00+00:00')
+        self.assertEqual(metadata['modified'], '')
+
+    def test_invalid_file(self):
+        bad_path = os.path.join(self.temp_dir.name, 'broken.docx')
+        with open(bad_path, 'w') as f:
+            f.write('not a zip')
+        result = self.engine.extract_text(bad_path)
+        self.assertFalse(result.success)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the complaint edit journal
+Tests delta round-trips, version reconstruction across snapshots and recovery from torn appends
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the project root to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dashboard.edit_journal import (
+    EditJournalStore, JOURNAL_FILENAME, RECORD_PREFIX, apply_delta, compute_delta
+)
+
+ORIGINAL = ('<html><body><h1>Complaint</h1><p>Plaintiff John Doe sues Equifax.</p>'
+            '<p>Count I: FCRA § 1681e(b)</p>\n<p>Damages: $1,000</p></body></html>')
+
+
+class TestDelta(unittest.TestCase):
+    """Test cases for compute_delta / apply_delta"""
+
+    def test_round_trips(self):
+        edits = [
+            ORIGINAL.replace('John Doe', 'Jane Roe'),
+            ORIGINAL.replace('<p>Damages: $1,000</p>', ''),
+            ORIGINAL + '<p>Appendix</p>',
+            '<p>' + ORIGINAL,
+            '',
+        ]
+        for edited in edits:
+            with self.subTest(edited=edited[:40]):
+                self.assertEqual(apply_delta(ORIGINAL, compute_delta(ORIGINAL, edited)), edited)
+        self.assertEqual(apply_delta('', compute_delta('', ORIGINAL)), ORIGINAL)
+
+    def test_local_edit_is_a_small_delta(self):
+        delta = compute_delta(ORIGINAL, ORIGINAL.replace('John Doe', 'Jane Roe'))
+        self.assertEqual(len(delta), 1)
+        self.assertEqual(delta[0][2], ['Plaintiff Jane Roe sues Equifax.</p>'])
+
+
+class TestEditJournalStore(unittest.TestCase):
+    """Test cases for EditJournalStore"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.case_dir = os.path.join(self.tmp.name, 'doe')
+        os.makedirs(self.case_dir)
+        self.complaint = os.path.join(self.case_dir, 'complaint_v1')
+        self.write_complaint(ORIGINAL)
+        self.store = EditJournalStore(snapshot_interval=3)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_complaint(self, content):
+        with open(self.complaint, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def read_complaint(self):
+        with open(self.complaint, encoding='utf-8') as f:
+            return f.read()
+
+    def save(self, content):
+        return self.store.save_edit(self.case_dir, self.complaint, content, 'atty', 'edit')
+
+    def test_first_save_seeds_original(self):
+        header = self.save(ORIGINAL.replace('John', 'Jane'))
+        self.assertTrue(header['journal_created'])
+        self.assertEqual(header['version'], 1)
+        self.assertEqual(self.read_complaint(), ORIGINAL.replace('John', 'Jane'))
+        self.assertEqual(self.store.reconstruct(self.case_dir, 0), ORIGINAL)
+        self.assertEqual(self.store.edit_count(self.case_dir), 1)
+
+    def test_reconstructs_every_version_across_snapshots(self):
+        saved = [ORIGINAL]
+        for i in range(8):
+            content = saved[-1].replace('</body>', f'<p>Paragraph {i}</p></body>')
+            self.save(content)
+            saved.append(content)
+
+        kinds = [record['kind'] for record in self.store.versions(self.case_dir)]
+        self.assertEqual(kinds, ['snapshot', 'delta', 'delta', 'snapshot', 'delta', 'delta', 'snapshot', 'delta', 'delta'])
+        # A fresh store rebuilds the index from disk
+        store = EditJournalStore(snapshot_interval=3)
+        for version, content in enumerate(saved):
+            self.assertEqual(store.reconstruct(self.case_dir, version), content)
+        with self.assertRaises(KeyError):
+            store.reconstruct(self.case_dir, len(saved))
+
+    def test_regenerated_complaint_is_snapshotted(self):
+        self.save(ORIGINAL.replace('John', 'Jane'))
+        regenerated = ORIGINAL.replace('Equifax', 'Experian')
+        self.write_complaint(regenerated)
+        self.save(regenerated.replace('$1,000', '$5,000'))
+
+        versions = self.store.versions(self.case_dir)
+        self.assertEqual(versions[2]['summary'], 'Complaint regenerated')
+        self.assertEqual(self.store.reconstruct(self.case_dir, 2), regenerated)
+        self.assertEqual(self.store.edit_count(self.case_dir), 2)
+
+    def test_torn_last_record_is_ignored_and_overwritten(self):
+        self.save(ORIGINAL.replace('John', 'Jane'))
+        journal = os.path.join(self.case_dir, JOURNAL_FILENAME)
+        intact_size = os.path.getsize(journal)
+        with open(journal, 'ab') as f:
+            f.write(RECORD_PREFIX + b'{"kind": "delta", "size": 500, "version": 2}\n' + b'x' * 20)
+
+        store = EditJournalStore(snapshot_interval=3)
+        self.assertEqual(len(store.versions(self.case_dir)), 2)
+        self.assertEqual(store.read(self.case_dir).offset, intact_size)
+
+        store.save_edit(self.case_dir, self.complaint, ORIGINAL.replace('John', 'Jim'), 'atty', 'edit')
+        self.assertEqual(len(store.versions(self.case_dir)), 3)
+        self.assertEqual(store.reconstruct(self.case_dir, 2), ORIGINAL.replace('John', 'Jim'))
+
+    def test_failed_write_appends_no_edit(self):
+        self.save(ORIGINAL.replace('John', 'Jane'))
+        with mock.patch('dashboard.edit_journal.os.replace', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                self.save(ORIGINAL.replace('John', 'Jim'))
+
+        self.assertEqual(self.read_complaint(), ORIGINAL.replace('John', 'Jane'))
+        self.assertEqual(len(self.store.versions(self.case_dir)), 2)
+        self.assertEqual(sorted(os.listdir(self.case_dir)),
+                         sorted(['complaint_v1', JOURNAL_FILENAME, '.complaint_edits.lock']))
+
+
+if __name__ == '__main__':
+    unittest.main()
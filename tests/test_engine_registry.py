@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the lazy engine registry
+Tests extension lookup, deferred imports and warm-up
+"""
+
+import sys
+import unittest
+from unittest import mock
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.engines.registry import EngineRegistry
+from app.engines.text_engine import TextEngine
+
+
+class TestEngineRegistry(unittest.TestCase):
+    """Test cases for EngineRegistry"""
+
+    def setUp(self):
+        sys.modules.pop('app.engines.tiered_pdf_engine', None)
+        self.registry = EngineRegistry(discover=False)
+
+    def test_text_lookup_does_not_load_pdf_engine(self):
+        engine = self.registry.engine_for_file('/cases/Rodriguez/Atty_Notes.TXT')
+        self.assertIsInstance(engine, TextEngine)
+        self.assertFalse(self.registry.is_loaded('pdf'))
+        self.assertNotIn('app.engines.tiered_pdf_engine', sys.modules)
+
+    def test_extension_lookup(self):
+        self.assertEqual(self.registry.extensions['.md'], 'txt')
+        self.assertIsNone(self.registry.engine_for_file('summons.xlsx'))
+        self.assertIs(self.registry.engine_for_extension('.md'),
+                      self.registry.engine_for_extension('.txt'))
+
+    def test_setup_runs_once_on_first_use(self):
+        engine = mock.Mock(spec=TextEngine, supported_formats=['.pdf'])
+        registry = EngineRegistry({'pdf': engine})
+        registry.engine_for_file('a.pdf')
+        registry.engine_for_file('b.pdf')
+        engine.setup_dependencies.assert_called_once_with()
+
+    def test_warm_up_calls_engine_warm_up(self):
+        engine = mock.Mock(spec=TextEngine, supported_formats=['.pdf'])
+        engine.setup_dependencies.return_value = True
+        registry = EngineRegistry({'pdf': engine})
+        self.assertEqual(registry.warm_up(), {'pdf': True})
+        engine.warm_up.assert_called_once_with()
+
+    def test_close_closes_only_loaded_engines(self):
+        engine = mock.Mock(spec=TextEngine, supported_formats=['.pdf'])
+        self.registry.register('pdf', engine)
+        self.registry.close()
+        engine.close.assert_called_once_with()
+        self.assertFalse(self.registry.is_loaded('docx'))
+
+    def test_entry_point_overrides_builtin_lazily(self):
+        entry_point = mock.Mock(value='app.engines.text_engine:TextEngine')
+        entry_point.name = 'pdf'
+        with mock.patch('app.engines.registry.metadata.entry_points', return_value=[entry_point]):
+            registry = EngineRegistry()
+        entry_point.load.assert_not_called()
+        self.assertIsInstance(registry.engine_for_file('denial.pdf'), TextEngine)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the processing manifest store
+Tests the fixed-width status line, field escaping, incremental reads and compaction
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the project root and shared-schema to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "shared-schema"))
+
+from dashboard.manifest_store import (
+    COMPACTION_THRESHOLD, MANIFEST_FILENAME, STATUS_LINE_WIDTH, ManifestEntry, ManifestStore
+)
+
+
+class TestManifestStore(unittest.TestCase):
+    """Test cases for ManifestStore"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.case_path = self.tmp.name
+        self.manifest_path = os.path.join(self.case_path, MANIFEST_FILENAME)
+        self.store = ManifestStore()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read_bytes(self):
+        with open(self.manifest_path, 'rb') as f:
+            return f.read()
+
+    def fresh_read(self):
+        """Parse from disk with an empty cache"""
+        return ManifestStore().read(self.case_path)
+
+    def test_status_flip_overwrites_fixed_width_line_in_place(self):
+        self.store.append_entry(self.case_path, 'complaint.pdf', 'success', file_size=1200)
+        inode = os.stat(self.manifest_path).st_ino
+        entries = self.read_bytes()[STATUS_LINE_WIDTH:]
+
+        self.store.update_case_status(self.case_path, 'PROCESSING')
+        self.store.update_case_status(self.case_path, 'PENDING_REVIEW')
+
+        data = self.read_bytes()
+        self.assertEqual(os.stat(self.manifest_path).st_ino, inode)
+        self.assertEqual(data.index(b'\n') + 1, STATUS_LINE_WIDTH)
+        self.assertEqual(data[STATUS_LINE_WIDTH:], entries)
+        self.assertEqual(self.store.read_case_status(self.case_path), 'PENDING_REVIEW')
+        self.assertEqual(self.fresh_read().case_status, 'PENDING_REVIEW')
+
+    def test_status_longer_than_slot_is_rejected(self):
+        self.store.update_case_status(self.case_path, 'PROCESSING')
+        before = self.read_bytes()
+        with self.assertRaises(ValueError):
+            self.store.update_case_status(self.case_path, 'X' * STATUS_LINE_WIDTH)
+        self.assertEqual(self.read_bytes(), before)
+        self.assertEqual(self.fresh_read().case_status, 'PROCESSING')
+
+    def test_status_needing_escapes_round_trips(self):
+        status = 'ERROR|retry\nlater\\'
+        self.store.update_case_status(self.case_path, status)
+        self.assertEqual(self.read_bytes().count(b'\n'), 1)
+        self.assertEqual(self.fresh_read().case_status, status)
+
+    def test_escaped_fields_never_split_records(self):
+        error = 'Tiger failed:\nTraceback | line 2\r\n\\path\\to\\file'
+        self.store.append_entry(self.case_path, 'odd|name.pdf', 'error', error_message=error)
+        self.store.append_entry(self.case_path, 'notes.txt', 'success', processing_time=42)
+
+        self.assertEqual(self.read_bytes().count(b'\n'), 3)
+        files = self.fresh_read().files
+        self.assertEqual(files['odd|name.pdf'].error_message, error)
+        self.assertEqual(files['notes.txt'].processing_time_ms, 42)
+        self.assertIsNone(files['notes.txt'].error_message)
+
+    def test_incremental_read_picks_up_appends(self):
+        self.store.append_entry(self.case_path, 'a.pdf', 'processing')
+        self.assertEqual(self.store.read(self.case_path).files['a.pdf'].status, 'processing')
+
+        # Another writer appends; a torn final line waits for the next read
+        with open(self.manifest_path, 'ab') as f:
+            f.write(ManifestEntry('a.pdf', 'success').to_line() + b'b.pdf|proc')
+        index = self.store.read(self.case_path)
+        self.assertEqual(index.files['a.pdf'].status, 'success')
+        self.assertNotIn('b.pdf', index.files)
+
+        with open(self.manifest_path, 'ab') as f:
+            f.write(b'essing|null|null|null|null|null\n')
+        self.assertEqual(self.store.read(self.case_path).files['b.pdf'].status, 'processing')
+
+    def test_legacy_manifest_is_upgraded(self):
+        with open(self.manifest_path, 'w') as f:
+            f.write('CASE_STATUS|NEW|2025-01-01T00:00:00|null|null|null|null\n'
+                    'a.pdf|success|null|null|10|null|null\n')
+        self.store.update_case_status(self.case_path, 'COMPLETE')
+        index = self.fresh_read()
+        self.assertEqual(index.status_line_width, STATUS_LINE_WIDTH)
+        self.assertEqual((index.case_status, index.files['a.pdf'].file_size), ('COMPLETE', 10))
+
+    def test_compacts_after_threshold_of_stale_entries(self):
+        self.store.update_case_status(self.case_path, 'PROCESSING')
+        for i in range(COMPACTION_THRESHOLD - 1):
+            self.store.append_entry(self.case_path, 'a.pdf', 'processing', start_time=str(i))
+        self.store.append_entry(self.case_path, 'b.pdf', 'success')
+        self.assertEqual(self.fresh_read().stale_entries, COMPACTION_THRESHOLD - 2)
+
+        self.store.append_entries(self.case_path, [ManifestEntry('a.pdf', 'success'),
+                                                   ManifestEntry('b.pdf', 'success')])
+        index = self.fresh_read()
+        self.assertEqual(index.entry_count, 2)
+        self.assertEqual(index.case_status, 'PROCESSING')
+        self.assertEqual({name: entry.status for name, entry in index.files.items()},
+                         {'a.pdf': 'success', 'b.pdf': 'success'})
+        self.assertEqual(sorted(os.listdir(self.case_path)), ['.processing_manifest.lock', MANIFEST_FILENAME])
+
+
+if __name__ == '__main__':
+    unittest.main()
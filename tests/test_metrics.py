@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the in-process metrics registry
+Tests Prometheus text rendering and snapshot round-trips between processes
+"""
+
+import unittest
+import json
+import os
+import tempfile
+from pathlib import Path
+
+# Add the project root and shared-schema to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "shared-schema"))
+
+from satori_common.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test cases for MetricsRegistry"""
+
+    def setUp(self):
+        self.registry = MetricsRegistry('test')
+
+    def test_counter_and_gauge_render(self):
+        """Counters and gauges render one sample per label set"""
+        counter = self.registry.counter('jobs_total', 'Jobs run', ('engine',))
+        counter.inc(engine='docling')
+        counter.inc(2, engine='docling')
+        gauge = self.registry.gauge('queue_depth', 'Queued jobs')
+        gauge.set(5)
+        gauge.dec()
+
+        text = self.registry.render()
+        self.assertIn('# TYPE jobs_total counter', text)
+        self.assertIn('jobs_total{engine="docling"} 3', text)
+        self.assertIn('queue_depth 4', text)
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Histogram buckets render cumulatively with sum and count"""
+        histogram = self.registry.histogram('step_seconds', 'Step time', buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        text = self.registry.render()
+        self.assertIn('step_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('step_seconds_bucket{le="1"} 2', text)
+        self.assertIn('step_seconds_bucket{le="+Inf"} 3', text)
+        self.assertIn('step_seconds_count 3', text)
+        self.assertAlmostEqual(histogram.sum(), 5.55)
+
+    def test_get_or_create_rejects_type_change(self):
+        """Re-registering a name returns the same metric unless the type differs"""
+        first = self.registry.counter('events_total', 'Events')
+        self.assertIs(first, self.registry.counter('events_total', 'Events'))
+        with self.assertRaises(ValueError):
+            self.registry.gauge('events_total', 'Events')
+
+    def test_snapshot_round_trip(self):
+        """A written snapshot merges into another registry"""
+        self.registry.counter('pages_total', 'Pages', ('engine',)).inc(7, engine='pdf')
+        self.registry.histogram('render_seconds', 'Render time', buckets=(1.0,)).observe(0.5)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self.registry.write_snapshot(temp_dir)
+            self.assertTrue(os.path.exists(path))
+            with open(path) as f:
+                snapshot = json.load(f)
+
+        collector = MetricsRegistry('collector')
+        collector.merge_snapshot(snapshot)
+        collector.merge_snapshot(snapshot)
+
+        self.assertEqual(collector.get('pages_total').value(engine='pdf'), 14)
+        self.assertEqual(collector.get('render_seconds').count(), 2)
+
+    def test_write_snapshot_without_directory(self):
+        """Without SATORI_METRICS_DIR nothing is written"""
+        previous = os.environ.pop('SATORI_METRICS_DIR', None)
+        try:
+            self.assertIsNone(self.registry.write_snapshot())
+        finally:
+            if previous is not None:
+                os.environ['SATORI_METRICS_DIR'] = previous
+
+
+if __name__ == '__main__':
+    unittest.main()
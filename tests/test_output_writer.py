@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the case output writer
+Tests that a case's documents are written once, atomically, and indexed
+"""
+
+import os
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the project root and shared-schema to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "shared-schema"))
+
+from app.core.utils.text_store import TextHandle
+from app.output.handlers import OutputManager, CASE_INDEX_FILENAME
+
+
+class FakeResult:
+    """Just the ProcessingResult surface the writer uses"""
+
+    def __init__(self, file_name, success=True, text='Plaintiff v. Equifax\n' * 50, error=None):
+        self.file_path = f'/cases/doe/{file_name}'
+        self.file_name = file_name
+        self.success = success
+        self.text_handle = TextHandle.of(text if success else '')
+        self.quality_metrics = {'quality_score': 90} if success else {}
+        self.metadata = {}
+        self.processing_time = 0.5
+        self.engine_used = 'test'
+        self.error = error
+        self.timestamp = '2026-01-01T00:00:00'
+        self.to_dict_calls = 0
+
+    def to_dict(self):
+        self.to_dict_calls += 1
+        return {
+            'file_path': self.file_path,
+            'file_name': self.file_name,
+            'success': self.success,
+            'extracted_text': str(self.text_handle),
+            'quality_metrics': self.quality_metrics,
+            'metadata': self.metadata,
+            'processing_time': self.processing_time,
+            'engine_used': self.engine_used,
+            'error': self.error,
+            'extracted_dates': [],
+            'timestamp': self.timestamp
+        }
+
+
+class TestCaseOutputWriter(unittest.TestCase):
+    """Test cases for CaseOutputWriter"""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.manager = OutputManager()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_writes_every_artifact_once_per_document(self):
+        results = [FakeResult(f'doc{i}.pdf') for i in range(6)]
+        with self.manager.case_writer('Doe_John') as writer:
+            for result in results:
+                writer.add_result(result)
+
+        for result in results:
+            self.assertEqual(result.to_dict_calls, 1)
+            files = writer.saved_files[result.file_name]
+            self.assertEqual(set(files), {'txt', 'json', 'md', 'raw_text', 'metadata'})
+            for path in files.values():
+                self.assertTrue(os.path.isfile(path))
+        with open(writer.saved_files['doc0.pdf']['raw_text'], encoding='utf-8') as f:
+            self.assertEqual(f.read(), str(results[0].text_handle))
+
+    def test_metadata_lists_saved_files(self):
+        with self.manager.case_writer('Doe_John') as writer:
+            writer.add_result(FakeResult('doc.pdf'))
+        with open(writer.saved_files['doc.pdf']['metadata'], encoding='utf-8') as f:
+            metadata = json.load(f)
+        self.assertEqual(set(metadata['output_files']), {'txt', 'json', 'md', 'raw_text'})
+        self.assertEqual(metadata['case_info']['case_name'], 'Doe_John')
+
+    def test_index_accumulates_and_leaves_no_temp_files(self):
+        with self.manager.case_writer('Doe_John') as writer:
+            writer.add_result(FakeResult('a.pdf'))
+            writer.add_result(FakeResult('bad.pdf', success=False, error='boom'))
+        self.manager.save_case_processing_result(FakeResult('b.pdf'), case_name='Doe_John')
+
+        case_root = writer.case_dirs['case_root']
+        with open(case_root / CASE_INDEX_FILENAME, encoding='utf-8') as f:
+            index = json.load(f)
+        self.assertEqual(set(index['documents']), {'a.pdf', 'bad.pdf', 'b.pdf'})
+        self.assertFalse(index['documents']['bad.pdf']['success'])
+        self.assertNotIn('raw_text', index['documents']['bad.pdf']['files'])
+        for root, _, names in os.walk('outputs'):
+            self.assertFalse([name for name in names if name.endswith('.tmp')], root)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Unit tests for budgeted, linear-time legal entity pattern matching
+Tests caption extraction on normal documents and bounded time on OCR noise
+"""
+
+import unittest
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.extractors.legal_entity_extractor import LegalEntityExtractor
+from app.core.extractors.pattern_scanner import ScanBudget, run_start_before, block_end
+
+import re
+
+CAPTION = """UNITED STATES DISTRICT COURT
+EASTERN DISTRICT OF NEW YORK
+
+EMAN YOUSSEF,
+Plaintiff,
+
+v.
+
+TD BANK, N.A., & EXPERIAN,
+Defendants.
+Case No. 1:25-cv-01987
+
+COMPLAINT
+Respectfully submitted,
+Kevin Mallon, Esq.
+Mallon Consumer Law Group
+kmallon@consumerprotectionfirm.com
+"""
+
+
+class TestPatternScanner(unittest.TestCase):
+    """Test cases for the scanner helpers"""
+
+    def test_run_start_before_is_bounded(self):
+        text = 'A' * 1000 + 'x'
+        self.assertEqual(run_start_before(text, 1000, str.isupper, 50), 950)
+        self.assertEqual(run_start_before(text, 1000, str.isupper, 5000, floor=900), 900)
+
+    def test_block_end_cuts_at_terminator_or_limit(self):
+        terminator = re.compile(r'\n\n')
+        self.assertEqual(block_end('abc\n\ndef', 0, terminator, 100), 3)
+        self.assertEqual(block_end('x' * 500, 0, terminator, 100), 100)
+
+    def test_expired_budget_skips_and_reports(self):
+        budget = ScanBudget(0.0)
+        self.assertIsNone(budget.search('court', re.compile('COURT'), 'COURT'))
+        self.assertEqual(list(budget.finditer('email', re.compile('@'), 'a@b')), [])
+        report = budget.report()
+        self.assertTrue(report['exhausted'])
+        self.assertEqual(report['exhausted_by'], 'court')
+        self.assertIn('email', report['skipped_patterns'])
+
+
+class TestLegalEntityExtractorBudget(unittest.TestCase):
+    """Test cases for LegalEntityExtractor under the scan budget"""
+
+    def setUp(self):
+        self.extractor = LegalEntityExtractor()
+
+    def test_caption_entities(self):
+        entities = self.extractor.extract_legal_entities(CAPTION)
+        self.assertEqual(entities['case_information'].case_number, '1:25-cv-01987')
+        self.assertEqual(entities['case_information'].court_name, 'UNITED STATES DISTRICT COURT')
+        plaintiffs = [p.name for p in entities['parties'] if p.role == 'plaintiff']
+        defendants = [p.name for p in entities['parties'] if p.role == 'defendant']
+        self.assertTrue(plaintiffs and plaintiffs[0].endswith('EMAN YOUSSEF'))
+        self.assertEqual(defendants, ['TD BANK, N.A., & EXPERIAN,'])
+        self.assertEqual(entities['emails'], ['kmallon@consumerprotectionfirm.com'])
+        # Same as the pre-budget extractor: "Kevin Mallon, Esq." is not picked up as an attorney
+        self.assertEqual(entities['attorneys'], [])
+        self.assertFalse(entities['extraction_budget']['exhausted'])
+
+    def test_pathological_ocr_text_is_fast(self):
+        noise = 'A ' * 20000 + 'x' + 'a' * 20000 + '@' + 'Ab, ' * 10000
+        started = time.perf_counter()
+        entities = self.extractor.extract_legal_entities(noise)
+        self.assertLess(time.perf_counter() - started, 5.0)
+        self.assertIn('pattern_seconds', entities['extraction_budget'])
+
+    def test_exhausted_budget_returns_partial_results(self):
+        extractor = LegalEntityExtractor(time_budget_seconds=0.0)
+        entities = extractor.extract_legal_entities(CAPTION)
+        budget = entities['extraction_budget']
+        self.assertTrue(budget['exhausted'])
+        self.assertEqual(budget['exhausted_by'], 'case_number')
+        self.assertEqual(entities['parties'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
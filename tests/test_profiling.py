@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Unit tests for opt-in case profiling
+Tests the stage hook in CaseConsolidator and the pstats/collapsed-stack outputs
+"""
+
+import unittest
+import os
+import pstats
+import tempfile
+from pathlib import Path
+
+# Add the project root to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.processors.case_consolidator import CaseConsolidator
+from app.core.utils.profiling import StageProfiler, CaseProfiler
+
+
+class TestProfiling(unittest.TestCase):
+    """Test cases for StageProfiler and CaseProfiler"""
+
+    def setUp(self):
+        self.results = [
+            type('ProcessingResult', (), {
+                'file_path': '/cases/youssef/Atty_Notes.txt',
+                'success': True,
+                'extracted_text': 'Attorney Notes: Client Jane Doe. July 15, 2024: Client disputed '
+                                  'credit report errors with Equifax Information Services LLC.'
+            })()
+        ]
+
+    def test_stage_hook_wraps_each_consolidation_stage(self):
+        """Every consolidation stage is reported through the hook"""
+        profiler = StageProfiler(trace_allocations=False)
+        consolidator = CaseConsolidator(stage_hook=profiler.stage)
+        consolidator.consolidate_case_folder('/cases/youssef', self.results)
+
+        stages = {stats['stage']: stats for stats in profiler.stages()}
+        for name in ('extract_legal_entities', 'parties', 'damages', 'timeline', 'causes_of_action'):
+            self.assertIn(name, stages)
+            self.assertEqual(stages[name]['calls'], 1)
+        self.assertNotIn('net_allocated_bytes', stages['parties'])
+
+    def test_repeated_stages_are_aggregated(self):
+        """Stages with the same name accumulate calls and time"""
+        profiler = StageProfiler()
+        for _ in range(3):
+            with profiler.stage('entities'):
+                pass
+
+        stats = profiler.stages()[0]
+        self.assertEqual(stats['calls'], 3)
+        self.assertGreaterEqual(stats['total_seconds'], stats['max_seconds'])
+
+    def test_case_profiler_writes_outputs(self):
+        """CaseProfiler writes a loadable pstats dump and a collapsed-stack file"""
+        profiler = CaseProfiler(sample_interval=0.001)
+        profiler.start()
+        consolidator = CaseConsolidator(stage_hook=profiler.stage)
+        consolidator.consolidate_case_folder('/cases/youssef', self.results)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            summary = profiler.write(temp_dir, 'Youssef_FCRA')
+
+            self.assertTrue(os.path.exists(summary['pstats_file']))
+            self.assertTrue(os.path.exists(summary['collapsed_stacks_file']))
+            pstats.Stats(summary['pstats_file'])
+
+            with open(summary['collapsed_stacks_file']) as f:
+                for line in f:
+                    stack, count = line.rsplit(' ', 1)
+                    self.assertTrue(stack)
+                    self.assertGreater(int(count), 0)
+
+        self.assertGreater(summary['wall_seconds'], 0)
+        self.assertTrue(summary['top_functions'])
+        self.assertIn('net_allocated_bytes', summary['stages'][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Unit tests for in-memory review state
+Tests all-or-nothing JSON Patch, version conflicts, write-behind flushing and the shared multi-worker mode
+"""
+
+import os
+import json
+import time
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the project root and shared-schema to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "shared-schema"))
+
+from dashboard.review_state import (
+    PatchError, ReviewStateStore, VersionConflict, apply_patch, escape_pointer
+)
+
+HYDRATED = {
+    'causes_of_action': [
+        {'title': 'FCRA § 1681e(b)', 'selected': False},
+        {'title': 'FCRA § 1681i', 'selected': False},
+    ],
+    'damages': {'actual': [{'type': 'Credit denial', 'selected': False}]},
+}
+
+
+class TestApplyPatch(unittest.TestCase):
+    """Test cases for apply_patch"""
+
+    def setUp(self):
+        self.document = json.loads(json.dumps(HYDRATED))
+
+    def test_applies_operations_in_order(self):
+        apply_patch(self.document, [
+            {'op': 'replace', 'path': '/causes_of_action/0/selected', 'value': True},
+            {'op': 'add', 'path': '/causes_of_action/-', 'value': {'title': 'FDCPA', 'selected': True}},
+            {'op': 'remove', 'path': '/damages/actual/0'},
+            {'op': 'test', 'path': '/causes_of_action/2/title', 'value': 'FDCPA'},
+        ])
+        self.assertTrue(self.document['causes_of_action'][0]['selected'])
+        self.assertEqual(len(self.document['causes_of_action']), 3)
+        self.assertEqual(self.document['damages']['actual'], [])
+
+    def test_failing_operation_rolls_back_earlier_ones(self):
+        for failing in (
+            {'op': 'remove', 'path': '/damages/punitive'},
+            {'op': 'test', 'path': '/causes_of_action/2/selected', 'value': True},
+            {'op': 'replace', 'path': '/causes_of_action/7/selected', 'value': True},
+            {'op': 'move', 'path': '/damages'},
+        ):
+            with self.subTest(op=failing):
+                self.document = json.loads(json.dumps(HYDRATED))
+                with self.assertRaises(PatchError):
+                    apply_patch(self.document, [
+                        {'op': 'replace', 'path': '/causes_of_action/0/selected', 'value': True},
+                        {'op': 'add', 'path': '/causes_of_action/0', 'value': {'title': 'new'}},
+                        {'op': 'remove', 'path': '/damages/actual/0'},
+                        {'op': 'add', 'path': '/damages/statutory', 'value': 1000},
+                        failing,
+                    ])
+                self.assertEqual(self.document, HYDRATED)
+
+    def test_escaped_pointer_tokens(self):
+        document = {'damages': {'a/b~c': 1}}
+        apply_patch(document, [{'op': 'replace', 'path': '/damages/' + escape_pointer('a/b~c'), 'value': 2}])
+        self.assertEqual(document, {'damages': {'a/b~c': 2}})
+
+
+class ReviewStateTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'hydrated_doe.json')
+        self.write_disk(HYDRATED)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_disk(self, data):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def read_disk(self):
+        with open(self.path, encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def select(index):
+        return [{'op': 'replace', 'path': f'/causes_of_action/{index}/selected', 'value': True}]
+
+
+class TestReviewStateStore(ReviewStateTestCase):
+    """Test cases for the single-worker write-behind store"""
+
+    def setUp(self):
+        super().setUp()
+        self.store = ReviewStateStore(debounce_seconds=60, max_write_delay_seconds=60)
+
+    def tearDown(self):
+        self.store.discard(self.path)
+        super().tearDown()
+
+    def test_failed_patch_changes_nothing(self):
+        with self.assertRaises(PatchError):
+            self.store.apply(self.path, self.select(0) + [{'op': 'remove', 'path': '/nope'}])
+        data, version = self.store.get(self.path)
+        self.assertEqual(data, HYDRATED)
+        self.assertEqual(version, 0)
+
+    def test_version_conflict(self):
+        self.assertEqual(self.store.apply(self.path, self.select(0), expected_version=0), 1)
+        with self.assertRaises(VersionConflict) as raised:
+            self.store.apply(self.path, self.select(1), expected_version=0)
+        self.assertEqual((raised.exception.expected, raised.exception.current), (0, 1))
+        self.assertFalse(self.store.get(self.path)[0]['causes_of_action'][1]['selected'])
+
+    def test_flush_writes_one_atomic_file(self):
+        for index in (0, 1):
+            self.store.apply(self.path, self.select(index))
+        self.assertEqual(self.read_disk(), HYDRATED)
+
+        with mock.patch('dashboard.review_state.os.replace', wraps=os.replace) as replace:
+            self.store.flush(self.path)
+        self.assertEqual(replace.call_count, 1)
+        self.assertEqual(replace.call_args[0][1], self.path)
+        self.assertEqual(self.read_disk(), self.store.get(self.path)[0])
+        self.assertEqual(os.listdir(self.tmp.name), ['hydrated_doe.json'])
+
+    def test_get_json_matches_document(self):
+        self.store.apply(self.path, self.select(0))
+        encoded, version = self.store.get_json(self.path)
+        self.assertEqual(json.loads(encoded), self.store.get(self.path)[0])
+        self.assertEqual(version, 1)
+
+    def test_external_rewrite_bumps_version(self):
+        self.assertEqual(self.store.version(self.path), 0)
+        rewritten = dict(HYDRATED, damages={})
+        self.write_disk(rewritten)
+        os.utime(self.path, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+        data, version = self.store.get(self.path)
+        self.assertEqual((data, version), (rewritten, 1))
+
+    def wait_for_disk(self, expected, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.read_disk() == expected:
+                return True
+            time.sleep(0.02)
+        return False
+
+    def test_debounce_flushes_in_background(self):
+        store = ReviewStateStore(debounce_seconds=0.05, max_write_delay_seconds=60)
+        store.apply(self.path, self.select(0))
+        self.assertTrue(self.wait_for_disk(store.get(self.path)[0]))
+
+    def test_max_delay_forces_flush(self):
+        store = ReviewStateStore(debounce_seconds=60, max_write_delay_seconds=0)
+        store.apply(self.path, self.select(0))
+        self.assertTrue(self.wait_for_disk(store.get(self.path)[0]))
+
+
+class TestSharedReviewState(ReviewStateTestCase):
+    """Test cases for the multi-worker write-through mode"""
+
+    def setUp(self):
+        super().setUp()
+        self.first = ReviewStateStore(shared=True)
+        self.second = ReviewStateStore(shared=True)
+
+    def test_patches_write_through_and_share_the_version(self):
+        self.assertEqual(self.first.apply(self.path, self.select(0)), 1)
+        self.assertTrue(self.read_disk()['causes_of_action'][0]['selected'])
+        self.assertEqual(self.second.version(self.path), 1)
+
+        self.assertEqual(self.second.apply(self.path, self.select(1), expected_version=1), 2)
+        data, version = self.first.get(self.path)
+        self.assertTrue(data['causes_of_action'][1]['selected'])
+        self.assertEqual(version, 2)
+
+        with open(os.path.join(self.tmp.name, '.hydrated_doe.json.review-version')) as f:
+            recorded_version, recorded_mtime_ns = (int(value) for value in f.read().split())
+        self.assertEqual((recorded_version, recorded_mtime_ns), (2, os.stat(self.path).st_mtime_ns))
+
+    def test_stale_worker_gets_version_conflict(self):
+        self.first.apply(self.path, self.select(0))
+        with self.assertRaises(VersionConflict):
+            self.second.apply(self.path, self.select(1), expected_version=0)
+
+    def test_external_rewrite_is_a_new_version(self):
+        self.first.apply(self.path, self.select(0))
+        self.write_disk(HYDRATED)
+        os.utime(self.path, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+        data, version = self.second.get(self.path)
+        self.assertEqual((data, version), (HYDRATED, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the cross-case search index
+Tests FTS query sanitising, facet and date-range filters, signature-based re-indexing and schema resets
+"""
+
+import os
+import json
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the project root to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dashboard import search_index
+from dashboard.search_index import (
+    DOCUMENT_TEXTS_FILENAME, SearchIndex, extract_facets, fts_query, normalize_date
+)
+
+
+def hydrated_case(plaintiff, defendant, filing_date, document_dates=()):
+    return {
+        'parties': {
+            'plaintiff': {'name': plaintiff},
+            'defendants': [{'name': defendant, 'type': 'Credit Bureau'}],
+        },
+        'case_information': {'court_name': 'United States District Court', 'case_number': '1:25-cv-0001'},
+        'causes_of_action': [{'title': 'Violation of the FCRA', 'legal_claims': [
+            {'citation': '15 U.S.C. § 1681e(b)', 'selected': True, 'description': 'Inaccurate reporting'},
+        ]}],
+        'case_timeline': {'filing_date': filing_date, 'document_dates': list(document_dates)},
+    }
+
+
+class TestQueryHelpers(unittest.TestCase):
+    """Test cases for fts_query and date normalization"""
+
+    def test_words_become_quoted_terms(self):
+        self.assertEqual(fts_query('capital one'), '"capital" "one"')
+        self.assertEqual(fts_query('"capital one" denial*'), '"capital one" "denial"*')
+
+    def test_operators_and_syntax_are_dropped(self):
+        self.assertEqual(fts_query('equifax OR NOT experian'), '"equifax" "experian"')
+        self.assertEqual(fts_query('body:secret NEAR(a b)'), '"body" "secret" "a" "b"')
+        self.assertEqual(fts_query('"unterminated phrase'), '"unterminated" "phrase"')
+        self.assertIsNone(fts_query('" OR *'))
+
+    def test_normalize_date(self):
+        for value in ('2025-03-04', '2025-03-04T10:00:00Z', '03/04/2025', 'March 4, 2025', 'Mar 4 2025', '4 March 2025'):
+            with self.subTest(value=value):
+                self.assertEqual(normalize_date(value), '2025-03-04')
+        for value in ('', 'sometime in spring', None, 20250304):
+            self.assertIsNone(normalize_date(value))
+
+    def test_date_facets_are_iso(self):
+        facets = extract_facets(hydrated_case('Jane Doe', 'Equifax', 'January 5, 2025', [
+            {'date': '02/10/2024', 'parsed_date': '2024-02-10'},
+            {'date': 'last summer'},
+        ]))
+        self.assertEqual([value for field, value in facets if field == 'date'], ['2025-01-05', '2024-02-10'])
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Test cases for SearchIndex against a temporary SQLite database"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.tmp.name, 'index', 'cases.sqlite3')
+        self.index = SearchIndex(self.index_path)
+        self.index.index_case('doe', hydrated_case('Jane Doe', 'Equifax Information Services', 'January 5, 2025'),
+                              [{'file_name': 'Denial_Letter.pdf', 'text': 'Your mortgage application was denied.'}],
+                              status='Complete')
+        self.index.index_case('roe', hydrated_case('Richard Roe', 'Capital One Bank', '2024-06-30'),
+                              [{'file_name': 'Atty_Notes.docx', 'text': 'Client disputed the tradeline twice.'}],
+                              status='New')
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp.cleanup()
+
+    def case_ids(self, **kwargs):
+        return sorted({result['case_id'] for result in self.index.search(**kwargs)['results']})
+
+    def test_full_text_search(self):
+        result = self.index.search(q='mortgage denied')
+        self.assertEqual(result['total'], 1)
+        self.assertEqual(result['results'][0]['doc_type'], 'denial_letter')
+        self.assertIn('<mark>', result['results'][0]['snippet'])
+        self.assertEqual(self.case_ids(q='dispute*'), ['roe'])
+
+    def test_injection_through_q_is_neutralised(self):
+        for q in ('mortgage" OR "tradeline', 'title:Equifax', 'mortgage OR tradeline', '")(*', 'NEAR(mortgage denied)'):
+            with self.subTest(q=q):
+                self.index.search(q=q)
+        self.assertEqual(self.case_ids(q='mortgage" OR "tradeline'), [])
+        self.assertEqual(self.case_ids(q='mortgage OR tradeline'), [])
+
+    def test_facet_filters(self):
+        self.assertEqual(self.case_ids(filters={'defendant': 'capital one'}), ['roe'])
+        self.assertEqual(self.case_ids(filters={'selected_claim': '1681e'}), ['doe', 'roe'])
+        self.assertEqual(self.case_ids(q='application', filters={'plaintiff': 'doe'}), ['doe'])
+        self.assertEqual(self.case_ids(status='New'), ['roe'])
+        with self.assertRaises(ValueError):
+            self.index.search(filters={'ssn': '123'})
+
+    def test_iso_date_ranges(self):
+        self.assertEqual(self.case_ids(date_from='2025-01-01'), ['doe'])
+        self.assertEqual(self.case_ids(date_to='2024-12-31'), ['roe'])
+        self.assertEqual(self.case_ids(date_from='2024-06-30', date_to='2025-01-05'), ['doe', 'roe'])
+        self.assertEqual(self.case_ids(date_from='06/01/2024', date_to='June 30, 2024'), ['roe'])
+        with self.assertRaises(ValueError):
+            self.index.search(date_from='not a date')
+
+    def test_reindexes_only_when_sources_change(self):
+        output_dir = os.path.join(self.tmp.name, 'outputs', 'doe')
+        os.makedirs(output_dir)
+        hydrated_path = os.path.join(output_dir, 'hydrated.json')
+        with open(hydrated_path, 'w', encoding='utf-8') as f:
+            json.dump(hydrated_case('Jane Doe', 'Equifax', '2025-01-05'), f)
+
+        self.assertTrue(self.index.index_case_outputs('doe', output_dir, hydrated_path, status='Complete'))
+        self.assertFalse(self.index.index_case_outputs('doe', output_dir, hydrated_path, status='Pending Review'))
+        self.assertEqual(self.case_ids(status='Pending Review'), ['doe'])
+
+        with open(os.path.join(output_dir, DOCUMENT_TEXTS_FILENAME), 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'file_name': 'Summons.pdf', 'text': 'You are hereby summoned.'}) + '\n')
+        self.assertTrue(self.index.index_case_outputs('doe', output_dir, hydrated_path, status='Pending Review'))
+        self.assertEqual(self.case_ids(q='summoned'), ['doe'])
+
+    def test_schema_version_change_clears_index(self):
+        self.index.close()
+        conn = sqlite3.connect(self.index_path)
+        conn.execute("UPDATE meta SET value = '1' WHERE key = 'schema_version'")
+        conn.commit()
+        conn.close()
+
+        index = SearchIndex(self.index_path)
+        self.assertEqual(index.search()['total'], 0)
+        self.assertEqual(index.search(q='mortgage')['total'], 0)
+        self.assertEqual(index._query("SELECT value FROM meta WHERE key = 'schema_version'")[0][0],
+                         str(search_index.SCHEMA_VERSION))
+        index.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared JSON serialization layer
+Tests that every backend writes the same JSON and that schema validation agrees for dicts and bytes
+"""
+
+import os
+import json
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+# Add the project root and shared-schema to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "shared-schema"))
+
+from satori_schema import serialization, validate_hydrated_json, validate_hydrated_json_bytes
+
+HYDRATED_SAMPLE = project_root / "test-data" / "test-json" / "hydrated-test-0.json"
+
+
+class TestSerialization(unittest.TestCase):
+    """Test cases for satori_schema.serialization"""
+
+    def setUp(self):
+        self.backend = serialization.BACKEND
+        self.value = {
+            'case': 'Doe v. Equifax – § 1681',
+            'dates': [datetime(2026, 1, 2, 3, 4, 5)],
+            'path': Path('/cases/doe'),
+            'counts': {1: 'one'},
+            'nested': {'score': 92.5, 'ok': True, 'none': None}
+        }
+
+    def tearDown(self):
+        serialization.BACKEND = self.backend
+
+    def backends(self):
+        available = ['json']
+        if serialization.orjson is not None:
+            available.append('orjson')
+        if serialization.msgspec is not None:
+            available.append('msgspec')
+        return available
+
+    def test_compact_by_default(self):
+        text = serialization.dumps({'a': [1, 2]})
+        self.assertEqual(text, '{"a":[1,2]}')
+
+    def test_pretty_on_demand(self):
+        self.assertEqual(serialization.dumps({'a': 1}, pretty=True), '{\n  "a": 1\n}')
+
+    def test_backends_agree_with_stdlib_default_str(self):
+        expected = json.loads(json.dumps(self.value, default=str))
+        for backend in self.backends():
+            if backend == 'msgspec':
+                continue  # encodes datetimes natively as ISO 8601
+            serialization.BACKEND = backend
+            with self.subTest(backend=backend):
+                self.assertEqual(serialization.loads(serialization.dumps_bytes(self.value)), expected)
+
+    def test_malformed_input_raises_value_error(self):
+        for backend in self.backends():
+            serialization.BACKEND = backend
+            with self.subTest(backend=backend):
+                with self.assertRaises(ValueError):
+                    serialization.loads('{"a": ')
+
+    def test_dump_is_atomic_and_round_trips(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'out.json')
+            serialization.dump({'a': 'ü'}, path)
+            self.assertEqual(serialization.load(path), {'a': 'ü'})
+            self.assertEqual(os.listdir(tmp), ['out.json'])
+
+
+class TestSchemaValidation(unittest.TestCase):
+    """Test cases for the shared HydratedJSON validator"""
+
+    def test_dict_and_bytes_validation_agree(self):
+        raw = HYDRATED_SAMPLE.read_bytes()
+        self.assertEqual(validate_hydrated_json(json.loads(raw))[0], True)
+        self.assertEqual(validate_hydrated_json_bytes(raw), (True, None, None))
+
+    def test_invalid_document_reports_errors(self):
+        is_valid, errors, _ = validate_hydrated_json_bytes(b'{"jury_demand": true}')
+        self.assertFalse(is_valid)
+        self.assertTrue(errors)
+
+
+if __name__ == '__main__':
+    unittest.main()
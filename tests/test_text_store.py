@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the spill-to-disk text store
+Tests that spilled text reads back identically and stays out of logs
+"""
+
+import io
+import unittest
+from pathlib import Path
+
+# Add the project root to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.utils.text_store import TextHandle, CHUNK_CHARS
+from app.engines.base_engine import ExtractionResult
+
+
+class TestTextHandle(unittest.TestCase):
+    """Test cases for TextHandle"""
+
+    def setUp(self):
+        # Multi-byte characters straddle chunk boundaries
+        self.text = ('§ 1681 – Plaintiff’s report\n' * (CHUNK_CHARS // 10))[:3 * CHUNK_CHARS + 17]
+
+    def test_short_text_stays_in_memory(self):
+        handle = TextHandle('short text', threshold=100)
+        self.assertFalse(handle.spilled)
+        self.assertEqual(str(handle), 'short text')
+
+    def test_spilled_text_round_trips(self):
+        handle = TextHandle(self.text, threshold=1000)
+        self.assertTrue(handle.spilled)
+        self.assertEqual(len(handle), len(self.text))
+        self.assertEqual(str(handle), self.text)
+        self.assertEqual(handle, self.text)
+
+    def test_spilled_slicing(self):
+        handle = TextHandle(self.text, threshold=1000)
+        for start, stop in [(0, 10), (CHUNK_CHARS - 5, CHUNK_CHARS + 5), (100, 2 * CHUNK_CHARS + 3), (-20, None)]:
+            self.assertEqual(handle[start:stop], self.text[start:stop])
+        self.assertEqual(handle[CHUNK_CHARS], self.text[CHUNK_CHARS])
+        self.assertEqual(handle[-1], self.text[-1])
+        self.assertEqual(handle[::7], self.text[::7])
+
+    def test_write_to_streams_full_text(self):
+        handle = TextHandle(self.text, threshold=1000)
+        out = io.StringIO()
+        handle.write_to(out)
+        self.assertEqual(out.getvalue(), self.text)
+
+    def test_materialized_decodes_once(self):
+        handle = TextHandle(self.text, threshold=1000)
+        with handle.materialized():
+            with handle.materialized():
+                first = str(handle)
+                self.assertIs(str(handle), first)
+            self.assertIs(str(handle), first)
+            self.assertEqual(handle[5:15], self.text[5:15])
+        self.assertIsNot(str(handle), first)
+        self.assertEqual(str(handle), self.text)
+
+    def test_repr_is_a_preview(self):
+        handle = TextHandle(self.text, threshold=1000)
+        self.assertLess(len(repr(handle)), 200)
+
+
+class TestExtractionResultText(unittest.TestCase):
+    """Test cases for ExtractionResult text handling"""
+
+    def test_text_property_and_log_dict(self):
+        text = 'x' * 5000
+        result = ExtractionResult(success=True, text=TextHandle(text, threshold=1000))
+        self.assertEqual(result.text, text)
+        self.assertEqual(result.text_length, 5000)
+        self.assertEqual(result.to_dict()['text'], text)
+        self.assertLess(len(result.to_dict(include_text=False)['text']), 100)
+
+    def test_empty_text(self):
+        result = ExtractionResult(success=False)
+        self.assertEqual(result.text, '')
+        self.assertEqual(result.text_length, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
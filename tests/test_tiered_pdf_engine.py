@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the tiered PDF engine
+Tests text layer quality checks and per-page OCR routing
+"""
+
+import unittest
+from unittest import mock
+from pathlib import Path
+
+# Add the project root to Python path
+import sys
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.engines import tiered_pdf_engine
+from app.engines.base_engine import ExtractionResult
+from app.engines.tiered_pdf_engine import TieredPdfEngine, text_layer_quality
+
+LETTER_PAGE = ("We regret to inform you that your application for credit has been denied. "
+               "This decision was based on information in your consumer report from Equifax.")
+
+
+class TestTextLayerQuality(unittest.TestCase):
+    """Test cases for text_layer_quality"""
+
+    def test_born_digital_page_is_usable(self):
+        self.assertEqual(text_layer_quality(LETTER_PAGE), (True, 'ok'))
+
+    def test_image_only_page(self):
+        self.assertEqual(text_layer_quality('  \n 3 \n'), (False, 'no_text_layer'))
+
+    def test_garbled_pages(self):
+        self.assertEqual(text_layer_quality('\ufffd' * 10 + LETTER_PAGE[:60]), (False, 'garbled'))
+        self.assertEqual(text_layer_quality('#$%^&*()!@' * 10), (False, 'garbled'))
+        self.assertEqual(text_layer_quality(LETTER_PAGE.replace(' ', '')), (False, 'garbled'))
+
+
+class TestTieredPdfEngine(unittest.TestCase):
+    """Test cases for TieredPdfEngine routing"""
+
+    def setUp(self):
+        self.ocr_engine = mock.Mock()
+        self.ocr_engine.setup_dependencies.return_value = True
+        self.engine = TieredPdfEngine(ocr_engine=self.ocr_engine)
+
+    def test_only_unusable_pages_are_ocrd(self):
+        layer = [LETTER_PAGE, '', LETTER_PAGE]
+        with mock.patch.object(tiered_pdf_engine, 'read_text_layer', return_value=layer), \
+                mock.patch.object(tiered_pdf_engine, 'convert_page_range',
+                                  return_value=[(2, 'Scanned enclosure')]) as convert:
+            result = self.engine.extract_text('denial.pdf')
+
+        convert.assert_called_once_with('denial.pdf', 2, 2)
+        self.assertTrue(result.success)
+        self.assertEqual([page['source'] for page in result.metadata['pages']],
+                         ['text_layer', 'ocr', 'text_layer'])
+        self.assertEqual(result.metadata['ocr_pages'], 1)
+        self.assertIn('Scanned enclosure', result.text)
+        self.assertLess(result.text.index('<!-- page 1 -->'), result.text.index('<!-- page 2 -->'))
+
+    def test_fully_scanned_pdf_goes_to_docling(self):
+        self.ocr_engine.extract_text.return_value = ExtractionResult(success=True, text='ocr text')
+        with mock.patch.object(tiered_pdf_engine, 'read_text_layer', return_value=['', '']):
+            result = self.engine.extract_text('scan.pdf')
+        self.ocr_engine.extract_text.assert_called_once_with('scan.pdf')
+        self.assertEqual(result.metadata['tiered_fallback'], 'no_usable_text_layer')
+
+
+if __name__ == '__main__':
+    unittest.main()
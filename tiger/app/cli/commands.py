@@ -9,7 +9,9 @@ import argparse
 import logging
 import json
 from pathlib import Path
+from datetime import datetime
 from typing import Optional
+from contextlib import nullcontext
 
 
 
@@ -21,6 +23,9 @@ from core.processors.case_consolidator import CaseConsolidator
 from core.event_broadcaster import ProcessingEventBroadcaster
 from config.settings import config
 from output.handlers import OutputManager
+from app.core.utils.metrics import registry as metrics_registry
+from app.core.utils.batch_scoring import BatchScores
+from app.core.utils.profiling import CaseProfiler
 
 class SatoriCLI:
     """Command Line Interface for Satori Tiger Document Processing Service"""
@@ -66,6 +71,7 @@ Examples:
   satori-tiger batch ./case_files/ --output-dir ./processed/  # Batch process with reports
   satori-tiger case-extract ./case_folder/ -o ./tests/output/  # Test case extraction
   satori-tiger hydrated-json ./case_folder/ -o ./output/      # Generate NY FCRA hydrated JSON
+  satori-tiger bench --sizes 1 10 --baseline bench.json        # Benchmark pipeline stages
   satori-tiger info                                            # Show service information
   satori-tiger validate document.pdf                          # Quality validation only
 
@@ -192,6 +198,11 @@ For more information, visit: https://github.com/satori-dev/tiger-engine
             action='store_true',
             help='Generate complaint.json from extracted case data'
         )
+        case_parser.add_argument(
+            '--profile',
+            action='store_true',
+            help='Write cProfile (.pstats) and collapsed-stack profiles and add per-stage timings to case metadata'
+        )
         
         # Hydrated-JSON command
         hydrated_parser = subparsers.add_parser(
@@ -220,6 +231,84 @@ For more information, visit: https://github.com/satori-dev/tiger-engine
             '--dashboard-url',
             help='Dashboard URL for real-time event broadcasting (e.g., http://127.0.0.1:8000)'
         )
+        hydrated_parser.add_argument(
+            '--profile',
+            action='store_true',
+            help='Write cProfile (.pstats) and collapsed-stack profiles and add per-stage timings to case metadata'
+        )
+        
+        # Bench command
+        bench_parser = subparsers.add_parser(
+            'bench',
+            help='Benchmark pipeline stages on synthetic case folders (offline, stub PDF engine)'
+        )
+        bench_parser.add_argument(
+            '--sizes',
+            nargs='+',
+            type=int,
+            default=[1, 10, 100, 500],
+            help='Documents per synthetic case (default: 1 10 100 500)'
+        )
+        bench_parser.add_argument(
+            '--formats',
+            nargs='+',
+            choices=['txt', 'docx', 'pdf'],
+            default=['txt', 'docx'],
+            help='Document formats to generate; pdf uses the stub engine (default: txt docx)'
+        )
+        bench_parser.add_argument(
+            '--repeats',
+            type=int,
+            default=3,
+            help='Runs per case; medians are reported (default: 3)'
+        )
+        bench_parser.add_argument(
+            '--warmup',
+            type=int,
+            default=1,
+            help='Untimed runs per case before measuring (default: 1)'
+        )
+        bench_parser.add_argument(
+            '--seed',
+            type=int,
+            default=1234,
+            help='Random seed for the synthetic case generator (default: 1234)'
+        )
+        bench_parser.add_argument(
+            '--report-pages',
+            type=int,
+            default=20,
+            help='Pages per synthetic credit report (default: 20)'
+        )
+        bench_parser.add_argument(
+            '--stub-seconds-per-page',
+            type=float,
+            default=0.0,
+            help='Simulated OCR latency per page for the stub PDF engine'
+        )
+        bench_parser.add_argument(
+            '--no-monkey',
+            action='store_true',
+            help='Skip the Monkey complaint render stage'
+        )
+        bench_parser.add_argument(
+            '--work-dir',
+            help='Keep generated case folders here instead of a temporary directory'
+        )
+        bench_parser.add_argument(
+            '-o', '--output',
+            help='Results JSON path (default: <output dir>/benchmarks/bench_<timestamp>.json)'
+        )
+        bench_parser.add_argument(
+            '--baseline',
+            help='Baseline results JSON to compare against'
+        )
+        bench_parser.add_argument(
+            '--threshold',
+            type=float,
+            default=0.2,
+            help='Fractional slowdown that counts as a regression (default: 0.2)'
+        )
         
         return parser
     
@@ -238,27 +327,34 @@ For more information, visit: https://github.com/satori-dev/tiger-engine
         if parsed_args.config and os.path.exists(parsed_args.config):
             self.config.load_from_file(parsed_args.config)
         
-        # Initialize processor
-        self.processor = DocumentProcessor(self.config)
-        
-        # Route to appropriate command
-        if parsed_args.command == 'process':
-            return self.cmd_process(parsed_args)
-        elif parsed_args.command == 'batch':
-            return self.cmd_batch(parsed_args)
-        elif parsed_args.command == 'case-extract':
-            return self.cmd_case_extract(parsed_args)
-        elif parsed_args.command == 'hydrated-json':
-            return self.cmd_hydrated_json(parsed_args)
-        elif parsed_args.command == 'validate':
-            return self.cmd_validate(parsed_args)
-        elif parsed_args.command == 'info':
-            return self.cmd_info(parsed_args)
-        elif parsed_args.command == 'test':
-            return self.cmd_test(parsed_args)
-        else:
-            parser.print_help()
-            return 1
+        # Initialize processor (bench builds its own with the stub PDF engine)
+        if parsed_args.command != 'bench':
+            self.processor = DocumentProcessor(self.config)
+        
+        # Route to appropriate command, then stop any OCR worker pool it started
+        try:
+            if parsed_args.command == 'process':
+                return self.cmd_process(parsed_args)
+            elif parsed_args.command == 'batch':
+                return self.cmd_batch(parsed_args)
+            elif parsed_args.command == 'case-extract':
+                return self.cmd_case_extract(parsed_args)
+            elif parsed_args.command == 'hydrated-json':
+                return self.cmd_hydrated_json(parsed_args)
+            elif parsed_args.command == 'validate':
+                return self.cmd_validate(parsed_args)
+            elif parsed_args.command == 'info':
+                return self.cmd_info(parsed_args)
+            elif parsed_args.command == 'test':
+                return self.cmd_test(parsed_args)
+            elif parsed_args.command == 'bench':
+                return self.cmd_bench(parsed_args)
+            else:
+                parser.print_help()
+                return 1
+        finally:
+            if self.processor:
+                self.processor.close()
     
     def cmd_process(self, args) -> int:
         """Process command handler"""
@@ -355,15 +451,16 @@ For more information, visit: https://github.com/satori-dev/tiger-engine
                 print(f"📋 Detailed Report: {report_file}")
             
             # Show quality summary for successful documents
-            successful_results = [r for r in batch_result.results if r.success and r.quality_metrics]
-            if successful_results:
-                quality_scores = [r.quality_metrics.get('quality_score', 0) for r in successful_results]
-                avg_quality = sum(quality_scores) / len(quality_scores)
-                high_quality = len([s for s in quality_scores if s >= 80])
+            scores = BatchScores.from_results(r for r in batch_result.results if r.success)
+            if len(scores):
+                quality = scores.distribution('quality_score')
+                tiers = scores.tier_counts(self.config.quality)
                 
                 print(f"🎯 Quality Summary:")
-                print(f"   Average Score: {avg_quality:.1f}/100")
-                print(f"   High Quality (≥80): {high_quality}/{len(successful_results)}")
+                print(f"   Average Score: {quality['average']:.1f}/100")
+                print(f"   Median Score: {quality['percentiles']['p50']:.1f}/100")
+                print(f"   High Quality (≥80): {tiers['high_quality_count']}/{len(scores)}")
+                print(f"   Average Readiness: {scores.distribution('readiness_score')['average']:.1f}/100")
             
             return 0 if batch_result.summary['failed'] == 0 else 1
             
@@ -473,6 +570,88 @@ For more information, visit: https://github.com/satori-dev/tiger-engine
             logging.exception("Error in info command")
             return 1
     
+    def cmd_bench(self, args) -> int:
+        """Benchmark command handler"""
+        from app.core.benchmarks.runner import BenchmarkConfig, BenchmarkRunner, STAGES, compare_to_baseline, save_results
+        
+        if any(size < 1 for size in args.sizes):
+            print("❌ Error: --sizes must be positive")
+            return 1
+        
+        bench_config = BenchmarkConfig(
+            sizes=args.sizes,
+            formats=args.formats,
+            repeats=args.repeats,
+            warmup=args.warmup,
+            seed=args.seed,
+            report_pages=args.report_pages,
+            stub_seconds_per_page=args.stub_seconds_per_page,
+            include_monkey=not args.no_monkey
+        )
+        output_path = args.output or str(
+            Path(self.config.get_data_dirs()['output']) / 'benchmarks' /
+            f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        
+        print(f"⏱️ Satori Tiger Benchmark")
+        print(f"📄 Sizes: {', '.join(str(size) for size in args.sizes)} documents")
+        print(f"📋 Formats: {', '.join(args.formats)}  Repeats: {args.repeats}  Seed: {args.seed}")
+        print()
+        
+        baseline = None
+        if args.baseline:
+            try:
+                with open(args.baseline, 'r', encoding='utf-8') as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"❌ Error: Could not read baseline {args.baseline}: {e}")
+                return 1
+        
+        # Per-document INFO logging would dominate the timings
+        if not args.verbose:
+            logging.getLogger().setLevel(logging.WARNING)
+        
+        try:
+            runner = BenchmarkRunner(bench_config, work_dir=args.work_dir)
+            results = runner.run(progress=lambda line: print(f"   {line}"))
+        except Exception as e:
+            print(f"💥 Fatal Error: {e}")
+            logging.exception("Fatal error in bench command")
+            return 1
+        
+        if not results['monkey_render'] and bench_config.include_monkey:
+            print("⚠️ Monkey renderer unavailable - monkey_render stage skipped")
+        
+        print(f"\n📊 Median seconds per stage")
+        header = f"{'format':<6} {'docs':>5}  " + ' '.join(f"{stage:>13}" for stage in STAGES) + f" {'total':>9}"
+        print(header)
+        for run in results['runs']:
+            cells = ' '.join(
+                f"{run['stages'][stage]['median_seconds']:>13.4f}" if stage in run['stages'] else f"{'-':>13}"
+                for stage in STAGES
+            )
+            print(f"{run['format']:<6} {run['documents']:>5}  {cells} {run['total']['median_seconds']:>9.3f}")
+        
+        exit_code = 0
+        if baseline:
+            comparison = compare_to_baseline(results, baseline, threshold=args.threshold)
+            results['comparison'] = comparison
+            print(f"\n📈 Baseline comparison ({comparison['compared']} measurements, threshold {args.threshold:.0%})")
+            for row in comparison['improvements']:
+                print(f"   ✅ {row['format']} x {row['documents']} {row['stage']}: "
+                      f"{row['baseline_seconds']:.4f}s → {row['current_seconds']:.4f}s ({row['change_percent']:+.1f}%)")
+            for row in comparison['regressions']:
+                print(f"   ❌ {row['format']} x {row['documents']} {row['stage']}: "
+                      f"{row['baseline_seconds']:.4f}s → {row['current_seconds']:.4f}s ({row['change_percent']:+.1f}%)")
+            if comparison['regressions']:
+                print(f"\n❌ {len(comparison['regressions'])} regression(s) beyond threshold")
+                exit_code = 1
+            else:
+                print(f"   No regressions beyond threshold")
+        
+        saved_path = save_results(results, output_path)
+        print(f"\n💾 Results: {saved_path}")
+        return exit_code
+    
     def cmd_test(self, args) -> int:
         """Test command handler"""
         print(f"🧪 Satori Tiger Service Test")
@@ -578,46 +757,55 @@ For more information, visit: https://github.com/satori-dev/tiger-engine
                 output_manager.base_output_dir = Path(output_dir)
             case_name_generator = CaseNameGenerator()
             
-            # Process each document with Tiger
-            print("🔄 Processing documents...")
-            extraction_results = []
+            profiler = CaseProfiler() if args.profile else None
+            if profiler:
+                profiler.start()
             
-            for doc_path in document_files:
-                print(f"   Processing: {doc_path.name}...", end=" ")
+            try:
+                # Process each document with Tiger
+                print("🔄 Processing documents...")
+                extraction_results = []
+            
+                for doc_path in document_files:
+                    print(f"   Processing: {doc_path.name}...", end=" ")
                 
-                # Process document without saving to old structure
-                result = self.processor.process_document(str(doc_path))
-                extraction_results.append(result)
+                    # Process document without saving to old structure
+                    with profiler.stage('document_processing') if profiler else nullcontext():
+                        result = self.processor.process_document(str(doc_path))
+                    extraction_results.append(result)
                 
-                if result.success:
-                    quality_score = result.quality_metrics.get('quality_score', 0)
-                    print(f"✅ {quality_score}/100")
-                else:
-                    print(f"❌ Failed: {result.error}")
+                    if result.success:
+                        quality_score = result.quality_metrics.get('quality_score', 0)
+                        print(f"✅ {quality_score}/100")
+                    else:
+                        print(f"❌ Failed: {result.error}")
             
-            print()
+                print()
             
-            # Consolidate case information
-            print("🔗 Consolidating case information...")
-            consolidator = CaseConsolidator()
-            consolidated_case = consolidator.consolidate_case_folder(case_folder, extraction_results)
+                # Consolidate case information
+                print("🔗 Consolidating case information...")
+                consolidator = CaseConsolidator(stage_hook=profiler.stage if profiler else None)
+                consolidated_case = consolidator.consolidate_case_folder(case_folder, extraction_results)
             
-            # Generate case name from consolidated case
-            case_name = case_name_generator.generate_case_folder_name(consolidated_case=consolidated_case)
-            print(f"📁 Case Name: {case_name}")
+                # Generate case name from consolidated case
+                case_name = case_name_generator.generate_case_folder_name(consolidated_case=consolidated_case)
+                print(f"📁 Case Name: {case_name}")
+            finally:
+                if profiler:
+                    profiler.stop()
+            
+            if profiler:
+                consolidated_case.profile = profiler.write(
+                    str(output_manager.subdirs['cases'] / case_name / 'profile'), case_name)
+                print(f"⏱️ Profile: {consolidated_case.profile['pstats_file']}")
             
             # Save all documents using case-based structure
             print("💾 Saving case documents...")
-            saved_files_list = []
-            
-            for result in extraction_results:
-                if result.success:
-                    saved_files = output_manager.save_case_processing_result(
-                        result, 
-                        case_name=case_name, 
-                        consolidated_case=consolidated_case
-                    )
-                    saved_files_list.append(saved_files)
+            with output_manager.case_writer(case_name) as case_writer:
+                for result in extraction_results:
+                    if result.success:
+                        case_writer.add_result(result)
+            saved_files_list = list(case_writer.saved_files.values())
             
             # Save consolidated case information
             case_info_file = output_manager.save_case_info_json(case_name, consolidated_case)
@@ -736,25 +924,38 @@ For more information, visit: https://github.com/satori-dev/tiger-engine
                 case_id = os.path.basename(case_folder)
                 event_broadcaster.broadcast_case_start(case_id, len(os.listdir(case_folder)))
             
-            # First, process all documents and save their raw text
-            extraction_results = process_documents_for_case(case_folder, exclude_files, event_broadcaster)
+            profiler = CaseProfiler() if args.profile else None
+            if profiler:
+                profiler.start()
             
-            output_manager = OutputManager(self.config)
-            if output_dir:
-                output_manager.base_output_dir = Path(output_dir)
+            try:
+                # First, process all documents and save their raw text
+                with profiler.stage('document_processing') if profiler else nullcontext():
+                    extraction_results = process_documents_for_case(case_folder, exclude_files, event_broadcaster)
+            
+                output_manager = OutputManager(self.config)
+                if output_dir:
+                    output_manager.base_output_dir = Path(output_dir)
 
-            for result in extraction_results:
-                if result.success:
-                    output_manager.save_case_processing_result(result)
+                with output_manager.case_writer() as case_writer:
+                    for result in extraction_results:
+                        if result.success:
+                            case_writer.add_result(result)
+                if output_dir:
+                    output_manager.save_document_texts(extraction_results, output_dir)
 
-            # Now, consolidate the results into a single hydrated JSON
-            result = consolidate_case_to_hydrated_json(
-                case_folder=case_folder,
-                output_dir=output_dir,
-                case_name=case_name,
-                exclude_files=exclude_files,
-                event_broadcaster=event_broadcaster
-            )
+                # Now, consolidate the results into a single hydrated JSON
+                result = consolidate_case_to_hydrated_json(
+                    case_folder=case_folder,
+                    output_dir=output_dir,
+                    case_name=case_name,
+                    exclude_files=exclude_files,
+                    event_broadcaster=event_broadcaster,
+                    profiler=profiler
+                )
+            finally:
+                if profiler:
+                    profiler.stop()
             
             print(f"✅ Hydrated JSON consolidation completed!")
             print(f"📊 Results Summary")
@@ -808,6 +1009,10 @@ For more information, visit: https://github.com/satori-dev/tiger-engine
             hydrated_json_file = os.path.join(output_dir, f"hydrated_FCRA_{result.case_name}.json")
             print(f"\n💾 Output File:")
             print(f"   📄 Hydrated JSON: {hydrated_json_file}")
+            if profiler:
+                profile = hydrated_json['metadata']['profile']
+                print(f"   ⏱️ Profile: {profile['pstats_file']}")
+                print(f"   🔥 Collapsed Stacks: {profile['collapsed_stacks_file']}")
             
             # Readiness assessment
             if result.completeness_score >= 80 and result.quality_score >= 70:
@@ -836,7 +1041,11 @@ For more information, visit: https://github.com/satori-dev/tiger-engine
 def main():
     """Main CLI entry point"""
     cli = SatoriCLI()
-    return cli.run()
+    try:
+        return cli.run()
+    finally:
+        # Hand this run's metrics to the dashboard when it asked for them
+        metrics_registry.write_snapshot()
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -24,6 +24,9 @@ class ProcessingConfig:
     max_file_size_mb: int = 100
     processing_timeout_seconds: int = 300
     batch_size: int = 10
+    ocr_shard_min_pages: int = 80      # PDFs with at least this many pages are OCR'd in page ranges
+    ocr_shard_pages: int = 20          # Pages per range
+    ocr_workers: int = 0               # Processes for page-range OCR (0 = one per CPU)
     
     def __post_init__(self):
         if self.supported_formats is None:
@@ -38,6 +41,7 @@ class OutputConfig:
     save_extracted_text: bool = True
     save_quality_report: bool = True
     output_formats: list = None
+    write_workers: int = 4             # Threads writing a case's output files
     
     def __post_init__(self):
         if self.output_formats is None:
@@ -103,6 +107,10 @@ class SatoriConfig:
             'SATORI_LOG_LEVEL': ('logging', 'level', str),
             'SATORI_MAX_FILE_SIZE': ('processing', 'max_file_size_mb', int),
             'SATORI_PROCESSING_TIMEOUT': ('processing', 'processing_timeout_seconds', int),
+            'SATORI_OCR_SHARD_MIN_PAGES': ('processing', 'ocr_shard_min_pages', int),
+            'SATORI_OCR_SHARD_PAGES': ('processing', 'ocr_shard_pages', int),
+            'SATORI_OCR_WORKERS': ('processing', 'ocr_workers', int),
+            'SATORI_OUTPUT_WRITE_WORKERS': ('output', 'write_workers', int),
         }
         
         for env_var, (section, attr, type_func) in env_mappings.items():
@@ -0,0 +1,282 @@
+"""
+Benchmark Runner for Tiger Engine
+Times each pipeline stage over synthetic case folders and compares against a baseline
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import platform
+import statistics
+import tempfile
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Callable
+
+from app.engines.stub_engine import StubEngine
+from app.engines.docx_engine import DocxEngine
+from app.engines.text_engine import TextEngine
+from app.core.processors.document_processor import DocumentProcessor, ProcessingResult
+from app.core.services.hydrated_json_consolidator import HydratedJSONConsolidator
+from app.core.utils.profiling import StageProfiler
+from app.core.benchmarks.synthetic_cases import SyntheticCaseGenerator
+
+logger = logging.getLogger(__name__)
+
+RESULTS_SCHEMA_VERSION = 1
+
+STAGES = ('engine', 'validator', 'dates', 'entities', 'consolidation', 'hydrated_json', 'monkey_render')
+
+DEFAULT_SIZES = (1, 10, 100, 500)
+
+# CaseConsolidator stages reported by the stage hook that are not consolidation proper
+_ENTITY_STAGE = 'extract_legal_entities'
+_HYDRATED_STAGE = 'build_hydrated_json'
+
+MONKEY_COMPLAINT_TEMPLATE = 'html/fcra/complaint.html'
+
+
+@dataclass
+class BenchmarkConfig:
+    """Parameters that define a reproducible benchmark run"""
+    sizes: List[int] = field(default_factory=lambda: list(DEFAULT_SIZES))
+    formats: List[str] = field(default_factory=lambda: ['txt', 'docx'])
+    repeats: int = 3
+    warmup: int = 1
+    seed: int = 1234
+    report_pages: int = 20
+    stub_seconds_per_page: float = 0.0
+    include_monkey: bool = True
+
+
+def _load_monkey_renderer() -> Optional[Callable[[Dict[str, Any]], str]]:
+    """Return a hydrated-JSON -> complaint HTML renderer, or None when Monkey is unavailable"""
+    repo_root = Path(__file__).resolve().parents[4]
+    if not (repo_root / 'monkey' / 'core' / 'html_engine.py').exists():
+        return None
+    if str(repo_root) not in sys.path:
+        sys.path.append(str(repo_root))
+    try:
+        # Load through the ``monkey`` package; Tiger already owns the top-level ``core`` name
+        from monkey.core.html_engine import HtmlEngine
+    except ImportError as e:
+        logger.warning(f"Monkey renderer unavailable, skipping monkey_render stage: {e}")
+        return None
+
+    engine = HtmlEngine(template_dir=str(repo_root / 'monkey' / 'templates'))
+    return lambda hydrated_json: engine.render_template(MONKEY_COMPLAINT_TEMPLATE, {'hydratedjson': hydrated_json})
+
+
+class BenchmarkRunner:
+    """Generate synthetic cases and time every pipeline stage"""
+
+    def __init__(self, bench_config: BenchmarkConfig, work_dir: Optional[str] = None):
+        """
+        Args:
+            bench_config: Sizes, formats and repeat count to run
+            work_dir: Where case folders are generated; a temporary directory is used by default
+        """
+        self.bench_config = bench_config
+        self.work_dir = work_dir
+        self.generator = SyntheticCaseGenerator(seed=bench_config.seed, report_pages=bench_config.report_pages)
+        self.processor = DocumentProcessor(engines={
+            'pdf': StubEngine(seconds_per_page=bench_config.stub_seconds_per_page),
+            'docx': DocxEngine(),
+            'txt': TextEngine()
+        })
+        self.render_complaint = _load_monkey_renderer() if bench_config.include_monkey else None
+
+    def run(self, progress: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """
+        Run every (size, format) combination
+
+        Args:
+            progress: Optional callback receiving one line per completed combination
+
+        Returns:
+            JSON-serializable results document
+        """
+        work_dir = self.work_dir or tempfile.mkdtemp(prefix='tiger_bench_')
+        runs = []
+        try:
+            for file_format in self.bench_config.formats:
+                for size in self.bench_config.sizes:
+                    case_dir = os.path.join(work_dir, f"bench_{file_format}_{size:03d}")
+                    if not os.path.isdir(case_dir):
+                        self.generator.generate_case(case_dir, size, file_format)
+                    run = self._run_combination(case_dir, size, file_format)
+                    runs.append(run)
+                    if progress:
+                        failed = f", {run['failures']} failed" if run['failures'] else ''
+                        progress(f"{file_format:>4} x {size:<4} docs: {run['total']['median_seconds']:.3f}s "
+                                 f"({run['documents_per_second']:.1f} docs/s{failed})")
+        finally:
+            if not self.work_dir:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+        return {
+            'schema_version': RESULTS_SCHEMA_VERSION,
+            'timestamp': datetime.now().isoformat(),
+            'environment': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count()
+            },
+            'config': asdict(self.bench_config),
+            'monkey_render': self.render_complaint is not None,
+            'runs': runs
+        }
+
+    def _run_combination(self, case_dir: str, size: int, file_format: str) -> Dict[str, Any]:
+        # Untimed passes warm regex caches, lazy imports and the page cache
+        for _ in range(self.bench_config.warmup):
+            self._run_case(case_dir)
+        samples = [self._run_case(case_dir) for _ in range(max(1, self.bench_config.repeats))]
+        stages = {}
+        for stage in STAGES + ('total',):
+            values = [sample[stage] for sample in samples if stage in sample]
+            if not values:
+                continue
+            median = statistics.median(values)
+            stages[stage] = {
+                'median_seconds': round(median, 6),
+                'min_seconds': round(min(values), 6),
+                'max_seconds': round(max(values), 6),
+                'per_document_ms': round(median * 1000 / size, 3)
+            }
+        total = stages.pop('total')
+        return {
+            'documents': size,
+            'format': file_format,
+            'failures': samples[-1]['failures'],
+            'stages': stages,
+            'total': total,
+            'documents_per_second': round(size / total['median_seconds'], 3) if total['median_seconds'] else None
+        }
+
+    def _run_case(self, case_dir: str) -> Dict[str, float]:
+        """Process one case folder once and return seconds per stage"""
+        timings = {stage: 0.0 for stage in ('engine', 'validator', 'dates')}
+        results: List[ProcessingResult] = []
+        failures = 0
+        case_start = time.perf_counter()
+
+        for file_name in sorted(os.listdir(case_dir)):
+            file_path = os.path.join(case_dir, file_name)
+            engine = self.processor.get_engine_for_file(file_path)
+            if engine is None:
+                continue
+
+            start = time.perf_counter()
+            extraction = engine.process_document(file_path)
+            timings['engine'] += time.perf_counter() - start
+            if not extraction.success:
+                failures += 1
+                continue
+
+            start = time.perf_counter()
+            quality_metrics = self.processor.quality_validator.validate_extraction(file_path, extraction.text)
+            timings['validator'] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            dates = self.processor.date_extractor.extract_dates_from_text(
+                extraction.text, self.processor._determine_document_type(file_path))
+            timings['dates'] += time.perf_counter() - start
+
+            results.append(ProcessingResult(
+                file_path=file_path,
+                success=True,
+                extracted_text=extraction.text,
+                quality_metrics=quality_metrics,
+                metadata=extraction.metadata,
+                processing_time=extraction.processing_time,
+                engine_used=engine.name,
+                extracted_dates=[date.to_dict() for date in dates]
+            ))
+
+        # Consolidation stages are split out through the CaseConsolidator stage hook
+        stage_profiler = StageProfiler()
+        consolidator = HydratedJSONConsolidator(stage_hook=stage_profiler.stage)
+        start = time.perf_counter()
+        hydrated = consolidator.consolidate_extraction_results(case_dir, results)
+        consolidate_seconds = time.perf_counter() - start
+
+        stage_seconds = {stats['stage']: stats['total_seconds'] for stats in stage_profiler.stages()}
+        timings['entities'] = stage_seconds.get(_ENTITY_STAGE, 0.0)
+        timings['consolidation'] = sum(seconds for stage, seconds in stage_seconds.items()
+                                       if stage not in (_ENTITY_STAGE, _HYDRATED_STAGE))
+        # Hydrated JSON build plus scoring, naming and warnings collection
+        timings['hydrated_json'] = consolidate_seconds - timings['entities'] - timings['consolidation']
+
+        if self.render_complaint:
+            start = time.perf_counter()
+            self.render_complaint(hydrated.hydrated_json)
+            timings['monkey_render'] = time.perf_counter() - start
+
+        timings['total'] = time.perf_counter() - case_start
+        timings['failures'] = failures
+        return timings
+
+
+def compare_to_baseline(current: Dict[str, Any], baseline: Dict[str, Any],
+                        threshold: float = 0.2, min_delta_seconds: float = 0.005) -> Dict[str, Any]:
+    """
+    Compare median stage times against a baseline results document
+
+    A stage regresses when it is both ``threshold`` (fractional) slower and at
+    least ``min_delta_seconds`` slower, so sub-millisecond noise is ignored.
+
+    Returns:
+        Dict with ``regressions``, ``improvements`` and ``compared`` count
+    """
+    def index(results):
+        rows = {}
+        for run in results.get('runs', []):
+            for stage, stats in list(run['stages'].items()) + [('total', run['total'])]:
+                rows[(run['documents'], run['format'], stage)] = stats['median_seconds']
+        return rows
+
+    baseline_rows = index(baseline)
+    regressions, improvements = [], []
+    compared = 0
+    for key, current_seconds in sorted(index(current).items()):
+        baseline_seconds = baseline_rows.get(key)
+        if baseline_seconds is None:
+            continue
+        compared += 1
+        delta = current_seconds - baseline_seconds
+        ratio = current_seconds / baseline_seconds if baseline_seconds else float('inf')
+        row = {
+            'documents': key[0],
+            'format': key[1],
+            'stage': key[2],
+            'baseline_seconds': baseline_seconds,
+            'current_seconds': current_seconds,
+            'change_percent': round((ratio - 1) * 100, 1) if baseline_seconds else None
+        }
+        if delta >= min_delta_seconds and ratio > 1 + threshold:
+            regressions.append(row)
+        elif -delta >= min_delta_seconds and ratio < 1 - threshold:
+            improvements.append(row)
+
+    return {
+        'baseline_timestamp': baseline.get('timestamp'),
+        'threshold': threshold,
+        'min_delta_seconds': min_delta_seconds,
+        'compared': compared,
+        'regressions': regressions,
+        'improvements': improvements
+    }
+
+
+def save_results(results: Dict[str, Any], output_path: str) -> str:
+    """Write results JSON, creating parent directories"""
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    return str(path)
@@ -0,0 +1,265 @@
+"""
+Synthetic Case Folder Generator for Tiger Benchmarks
+Writes deterministic FCRA case folders (TXT, DOCX or stub PDF) of any size
+"""
+
+import os
+import random
+import zipfile
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Any
+from xml.sax.saxutils import escape
+
+from app.engines.stub_engine import PAGE_BREAK
+
+# Document tiers, cycled after the single attorney-notes file
+DOCUMENT_KINDS = ('attorney_notes', 'denial_letter', 'summons', 'credit_report')
+
+# 'pdf' files are text payloads read by StubEngine, not real PDFs
+FILE_FORMATS = ('txt', 'docx', 'pdf')
+
+FIRST_NAMES = ['Sarah', 'Carlos', 'Maria', 'John', 'Aisha', 'Wei', 'Priya', 'David', 'Elena', 'Marcus']
+LAST_NAMES = ['Johnson', 'Rodriguez', 'Garcia', 'Chen', 'Okafor', 'Patel', 'Kowalski', 'Nguyen', 'Haddad', 'Brooks']
+CREDIT_BUREAUS = [
+    'EQUIFAX INFORMATION SERVICES LLC',
+    'EXPERIAN INFORMATION SOLUTIONS, INC.',
+    'TRANS UNION LLC',
+]
+FURNISHERS = [
+    'CHASE BANK, N.A.', 'CAPITAL ONE, N.A.', 'DISCOVER BANK', 'CITIBANK, N.A.',
+    'WELLS FARGO BANK, N.A.', 'SYNCHRONY BANK', 'AMERICAN EXPRESS NATIONAL BANK',
+]
+LENDERS = ['Wells Fargo Dealer Services', 'Mortgage Pros Lending', 'Brooklyn Heights Apartments',
+           'Citibank', 'Ally Financial', 'Navy Federal Credit Union']
+DISTRICTS = ['EASTERN DISTRICT OF NEW YORK', 'SOUTHERN DISTRICT OF NEW YORK']
+BOROUGHS = ['Brooklyn, NY', 'Queens, NY', 'Bronx, NY', 'New York, NY', 'Staten Island, NY']
+
+
+def _format_date(value: date) -> str:
+    return value.strftime('%B %d, %Y').replace(' 0', ' ')
+
+
+def write_docx(path: str, text: str):
+    """Write ``text`` as a minimal DOCX (one paragraph per line, form feeds as page breaks)"""
+    paragraphs = []
+    for page_number, page in enumerate(text.split(PAGE_BREAK)):
+        if page_number:
+            paragraphs.append('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+        for line in page.split('\n'):
+            paragraphs.append(f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>')
+
+    document_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{"".join(paragraphs)}</w:body></w:document>'
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '</Types>'
+    )
+    rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="word/document.xml"/>'
+        '</Relationships>'
+    )
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr('[Content_Types].xml', content_types)
+        docx.writestr('_rels/.rels', rels)
+        docx.writestr('word/document.xml', document_xml)
+
+
+class SyntheticCaseGenerator:
+    """Generate reproducible FCRA case folders for benchmarking"""
+
+    def __init__(self, seed: int = 1234, report_pages: int = 20):
+        """
+        Args:
+            seed: Base random seed; the same seed and size always yield the same folder
+            report_pages: Pages per synthetic credit report
+        """
+        self.seed = seed
+        self.report_pages = report_pages
+
+    def generate_case(self, case_dir: str, num_documents: int, file_format: str = 'txt') -> List[str]:
+        """
+        Write a case folder with ``num_documents`` documents
+
+        Args:
+            case_dir: Destination folder (created if missing)
+            num_documents: Total documents, including the attorney notes
+            file_format: One of FILE_FORMATS
+
+        Returns:
+            Paths of the generated documents
+        """
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f"Unsupported format: {file_format}. Choose from {FILE_FORMATS}")
+        if num_documents < 1:
+            raise ValueError("num_documents must be at least 1")
+
+        rng = random.Random(f"{self.seed}:{num_documents}")
+        profile = self._case_profile(rng)
+        Path(case_dir).mkdir(parents=True, exist_ok=True)
+
+        paths = []
+        for index in range(num_documents):
+            kind = DOCUMENT_KINDS[0] if index == 0 else DOCUMENT_KINDS[1 + (index - 1) % (len(DOCUMENT_KINDS) - 1)]
+            stem, text = getattr(self, f"_{kind}")(rng, profile, index)
+            path = os.path.join(case_dir, f"{stem}.{file_format}")
+            if file_format == 'docx':
+                write_docx(path, text)
+            else:
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+            paths.append(path)
+        return paths
+
+    # --- Case-level facts shared by every document ---
+
+    def _case_profile(self, rng: random.Random) -> Dict[str, Any]:
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        discovery = date(2025, 1, 1) + timedelta(days=rng.randint(0, 90))
+        furnisher = rng.choice(FURNISHERS)
+        return {
+            'plaintiff': f"{first} {last}",
+            'last_name': last,
+            'location': rng.choice(BOROUGHS),
+            'case_number': f"1:25-cv-{rng.randint(1000, 9999):05d}",
+            'district': rng.choice(DISTRICTS),
+            'furnisher': furnisher,
+            'defendants': CREDIT_BUREAUS + [furnisher],
+            'account': f"****{rng.randint(1000, 9999)}",
+            'balance': rng.randint(500, 25000),
+            'discovery_date': discovery,
+            'dispute_date': discovery + timedelta(days=rng.randint(5, 30)),
+            'filing_date': discovery + timedelta(days=rng.randint(120, 180)),
+        }
+
+    # --- Document tiers; each returns (file stem, text) ---
+
+    def _attorney_notes(self, rng: random.Random, profile: Dict[str, Any], index: int):
+        defendants = '\n'.join(f"- {name}" for name in profile['defendants'])
+        damages = '\n'.join(
+            f"- Denied Credit: {rng.choice(LENDERS)}, "
+            f"{_format_date(profile['discovery_date'] + timedelta(days=rng.randint(1, 60)))}. Have denial letter."
+            for _ in range(rng.randint(2, 5))
+        )
+        text = f"""NAME: {profile['plaintiff']}
+CONTACT: 929-555-{rng.randint(1000, 9999)}
+LOCATION: {profile['location']}
+ISSUE: Inaccurate {profile['furnisher']} account reported after a successful dispute.
+
+CASE_NUMBER: {profile['case_number']}
+COURT_NAME: UNITED STATES DISTRICT COURT
+COURT_DISTRICT: {profile['district']}
+FILING_DATE: {_format_date(profile['filing_date'])}
+
+PLAINTIFF_COUNSEL_NAME: Kevin C. Mallon
+
+FURNISHER: {profile['furnisher']}
+INACCURATE_ACCOUNT: Account {profile['account']} showing a charge-off balance of ${profile['balance']:,}.
+
+DEFENDANTS:
+{defendants}
+
+BACKGROUND:
+1. Discovered the inaccurate account on {_format_date(profile['discovery_date'])}.
+2. Sent written disputes to all three credit reporting agencies on {_format_date(profile['dispute_date'])}.
+3. Each agency verified the account without a reasonable investigation.
+
+DAMAGES:
+{damages}
+- Emotional Distress: Significant stress and anxiety.
+"""
+        return "Atty_Notes", text
+
+    def _denial_letter(self, rng: random.Random, profile: Dict[str, Any], index: int):
+        lender = rng.choice(LENDERS)
+        bureau = rng.choice(CREDIT_BUREAUS)
+        denied_on = profile['discovery_date'] + timedelta(days=rng.randint(1, 90))
+        text = f"""{lender.upper()}
+{rng.randint(100, 999)} Commerce Street
+New York, NY 100{rng.randint(10, 99)}
+
+{_format_date(denied_on)}
+
+{profile['plaintiff']}
+{rng.randint(10, 999)} Main Street
+{profile['location']}
+
+RE: Application #{rng.randint(100000, 999999)} - ADVERSE ACTION NOTICE
+
+Dear {profile['plaintiff']},
+
+We regret to inform you that your application dated {_format_date(denied_on - timedelta(days=5))} has been DENIED
+based on information contained in your credit report.
+
+REASONS FOR DENIAL:
+- Delinquent account: {profile['furnisher']}
+- Account Number: {profile['account']}
+- Balance: ${profile['balance']:,}.00
+- Status: 120+ days past due
+
+This adverse action is based on information obtained from {bureau}. You have the right to obtain
+a free copy of your credit report within 60 days and to dispute any inaccurate information.
+
+Sincerely,
+
+Loan Officer
+"""
+        return f"Denial_Letter_{index:03d}", text
+
+    def _summons(self, rng: random.Random, profile: Dict[str, Any], index: int):
+        defendant = profile['defendants'][index % len(profile['defendants'])]
+        text = f"""UNITED STATES DISTRICT COURT
+{profile['district']}
+
+{profile['plaintiff'].upper()},
+                                    Plaintiff,
+v.                                           Case No. {profile['case_number']}
+
+{defendant},
+                                    Defendant.
+
+SUMMONS IN A CIVIL ACTION
+
+TO: {defendant}
+
+A lawsuit has been filed against you.
+
+Within 21 days after service of this summons on you (not counting the day you received it) you must serve
+on the plaintiff an answer to the attached complaint or a motion under Rule 12 of the Federal Rules of
+Civil Procedure.
+
+If you fail to respond, judgment by default will be entered against you for the relief demanded in the complaint.
+
+Date: {_format_date(profile['filing_date'])}
+"""
+        return f"Summons_{index:03d}", text
+
+    def _credit_report(self, rng: random.Random, profile: Dict[str, Any], index: int):
+        bureau = rng.choice(CREDIT_BUREAUS)
+        pages = []
+        for page in range(1, self.report_pages + 1):
+            lines = [f"{bureau} CONSUMER DISCLOSURE - {profile['plaintiff'].upper()} - Page {page} of {self.report_pages}", '']
+            for _ in range(12):
+                opened = date(2015, 1, 1) + timedelta(days=rng.randint(0, 3000))
+                creditor = rng.choice(FURNISHERS)
+                status = 'CHARGE OFF' if creditor == profile['furnisher'] else rng.choice(['PAYS AS AGREED', 'CURRENT', 'CLOSED'])
+                lines.append(
+                    f"{creditor:<35} Acct ****{rng.randint(1000, 9999)}  Opened {opened.strftime('%m/%d/%Y')}  "
+                    f"Balance ${rng.randint(0, 20000):>6,}  Status {status}"
+                )
+            lines.append('')
+            lines.append(f"Date reported: {_format_date(profile['dispute_date'] + timedelta(days=rng.randint(0, 30)))}")
+            pages.append('\n'.join(lines))
+        return f"Credit_Report_{index:03d}", PAGE_BREAK.join(pages)
@@ -5,10 +5,36 @@ Specialized extraction of legal entities, case information, and structured legal
 
 import re
 import logging
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    from .pattern_scanner import ScanBudget, DEFAULT_BUDGET_SECONDS, run_start_before, skip_back, block_end
+except ImportError:
+    from app.core.extractors.pattern_scanner import ScanBudget, DEFAULT_BUDGET_SECONDS, run_start_before, skip_back, block_end
+
+# Bounds for anchor windows (characters)
+NAME_WINDOW = 120          # Name-before-keyword lookbehind
+CAPS_RUN_WINDOW = 500      # ALL-CAPS caption run before Plaintiff/Defendant
+BLOCK_MAX_CHARS = 2000     # Attorney signature block length
+EMAIL_LOCAL_MAX = 64       # RFC 5321 local-part limit
+
+_WHITESPACE = ' \t\n\r\f\v'
+
+
+def _is_caps_or_space(char: str) -> bool:
+    return ('A' <= char <= 'Z') or char.isspace()
+
+
+def _is_defendant_char(char: str) -> bool:
+    return ('A' <= char <= 'Z') or char.isspace() or char in ',.&'
+
+
+def _is_email_local_char(char: str) -> bool:
+    return char.isalnum() or char in '._%+-'
+
 @dataclass
 class LegalEntity:
     """Represents a legal entity extracted from documents"""
@@ -32,39 +58,52 @@ class CaseInformation:
     jury_demand: Optional[bool] = None
 
 class LegalEntityExtractor:
-    """Extract legal entities and case information from legal documents"""
+    """
+    Extract legal entities and case information from legal documents
+
+    All patterns are precompiled and written to run in linear time: open-ended
+    runs such as the ALL-CAPS name before "Plaintiff" are matched by finding the
+    keyword first and walking back over a bounded window, and lazy
+    ``.*?(?=...)`` blocks are cut at the first terminator within a fixed
+    length. Each document also gets a wall-clock budget; when it runs out the
+    remaining patterns are skipped and the offending pattern is reported in
+    ``extraction_budget``.
+    """
     
-    def __init__(self):
+    def __init__(self, time_budget_seconds: float = DEFAULT_BUDGET_SECONDS):
         self.logger = logging.getLogger(__name__)
+        self.time_budget_seconds = time_budget_seconds
+        self._budget: Optional[ScanBudget] = None
         self._setup_patterns()
     
     def _setup_patterns(self):
-        """Setup regex patterns for legal entity extraction"""
+        """Setup precompiled regex patterns for legal entity extraction"""
+        I = re.IGNORECASE
         
         # Case number patterns
-        self.case_number_patterns = [
+        self.case_number_patterns = [re.compile(p, I) for p in [
             r'\b\d{1,2}:\d{2}-cv-\d{4,6}\b',  # Federal format: 1:25-cv-01987
             r'\b\d{4}-\d{6}\b',                # State format: 2025-123456
             r'Case\s+No\.?\s*:?\s*([A-Z0-9:\-\.]+)',
             r'Civil\s+Action\s+No\.?\s*:?\s*([A-Z0-9:\-\.]+)',
             r'BC\d{6}',                        # California BC format
-        ]
+        ]]
         
-        # Court patterns
-        self.court_patterns = [
+        # Court patterns (open-ended name runs are bounded to keep matching linear)
+        self.court_patterns = [re.compile(p, I) for p in [
             r'UNITED\s+STATES\s+DISTRICT\s+COURT',
             r'U\.S\.\s+DISTRICT\s+COURT',
             r'SUPERIOR\s+COURT\s+OF\s+[A-Z\s]+',
-            r'([A-Z\s]+)\s+DISTRICT\s+COURT',
+            r'([A-Z\s]{1,80})\s+DISTRICT\s+COURT',
             r'COURT\s+OF\s+[A-Z\s]+',
-        ]
+        ]]
         
         # District patterns  
-        self.district_patterns = [
+        self.district_patterns = [re.compile(p, I) for p in [
             r'(EASTERN|WESTERN|NORTHERN|SOUTHERN|CENTRAL|MIDDLE)\s+DISTRICT\s+OF\s+([A-Z]{2,15}(?:\s+[A-Z]{2,15})?)',
             r'DISTRICT\s+OF\s+([A-Z]{2,15}(?:\s+[A-Z]{2,15})?)',
             r'COUNTY\s+OF\s+([A-Z]{2,15}(?:\s+[A-Z]{2,15})?)',
-        ]
+        ]]
         
         # Legal roles patterns
         self.role_patterns = {
@@ -75,54 +114,120 @@ class LegalEntityExtractor:
             'clerk': [r'Clerk\s+of\s+Court', r'CLERK\s+OF\s+COURT'],
         }
         
-        # Address patterns
-        self.address_patterns = [
-            r'\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Boulevard|Blvd|Drive|Dr|Road|Rd|Lane|Ln|Place|Pl)\b[,\s]*[A-Za-z\s]*[,\s]*[A-Z]{2}\s*\d{5}(?:-\d{4})?',
-            r'P\.O\.\s+Box\s+\d+[,\s]*[A-Za-z\s]*[,\s]*[A-Z]{2}\s*\d{5}(?:-\d{4})?',
-        ]
+        # Address patterns (street/city runs bounded so nested quantifiers can't backtrack)
+        self.address_patterns = [re.compile(p, I) for p in [
+            r'\d+\s+[A-Za-z\s]{1,60}(?:Street|St|Avenue|Ave|Boulevard|Blvd|Drive|Dr|Road|Rd|Lane|Ln|Place|Pl)\b[,\s]{0,5}[A-Za-z\s]{0,40}[,\s]{0,5}[A-Z]{2}\s*\d{5}(?:-\d{4})?',
+            r'P\.O\.\s+Box\s+\d+[,\s]{0,5}[A-Za-z\s]{0,40}[,\s]{0,5}[A-Z]{2}\s*\d{5}(?:-\d{4})?',
+        ]]
         
         # Phone patterns
-        self.phone_patterns = [
+        self.phone_patterns = [re.compile(p) for p in [
             r'\(\d{3}\)\s*\d{3}-\d{4}',
             r'\d{3}-\d{3}-\d{4}',
             r'\d{3}\.\d{3}\.\d{4}',
             r'\d{10}',
-        ]
+        ]]
         
-        # Email patterns
-        self.email_patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-        ]
+        # Email domain, matched forward from each '@' anchor
+        self.email_domain_pattern = re.compile(r'[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', I)
         
         # Legal document type patterns
-        self.document_type_patterns = {
+        self.document_type_patterns = {doc_type: [re.compile(p, I) for p in patterns] for doc_type, patterns in {
             'summons': [r'SUMMONS\s+IN\s+A\s+CIVIL\s+ACTION', r'SUMMONS'],
             'complaint': [r'COMPLAINT', r'AMENDED\s+COMPLAINT'],
             'motion': [r'MOTION\s+FOR', r'MOTION\s+TO'],
             'order': [r'ORDER', r'JUDGMENT'],
             'cover_sheet': [r'CIVIL\s+COVER\s+SHEET', r'COVER\s+SHEET'],
-        }
+        }.items()}
+        
+        self.case_type_patterns = {case_type: [re.compile(p, I) for p in patterns] for case_type, patterns in {
+            'Complaint': [r'COMPLAINT', r'CIVIL\s+COMPLAINT'],
+            'Motion': [r'MOTION\s+FOR', r'MOTION\s+TO'],
+            'Summons': [r'SUMMONS'],
+            'Order': [r'ORDER\s+AND\s+JUDGMENT', r'ORDER'],
+        }.items()}
+        
+        self.jury_patterns = [re.compile(p, I) for p in [
+            r'JURY\s+TRIAL\s+DEMANDED',
+            r'DEMANDS?\s+A\s+JURY\s+TRIAL',
+            r'JURY\s+DEMAND:?\s*YES',
+            r'CHECK\s+IF\s+JURY\s+TRIAL\s+IS\s+DEMANDED',
+        ]]
+        self.no_jury_patterns = [re.compile(p, I) for p in [
+            r'JURY\s+DEMAND:?\s*NO',
+            r'NO\s+JURY\s+TRIAL',
+        ]]
+        
+        self.filing_date_patterns = [re.compile(p, I) for p in [
+            r'Date[d]?:?\s*([A-Z][a-z]+\s+\d{1,2},\s+\d{4})',
+            r'Filed:?\s*([A-Z][a-z]+\s+\d{1,2},\s+\d{4})',
+            r'(\d{1,2}/\d{1,2}/\d{4})',
+            r'(\d{4}-\d{2}-\d{2})',
+        ]]
+        
+        # Party keywords (case-sensitive, as in "JOHN DOE, Plaintiff") and forward patterns
+        self.plaintiff_keyword = re.compile(r'Plaintiff[s]?')
+        self.defendant_keyword = re.compile(r'Defendant[s]?')
+        self.name_before_keyword = re.compile(r'[A-Z][a-z]+\s[A-Z][a-z]+,?\s*\Z')
+        self.plaintiff_name_after = re.compile(r'Plaintiff[s]?[,:]?\s*([A-Z][a-z]+\s[A-Z][a-z]+)')
+        self.plaintiff_caps_after = re.compile(r'Plaintiff[s]?[,:]?\s*([A-Z][A-Z\s]{1,%d})' % CAPS_RUN_WINDOW)
+        self.defendant_caps_after = re.compile(r'Defendant[s]?[,:]?\s*([A-Z][A-Z\s,\.&]{1,%d})' % CAPS_RUN_WINDOW)
+        
+        # Attorney block anchors; blocks end at a blank line or a new line starting with a letter
+        self.attorney_for_keyword = re.compile(r'Attorney[s]?\s+for', I)
+        self.esq_keyword = re.compile(r'Esq\.?', I)
+        self.esq_name_before = re.compile(r'[A-Z]{2,}\s+[A-Z]{2,},?\s+\Z', I)
+        self.respectfully_keyword = re.compile(r'Respectfully\s+submitted[,:]?\s*', I)
+        self.block_terminator = re.compile(r'\n\n|\n[A-Z]', I)
+        
+        self.us_code_citation = re.compile(r'\d+\s+U\.S\.C\.\s+§\s+\d+')
+        self.structure_patterns = [(re.compile(p, re.IGNORECASE), points) for p, points in [
+            (r'UNITED STATES DISTRICT COURT', 20),
+            (r'Case No\.', 10),
+            (r'COMPLAINT|SUMMONS', 15),
+            (r'Respectfully submitted', 10),
+            (r'Attorney for', 10),
+            (r'/s/', 5),  # Electronic signature
+            (r'Date:', 5),
+            (r'\(\d{3}\)\s*\d{3}-\d{4}', 5),  # Phone number
+        ]]
+    
+    @contextmanager
+    def _document_budget(self):
+        """Share one ScanBudget across every pattern run on the current document"""
+        if self._budget is not None:
+            yield self._budget
+            return
+        self._budget = ScanBudget(self.time_budget_seconds)
+        try:
+            yield self._budget
+        finally:
+            self._budget = None
+    
+    def _current_budget(self) -> ScanBudget:
+        return self._budget if self._budget is not None else ScanBudget(self.time_budget_seconds)
     
     def extract_case_information(self, text: str) -> CaseInformation:
         """Extract structured case information from document text"""
         case_info = CaseInformation()
         
-        # Extract case number
-        case_info.case_number = self._extract_case_number(text)
-        
-        # Extract court information
-        court_info = self._extract_court_info(text)
-        case_info.court_name = court_info.get('name')
-        case_info.court_district = court_info.get('district')
-        
-        # Extract case type
-        case_info.case_type = self._extract_case_type(text)
-        
-        # Extract jury demand
-        case_info.jury_demand = self._extract_jury_demand(text)
-        
-        # Extract filing date
-        case_info.filing_date = self._extract_filing_date(text)
+        with self._document_budget():
+            # Extract case number
+            case_info.case_number = self._extract_case_number(text)
+            
+            # Extract court information
+            court_info = self._extract_court_info(text)
+            case_info.court_name = court_info.get('name')
+            case_info.court_district = court_info.get('district')
+            
+            # Extract case type
+            case_info.case_type = self._extract_case_type(text)
+            
+            # Extract jury demand
+            case_info.jury_demand = self._extract_jury_demand(text)
+            
+            # Extract filing date
+            case_info.filing_date = self._extract_filing_date(text)
         
         return case_info
     
@@ -130,13 +235,14 @@ class LegalEntityExtractor:
         """Extract plaintiff and defendant information"""
         parties = []
         
-        # Extract plaintiffs
-        plaintiffs = self._extract_plaintiffs(text)
-        parties.extend(plaintiffs)
-        
-        # Extract defendants  
-        defendants = self._extract_defendants(text)
-        parties.extend(defendants)
+        with self._document_budget():
+            # Extract plaintiffs
+            plaintiffs = self._extract_plaintiffs(text)
+            parties.extend(plaintiffs)
+            
+            # Extract defendants  
+            defendants = self._extract_defendants(text)
+            parties.extend(defendants)
         
         return parties
     
@@ -144,45 +250,92 @@ class LegalEntityExtractor:
         """Extract attorney/counsel information"""
         attorneys = []
         
-        # Look for attorney blocks in common formats
-        attorney_patterns = [
-            r'Attorney[s]?\s+for.*?(?=\n\n|\n[A-Z]|\Z)',
-            r'[A-Z][a-z]+\s+[A-Z][a-z]+(?:,?\s+Esq\.?).*?(?=\n\n|\n[A-Z]|\Z)',
-            r'Respectfully\s+submitted[,:]?\s*.*?(?=\n\n|\n[A-Z]|\Z)',
-        ]
-        
-        for pattern in attorney_patterns:
-            matches = re.finditer(pattern, text, re.DOTALL | re.IGNORECASE)
-            for match in matches:
-                attorney_block = match.group(0)
-                attorney = self._parse_attorney_block(attorney_block)
-                if attorney:
-                    attorneys.append(attorney)
+        # Look for attorney blocks in common formats: "Attorneys for ...",
+        # "<First> <Last>, Esq." and "Respectfully submitted, ..."
+        with self._document_budget():
+            for name, find_block in (('attorney_for', self._attorney_for_blocks),
+                                     ('esq_signature', self._esq_blocks),
+                                     ('respectfully_submitted', self._respectfully_submitted_blocks)):
+                for attorney_block in find_block(name, text):
+                    attorney = self._parse_attorney_block(attorney_block)
+                    if attorney:
+                        attorneys.append(attorney)
         
         return attorneys
     
+    def _attorney_for_blocks(self, name: str, text: str):
+        """``Attorney[s]?\\s+for.*?(?=\\n\\n|\\n[A-Z]|\\Z)`` as keyword + bounded block"""
+        budget = self._current_budget()
+        position = 0
+        while True:
+            keyword = budget.search(name, self.attorney_for_keyword, text, position)
+            if not keyword:
+                return
+            end = block_end(text, keyword.end(), self.block_terminator, BLOCK_MAX_CHARS)
+            yield text[keyword.start():end]
+            position = end
+    
+    def _esq_blocks(self, name: str, text: str):
+        """``[A-Z][a-z]+\\s+[A-Z][a-z]+,?\\s+Esq\\.?.*?(?=...)`` anchored on "Esq" """
+        budget = self._current_budget()
+        position = 0
+        while True:
+            keyword = budget.search(name, self.esq_keyword, text, position)
+            if not keyword:
+                return
+            window_start = max(position, keyword.start() - NAME_WINDOW)
+            name_match = self.esq_name_before.search(text, window_start, keyword.start())
+            if not name_match:
+                position = keyword.end()
+                continue
+            end = block_end(text, keyword.end(), self.block_terminator, BLOCK_MAX_CHARS)
+            yield text[name_match.start():end]
+            position = end
+    
+    def _respectfully_submitted_blocks(self, name: str, text: str):
+        """``Respectfully\\s+submitted[,:]?\\s*.*?(?=...)`` as keyword + bounded block"""
+        budget = self._current_budget()
+        position = 0
+        while True:
+            keyword = budget.search(name, self.respectfully_keyword, text, position)
+            if not keyword:
+                return
+            end = block_end(text, keyword.end(), self.block_terminator, BLOCK_MAX_CHARS)
+            yield text[keyword.start():end]
+            position = end
+    
     def extract_legal_entities(self, text: str) -> Dict[str, Any]:
         """Extract comprehensive legal entity information"""
-        entities = {
-            'case_information': self.extract_case_information(text),
-            'parties': self.extract_parties(text),
-            'attorneys': self.extract_attorneys(text),
-            'addresses': self._extract_addresses(text),
-            'phones': self._extract_phone_numbers(text),
-            'emails': self._extract_emails(text),
-            'document_type': self._classify_document_type(text),
-            'legal_indicators': self._extract_legal_indicators(text)
-        }
+        with self._document_budget() as budget:
+            entities = {
+                'case_information': self.extract_case_information(text),
+                'parties': self.extract_parties(text),
+                'attorneys': self.extract_attorneys(text),
+                'addresses': self._extract_addresses(text),
+                'phones': self._extract_phone_numbers(text),
+                'emails': self._extract_emails(text),
+                'document_type': self._classify_document_type(text),
+                'legal_indicators': self._extract_legal_indicators(text)
+            }
+            entities['extraction_budget'] = budget.report()
         
         return entities
     
+    def _first_search(self, name: str, patterns, text: str):
+        """First match among ``patterns`` in order, within the document budget"""
+        budget = self._current_budget()
+        for pattern in patterns:
+            match = budget.search(name, pattern, text)
+            if match:
+                return match
+        return None
+    
     def _extract_case_number(self, text: str) -> Optional[str]:
         """Extract case number from text"""
-        for pattern in self.case_number_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                # Return the full match for most patterns, or group 1 for capturing patterns
-                return match.group(1) if match.groups() else match.group(0)
+        match = self._first_search('case_number', self.case_number_patterns, text)
+        if match:
+            # Return the full match for most patterns, or group 1 for capturing patterns
+            return match.group(1) if match.groups() else match.group(0)
         return None
     
     def _extract_court_info(self, text: str) -> Dict[str, Optional[str]]:
@@ -190,144 +343,152 @@ class LegalEntityExtractor:
         court_info = {'name': None, 'district': None}
         
         # Extract court name
-        for pattern in self.court_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                court_info['name'] = match.group(0)
-                break
+        match = self._first_search('court', self.court_patterns, text)
+        if match:
+            court_info['name'] = match.group(0)
         
         # Extract district
-        for pattern in self.district_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                if match.groups():
-                    # Combine direction and state if captured
-                    groups = match.groups()
-                    if len(groups) >= 2:
-                        court_info['district'] = f"{groups[0]} District of {groups[1]}".strip()
-                    else:
-                        court_info['district'] = groups[0].strip()
+        match = self._first_search('district', self.district_patterns, text)
+        if match:
+            if match.groups():
+                # Combine direction and state if captured
+                groups = match.groups()
+                if len(groups) >= 2:
+                    court_info['district'] = f"{groups[0]} District of {groups[1]}".strip()
                 else:
-                    # Clean the match to avoid contamination
-                    district_text = match.group(0).strip()
-                    # Stop at line breaks to avoid capturing subsequent content
-                    district_text = district_text.split('\n')[0].strip()
-                    court_info['district'] = district_text
-                break
+                    court_info['district'] = groups[0].strip()
+            else:
+                # Clean the match to avoid contamination
+                district_text = match.group(0).strip()
+                # Stop at line breaks to avoid capturing subsequent content
+                district_text = district_text.split('\n')[0].strip()
+                court_info['district'] = district_text
         
         return court_info
     
     def _extract_case_type(self, text: str) -> Optional[str]:
         """Determine case type from document content"""
-        case_types = {
-            'Complaint': [r'COMPLAINT', r'CIVIL\s+COMPLAINT'],
-            'Motion': [r'MOTION\s+FOR', r'MOTION\s+TO'],
-            'Summons': [r'SUMMONS'],
-            'Order': [r'ORDER\s+AND\s+JUDGMENT', r'ORDER'],
-        }
-        
-        for case_type, patterns in case_types.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return case_type
+        for case_type, patterns in self.case_type_patterns.items():
+            if self._first_search('case_type', patterns, text):
+                return case_type
         
         return None
     
     def _extract_jury_demand(self, text: str) -> Optional[bool]:
         """Check for jury demand"""
-        jury_patterns = [
-            r'JURY\s+TRIAL\s+DEMANDED',
-            r'DEMANDS?\s+A\s+JURY\s+TRIAL',
-            r'JURY\s+DEMAND:?\s*YES',
-            r'CHECK\s+IF\s+JURY\s+TRIAL\s+IS\s+DEMANDED',
-        ]
-        
-        for pattern in jury_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
+        if self._first_search('jury_demand', self.jury_patterns, text):
+            return True
         
         # Check for explicit "NO" 
-        no_jury_patterns = [
-            r'JURY\s+DEMAND:?\s*NO',
-            r'NO\s+JURY\s+TRIAL',
-        ]
-        
-        for pattern in no_jury_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return False
+        if self._first_search('jury_demand', self.no_jury_patterns, text):
+            return False
         
         return None
     
     def _extract_filing_date(self, text: str) -> Optional[str]:
         """Extract filing date"""
-        date_patterns = [
-            r'Date[d]?:?\s*([A-Z][a-z]+\s+\d{1,2},\s+\d{4})',
-            r'Filed:?\s*([A-Z][a-z]+\s+\d{1,2},\s+\d{4})',
-            r'(\d{1,2}/\d{1,2}/\d{4})',
-            r'(\d{4}-\d{2}-\d{2})',
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        
-        return None
+        match = self._first_search('filing_date', self.filing_date_patterns, text)
+        return match.group(1) if match else None
+    
+    def _names_before_keyword(self, name: str, text: str, keyword_pattern, find_start):
+        """
+        Yield ``(start, keyword_end)`` for each keyword whose preceding text
+        satisfies ``find_start(keyword_start, floor)``, honouring finditer's
+        non-overlapping order (``floor`` is the end of the previous match).
+        """
+        floor = 0
+        for keyword in self._current_budget().finditer(name, keyword_pattern, text):
+            start = find_start(keyword.start(), floor)
+            if start is not None:
+                yield start, keyword.end()
+                floor = keyword.end()
+    
+    def _party_entities(self, matches, text: str, role: str, strip_group) -> List[LegalEntity]:
+        entities = []
+        for start, end in matches:
+            match_text = text[start:end]
+            name = strip_group(match_text)
+            if name and len(name) > 2:
+                entities.append(LegalEntity(
+                    entity_type='party',
+                    name=name,
+                    role=role,
+                    confidence=0.8,
+                    source_text=match_text
+                ))
+        return entities
     
     def _extract_plaintiffs(self, text: str) -> List[LegalEntity]:
         """Extract plaintiff information"""
         plaintiffs = []
-        
-        # Look for plaintiff section patterns
-        plaintiff_patterns = [
-            r'([A-Z][a-z]+\s[A-Z][a-z]+),?\s*Plaintiff[s]?',
-            r'Plaintiff[s]?[,:]?\s*([A-Z][a-z]+\s[A-Z][a-z]+)',
-            r'([A-Z][A-Z\s]+),?\s*Plaintiff[s]?',
-            r'Plaintiff[s]?[,:]?\s*([A-Z][A-Z\s]+)',
-        ]
-        
-        for pattern in plaintiff_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                name = match.group(1).strip()
-                if name and len(name) > 2:
-                    plaintiff = LegalEntity(
-                        entity_type='party',
-                        name=name,
-                        role='plaintiff',
-                        confidence=0.8,
-                        source_text=match.group(0)
-                    )
-                    plaintiffs.append(plaintiff)
+        budget = self._current_budget()
+        
+        def strip_keyword(match_text):
+            return self.plaintiff_keyword.split(match_text)[0].rstrip(_WHITESPACE).rstrip(',').strip()
+        
+        # "Jane Doe, Plaintiff": two capitalized words in a short window before the keyword
+        def title_case_start(keyword_start, floor):
+            window_start = max(floor, keyword_start - NAME_WINDOW)
+            match = self.name_before_keyword.search(text, window_start, keyword_start)
+            return match.start() if match else None
+        
+        # "JANE DOE, Plaintiff": the ALL-CAPS run before the keyword
+        def caps_run_start(keyword_start, floor):
+            end = skip_back(text, keyword_start, _WHITESPACE, floor)
+            if end > floor and text[end - 1] == ',':
+                end -= 1
+            start = run_start_before(text, end, _is_caps_or_space, CAPS_RUN_WINDOW, floor)
+            while start < end and not ('A' <= text[start] <= 'Z'):
+                start += 1
+            return start if end - start >= 2 else None
+        
+        plaintiffs.extend(self._party_entities(
+            self._names_before_keyword('plaintiff_name_before', text, self.plaintiff_keyword, title_case_start),
+            text, 'plaintiff', strip_keyword))
+        plaintiffs.extend(self._forward_party_entities(
+            budget.finditer('plaintiff_name_after', self.plaintiff_name_after, text), 'plaintiff'))
+        plaintiffs.extend(self._party_entities(
+            self._names_before_keyword('plaintiff_caps_before', text, self.plaintiff_keyword, caps_run_start),
+            text, 'plaintiff', strip_keyword))
+        plaintiffs.extend(self._forward_party_entities(
+            budget.finditer('plaintiff_caps_after', self.plaintiff_caps_after, text), 'plaintiff'))
         
         return plaintiffs
     
+    def _forward_party_entities(self, matches, role: str) -> List[LegalEntity]:
+        entities = []
+        for match in matches:
+            name = match.group(1).strip()
+            if name and len(name) > 2:
+                entities.append(LegalEntity(
+                    entity_type='party',
+                    name=name,
+                    role=role,
+                    confidence=0.8,
+                    source_text=match.group(0)
+                ))
+        return entities
+    
     def _extract_defendants(self, text: str) -> List[LegalEntity]:
         """Extract defendant information"""
         defendants = []
         
-        # Look for defendant section patterns
-        defendant_patterns = [
-            r'([A-Z][A-Z\s,\.&]+),?\s*Defendant[s]?',
-            r'Defendant[s]?[,:]?\s*([A-Z][A-Z\s,\.&]+)',
-        ]
-        
-        for pattern in defendant_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                name = match.group(1).strip()
-                if name and len(name) > 2:
-                    defendant = LegalEntity(
-                        entity_type='party',
-                        name=name,
-                        role='defendant', 
-                        confidence=0.8,
-                        source_text=match.group(0)
-                    )
-                    defendants.append(defendant)
+        # "TRANS UNION, LLC, Defendant": the run of capitals and punctuation before the keyword
+        def caps_run_start(keyword_start, floor):
+            start = run_start_before(text, keyword_start, _is_defendant_char, CAPS_RUN_WINDOW, floor)
+            while start < keyword_start and not ('A' <= text[start] <= 'Z'):
+                start += 1
+            return start if keyword_start - start >= 2 else None
+        
+        defendants.extend(self._party_entities(
+            self._names_before_keyword('defendant_caps_before', text, self.defendant_keyword, caps_run_start),
+            text, 'defendant', lambda match_text: self.defendant_keyword.split(match_text)[0].strip()))
+        defendants.extend(self._forward_party_entities(
+            self._current_budget().finditer('defendant_caps_after', self.defendant_caps_after, text), 'defendant'))
         
         return defendants
     
+    
     def _parse_attorney_block(self, attorney_block: str) -> Optional[LegalEntity]:
         """Parse attorney information from text block"""
         lines = attorney_block.strip().split('\n')
@@ -385,73 +546,101 @@ class LegalEntityExtractor:
     def _extract_addresses(self, text: str) -> List[str]:
         """Extract all addresses from text"""
         addresses = []
+        budget = self._current_budget()
         for pattern in self.address_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+            for match in budget.finditer('address', pattern, text):
                 addresses.append(match.group(0).strip())
         return addresses
     
     def _extract_phone_numbers(self, text: str) -> List[str]:
         """Extract phone numbers from text"""
         phones = []
+        budget = self._current_budget()
         for pattern in self.phone_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
+            for match in budget.finditer('phone', pattern, text):
                 phones.append(match.group(0))
         return phones
     
     def _extract_emails(self, text: str) -> List[str]:
-        """Extract email addresses from text"""
+        """Extract email addresses from text, anchored on each '@'"""
         emails = []
-        for pattern in self.email_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                emails.append(match.group(0))
+        
+        def scan():
+            position = 0
+            while True:
+                at = text.find('@', position)
+                if at < 0:
+                    return
+                position = at + 1
+                start = run_start_before(text, at, _is_email_local_char, EMAIL_LOCAL_MAX, 0)
+                # The local part must begin on a word boundary
+                while start < at and start > 0 and text[start].isalnum() == text[start - 1].isalnum():
+                    start += 1
+                domain = self.email_domain_pattern.match(text, at + 1)
+                if start < at and domain:
+                    emails.append(text[start:domain.end()])
+                    position = domain.end()
+        
+        self._current_budget().run('email', scan)
         return emails
     
     def _classify_document_type(self, text: str) -> Optional[str]:
         """Classify the type of legal document"""
         for doc_type, patterns in self.document_type_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return doc_type
+            if self._first_search('document_type', patterns, text):
+                return doc_type
         return None
     
     def _extract_legal_indicators(self, text: str) -> Dict[str, Any]:
         """Extract legal document indicators for quality assessment"""
+        budget = self._current_budget()
+        lowered = text.lower()
         indicators = {
             'has_case_number': bool(self._extract_case_number(text)),
-            'has_court_header': any(re.search(p, text, re.IGNORECASE) for p in self.court_patterns),
-            'has_parties': bool(re.search(r'Plaintiff|Defendant', text, re.IGNORECASE)),
-            'has_attorney_info': bool(re.search(r'Attorney|Counsel|Esq', text, re.IGNORECASE)),
-            'has_legal_citations': bool(re.search(r'\d+\s+U\.S\.C\.\s+§\s+\d+', text)),
+            'has_court_header': bool(self._first_search('court', self.court_patterns, text)),
+            'has_parties': 'plaintiff' in lowered or 'defendant' in lowered,
+            'has_attorney_info': 'attorney' in lowered or 'counsel' in lowered or 'esq' in lowered,
+            'has_legal_citations': bool(budget.search('legal_citation', self.us_code_citation, text)),
             'document_structure_score': self._calculate_structure_score(text),
         }
         
         return indicators
     
+    @staticmethod
+    def _ordered_on_one_line(lowered: str, *needles: str) -> bool:
+        """True if some line contains ``needles`` in order (``a.*b.*c`` without DOTALL)"""
+        position = lowered.find(needles[0])
+        while position >= 0:
+            line_end = lowered.find('\n', position)
+            line_end = len(lowered) if line_end < 0 else line_end
+            cursor = position + len(needles[0])
+            for needle in needles[1:]:
+                cursor = lowered.find(needle, cursor, line_end)
+                if cursor < 0:
+                    break
+                cursor += len(needle)
+            else:
+                return True
+            position = lowered.find(needles[0], line_end)
+        return False
+    
     def _calculate_structure_score(self, text: str) -> float:
         """Calculate document structure quality score"""
         score = 0.0
+        budget = self._current_budget()
+        lowered = text.lower()
         
         # Check for legal document structure elements
-        structure_elements = [
-            (r'UNITED STATES DISTRICT COURT', 20),
-            (r'Plaintiff[s]?.*v\..*Defendant[s]?', 15),
-            (r'Case No\.', 10),
-            (r'COMPLAINT|SUMMONS', 15),
-            (r'Respectfully submitted', 10),
-            (r'Attorney for', 10),
-            (r'/s/', 5),  # Electronic signature
-            (r'Date:', 5),
-            (r'\(\d{3}\)\s*\d{3}-\d{4}', 5),  # Phone number
-            (r'@.*\.com', 5),  # Email
-        ]
-        
-        for pattern, points in structure_elements:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern, points in self.structure_patterns:
+            if budget.search('structure_score', pattern, text):
                 score += points
         
+        # Plaintiff ... v. ... Defendant caption and an email address, each on one line
+        if budget.run('structure_score', lambda: self._ordered_on_one_line(lowered, 'plaintiff', 'v.', 'defendant')):
+            score += 15
+        if budget.run('structure_score', lambda: self._ordered_on_one_line(lowered, '@', '.com')):
+            score += 5
+        
         # Normalize to 0-100 scale
         return min(score, 100.0)
 
@@ -0,0 +1,143 @@
+"""
+Pattern Scanner for Tiger Engine
+Time-budgeted regex execution and anchor-window helpers for linear-time entity matching
+"""
+
+import os
+import time
+import logging
+from typing import Callable, Dict, Iterator, List, Match, Optional, Pattern, Any
+
+logger = logging.getLogger(__name__)
+
+# Wall-clock budget for all entity patterns on one document (seconds)
+DEFAULT_BUDGET_SECONDS = float(os.environ.get('TIGER_ENTITY_BUDGET_SECONDS', '2.0'))
+
+
+class ScanBudget:
+    """
+    Per-document time budget shared by every pattern run on that document
+
+    Patterns are checked between matches; once the budget is spent the
+    remaining patterns are skipped and the extractor returns what it has.
+    The pattern that was running when the budget ran out is reported so
+    pathological inputs can be traced back to a specific regex.
+    """
+
+    def __init__(self, seconds: float = DEFAULT_BUDGET_SECONDS):
+        self.seconds = seconds
+        self.started = time.perf_counter()
+        self.exhausted_by: Optional[str] = None
+        self.skipped: List[str] = []
+        self.pattern_seconds: Dict[str, float] = {}
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def expired(self) -> bool:
+        return self.elapsed() >= self.seconds
+
+    def _charge(self, name: str, started: float):
+        self.pattern_seconds[name] = self.pattern_seconds.get(name, 0.0) + time.perf_counter() - started
+
+    def _exhaust(self, name: str):
+        if self.exhausted_by is None:
+            self.exhausted_by = name
+            logger.warning(f"Entity extraction budget of {self.seconds:.2f}s exhausted in pattern '{name}'; "
+                           f"returning partial results")
+
+    def _skip(self, name: str) -> bool:
+        if not self.expired():
+            return False
+        if self.exhausted_by is None:
+            self._exhaust(name)
+        elif name not in self.skipped and name != self.exhausted_by:
+            self.skipped.append(name)
+        return True
+
+    def search(self, name: str, pattern: Pattern, text: str, pos: int = 0, endpos: Optional[int] = None) -> Optional[Match]:
+        """``pattern.search`` unless the budget is already spent"""
+        if self._skip(name):
+            return None
+        started = time.perf_counter()
+        try:
+            return pattern.search(text, pos, len(text) if endpos is None else endpos)
+        finally:
+            self._charge(name, started)
+            if self.expired():
+                self._exhaust(name)
+
+    def finditer(self, name: str, pattern: Pattern, text: str) -> Iterator[Match]:
+        """``pattern.finditer`` that stops yielding once the budget is spent"""
+        if self._skip(name):
+            return
+        started = time.perf_counter()
+        try:
+            for match in pattern.finditer(text):
+                if self.expired():
+                    self._exhaust(name)
+                    return
+                self._charge(name, started)
+                yield match
+                started = time.perf_counter()
+        finally:
+            self._charge(name, started)
+
+    def run(self, name: str, func: Callable[[], Any], default: Any = None) -> Any:
+        """Call ``func`` unless the budget is spent, charging its time to ``name``"""
+        if self._skip(name):
+            return default
+        started = time.perf_counter()
+        try:
+            return func()
+        finally:
+            self._charge(name, started)
+            if self.expired():
+                self._exhaust(name)
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            'budget_seconds': self.seconds,
+            'elapsed_seconds': round(self.elapsed(), 6),
+            'exhausted': self.exhausted_by is not None,
+            'exhausted_by': self.exhausted_by,
+            'skipped_patterns': list(self.skipped),
+            'pattern_seconds': {name: round(seconds, 6) for name, seconds in self.pattern_seconds.items()}
+        }
+
+
+def run_start_before(text: str, end: int, allowed: Callable[[str], bool], window: int, floor: int = 0) -> int:
+    """
+    Walk back from ``end`` over characters accepted by ``allowed``
+
+    Equivalent to the leftmost start of a greedy ``[class]+`` that must end at
+    ``end``, but bounded to ``window`` characters and never before ``floor``
+    (the end of the previous match), so the cost per anchor is constant.
+    """
+    start = end
+    limit = max(floor, end - window)
+    while start > limit and allowed(text[start - 1]):
+        start -= 1
+    return start
+
+
+def skip_back(text: str, end: int, chars: str, floor: int = 0, max_count: Optional[int] = None) -> int:
+    """Walk back from ``end`` over up to ``max_count`` characters in ``chars``"""
+    position = end
+    while position > floor and text[position - 1] in chars:
+        if max_count is not None and end - position >= max_count:
+            break
+        position -= 1
+    return position
+
+
+def block_end(text: str, start: int, terminator: Pattern, max_chars: int) -> int:
+    """
+    End of a block that runs from ``start`` to the next ``terminator`` match
+
+    Replaces lazy ``.*?(?=...)`` scans: the search is a single forward pass
+    limited to ``max_chars``, after which the block is cut off.
+    """
+    limit = min(len(text), start + max_chars)
+    match = terminator.search(text, start, limit)
+    return match.start() if match else limit
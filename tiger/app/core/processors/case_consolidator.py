@@ -7,8 +7,9 @@ import os
 import json
 import logging
 import re
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable, ContextManager
 from pathlib import Path
+from contextlib import contextmanager, ExitStack
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from collections import defaultdict
@@ -19,12 +20,19 @@ try:
     from ..extractors.date_extractor import EnhancedDateExtractor, ExtractedDate, DateContext
     from ...engines.base_engine import ExtractionResult
     from ..settings_loader import SettingsLoader
+    from ..utils.text_store import TextHandle
+    from .party_index import PartyResolutionIndex, NAME_ABBREVIATIONS, CORPORATE_ABBREVIATIONS, PERSON_NAME_MAX_WORDS, normalize_party_name
 except ImportError:
     from app.core.extractors.legal_entity_extractor import LegalEntityExtractor, LegalEntity, CaseInformation
     from app.core.extractors.damage_extractor import DamageExtractor, DamageItem
     from app.core.extractors.date_extractor import EnhancedDateExtractor, ExtractedDate, DateContext
     from app.engines.base_engine import ExtractionResult
     from app.core.settings_loader import SettingsLoader
+    from app.core.utils.text_store import TextHandle
+    from app.core.processors.party_index import PartyResolutionIndex, NAME_ABBREVIATIONS, CORPORATE_ABBREVIATIONS, PERSON_NAME_MAX_WORDS, normalize_party_name
+
+# Always import through the ``app`` package so CLI and library callers share one registry
+from app.core.utils.metrics import CONSOLIDATION_STEP_SECONDS
 
 @dataclass
 class CaseTimeline:
@@ -61,6 +69,7 @@ class ConsolidatedCase:
     extraction_confidence: float = 0.0
     consolidation_timestamp: str = None
     warnings: List[str] = None
+    profile: Optional[Dict[str, Any]] = None
     
     def __post_init__(self):
         if self.defendants is None:
@@ -77,11 +86,28 @@ class ConsolidatedCase:
 class CaseConsolidator:
     """Consolidate legal information across multiple documents in a case"""
     
-    def __init__(self):
+    def __init__(self, stage_hook: Optional[Callable[[str], ContextManager]] = None):
+        """
+        Args:
+            stage_hook: Optional ``hook(stage_name)`` context manager wrapped around
+                each consolidation stage, e.g. ``StageProfiler.stage``
+        """
         self.logger = logging.getLogger(__name__)
         self.legal_extractor = LegalEntityExtractor()
         self.damage_extractor = DamageExtractor()
         self.date_extractor = EnhancedDateExtractor()
+        self.stage_hook = stage_hook
+        self._party_indexes: Dict[int, Tuple[List[Dict], PartyResolutionIndex]] = {}
+    
+    @contextmanager
+    def stage(self, name: str):
+        """Time a consolidation stage and run it inside the optional stage hook"""
+        with CONSOLIDATION_STEP_SECONDS.time(step=name):
+            if self.stage_hook is None:
+                yield
+            else:
+                with self.stage_hook(name):
+                    yield
     
     def consolidate_case_folder(self, folder_path: str, extraction_results: List[ExtractionResult]) -> ConsolidatedCase:
         """
@@ -94,6 +120,15 @@ class CaseConsolidator:
         Returns:
             ConsolidatedCase object with merged information
         """
+        # Nearly every stage reads result.extracted_text; decode each spilled text once for the whole run
+        with ExitStack() as decoded:
+            for result in extraction_results:
+                handle = getattr(result, 'text_handle', None)
+                if isinstance(handle, TextHandle):
+                    decoded.enter_context(handle.materialized())
+            return self._consolidate_documents(folder_path, extraction_results)
+
+    def _consolidate_documents(self, folder_path: str, extraction_results: List[ExtractionResult]) -> ConsolidatedCase:
         self.logger.info(f"Consolidating case folder: {folder_path}")
         
         case_id = os.path.basename(folder_path)
@@ -115,27 +150,42 @@ class CaseConsolidator:
                 continue
                 
             consolidated.source_documents.append(result.file_path)
-            document_texts.append(result.extracted_text)
+            # Keep handles rather than strings so spilled texts stay on disk until used
+            document_texts.append(TextHandle.of(getattr(result, 'text_handle', None) or result.extracted_text))
             
             # Extract legal entities from this document
-            legal_entities = self.legal_extractor.extract_legal_entities(result.extracted_text)
+            with self.stage('extract_legal_entities'):
+                legal_entities = self.legal_extractor.extract_legal_entities(result.extracted_text)
+            budget = legal_entities.get('extraction_budget', {})
+            if budget.get('exhausted'):
+                consolidated.warnings.append(
+                    f"Entity extraction time budget exhausted for {result.file_path} "
+                    f"in pattern '{budget['exhausted_by']}'; results may be incomplete")
             all_legal_entities.append({
                 'file_path': result.file_path,
                 'entities': legal_entities
             })
         
         # Consolidate information across all documents
-        self._consolidate_case_information(consolidated, all_legal_entities, extraction_results)
-        self._consolidate_parties(consolidated, all_legal_entities, extraction_results)
-        self._consolidate_attorneys(consolidated, all_legal_entities, extraction_results)
-        self._consolidate_factual_background(consolidated, document_texts, extraction_results)
-        self._consolidate_damages(consolidated, document_texts, extraction_results)
-        self._consolidate_timeline(consolidated, extraction_results)
+        with self.stage('case_information'):
+            self._consolidate_case_information(consolidated, all_legal_entities, extraction_results)
+        with self.stage('parties'):
+            self._consolidate_parties(consolidated, all_legal_entities, extraction_results)
+        with self.stage('attorneys'):
+            self._consolidate_attorneys(consolidated, all_legal_entities, extraction_results)
+        with self.stage('factual_background'):
+            self._consolidate_factual_background(consolidated, document_texts, extraction_results)
+        with self.stage('damages'):
+            self._consolidate_damages(consolidated, document_texts, extraction_results)
+        with self.stage('timeline'):
+            self._consolidate_timeline(consolidated, extraction_results)
         self.logger.info("Calling _build_causes_of_action")
-        consolidated.causes_of_action = self._build_causes_of_action(document_texts, consolidated.defendants)
+        with self.stage('causes_of_action'):
+            consolidated.causes_of_action = self._build_causes_of_action(document_texts, consolidated.defendants)
         
         # Calculate overall confidence
-        consolidated.extraction_confidence = self._calculate_case_confidence(consolidated, all_legal_entities)
+        with self.stage('confidence'):
+            consolidated.extraction_confidence = self._calculate_case_confidence(consolidated, all_legal_entities)
         
         self.logger.info(f"Case consolidation complete. Confidence: {consolidated.extraction_confidence:.1f}%")
         
@@ -940,7 +990,7 @@ class CaseConsolidator:
                             }
                             return
     
-    def _consolidate_factual_background(self, consolidated: ConsolidatedCase, document_texts: List[str], extraction_results: List[ExtractionResult]):
+    def _consolidate_factual_background(self, consolidated: ConsolidatedCase, document_texts: List[TextHandle], extraction_results: List[ExtractionResult]):
         """Extract and consolidate factual background from attorney notes and other documents"""
         factual_info = {
             'summary': '',
@@ -996,7 +1046,7 @@ class CaseConsolidator:
             reasons = [reason.strip() for reason in reasons_block.split('·') if reason.strip()]
         return reasons
 
-    def _consolidate_damages(self, consolidated: ConsolidatedCase, document_texts: List[str], extraction_results: List[ExtractionResult]):
+    def _consolidate_damages(self, consolidated: ConsolidatedCase, document_texts: List[TextHandle], extraction_results: List[ExtractionResult]):
         """Extract and consolidate damages information using enhanced damage extractor"""
         
         # Initialize damages structure
@@ -1111,7 +1161,7 @@ class CaseConsolidator:
             
             if any(keyword in filename for keyword in ['denial', 'adverse', 'rejection']):
                 if i < len(document_texts):
-                    text = document_texts[i]
+                    text = str(document_texts[i])
                     denial_info = self._extract_denial_information(text)
                     if denial_info:
                         damages_info['denials'].append(denial_info)
@@ -2085,6 +2135,7 @@ class CaseConsolidator:
                 'source_documents': [],
                 '_raw_extractions': []
             }
+            self._party_indexes = {}
             self._processing_complete = False
         
         # Store the raw extraction for final consolidation
@@ -2232,31 +2283,41 @@ class CaseConsolidator:
             }
             self._case_data['issues'].append(conflict_issue)
     
+    def _party_index(self, party_list: List[Dict]) -> PartyResolutionIndex:
+        """Resolution index for ``party_list``, rebuilt if the list was changed elsewhere"""
+        entry = self._party_indexes.get(id(party_list))
+        if entry is None or entry[0] is not party_list or len(entry[1]) != len(party_list):
+            index = PartyResolutionIndex(self._normalized_names_similar)
+            for party in party_list:
+                index.add(party['name'])
+            entry = self._party_indexes[id(party_list)] = (party_list, index)
+        return entry[1]
+    
     def _add_party_with_dedup(self, party_list: List[Dict], new_party: Dict) -> None:
         """Add party to list with deduplication"""
-        # Simple name-based deduplication with fuzzy matching
-        new_name = new_party['name'].upper().strip()
-        
-        for existing_party in party_list:
-            existing_name = existing_party['name'].upper().strip()
-            
-            # Simple fuzzy matching - can be enhanced
-            if self._names_similar(new_name, existing_name):
-                # Merge sources and update confidence
-                existing_party['sources'].extend(new_party['sources'])
-                existing_party['sources'] = list(set(existing_party['sources']))  # Remove duplicates
-                existing_party['confidence'] = max(existing_party['confidence'], new_party['confidence'])
-                return
+        # Only the candidates blocked by the index get the fuzzy comparison
+        index = self._party_index(party_list)
+        match = index.find(new_party['name'])
+        
+        if match is not None:
+            # Merge sources and update confidence
+            existing_party = party_list[match]
+            existing_party['sources'].extend(new_party['sources'])
+            existing_party['sources'] = list(set(existing_party['sources']))  # Remove duplicates
+            existing_party['confidence'] = max(existing_party['confidence'], new_party['confidence'])
+            return
         
         # No duplicate found, add new party
         party_list.append(new_party)
+        index.add(new_party['name'])
     
     def _names_similar(self, name1: str, name2: str) -> bool:
         """Simple name similarity check - can be enhanced with fuzzy matching"""
         # Normalize names for comparison
-        name1 = self._normalize_name(name1)
-        name2 = self._normalize_name(name2)
-        
+        return self._normalized_names_similar(self._normalize_name(name1), self._normalize_name(name2))
+    
+    def _normalized_names_similar(self, name1: str, name2: str) -> bool:
+        """Similarity rules for names already passed through ``_normalize_name``"""
         # Exact match
         if name1 == name2:
             return True
@@ -2266,16 +2327,9 @@ class CaseConsolidator:
             return True
         
         # Check common name abbreviations and variations
-        name_abbreviations = {
-            'J DOE': 'JANE DOE',
-            'J. DOE': 'JANE DOE', 
-            'JOHN DOE': 'J DOE',
-            'JANE DOE': 'J DOE'
-        }
-        
-        if name1 in name_abbreviations and name_abbreviations[name1] == name2:
+        if name1 in NAME_ABBREVIATIONS and NAME_ABBREVIATIONS[name1] == name2:
             return True
-        if name2 in name_abbreviations and name_abbreviations[name2] == name1:
+        if name2 in NAME_ABBREVIATIONS and NAME_ABBREVIATIONS[name2] == name1:
             return True
         
         # Check word overlap for names (at least 1 word in common for person names)
@@ -2283,26 +2337,14 @@ class CaseConsolidator:
         words2 = set(name2.split())
         
         # For person names (likely 2-3 words), check if they share a surname
-        if len(words1) <= 3 and len(words2) <= 3:
-            overlap = words1.intersection(words2)
-            if overlap and len(overlap) >= 1:
+        if len(words1) <= PERSON_NAME_MAX_WORDS and len(words2) <= PERSON_NAME_MAX_WORDS:
+            if words1.intersection(words2):
                 # If they share at least one word and both are short names, likely same person
                 return True
         
         # Check common corporate abbreviations
-        corporate_abbreviations = {
-            'INFORMATION SERVICES': 'INFO SERVICES',
-            'INFORMATION SOLUTIONS': 'INFO SOLUTIONS',
-            'INCORPORATED': 'INC',
-            'LIMITED LIABILITY COMPANY': 'LLC',
-            'NATIONAL ASSOCIATION': 'N.A.',
-            'CORPORATION': 'CORP'
-        }
-        
-        for full, abbrev in corporate_abbreviations.items():
-            name1_abbrev = name1.replace(full, abbrev)
-            name2_abbrev = name2.replace(full, abbrev)
-            if name1_abbrev == name2_abbrev:
+        for full, abbrev in CORPORATE_ABBREVIATIONS.items():
+            if name1.replace(full, abbrev) == name2.replace(full, abbrev):
                 return True
         
         return False
@@ -2310,10 +2352,7 @@ class CaseConsolidator:
     def _normalize_name(self, name: str) -> str:
         """Normalize name for comparison"""
         # Remove punctuation and extra spaces
-        import re
-        normalized = re.sub(r'[^A-Z0-9\s]', '', name.upper())
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        return normalized
+        return normalize_party_name(name)
     
     def _deduplicate_entities(self) -> None:
         """Perform final entity deduplication across all parties"""
@@ -6,18 +6,18 @@ import os
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 
 # Use absolute imports
 from app.config.settings import config
-from app.engines.docling_engine import DoclingEngine
-from app.engines.docx_engine import DocxEngine
-from app.engines.text_engine import TextEngine
 from app.engines.base_engine import BaseEngine
+from app.engines.registry import EngineRegistry
 from app.core.validators import QualityValidator
 from app.core.extractors.text_extractor import TextExtractor
 from app.core.extractors.date_extractor import EnhancedDateExtractor
 from app.core.event_broadcaster import ProcessingEventBroadcaster
+from app.core.utils.metrics import DOCUMENT_STAGE_SECONDS
+from app.core.utils.text_store import TextHandle
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +27,7 @@ class ProcessingResult:
     def __init__(self, 
                  file_path: str,
                  success: bool = False,
-                 extracted_text: str = "",
+                 extracted_text: Union[str, TextHandle] = "",
                  quality_metrics: Dict[str, Any] = None,
                  metadata: Dict[str, Any] = None,
                  processing_time: float = 0.0,
@@ -46,6 +46,15 @@ class ProcessingResult:
         self.extracted_dates = extracted_dates or []
         self.timestamp = datetime.now().isoformat()
     
+    @property
+    def extracted_text(self) -> str:
+        return str(self.text_handle)
+    
+    @extracted_text.setter
+    def extracted_text(self, value: Union[str, TextHandle]):
+        # Shares the engine's handle when given one, so the text is stored once
+        self.text_handle = TextHandle.of(value)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary"""
         return {
@@ -109,17 +118,14 @@ class BatchProcessingResult:
 class DocumentProcessor:
     """Main document processing orchestrator"""
     
-    def __init__(self, custom_config=None, event_broadcaster: ProcessingEventBroadcaster = None):
+    def __init__(self, custom_config=None, event_broadcaster: ProcessingEventBroadcaster = None,
+                 engines: Optional[Dict[str, BaseEngine]] = None):
         self.config = custom_config or config
         self.logger = logging.getLogger(__name__)
         self.event_broadcaster = event_broadcaster
         
-        # Initialize engines
-        self.engines: Dict[str, BaseEngine] = {
-            'pdf': DoclingEngine(),
-            'docx': DocxEngine(),
-            'txt': TextEngine()
-        }
+        # Engines load on first use (callers such as `tiger bench` may substitute their own)
+        self.engines = EngineRegistry(engines or None)
         
         # Initialize quality validator and extractors
         self.quality_validator = QualityValidator(self.config)
@@ -129,22 +135,16 @@ class DocumentProcessor:
         # Ensure data directories exist
         self.config.ensure_directories()
         
-        # Setup engines
-        self._setup_engines()
-        
         # Case context for event broadcasting
         self.current_case_id = None
     
-    def _setup_engines(self):
-        """Setup all processing engines"""
-        for engine_name, engine in self.engines.items():
-            try:
-                if engine.setup_dependencies():
-                    self.logger.info(f"{engine_name} engine ready")
-                else:
-                    self.logger.warning(f"{engine_name} engine setup failed")
-            except Exception as e:
-                self.logger.error(f"Failed to setup {engine_name} engine: {e}")
+    def warm_up(self, engine_names: Optional[List[str]] = None) -> Dict[str, bool]:
+        """Load engines and their models before processing (all engines by default)"""
+        return self.engines.warm_up(engine_names)
+    
+    def close(self):
+        """Shut down engine worker pools (Docling's OCR processes)"""
+        self.engines.close()
     
     def set_case_context(self, case_id: str):
         """Set case context for event broadcasting"""
@@ -152,13 +152,7 @@ class DocumentProcessor:
     
     def get_engine_for_file(self, file_path: str) -> Optional[BaseEngine]:
         """Get appropriate engine for file type"""
-        file_ext = Path(file_path).suffix.lower()
-        
-        for engine in self.engines.values():
-            if engine.can_process(file_path):
-                return engine
-        
-        return None
+        return self.engines.engine_for_file(file_path)
     
     def _determine_document_type(self, file_path: str) -> str:
         """Determine document type from filename for enhanced date extraction"""
@@ -232,16 +226,22 @@ class DocumentProcessor:
                     processing_time=extraction_result.processing_time
                 )
             
+            # Materialize the text once for validation and date extraction
+            text = extraction_result.text
+            
             # Validate quality
-            quality_metrics = self.quality_validator.validate_extraction(
-                file_path, extraction_result.text
-            )
+            with DOCUMENT_STAGE_SECONDS.time(stage='quality_validation'):
+                quality_metrics = self.quality_validator.validate_extraction(
+                    file_path, text
+                )
             
             # Extract dates with enhanced date extractor
             document_type = self._determine_document_type(file_path)
-            extracted_dates = self.date_extractor.extract_dates_from_text(
-                extraction_result.text, document_type
-            )
+            with DOCUMENT_STAGE_SECONDS.time(stage='date_extraction'):
+                extracted_dates = self.date_extractor.extract_dates_from_text(
+                    text, document_type
+                )
+            del text
             
             # Convert dates to dictionaries for JSON serialization
             dates_data = [date.to_dict() for date in extracted_dates]
@@ -253,7 +253,7 @@ class DocumentProcessor:
             result = ProcessingResult(
                 file_path=file_path,
                 success=True,
-                extracted_text=extraction_result.text,
+                extracted_text=extraction_result.text_handle,
                 quality_metrics=quality_metrics,
                 metadata=extraction_result.metadata,
                 processing_time=total_time,
@@ -263,7 +263,8 @@ class DocumentProcessor:
             
             # Save outputs if output directory specified
             if output_dir:
-                self._save_processing_outputs(result, output_dir)
+                with DOCUMENT_STAGE_SECONDS.time(stage='save_outputs'):
+                    self._save_processing_outputs(result, output_dir)
             
             # Broadcast success
             if self.event_broadcaster and self.current_case_id:
@@ -272,7 +273,7 @@ class DocumentProcessor:
                     file_name, 
                     {
                         "quality_score": quality_metrics.get("quality_score", 0),
-                        "text_length": len(extraction_result.text),
+                        "text_length": extraction_result.text_length,
                         "engine_used": engine.name,
                         "processing_time": total_time,
                         "dates_extracted": len(dates_data)
@@ -351,21 +352,18 @@ class DocumentProcessor:
     
     def _save_batch_summary(self, batch_result: BatchProcessingResult, output_dir: str):
         """Save batch processing summary"""
-        import json
+        from satori_schema import serialization
         
         os.makedirs(output_dir, exist_ok=True)
         
         summary_file = os.path.join(output_dir, "batch_processing_summary.json")
-        with open(summary_file, 'w') as f:
-            json.dump(batch_result.to_dict(), f, indent=2, default=str)
+        serialization.dump(batch_result.to_dict(), summary_file)
         
         self.logger.info(f"Batch summary saved to {summary_file}")
     
     def get_service_info(self) -> Dict[str, Any]:
         """Get service information and status"""
-        engine_info = {}
-        for name, engine in self.engines.items():
-            engine_info[name] = engine.get_engine_info()
+        engine_info = self.engines.describe()
         
         return {
             'service_name': self.config.service_name,
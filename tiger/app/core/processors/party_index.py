@@ -0,0 +1,147 @@
+"""
+Party Resolution Index for Tiger Engine
+Blocks party-name candidates by exact, substring, token and abbreviation keys
+so deduplicating a party list does not compare every pair of names
+"""
+
+import re
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+_NON_NAME_CHARS = re.compile(r'[^A-Z0-9\s]')
+_WHITESPACE_RUN = re.compile(r'\s+')
+
+# Separator for the substring haystack; normalized names never contain it
+_SEPARATOR = '\x00'
+
+# Common name abbreviations and variations
+NAME_ABBREVIATIONS = {
+    'J DOE': 'JANE DOE',
+    'J. DOE': 'JANE DOE',
+    'JOHN DOE': 'J DOE',
+    'JANE DOE': 'J DOE'
+}
+
+# Common corporate abbreviations
+CORPORATE_ABBREVIATIONS = {
+    'INFORMATION SERVICES': 'INFO SERVICES',
+    'INFORMATION SOLUTIONS': 'INFO SOLUTIONS',
+    'INCORPORATED': 'INC',
+    'LIMITED LIABILITY COMPANY': 'LLC',
+    'NATIONAL ASSOCIATION': 'N.A.',
+    'CORPORATION': 'CORP'
+}
+
+# Names with at most this many words are treated as person names (shared word = same person)
+PERSON_NAME_MAX_WORDS = 3
+
+
+def normalize_party_name(name: str) -> str:
+    """Uppercase, drop punctuation and collapse whitespace"""
+    normalized = _NON_NAME_CHARS.sub('', name.upper())
+    return _WHITESPACE_RUN.sub(' ', normalized).strip()
+
+
+class PartyResolutionIndex:
+    """
+    Incremental index over one party list
+
+    Each name is normalized once when it is added. A lookup collects the
+    candidates that could satisfy any similarity rule (exact name, substring
+    either way, a known abbreviation, a shared word between short names, or
+    equality after a corporate-abbreviation rewrite) and only those are
+    confirmed with ``similar``, whose results are memoized.
+    """
+
+    def __init__(self, similar: Callable[[str, str], bool]):
+        self._similar = similar
+        self._similar_cache: Dict[Tuple[str, str], bool] = {}
+        self._normalized_cache: Dict[str, str] = {}
+        self.names: List[str] = []
+        self._first_index: Dict[str, int] = {}
+        self._lengths: Set[int] = set()
+        self._haystack = ''
+        self._offsets: List[int] = []
+        self._tokens: Dict[str, int] = {}
+        self._rewrites: List[Dict[str, int]] = [{} for _ in CORPORATE_ABBREVIATIONS]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def normalize(self, name: str) -> str:
+        normalized = self._normalized_cache.get(name)
+        if normalized is None:
+            normalized = self._normalized_cache[name] = normalize_party_name(name)
+        return normalized
+
+    def add(self, name: str) -> int:
+        """Index ``name`` as the next party in the list and return its position"""
+        normalized = self.normalize(name)
+        index = len(self.names)
+        self.names.append(normalized)
+        self._first_index.setdefault(normalized, index)
+        self._lengths.add(len(normalized))
+        self._offsets.append(len(self._haystack))
+        self._haystack += normalized + _SEPARATOR
+
+        words = normalized.split()
+        if len(set(words)) <= PERSON_NAME_MAX_WORDS:
+            for word in words:
+                self._tokens.setdefault(word, index)
+
+        for rewrites, (full, abbrev) in zip(self._rewrites, CORPORATE_ABBREVIATIONS.items()):
+            rewrites.setdefault(normalized.replace(full, abbrev), index)
+        return index
+
+    def _candidates(self, normalized: str) -> Set[int]:
+        candidates = set()
+
+        # Exact match, or an existing name inside the new one
+        for length in self._lengths:
+            for start in range(len(normalized) - length + 1):
+                index = self._first_index.get(normalized[start:start + length])
+                if index is not None:
+                    candidates.add(index)
+
+        # The new name inside an existing one
+        position = self._haystack.find(normalized)
+        if position >= 0 and self.names:
+            candidates.add(bisect_right(self._offsets, position) - 1)
+
+        # Known abbreviations in either direction
+        index = self._first_index.get(NAME_ABBREVIATIONS.get(normalized))
+        if index is not None:
+            candidates.add(index)
+        for short, full in NAME_ABBREVIATIONS.items():
+            if full == normalized and short in self._first_index:
+                candidates.add(self._first_index[short])
+
+        # Shared word between person-length names
+        words = set(normalized.split())
+        if len(words) <= PERSON_NAME_MAX_WORDS:
+            for word in words:
+                if word in self._tokens:
+                    candidates.add(self._tokens[word])
+
+        # Equal after a corporate abbreviation rewrite
+        for rewrites, (full, abbrev) in zip(self._rewrites, CORPORATE_ABBREVIATIONS.items()):
+            index = rewrites.get(normalized.replace(full, abbrev))
+            if index is not None:
+                candidates.add(index)
+
+        return candidates
+
+    def similar(self, name1: str, name2: str) -> bool:
+        key = (name1, name2)
+        result = self._similar_cache.get(key)
+        if result is None:
+            result = self._similar_cache[key] = self._similar(name1, name2)
+        return result
+
+    def find(self, name: str) -> Optional[int]:
+        """Position of the first indexed party similar to ``name``, if any"""
+        normalized = self.normalize(name)
+        for index in sorted(self._candidates(normalized)):
+            if self.similar(normalized, self.names[index]):
+                return index
+        return None
@@ -18,7 +18,9 @@ from collections import defaultdict
 from app.core.processors.case_consolidator import CaseConsolidator, ConsolidatedCase
 from app.engines.base_engine import ExtractionResult
 from app.core.event_broadcaster import ProcessingEventBroadcaster
-from satori_schema import validate_hydrated_json, HydratedJSON
+from app.core.utils.metrics import CASE_FILES_PENDING
+from app.core.utils.profiling import CaseProfiler
+from satori_schema import validate_hydrated_json, HydratedJSON, serialization
 
 @dataclass
 class HydratedJSONResult:
@@ -64,31 +66,37 @@ def process_documents_for_case(case_folder: str, exclude_files: List[str] = None
     processor.set_case_context(case_id)
     
     extraction_results = []
+    CASE_FILES_PENDING.set(len(document_files))
     
-    for doc_path in document_files:
-        logger.info(f"Processing document: {doc_path.name}")
+    try:
+        for doc_path in document_files:
+            logger.info(f"Processing document: {doc_path.name}")
         
-        try:
-            result = processor.process_document(str(doc_path))
-            extraction_results.append(result)
+            try:
+                result = processor.process_document(str(doc_path))
+                extraction_results.append(result)
             
-            if result.success:
-                logger.info(f"✅ {doc_path.name}: Quality {result.quality_metrics.get('quality_score', 0)}/100")
-            else:
-                logger.warning(f"❌ {doc_path.name}: {result.error}")
+                if result.success:
+                    logger.info(f"✅ {doc_path.name}: Quality {result.quality_metrics.get('quality_score', 0)}/100")
+                else:
+                    logger.warning(f"❌ {doc_path.name}: {result.error}")
                 
-        except Exception as e:
-            logger.error(f"Failed to process {doc_path.name}: {e}")
-            continue
+            except Exception as e:
+                logger.error(f"Failed to process {doc_path.name}: {e}")
+                continue
+            finally:
+                CASE_FILES_PENDING.dec()
+    finally:
+        processor.close()
             
     return extraction_results
 
 class HydratedJSONConsolidator:
     """Service to consolidate multiple Tiger document JSONs into a single hydrated FCRA-compliant JSON"""
     
-    def __init__(self, event_broadcaster: ProcessingEventBroadcaster = None):
+    def __init__(self, event_broadcaster: ProcessingEventBroadcaster = None, stage_hook=None):
         self.logger = logging.getLogger(__name__)
-        self.case_consolidator = CaseConsolidator()
+        self.case_consolidator = CaseConsolidator(stage_hook=stage_hook)
         self.event_broadcaster = event_broadcaster
     
     def consolidate_case_files(self, case_folder: str, case_name: Optional[str] = None, exclude_files: List[str] = None) -> HydratedJSONResult:
@@ -106,6 +114,20 @@ class HydratedJSONConsolidator:
         self.logger.info(f"Starting hydrated JSON consolidation for: {case_folder}")
         
         extraction_results = process_documents_for_case(case_folder, exclude_files, self.event_broadcaster)
+        return self.consolidate_extraction_results(case_folder, extraction_results, case_name)
+    
+    def consolidate_extraction_results(self, case_folder: str, extraction_results: List[ExtractionResult], case_name: Optional[str] = None) -> HydratedJSONResult:
+        """
+        Build hydrated JSON from documents that have already been processed
+        
+        Args:
+            case_folder: Path to folder containing legal documents
+            extraction_results: Per-document processing results
+            case_name: Optional case name, will be generated if not provided
+            
+        Returns:
+            HydratedJSONResult with consolidated data
+        """
         processed_files = [result.file_path for result in extraction_results]
 
         # Consolidate using Tiger's existing case consolidator
@@ -116,7 +138,8 @@ class HydratedJSONConsolidator:
             case_name = self._generate_case_name(consolidated_case)
         
         # Build hydrated JSON following NY FCRA format
-        hydrated_json = self._build_hydrated_fcra_json(consolidated_case, extraction_results)
+        with self.case_consolidator.stage('build_hydrated_json'):
+            hydrated_json = self._build_hydrated_fcra_json(consolidated_case, extraction_results)
         
         # Calculate quality and completeness scores
         quality_score = self._calculate_quality_score(hydrated_json, extraction_results)
@@ -157,12 +180,10 @@ class HydratedJSONConsolidator:
         
         for json_file in json_files:
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    individual_extractions.append({
-                        'file_path': json_file,
-                        'data': data
-                    })
+                individual_extractions.append({
+                    'file_path': json_file,
+                    'data': serialization.load(json_file)
+                })
             except Exception as e:
                 self.logger.error(f"Failed to load JSON file {json_file}: {e}")
                 continue
@@ -760,9 +781,8 @@ class HydratedJSONConsolidator:
             self.logger.info(f"Schema validation warnings: {warnings}")
             result.warnings.extend([f"Schema validation warning: {warning}" for warning in warnings])
         
-        # Save with proper formatting
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(result.hydrated_json, f, indent=2, ensure_ascii=False)
+        # Compact unless pretty output is requested (SATORI_JSON_PRETTY)
+        serialization.dump(result.hydrated_json, file_path)
         
         self.logger.info(f"Saved hydrated JSON to: {file_path} (Schema valid: {is_valid})")
         return str(file_path)
@@ -810,7 +830,7 @@ class HydratedJSONConsolidator:
         }
 
 
-def consolidate_case_to_hydrated_json(case_folder: str, output_dir: str, case_name: Optional[str] = None, exclude_files: List[str] = None, event_broadcaster: ProcessingEventBroadcaster = None) -> HydratedJSONResult:
+def consolidate_case_to_hydrated_json(case_folder: str, output_dir: str, case_name: Optional[str] = None, exclude_files: List[str] = None, event_broadcaster: ProcessingEventBroadcaster = None, profiler: Optional[CaseProfiler] = None) -> HydratedJSONResult:
     """
     Convenience function to consolidate a case folder into hydrated JSON
     
@@ -820,13 +840,19 @@ def consolidate_case_to_hydrated_json(case_folder: str, output_dir: str, case_na
         case_name: Optional case name
         exclude_files: Optional list of filenames to exclude
         event_broadcaster: Optional event broadcaster for real-time updates
+        profiler: Optional started CaseProfiler; its dumps are written to
+            ``<output_dir>/profiles`` and summarized under ``metadata.profile``
         
     Returns:
         HydratedJSONResult with consolidated data and file path
     """
-    consolidator = HydratedJSONConsolidator(event_broadcaster)
+    consolidator = HydratedJSONConsolidator(event_broadcaster, stage_hook=profiler.stage if profiler else None)
     result = consolidator.consolidate_case_files(case_folder, case_name, exclude_files)
     
+    if profiler:
+        result.hydrated_json['metadata']['profile'] = profiler.write(
+            os.path.join(output_dir, 'profiles'), result.case_name)
+    
     # Save the hydrated JSON
     saved_path = consolidator.save_hydrated_json(result, output_dir)
     
@@ -0,0 +1,213 @@
+"""
+Columnar Batch Scoring for Tiger Engine
+Quality, readiness and legal-indicator statistics for a whole batch as NumPy arrays
+"""
+
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+
+from app.config.settings import QualityThresholds
+
+# Text length tiers and the points QualityValidator awards at or above each one
+LENGTH_TIERS = np.array([100, 200, 500, 1000, 2000, 3000])
+LENGTH_POINTS = np.array([0, 5, 10, 15, 20, 25, 30])
+
+# Count-based legal indicators: (indicator, points per match, cap)
+COUNT_POINTS = (
+    ('legal_entities', 2, 6),
+    ('addresses', 2, 4),
+    ('phone_numbers', 1, 3),
+    ('emails', 1, 2),
+    ('dates', 1, 3),
+)
+
+# Compression ratios reported as optimal in quality summaries
+OPTIMAL_COMPRESSION = (0.002, 0.05)
+
+PERCENTILES = (10, 25, 50, 75, 90)
+SCORE_BINS = np.linspace(0, 100, 11)
+
+# Column order of the feature matrix
+COLUMNS = (
+    'quality_score', 'readiness_score', 'text_length', 'file_size_bytes', 'compression_ratio',
+    'court_document', 'summons', 'complaint', 'case_number',
+    'legal_entities', 'addresses', 'phone_numbers', 'emails', 'dates',
+)
+_COUNT_COLUMNS = frozenset(name for name, _, _ in COUNT_POINTS)
+_BOOL_COLUMNS = frozenset(('court_document', 'summons', 'complaint', 'case_number'))
+
+
+def _feature_row(metrics: Dict[str, Any]) -> List[float]:
+    indicators = metrics.get('legal_indicators') or {}
+    row = []
+    for name in COLUMNS:
+        if name in _COUNT_COLUMNS:
+            row.append((indicators.get(name) or {}).get('count', 0))
+        elif name in _BOOL_COLUMNS:
+            row.append(bool(indicators.get(name, False)))
+        else:
+            row.append(metrics.get(name) or 0)
+    return row
+
+
+class BatchScores:
+    """
+    Per-document quality features of a batch, one NumPy column per feature
+
+    Built once from the per-file ``quality_metrics`` dicts; every batch
+    statistic is then an array operation. ``batch[i]`` gives the familiar
+    per-file dict for a single document.
+    """
+
+    def __init__(self, names: List[str], features: np.ndarray):
+        self.names = names
+        self.features = features.reshape(-1, len(COLUMNS))
+        self.columns = {name: self.features[:, i] for i, name in enumerate(COLUMNS)}
+
+    @classmethod
+    def from_metrics(cls, metrics: Iterable[Dict[str, Any]], names: List[str] = None) -> 'BatchScores':
+        """Gather quality_metrics dicts into columns"""
+        rows = [_feature_row(m or {}) for m in metrics]
+        if names is None:
+            names = [str(i) for i in range(len(rows))]
+        return cls(list(names), np.array(rows, dtype=np.float64))
+
+    @classmethod
+    def from_results(cls, results: Iterable[Any]) -> 'BatchScores':
+        """Gather ProcessingResults (or their dicts), skipping those without quality metrics"""
+        names, metrics = [], []
+        for result in results:
+            if isinstance(result, dict):
+                quality, name = result.get('quality_metrics'), result.get('file_name')
+            else:
+                quality, name = result.quality_metrics, result.file_name
+            if quality:
+                names.append(name or str(len(names)))
+                metrics.append(quality)
+        return cls.from_metrics(metrics, names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Per-file view of one document's features"""
+        row = self.features[index]
+        view = {'file_name': self.names[index]}
+        for i, name in enumerate(COLUMNS):
+            value = row[i]
+            if name in _BOOL_COLUMNS:
+                view[name] = bool(value)
+            elif name in _COUNT_COLUMNS or name in ('text_length', 'file_size_bytes'):
+                view[name] = int(value)
+            else:
+                view[name] = float(value)
+        return view
+
+    def documents(self) -> Iterable[Dict[str, Any]]:
+        """Per-file views in batch order"""
+        return (self[i] for i in range(len(self)))
+
+    def rescore(self, thresholds: QualityThresholds = None) -> np.ndarray:
+        """
+        Recompute quality scores for the whole batch
+
+        Vectorized QualityValidator._calculate_quality_score, so historical
+        batches can be rescored against current thresholds without re-reading text.
+        """
+        thresholds = thresholds or QualityThresholds()
+        c = self.columns
+        low, high = thresholds.compression_ratio_min, thresholds.compression_ratio_max
+        ratio = c['compression_ratio']
+
+        score = LENGTH_POINTS[np.searchsorted(LENGTH_TIERS, c['text_length'], side='right')].astype(np.float64)
+        score += np.where(
+            (ratio >= low) & (ratio <= high), 20.0,
+            np.where(ratio < low,
+                     np.maximum(0.0, 10 - (low - ratio) * 500),
+                     np.maximum(0.0, 15 - (ratio - high) * 100))
+        )
+        score += 15 * c['court_document']
+        score += 10 * np.logical_or(c['summons'], c['complaint'])
+        score += 10 * c['case_number']
+        for name, points, cap in COUNT_POINTS:
+            score += np.minimum(c[name] * points, cap)
+        return np.minimum(score, 100)
+
+    def passes_threshold(self, thresholds: QualityThresholds = None) -> np.ndarray:
+        """Boolean mask of documents meeting the minimum extraction thresholds"""
+        thresholds = thresholds or QualityThresholds()
+        c = self.columns
+        return ((c['text_length'] >= thresholds.min_text_length) &
+                (c['compression_ratio'] >= thresholds.compression_ratio_min) &
+                (c['compression_ratio'] <= thresholds.compression_ratio_max))
+
+    def tier_counts(self, thresholds: QualityThresholds = None, column: str = 'quality_score') -> Dict[str, int]:
+        """High / medium / low counts for a 0-100 score column"""
+        thresholds = thresholds or QualityThresholds()
+        tiers = np.searchsorted([thresholds.min_quality_score, thresholds.high_quality_threshold],
+                                self.columns[column], side='right')
+        low, medium, high = np.bincount(tiers, minlength=3)
+        return {'high_quality_count': int(high), 'medium_quality_count': int(medium),
+                'low_quality_count': int(low)}
+
+    def distribution(self, column: str) -> Dict[str, Any]:
+        """Average, range, percentiles and (for 0-100 scores) a 10-point histogram"""
+        values = self.columns[column]
+        if not len(values):
+            return {'average': 0.0, 'min': 0, 'max': 0, 'percentiles': {}}
+        percentiles = np.percentile(values, PERCENTILES)
+        stats = {
+            'average': float(values.mean()),
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'std': float(values.std()),
+            'percentiles': {f'p{p}': float(v) for p, v in zip(PERCENTILES, percentiles)},
+        }
+        if column in ('quality_score', 'readiness_score'):
+            counts, _ = np.histogram(values, bins=SCORE_BINS)
+            stats['histogram'] = {'bins': SCORE_BINS.tolist(), 'counts': counts.tolist()}
+        return stats
+
+    def legal_indicator_summary(self) -> Dict[str, int]:
+        """Documents carrying each legal indicator and total extracted contacts"""
+        c = self.columns
+        return {
+            'court_documents': int(c['court_document'].sum()),
+            'case_numbers_found': int(c['case_number'].sum()),
+            'summons_detected': int(c['summons'].sum()),
+            'complaints_detected': int(c['complaint'].sum()),
+            'addresses_extracted': int(c['addresses'].sum()),
+            'phone_numbers_extracted': int(c['phone_numbers'].sum()),
+            'emails_extracted': int(c['emails'].sum()),
+        }
+
+    def report(self, thresholds: QualityThresholds = None) -> Dict[str, Any]:
+        """Batch quality analysis in the shape OutputManager's quality summary uses"""
+        c = self.columns
+        ratios = c['compression_ratio']
+        lengths = c['text_length']
+
+        score_statistics = self.distribution('quality_score')
+        score_statistics.update(self.tier_counts(thresholds))
+
+        compression_statistics = self.distribution('compression_ratio')
+        compression_statistics['optimal_count'] = int(np.count_nonzero(
+            (ratios >= OPTIMAL_COMPRESSION[0]) & (ratios <= OPTIMAL_COMPRESSION[1])))
+
+        text_length_statistics = self.distribution('text_length')
+        text_length_statistics.update({
+            'min': int(lengths.min()) if len(lengths) else 0,
+            'max': int(lengths.max()) if len(lengths) else 0,
+            'total_characters': int(lengths.sum()),
+        })
+
+        return {
+            'total_documents': len(self),
+            'score_statistics': score_statistics,
+            'readiness_statistics': self.distribution('readiness_score'),
+            'compression_statistics': compression_statistics,
+            'text_length_statistics': text_length_statistics,
+            'passes_threshold_count': int(np.count_nonzero(self.passes_threshold(thresholds))),
+            'legal_indicators': self.legal_indicator_summary(),
+        }
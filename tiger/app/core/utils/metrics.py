@@ -0,0 +1,30 @@
+"""
+Metrics for Tiger Engine
+Pipeline telemetry on the shared satori_common metrics registry
+"""
+
+from satori_common.metrics import MetricsRegistry
+
+# Global registry for the Tiger process
+registry = MetricsRegistry('tiger')
+
+ENGINE_SECONDS = registry.histogram(
+    'tiger_engine_extraction_seconds', 'Per-engine text extraction time', ('engine',))
+ENGINE_BYTES = registry.counter(
+    'tiger_engine_input_bytes_total', 'Input bytes processed by each engine', ('engine',))
+ENGINE_PAGES = registry.counter(
+    'tiger_engine_pages_total', 'Pages processed by each engine', ('engine',))
+ENGINE_BYTES_PER_SECOND = registry.histogram(
+    'tiger_engine_bytes_per_second', 'Per-document extraction throughput in bytes/s', ('engine',),
+    buckets=(1e3, 1e4, 1e5, 1e6, 1e7, 1e8))
+ENGINE_PAGES_PER_SECOND = registry.histogram(
+    'tiger_engine_pages_per_second', 'Per-document extraction throughput in pages/s', ('engine',),
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100))
+ENGINE_FAILURES = registry.counter(
+    'tiger_engine_failures_total', 'Failed extractions per engine', ('engine',))
+DOCUMENT_STAGE_SECONDS = registry.histogram(
+    'tiger_document_stage_seconds', 'Per-document post-extraction stage time', ('stage',))
+CONSOLIDATION_STEP_SECONDS = registry.histogram(
+    'tiger_consolidation_step_seconds', 'CaseConsolidator step time', ('step',))
+CASE_FILES_PENDING = registry.gauge(
+    'tiger_case_files_pending', 'Documents queued but not yet processed in the current case')
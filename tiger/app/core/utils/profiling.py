@@ -0,0 +1,187 @@
+"""
+Opt-in Profiling for Tiger Case Processing
+Per-stage timing/allocation hooks plus cProfile and collapsed-stack capture
+"""
+
+import os
+import sys
+import time
+import cProfile
+import pstats
+import threading
+import tracemalloc
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+logger = logging.getLogger(__name__)
+
+# Seconds between stack samples for the collapsed-stack (flame graph) output
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+
+class StageProfiler:
+    """
+    Context-manager hook recording wall time and, optionally, allocations per stage
+
+    Pass ``profiler.stage`` as the ``stage_hook`` of CaseConsolidator (or any
+    component that accepts one). Repeated stages are aggregated by name.
+    """
+
+    def __init__(self, trace_allocations: bool = False):
+        self.trace_allocations = trace_allocations
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str):
+        tracing = self.trace_allocations and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            allocated = peak = None
+            if tracing:
+                current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+                allocated = current_bytes - start_bytes
+                peak = peak_bytes - start_bytes
+            self._record(name, elapsed, allocated, peak)
+
+    def _record(self, name: str, elapsed: float, allocated: Optional[int], peak: Optional[int]):
+        with self._lock:
+            stats = self._stages.setdefault(name, {
+                'stage': name, 'calls': 0, 'total_seconds': 0.0, 'max_seconds': 0.0
+            })
+            stats['calls'] += 1
+            stats['total_seconds'] += elapsed
+            stats['max_seconds'] = max(stats['max_seconds'], elapsed)
+            if allocated is not None:
+                stats['net_allocated_bytes'] = stats.get('net_allocated_bytes', 0) + allocated
+                stats['peak_allocated_bytes'] = max(stats.get('peak_allocated_bytes', 0), peak)
+
+    def stages(self) -> List[Dict[str, Any]]:
+        """Stage statistics, slowest first"""
+        with self._lock:
+            stages = [dict(stats) for stats in self._stages.values()]
+        for stats in stages:
+            stats['total_seconds'] = round(stats['total_seconds'], 6)
+            stats['max_seconds'] = round(stats['max_seconds'], 6)
+        return sorted(stages, key=lambda s: s['total_seconds'], reverse=True)
+
+
+class _StackSampler(threading.Thread):
+    """Samples one thread's Python stack at a fixed interval into collapsed-stack counts"""
+
+    def __init__(self, target_thread_id: int, interval: float):
+        super().__init__(name='tiger-stack-sampler', daemon=True)
+        self.target_thread_id = target_thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.target_thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.samples[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+class CaseProfiler(StageProfiler):
+    """
+    Whole-case profiler used by ``--profile``
+
+    Combines stage timing with a deterministic cProfile run and a sampled
+    collapsed-stack file (``stack;frames count`` lines, readable by
+    flamegraph.pl, speedscope and similar tools).
+    """
+
+    def __init__(self, trace_allocations: bool = True, sample_interval: float = DEFAULT_SAMPLE_INTERVAL):
+        super().__init__(trace_allocations=trace_allocations)
+        self.sample_interval = sample_interval
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[_StackSampler] = None
+        self._started_tracemalloc = False
+        self._start_time: Optional[float] = None
+        self.wall_seconds: Optional[float] = None
+
+    def start(self):
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._sampler = _StackSampler(threading.get_ident(), self.sample_interval)
+        self._sampler.start()
+        self._profile = cProfile.Profile()
+        self._start_time = time.perf_counter()
+        self._profile.enable()
+
+    def stop(self):
+        if self._profile is None or self.wall_seconds is not None:
+            return
+        self._profile.disable()
+        self.wall_seconds = time.perf_counter() - self._start_time
+        self._sampler.stop()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+
+    def write(self, output_dir: str, case_name: str) -> Dict[str, Any]:
+        """
+        Stop profiling and write ``<case>.pstats`` and ``<case>.collapsed``
+
+        Args:
+            output_dir: Directory for the profile files
+            case_name: Case name used as the file stem
+
+        Returns:
+            Summary suitable for embedding in case metadata
+        """
+        self.stop()
+        profile_dir = Path(output_dir)
+        profile_dir.mkdir(parents=True, exist_ok=True)
+
+        pstats_path = profile_dir / f"{case_name}.pstats"
+        self._profile.dump_stats(str(pstats_path))
+
+        collapsed_path = profile_dir / f"{case_name}.collapsed"
+        with open(collapsed_path, 'w', encoding='utf-8') as f:
+            for stack, count in self._sampler.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+        logger.info(f"Saved profile for {case_name}: {pstats_path}, {collapsed_path}")
+        return {
+            'wall_seconds': round(self.wall_seconds, 6),
+            'stages': self.stages(),
+            'top_functions': self.top_functions(),
+            'pstats_file': str(pstats_path),
+            'collapsed_stacks_file': str(collapsed_path),
+            'stack_samples': sum(self._sampler.samples.values())
+        }
+
+    def top_functions(self, limit: int = 15) -> List[Dict[str, Any]]:
+        """Functions with the highest cumulative time in the cProfile run"""
+        stats = pstats.Stats(self._profile)
+        rows = []
+        for (file_name, line, func), (_, calls, total, cumulative, _) in stats.stats.items():
+            rows.append({
+                'function': f"{func} ({os.path.basename(file_name)}:{line})",
+                'calls': calls,
+                'total_seconds': round(total, 6),
+                'cumulative_seconds': round(cumulative, 6)
+            })
+        rows.sort(key=lambda r: r['cumulative_seconds'], reverse=True)
+        return rows[:limit]
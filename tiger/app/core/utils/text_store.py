@@ -0,0 +1,182 @@
+"""
+Spill-to-Disk Text Store for Tiger Engine
+Holds extracted document text in memory or, past a size threshold, in a memory-mapped spill file
+"""
+
+import os
+import mmap
+import tempfile
+import weakref
+import logging
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, TextIO, Union
+
+logger = logging.getLogger(__name__)
+
+# Texts at least this many characters long are moved out of the Python heap
+SPILL_THRESHOLD_CHARS = int(os.environ.get('TIGER_TEXT_SPILL_CHARS', str(1024 * 1024)))
+
+# Directory for spill files (defaults to the system temp directory)
+SPILL_DIR = os.environ.get('TIGER_TEXT_SPILL_DIR') or None
+
+# Characters per decoded chunk; byte offsets are recorded at each chunk boundary
+CHUNK_CHARS = 64 * 1024
+
+# Characters shown by repr() and log summaries
+PREVIEW_CHARS = 80
+
+
+def _close_map(mapped: mmap.mmap):
+    try:
+        mapped.close()
+    except (BufferError, ValueError):
+        pass
+
+
+class TextHandle:
+    """
+    Extracted text that may live in a memory-mapped spill file
+
+    Short texts are kept as a ``str``. Long ones are written once as UTF-8 to
+    an unlinked temp file and memory-mapped, so the pages are owned by the OS
+    page cache rather than the Python heap and are released when the handle
+    is garbage collected. ``str(handle)`` materializes the full text;
+    slicing, ``iter_chunks`` and ``write_to`` decode only what they touch.
+    ``repr`` never includes more than a short preview.
+    """
+
+    def __init__(self, text: str = '', threshold: Optional[int] = None, spill_dir: Optional[str] = SPILL_DIR):
+        self._text: Optional[str] = None
+        self._decoded: Optional[str] = None
+        self._pins = 0
+        self._map: Optional[mmap.mmap] = None
+        self._offsets: List[int] = [0]
+        self._length = len(text)
+        threshold = SPILL_THRESHOLD_CHARS if threshold is None else threshold
+
+        if self._length < threshold or self._length == 0:
+            self._text = text
+            return
+        try:
+            self._spill(text, spill_dir)
+        except OSError as e:
+            logger.warning(f"Could not spill {self._length} characters to disk, keeping text in memory: {e}")
+            self._text = text
+            self._offsets = [0]
+
+    def _spill(self, text: str, spill_dir: Optional[str]):
+        fd, path = tempfile.mkstemp(prefix='tiger-text-', suffix='.spill', dir=spill_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for start in range(0, self._length, CHUNK_CHARS):
+                    data = text[start:start + CHUNK_CHARS].encode('utf-8', 'surrogatepass')
+                    f.write(data)
+                    self._offsets.append(self._offsets[-1] + len(data))
+            with open(path, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            # The mapping keeps the data alive; the name is never needed again
+            os.unlink(path)
+        weakref.finalize(self, _close_map, self._map)
+
+    @classmethod
+    def of(cls, value: Union['TextHandle', str, None]) -> 'TextHandle':
+        """Wrap ``value`` unless it already is a handle"""
+        if isinstance(value, TextHandle):
+            return value
+        return cls(value or '')
+
+    @property
+    def spilled(self) -> bool:
+        return self._map is not None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def _chunk(self, index: int) -> str:
+        return self._map[self._offsets[index]:self._offsets[index + 1]].decode('utf-8', 'surrogatepass')
+
+    def iter_chunks(self, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """Yield the text between ``start`` and ``stop`` in pieces of at most CHUNK_CHARS"""
+        stop = self._length if stop is None else min(stop, self._length)
+        if start >= stop:
+            return
+        if self._text is not None:
+            for position in range(start, stop, CHUNK_CHARS):
+                yield self._text[position:min(position + CHUNK_CHARS, stop)]
+            return
+        for index in range(start // CHUNK_CHARS, (stop - 1) // CHUNK_CHARS + 1):
+            base = index * CHUNK_CHARS
+            chunk = self._chunk(index)
+            yield chunk[max(start - base, 0):stop - base]
+
+    def __getitem__(self, key: Union[int, slice]) -> str:
+        if self._text is not None:
+            return self._text[key]
+        if self._decoded is not None:
+            return self._decoded[key]
+        if isinstance(key, int):
+            if key < 0:
+                key += self._length
+            if not 0 <= key < self._length:
+                raise IndexError('text index out of range')
+            return self._chunk(key // CHUNK_CHARS)[key % CHUNK_CHARS]
+        start, stop, step = key.indices(self._length)
+        if step != 1:
+            return str(self)[key]
+        return ''.join(self.iter_chunks(start, stop))
+
+    def __str__(self) -> str:
+        if self._text is not None:
+            return self._text
+        if self._decoded is not None:
+            return self._decoded
+        return self._map[:].decode('utf-8', 'surrogatepass')
+
+    @contextmanager
+    def materialized(self):
+        """
+        Keep one decoded copy of a spilled text for the duration of the block
+
+        ``str(handle)`` then returns that copy instead of decoding the spill
+        file on every call. Blocks may nest; the copy is dropped when the
+        outermost one exits.
+        """
+        if self._map is not None:
+            if not self._pins:
+                self._decoded = self._map[:].decode('utf-8', 'surrogatepass')
+            self._pins += 1
+        try:
+            yield self
+        finally:
+            if self._map is not None:
+                self._pins -= 1
+                if not self._pins:
+                    self._decoded = None
+
+    read = __str__
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TextHandle):
+            return self._length == other._length and str(self) == str(other)
+        if isinstance(other, str):
+            return self._length == len(other) and str(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def preview(self, chars: int = PREVIEW_CHARS) -> str:
+        preview = self[:chars]
+        return preview + ('...' if self._length > chars else '')
+
+    def __repr__(self) -> str:
+        where = 'spilled' if self.spilled else 'in memory'
+        return f"<TextHandle {self._length} chars {where}: {self.preview()!r}>"
+
+    def write_to(self, f: TextIO):
+        """Stream the text to an open text file without materializing it"""
+        for chunk in self.iter_chunks():
+            f.write(chunk)
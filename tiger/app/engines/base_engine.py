@@ -4,19 +4,31 @@ Abstract base class for all document processing engines
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 from pathlib import Path
+import os
 import time
 import logging
 
+from app.core.utils.metrics import (
+    ENGINE_SECONDS, ENGINE_BYTES, ENGINE_PAGES, ENGINE_BYTES_PER_SECOND,
+    ENGINE_PAGES_PER_SECOND, ENGINE_FAILURES
+)
+from app.core.utils.text_store import TextHandle
+
 logger = logging.getLogger(__name__)
 
 class ExtractionResult:
-    """Standardized result object for document extraction"""
+    """
+    Standardized result object for document extraction
+
+    The text is held in a ``TextHandle`` (``text_handle``), which moves large
+    extractions to a memory-mapped spill file. ``text`` returns it as a ``str``.
+    """
     
     def __init__(self, 
                  success: bool,
-                 text: str = "",
+                 text: Union[str, TextHandle] = "",
                  metadata: Dict[str, Any] = None,
                  processing_time: float = 0.0,
                  engine_name: str = "",
@@ -30,16 +42,27 @@ class ExtractionResult:
         self.processing_time = processing_time
         self.engine_name = engine_name
         self.error = error
-        self.text_length = len(text) if text else 0
         self.file_path = file_path
         self.confidence = confidence
         self.legal_entities = legal_entities or []
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert result to dictionary"""
+    @property
+    def text(self) -> str:
+        return str(self.text_handle)
+    
+    @text.setter
+    def text(self, value: Union[str, TextHandle]):
+        self.text_handle = TextHandle.of(value)
+    
+    @property
+    def text_length(self) -> int:
+        return len(self.text_handle)
+    
+    def to_dict(self, include_text: bool = True) -> Dict[str, Any]:
+        """Convert result to dictionary; ``include_text=False`` gives a short preview instead"""
         return {
             'success': self.success,
-            'text': self.text,
+            'text': self.text if include_text else self.text_handle.preview(),
             'text_length': self.text_length,
             'metadata': self.metadata,
             'processing_time': self.processing_time,
@@ -103,13 +126,15 @@ class BaseEngine(ABC):
             result = self.extract_text(file_path)
             result.processing_time = time.time() - start_time
             result.engine_name = self.name
+            self._record_metrics(file_path, result)
             
             self.logger.info(f"Successfully processed {file_path} - {result.text_length} characters extracted")
-            self.logger.info(f"Extraction result: {result.to_dict()}")
+            self.logger.info(f"Extraction result: {result.to_dict(include_text=False)}")
             return result
             
         except Exception as e:
             self.logger.error(f"Failed to process {file_path}: {str(e)}", exc_info=True)
+            ENGINE_FAILURES.inc(engine=self.name)
             return ExtractionResult(
                 success=False,
                 error=str(e),
@@ -117,11 +142,40 @@ class BaseEngine(ABC):
                 engine_name=self.name
             )
     
+    def _record_metrics(self, file_path: str, result: ExtractionResult):
+        """Record extraction time and bytes/pages throughput for this engine"""
+        if not result.success:
+            ENGINE_FAILURES.inc(engine=self.name)
+            return
+        
+        elapsed = max(result.processing_time, 1e-9)
+        ENGINE_SECONDS.observe(result.processing_time, engine=self.name)
+        
+        try:
+            file_size = os.path.getsize(file_path)
+        except OSError:
+            file_size = 0
+        ENGINE_BYTES.inc(file_size, engine=self.name)
+        ENGINE_BYTES_PER_SECOND.observe(file_size / elapsed, engine=self.name)
+        
+        page_count = result.metadata.get('page_count') or result.metadata.get('pages')
+        if isinstance(page_count, int) and page_count > 0:
+            ENGINE_PAGES.inc(page_count, engine=self.name)
+            ENGINE_PAGES_PER_SECOND.observe(page_count / elapsed, engine=self.name)
+    
     @abstractmethod
     def setup_dependencies(self) -> bool:
         """Setup engine dependencies - must be implemented by subclasses"""
         pass
     
+    def warm_up(self) -> bool:
+        """Preload models or other expensive state before the first document"""
+        return True
+    
+    def close(self):
+        """Release worker pools or other state kept across documents"""
+        pass
+    
     def get_engine_info(self) -> Dict[str, Any]:
         """Get engine information"""
         return {
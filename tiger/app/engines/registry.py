@@ -0,0 +1,241 @@
+"""
+Engine Registry
+Maps file extensions to processing engines that are imported and set up on first use
+"""
+
+import os
+import logging
+import importlib
+from importlib import metadata
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Union
+try:
+    from .base_engine import BaseEngine
+except ImportError:
+    from base_engine import BaseEngine
+
+logger = logging.getLogger(__name__)
+
+# Third-party engines register under this entry-point group, e.g. in pyproject.toml:
+#   [project.entry-points."satori_tiger.engines"]
+#   pdf = "my_package.engines:FasterPdfEngine"
+ENTRY_POINT_GROUP = 'satori_tiger.engines'
+
+# Built-in engines as (name, "module:Class", extensions)
+BUILTIN_ENGINES = [
+    ('pdf', 'app.engines.tiered_pdf_engine:TieredPdfEngine', ['.pdf']),
+    ('docx', 'app.engines.docx_engine:DocxEngine', ['.docx']),
+    ('txt', 'app.engines.text_engine:TextEngine', ['.txt', '.md']),
+]
+
+EngineTarget = Union[str, Callable[[], BaseEngine], BaseEngine]
+
+
+def load_target(target: str) -> Callable[[], BaseEngine]:
+    """Import a ``module:attribute`` target and return the attribute"""
+    module_name, _, attribute = target.partition(':')
+    obj = importlib.import_module(module_name)
+    for part in attribute.split('.') if attribute else []:
+        obj = getattr(obj, part)
+    return obj
+
+
+class EngineRegistry:
+    """
+    Registry of processing engines keyed by name and file extension
+
+    Engines are registered as ``module:Class`` strings, factories or ready
+    instances. A string target is not imported until a file with one of its
+    extensions is processed, and ``setup_dependencies`` runs at that point
+    rather than at start-up, so a TXT-only run never imports Docling.
+    ``warm_up`` does the same work ahead of time for long-running callers.
+
+    Entry points in the ``satori_tiger.engines`` group whose name matches a
+    registered engine replace its target without being imported. Other
+    entry points declare their extensions through ``supported_formats``, so
+    they are only loaded when a lookup misses the known extensions, or when
+    every engine is listed.
+    """
+
+    def __init__(self, engines: Optional[Dict[str, BaseEngine]] = None,
+                 discover: bool = True):
+        self._targets: Dict[str, EngineTarget] = {}
+        self._extensions: Dict[str, str] = {}
+        self._instances: Dict[str, BaseEngine] = {}
+        self._ready: Dict[str, bool] = {}
+        self._pending_entry_points: List[metadata.EntryPoint] = []
+
+        if engines is not None:
+            # Explicit engines (e.g. `tiger bench`) replace the built-ins
+            for name, engine in engines.items():
+                self.register(name, engine)
+            return
+
+        for name, target, extensions in BUILTIN_ENGINES:
+            self.register(name, target, extensions)
+        if discover:
+            self._discover_entry_points()
+
+    def register(self, name: str, target: EngineTarget,
+                 extensions: Optional[Iterable[str]] = None):
+        """
+        Register an engine under ``name``
+
+        ``extensions`` may be omitted for instances, whose
+        ``supported_formats`` are used. Re-registering a name replaces it;
+        an extension already claimed by another engine keeps its first owner.
+        """
+        if isinstance(target, BaseEngine):
+            self._instances[name] = target
+            extensions = extensions or target.supported_formats
+        else:
+            self._instances.pop(name, None)
+            self._ready.pop(name, None)
+        self._targets[name] = target
+
+        for extension in extensions or []:
+            self._extensions.setdefault(extension.lower(), name)
+
+    def _discover_entry_points(self):
+        """Apply entry-point overrides now and keep new engines for lazy loading"""
+        try:
+            entry_points = metadata.entry_points(group=ENTRY_POINT_GROUP)
+        except Exception as e:
+            logger.warning(f"Engine entry-point discovery failed: {e}")
+            return
+
+        for entry_point in entry_points:
+            if entry_point.name in self._targets:
+                self.register(entry_point.name, entry_point.value)
+            else:
+                self._pending_entry_points.append(entry_point)
+
+    def _load_pending_entry_points(self):
+        """Load entry points that add engines, learning their extensions"""
+        pending, self._pending_entry_points = self._pending_entry_points, []
+        for entry_point in pending:
+            try:
+                engine = entry_point.load()()
+            except Exception as e:
+                logger.error(f"Failed to load engine entry point {entry_point.name}: {e}")
+                continue
+            self.register(entry_point.name, engine)
+
+    def _instance(self, name: str) -> BaseEngine:
+        """Import and construct an engine on first use"""
+        engine = self._instances.get(name)
+        if engine is None:
+            target = self._targets[name]
+            factory = load_target(target) if isinstance(target, str) else target
+            engine = factory()
+            self._instances[name] = engine
+        return engine
+
+    def get(self, name: str) -> Optional[BaseEngine]:
+        """Engine by name with its dependencies set up, or None if it cannot load"""
+        if name not in self._targets:
+            return None
+        try:
+            engine = self._instance(name)
+        except Exception as e:
+            logger.error(f"Failed to load {name} engine: {e}")
+            return None
+
+        if name not in self._ready:
+            try:
+                self._ready[name] = bool(engine.setup_dependencies())
+            except Exception as e:
+                logger.error(f"Failed to setup {name} engine: {e}")
+                self._ready[name] = False
+            if self._ready[name]:
+                logger.info(f"{name} engine ready")
+            else:
+                logger.warning(f"{name} engine setup failed")
+        return engine
+
+    def engine_for_extension(self, extension: str) -> Optional[BaseEngine]:
+        """Engine registered for an extension such as ``.pdf``"""
+        extension = extension.lower()
+        if extension not in self._extensions and self._pending_entry_points:
+            self._load_pending_entry_points()
+        name = self._extensions.get(extension)
+        return self.get(name) if name else None
+
+    def engine_for_file(self, file_path: str) -> Optional[BaseEngine]:
+        """Engine for a file path, chosen by its extension"""
+        return self.engine_for_extension(os.path.splitext(file_path)[1])
+
+    def warm_up(self, names: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+        """
+        Load engines and their dependencies ahead of the first document
+
+        Each engine's ``warm_up`` also runs, which preloads Docling's
+        models. Returns whether each engine is ready.
+        """
+        if names is None:
+            self._load_pending_entry_points()
+            names = list(self._targets)
+
+        status = {}
+        for name in names:
+            engine = self.get(name)
+            ready = engine is not None and self._ready.get(name, False)
+            if ready:
+                try:
+                    engine.warm_up()
+                except Exception as e:
+                    logger.warning(f"{name} engine warm-up failed: {e}")
+            status[name] = ready
+        return status
+
+    def close(self):
+        """Close every engine that has been constructed"""
+        for name, engine in self._instances.items():
+            try:
+                engine.close()
+            except Exception as e:
+                logger.warning(f"Failed to close {name} engine: {e}")
+
+    @property
+    def extensions(self) -> Dict[str, str]:
+        """Known extension to engine name mapping"""
+        return dict(self._extensions)
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether an engine has been constructed"""
+        return name in self._instances
+
+    # Read-only mapping of name to engine; iterating values constructs every
+    # engine (without setting up dependencies) for callers that list them all.
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._targets
+
+    def __getitem__(self, name: str) -> BaseEngine:
+        if name not in self._targets:
+            raise KeyError(name)
+        return self._instance(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._targets))
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def keys(self) -> List[str]:
+        return list(self._targets)
+
+    def items(self) -> Iterator:
+        self._load_pending_entry_points()
+        for name in list(self._targets):
+            try:
+                yield name, self._instance(name)
+            except Exception as e:
+                logger.error(f"Failed to load {name} engine: {e}")
+
+    def values(self) -> Iterator[BaseEngine]:
+        for _, engine in self.items():
+            yield engine
+
+    def describe(self) -> Dict[str, Any]:
+        """Engine info for every engine, without setting up dependencies"""
+        return {name: engine.get_engine_info() for name, engine in self.items()}
@@ -0,0 +1,216 @@
+"""
+Tiered PDF Engine
+Uses a PDF's embedded text layer where it is usable and OCRs only the remaining pages
+"""
+
+import importlib.util
+import unicodedata
+from typing import Dict, Any, List, Optional, Tuple
+try:
+    from .base_engine import BaseEngine, ExtractionResult
+    from .docling_engine import DoclingEngine, convert_page_range, stitch_pages
+except ImportError:
+    from base_engine import BaseEngine, ExtractionResult
+    from docling_engine import DoclingEngine, convert_page_range, stitch_pages
+
+# A page needs at least this many non-whitespace characters to count as having a text layer
+MIN_PAGE_CHARS = 40
+
+# Garbled-text thresholds for embedded text layers
+MAX_BAD_CHAR_RATIO = 0.02       # U+FFFD, private-use and control characters
+MIN_ALNUM_RATIO = 0.5           # Letters/digits among non-whitespace characters
+MAX_AVG_WORD_LENGTH = 20        # Words run together when the layer lost its spaces
+
+
+def text_layer_quality(text: str) -> Tuple[bool, str]:
+    """
+    Decide whether an embedded text layer can be used as-is
+
+    Returns ``(usable, reason)`` where reason is ``ok``, ``no_text_layer``
+    (image-only page) or ``garbled`` (broken font encoding, lost spacing).
+    """
+    visible = [char for char in text if not char.isspace()]
+    if len(visible) < MIN_PAGE_CHARS:
+        return False, 'no_text_layer'
+
+    bad = sum(1 for char in visible
+              if char == '\ufffd' or unicodedata.category(char) in ('Co', 'Cc', 'Cs'))
+    if bad / len(visible) > MAX_BAD_CHAR_RATIO:
+        return False, 'garbled'
+
+    alnum = sum(1 for char in visible if char.isalnum())
+    if alnum / len(visible) < MIN_ALNUM_RATIO:
+        return False, 'garbled'
+
+    words = text.split()
+    if len(visible) / len(words) > MAX_AVG_WORD_LENGTH:
+        return False, 'garbled'
+
+    return True, 'ok'
+
+
+def read_text_layer(file_path: str) -> Optional[List[str]]:
+    """Embedded text of each page, or None when pypdfium2 is unavailable"""
+    try:
+        import pypdfium2
+    except ImportError:
+        return None
+
+    pdf = pypdfium2.PdfDocument(file_path)
+    try:
+        pages = []
+        for index in range(len(pdf)):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            try:
+                pages.append(textpage.get_text_range())
+            finally:
+                textpage.close()
+                page.close()
+        return pages
+    finally:
+        pdf.close()
+
+
+def _runs(pages: List[int]) -> List[Tuple[int, int]]:
+    """Group sorted page numbers into contiguous inclusive (start, end) runs"""
+    runs = []
+    for page in pages:
+        if runs and runs[-1][1] == page - 1:
+            runs[-1] = (runs[-1][0], page)
+        else:
+            runs.append((page, page))
+    return runs
+
+
+class TieredPdfEngine(BaseEngine):
+    """
+    PDF engine that reads the embedded text layer first
+
+    Each page's text layer is probed with pypdfium2 (installed with docling).
+    Pages whose layer passes ``text_layer_quality`` are taken directly; only
+    image-only or garbled pages are sent to Docling OCR. When no page has a
+    usable layer the whole file goes to ``DoclingEngine``, which keeps its
+    page-range parallel mode. Per-page provenance is recorded in
+    ``metadata['pages']``.
+    """
+
+    def __init__(self, ocr_engine: Optional[DoclingEngine] = None):
+        super().__init__("TieredPdfEngine")
+        self.supported_formats = ['.pdf']
+        self.ocr_engine = ocr_engine or DoclingEngine()
+        self._text_layer_available = None
+
+    def setup_dependencies(self) -> bool:
+        """Ready if either the text-layer reader or Docling OCR is available"""
+        if self._text_layer_available is None:
+            self._text_layer_available = importlib.util.find_spec('pypdfium2') is not None
+            if not self._text_layer_available:
+                self.logger.warning("pypdfium2 not available; all PDF pages will be OCR'd")
+        ocr_ready = self.ocr_engine.setup_dependencies()
+        return self._text_layer_available or ocr_ready
+
+    def warm_up(self) -> bool:
+        """Load Docling's OCR models ahead of the first scanned page"""
+        return self.ocr_engine.warm_up()
+
+    def close(self):
+        """Shut down the OCR engine's worker pool"""
+        self.ocr_engine.close()
+    
+    def extract_text(self, file_path: str) -> ExtractionResult:
+        """Extract text from the embedded layer, OCR'ing only pages that need it"""
+        try:
+            layer = read_text_layer(file_path) if self._text_layer_available is not False else None
+        except Exception as e:
+            self.logger.warning(f"Could not read text layer of {file_path}: {e}")
+            layer = None
+
+        if not layer:
+            return self._ocr_whole(file_path, reason='no_text_layer_reader' if layer is None else 'empty')
+
+        provenance = {}
+        ocr_pages = []
+        for page, text in enumerate(layer, start=1):
+            usable, reason = text_layer_quality(text)
+            provenance[page] = {'source': 'text_layer' if usable else 'ocr', 'reason': reason}
+            if not usable:
+                ocr_pages.append(page)
+
+        if len(ocr_pages) == len(layer):
+            return self._ocr_whole(file_path, reason='no_usable_text_layer')
+
+        pages = {page: layer[page - 1] for page in provenance if page not in ocr_pages}
+        warnings = []
+        if ocr_pages:
+            if self.ocr_engine.setup_dependencies():
+                try:
+                    for start, end in _runs(ocr_pages):
+                        converted = dict(convert_page_range(file_path, start, end))
+                        # Older docling returns the whole run under its first page
+                        for page in range(start, end + 1):
+                            pages[page] = converted.get(page, '')
+                except Exception as e:
+                    warnings.append(f"OCR of pages {ocr_pages} failed: {e}")
+            else:
+                warnings.append("Docling not available; OCR pages use their raw text layer")
+
+            for page in ocr_pages:
+                if page not in pages:
+                    pages[page] = layer[page - 1]
+                    provenance[page]['source'] = 'text_layer_unverified'
+
+        text_content, page_info = stitch_pages(list(pages.items()))
+        for info in page_info:
+            info.update(provenance[info['page']])
+
+        metadata = {
+            'page_count': len(layer),
+            'format': 'pdf',
+            'extraction_method': 'tiered',
+            'text_layer_pages': sum(1 for info in page_info if info['source'] == 'text_layer'),
+            'ocr_pages': sum(1 for info in page_info if info['source'] == 'ocr'),
+            'pages': page_info
+        }
+        if warnings:
+            metadata['warnings'] = warnings
+
+        if len(text_content.strip()) < 10:
+            return ExtractionResult(
+                success=False,
+                error="No meaningful text extracted from document",
+                engine_name=self.name,
+                metadata=metadata
+            )
+
+        return ExtractionResult(
+            success=True,
+            text=text_content,
+            metadata=metadata,
+            engine_name=self.name
+        )
+
+    def _ocr_whole(self, file_path: str, reason: str) -> ExtractionResult:
+        """Send the whole document to Docling"""
+        result = self.ocr_engine.extract_text(file_path)
+        result.metadata.setdefault('tiered_fallback', reason)
+        return result
+
+    def get_engine_info(self) -> Dict[str, Any]:
+        """Get detailed engine information"""
+        info = super().get_engine_info()
+        info.update({
+            'description': 'Embedded text layer first, Docling OCR only for image-only or garbled pages',
+            'features': [
+                'Per-page text layer quality check',
+                'OCR limited to pages without a usable text layer',
+                'Per-page provenance in metadata'
+            ],
+            'optimal_for': [
+                'Born-digital denial letters and bank statements',
+                'Mixed scanned and digital PDFs'
+            ],
+            'text_layer_available': self._text_layer_available,
+            'ocr_engine': self.ocr_engine.get_engine_info()
+        })
+        return info
@@ -3,11 +3,12 @@ Output Formatters for Satori Tiger service
 Different output formats for processed documents
 """
 
-import json
 from abc import ABC, abstractmethod
 from typing import Dict, Any
 from datetime import datetime
 
+from satori_schema import serialization
+
 class BaseFormatter(ABC):
     """Base class for output formatters"""
     
@@ -95,7 +96,7 @@ class JSONFormatter(BaseFormatter):
             }
         }
         
-        return json.dumps(clean_data, indent=2, default=str)
+        return serialization.dumps(clean_data)
     
     def get_extension(self) -> str:
         return 'json'
@@ -4,10 +4,10 @@ Manages saving and organizing processed document outputs
 """
 
 import os
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Union
 from datetime import datetime
 
 try:
@@ -20,8 +20,200 @@ try:
 except ImportError:
     from app.core.utils.case_name_generator import CaseNameGenerator
 
+try:
+    from ..core.utils.batch_scoring import BatchScores
+except ImportError:
+    from app.core.utils.batch_scoring import BatchScores
+
+from satori_schema import serialization
+
 logger = logging.getLogger(__name__)
 
+# Per-document extracted text for a case, one JSON object per line; read by
+# the dashboard's search index (kept out of *.json so it is never mistaken
+# for the hydrated JSON)
+DOCUMENT_TEXTS_FILENAME = 'document_texts.jsonl'
+
+# Per-case record of the files written for each document
+CASE_INDEX_FILENAME = 'output_index.json'
+
+DEFAULT_WRITE_WORKERS = 4
+
+
+def _write_atomic(path: Path, content: Union[str, bytes]):
+    """Write via a temp file and rename, so readers never see a partial file"""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        if isinstance(content, bytes):
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class CaseOutputWriter:
+    """
+    Writes the per-document outputs of one case
+    
+    The case directory tree is created once. Each document's ``to_dict()``
+    is built once and shared by all formatters; formatting and writing run
+    on a small thread pool, every file via temp + rename. ``close()`` waits
+    for the writes, then writes each document's metadata (listing the files
+    that were actually saved) and the case's ``output_index.json``.
+    
+    Usage::
+    
+        with output_manager.case_writer(case_name) as writer:
+            for result in results:
+                writer.add_result(result)
+        writer.saved_files  # file_name -> {format: path}
+    """
+    
+    def __init__(self, output_manager: 'OutputManager', case_name: str,
+                 max_workers: int = DEFAULT_WRITE_WORKERS):
+        self.output_manager = output_manager
+        self.case_name = case_name
+        self.case_dirs = output_manager.create_case_directory_structure(case_name)
+        self.failed_dir = output_manager.subdirs['legacy'] / 'failed'
+        self.saved_files: Dict[str, Dict[str, str]] = {}
+        self.errors: Dict[str, Dict[str, str]] = {}
+        self.logger = output_manager.logger
+        self._documents: Dict[str, tuple] = {}
+        self._pending: List[tuple] = []
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers),
+                                            thread_name_prefix='tiger-output')
+        self._closed = False
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+    
+    def add_result(self, result):
+        """Queue the formatted outputs and raw text of one processing result"""
+        base_name = self.output_manager._generate_clean_filename(result.file_name)
+        
+        # Determine output directory based on success
+        if result.success:
+            output_dir = self.case_dirs['processed']
+        else:
+            # Use legacy folder for failed processing
+            output_dir = self.failed_dir
+            output_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.saved_files[result.file_name] = {}
+        self._documents[result.file_name] = (result, base_name)
+        
+        # One dict per document, so the text is materialized once
+        result_data = result.to_dict()
+        for format_name in self.output_manager._output_formats():
+            formatter = self.output_manager.formatters.get(format_name)
+            if formatter is None:
+                continue
+            output_file = output_dir / f"{base_name}.{formatter.get_extension()}"
+            self._submit(result.file_name, format_name, output_file,
+                         lambda formatter=formatter: formatter.format(result_data))
+        
+        # Save raw text separately if successful
+        if result.success and result.text_handle:
+            raw_text_file = self.case_dirs['raw_text'] / f"{base_name}_raw.txt"
+            self._submit(result.file_name, 'raw_text', raw_text_file,
+                         lambda: result_data['extracted_text'])
+    
+    def _submit(self, file_name: str, artifact: str, path: Path, render: Callable[[], Union[str, bytes]]):
+        future = self._executor.submit(lambda: _write_atomic(path, render()))
+        self._pending.append((file_name, artifact, path, future))
+    
+    def _collect(self):
+        """Wait for queued writes and record which succeeded"""
+        pending, self._pending = self._pending, []
+        for file_name, artifact, path, future in pending:
+            try:
+                future.result()
+                self.saved_files[file_name][artifact] = str(path)
+                self.logger.debug(f"Saved {artifact} output: {path}")
+            except Exception as e:
+                self.errors.setdefault(file_name, {})[artifact] = str(e)
+                self.logger.error(f"Failed to save {artifact} output for {file_name}: {e}")
+    
+    def _metadata(self, result, saved_files: Dict[str, str]) -> Dict[str, Any]:
+        return {
+            'file_info': {
+                'original_path': result.file_path,
+                'file_name': result.file_name,
+                'processing_timestamp': result.timestamp
+            },
+            'processing_result': {
+                'success': result.success,
+                'engine_used': result.engine_used,
+                'processing_time': result.processing_time,
+                'error': result.error
+            },
+            'quality_metrics': result.quality_metrics,
+            'extraction_metadata': result.metadata,
+            'case_info': {
+                'case_name': self.case_name,
+                'case_folder': str(self.case_dirs['case_root'])
+            },
+            'output_files': saved_files
+        }
+    
+    def _write_index(self):
+        index_file = self.case_dirs['case_root'] / CASE_INDEX_FILENAME
+        try:
+            documents = serialization.load(index_file).get('documents') or {}
+        except (OSError, ValueError, AttributeError):
+            documents = {}
+        for file_name, (result, _) in self._documents.items():
+            entry = {'success': result.success, 'files': self.saved_files[file_name]}
+            if file_name in self.errors:
+                entry['errors'] = self.errors[file_name]
+            documents[file_name] = entry
+        index = {
+            'case_name': self.case_name,
+            'case_folder': str(self.case_dirs['case_root']),
+            'updated_at': datetime.now().isoformat(),
+            'documents': documents
+        }
+        try:
+            _write_atomic(index_file, serialization.dumps_bytes(index))
+        except Exception as e:
+            self.logger.error(f"Failed to save output index: {e}")
+    
+    def close(self) -> Dict[str, Dict[str, str]]:
+        """Finish all writes; returns ``file_name -> {format: path}``"""
+        if self._closed:
+            return self.saved_files
+        self._closed = True
+        try:
+            self._collect()
+            for file_name, (result, base_name) in self._documents.items():
+                metadata_file = self.case_dirs['metadata'] / f"{base_name}_metadata.json"
+                metadata = self._metadata(result, dict(self.saved_files[file_name]))
+                self._submit(file_name, 'metadata', metadata_file,
+                             lambda metadata=metadata: serialization.dumps_bytes(metadata))
+            self._collect()
+            if self._documents:
+                self._write_index()
+        finally:
+            self._executor.shutdown(wait=True)
+        
+        total = sum(len(files) for files in self.saved_files.values())
+        self.logger.info(f"Saved {total} output files for {len(self._documents)} documents "
+                         f"in {self.case_dirs['case_root']}")
+        return self.saved_files
+
+
 class OutputManager:
     """Manages output saving and organization for processed documents"""
     
@@ -96,11 +288,42 @@ class OutputManager:
         self.logger.info(f"Created case directory structure: {case_dir}")
         return case_subdirs
     
+    def _output_formats(self) -> List[str]:
+        """Output formats from config, or the defaults"""
+        if self.config and hasattr(self.config.output, 'output_formats'):
+            return self.config.output.output_formats
+        return ['txt', 'json', 'md']
+    
+    def case_writer(self, case_name: str = None, consolidated_case=None,
+                    legal_entities: Dict = None) -> CaseOutputWriter:
+        """
+        Open a writer for a case's per-document outputs
+        
+        Args:
+            case_name: Manual case name (optional)
+            consolidated_case: ConsolidatedCase object used to name the case (optional)
+            legal_entities: Legal entities used to name the case (optional)
+            
+        Returns:
+            CaseOutputWriter; close it (or use it as a context manager) to finish writing
+        """
+        if not case_name:
+            case_name = self.case_name_generator.generate_case_folder_name(
+                consolidated_case=consolidated_case,
+                legal_entities=legal_entities
+            )
+        max_workers = DEFAULT_WRITE_WORKERS
+        if self.config and hasattr(self.config.output, 'write_workers'):
+            max_workers = self.config.output.write_workers
+        return CaseOutputWriter(self, case_name, max_workers=max_workers)
+    
     def save_case_processing_result(self, result, case_name: str = None, 
                                    consolidated_case=None) -> Dict[str, str]:
         """
         Save processing result in case-based structure
         
+        Saving a whole case? Use ``case_writer`` once for all its results.
+        
         Args:
             result: Processing result to save
             case_name: Manual case name (optional)
@@ -112,97 +335,10 @@ class OutputManager:
         if not self.use_case_folders:
             return self.save_processing_result(result)
         
-        # Generate case name if not provided
-        if not case_name:
-            case_name = self.case_name_generator.generate_case_folder_name(
-                consolidated_case=consolidated_case,
-                legal_entities=getattr(result, 'legal_entities', None)
-            )
-        
-        # Create case directory structure
-        case_dirs = self.create_case_directory_structure(case_name)
-        
-        # Generate clean filename (no timestamp)
-        base_name = self._generate_clean_filename(result.file_name)
-        
-        saved_files = {}
-        
-        # Get output formats from config or use defaults
-        output_formats = ['txt', 'json', 'md']
-        if self.config and hasattr(self.config.output, 'output_formats'):
-            output_formats = self.config.output.output_formats
-        
-        # Determine output directory based on success
-        if result.success:
-            output_dir = case_dirs['processed']
-        else:
-            # Use legacy folder for failed processing
-            output_dir = self.subdirs['legacy'] / 'failed'
-            output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Save in requested formats
-        for format_name in output_formats:
-            if format_name in self.formatters:
-                try:
-                    formatted_content = self.formatters[format_name].format(result.to_dict())
-                    file_extension = self.formatters[format_name].get_extension()
-                    
-                    output_file = output_dir / f"{base_name}.{file_extension}"
-                    
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(formatted_content)
-                    
-                    saved_files[format_name] = str(output_file)
-                    self.logger.info(f"Saved {format_name.upper()} output: {output_file}")
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to save {format_name} output: {e}")
-        
-        # Save raw text separately if successful
-        if result.success and result.extracted_text:
-            try:
-                raw_text_file = case_dirs['raw_text'] / f"{base_name}_raw.txt"
-                with open(raw_text_file, 'w', encoding='utf-8') as f:
-                    f.write(result.extracted_text)
-                saved_files['raw_text'] = str(raw_text_file)
-                self.logger.info(f"Saved raw text: {raw_text_file}")
-            except Exception as e:
-                self.logger.error(f"Failed to save raw text: {e}")
-        
-        # Save metadata
-        try:
-            metadata_file = case_dirs['metadata'] / f"{base_name}_metadata.json"
-            metadata = {
-                'file_info': {
-                    'original_path': result.file_path,
-                    'file_name': result.file_name,
-                    'processing_timestamp': result.timestamp
-                },
-                'processing_result': {
-                    'success': result.success,
-                    'engine_used': result.engine_used,
-                    'processing_time': result.processing_time,
-                    'error': result.error
-                },
-                'quality_metrics': result.quality_metrics,
-                'extraction_metadata': result.metadata,
-                'case_info': {
-                    'case_name': case_name,
-                    'case_folder': str(case_dirs['case_root'])
-                },
-                'output_files': saved_files
-            }
-            
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, default=str)
-            
-            saved_files['metadata'] = str(metadata_file)
-            self.logger.info(f"Saved metadata: {metadata_file}")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to save metadata: {e}")
-        
-        return saved_files
+        with self.case_writer(case_name, consolidated_case,
+                              legal_entities=getattr(result, 'legal_entities', None)) as writer:
+            writer.add_result(result)
+        return writer.saved_files[result.file_name]
     
     def save_case_info_json(self, case_name: str, consolidated_case) -> str:
         """
@@ -238,9 +374,10 @@ class OutputManager:
                 'consolidation_timestamp': consolidated_case.consolidation_timestamp,
                 'warnings': consolidated_case.warnings
             }
+            if getattr(consolidated_case, 'profile', None):
+                case_info['profile'] = consolidated_case.profile
             
-            with open(case_info_file, 'w', encoding='utf-8') as f:
-                json.dump(case_info, f, indent=2, default=str)
+            serialization.dump(case_info, case_info_file)
             
             self.logger.info(f"Saved case info: {case_info_file}")
             return str(case_info_file)
@@ -264,8 +401,7 @@ class OutputManager:
             case_dir = self.subdirs['cases'] / case_name
             complaint_file = case_dir / 'complaint.json'
             
-            with open(complaint_file, 'w', encoding='utf-8') as f:
-                json.dump(complaint_data, f, indent=2, default=str)
+            serialization.dump(complaint_data, complaint_file)
             
             self.logger.info(f"Saved complaint JSON: {complaint_file}")
             return str(complaint_file)
@@ -274,6 +410,41 @@ class OutputManager:
             self.logger.error(f"Failed to save complaint JSON: {e}")
             return ""
     
+    def save_document_texts(self, results: List, output_dir: str) -> str:
+        """
+        Save every document's extracted text to ``document_texts.jsonl``
+        
+        Args:
+            results: Processing results for the case's documents
+            output_dir: Case output directory (next to the hydrated JSON)
+            
+        Returns:
+            Path to the saved file, or "" on failure
+        """
+        texts_file = Path(output_dir) / DOCUMENT_TEXTS_FILENAME
+        tmp_file = texts_file.with_name(f".{DOCUMENT_TEXTS_FILENAME}.tmp")
+        try:
+            texts_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                for result in results:
+                    record = {
+                        'file_name': result.file_name,
+                        'success': result.success,
+                        'engine_used': result.engine_used,
+                        'timestamp': result.timestamp,
+                        'quality_score': (result.quality_metrics or {}).get('quality_score'),
+                        'text': result.extracted_text if result.success else ''
+                    }
+                    f.write(serialization.dumps(record, pretty=False) + '\n')
+            os.replace(tmp_file, texts_file)
+            
+            self.logger.info(f"Saved document texts: {texts_file}")
+            return str(texts_file)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to save document texts: {e}")
+            return ""
+    
     def generate_case_summary(self, case_name: str, results: List, 
                              consolidated_case=None) -> str:
         """
@@ -414,11 +585,12 @@ class OutputManager:
         if self.config and hasattr(self.config.output, 'output_formats'):
             output_formats = self.config.output.output_formats
         
-        # Save in requested formats
+        # Save in requested formats (one dict, so the text is materialized once)
+        result_data = result.to_dict()
         for format_name in output_formats:
             if format_name in self.formatters:
                 try:
-                    formatted_content = self.formatters[format_name].format(result.to_dict())
+                    formatted_content = self.formatters[format_name].format(result_data)
                     file_extension = self.formatters[format_name].get_extension()
                     
                     output_file = output_dir / f"{base_name}.{file_extension}"
@@ -433,11 +605,11 @@ class OutputManager:
                     self.logger.error(f"Failed to save {format_name} output: {e}")
         
         # Save raw text separately if successful
-        if result.success and result.extracted_text:
+        if result.success and result.text_handle:
             try:
                 raw_text_file = self.subdirs['raw_text'] / f"{base_name}_raw.txt"
                 with open(raw_text_file, 'w', encoding='utf-8') as f:
-                    f.write(result.extracted_text)
+                    result.text_handle.write_to(f)
                 saved_files['raw_text'] = str(raw_text_file)
             except Exception as e:
                 self.logger.error(f"Failed to save raw text: {e}")
@@ -462,8 +634,7 @@ class OutputManager:
                 'output_files': saved_files
             }
             
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, default=str)
+            serialization.dump(metadata, metadata_file)
             
             saved_files['metadata'] = str(metadata_file)
             
@@ -543,10 +714,9 @@ class OutputManager:
         successful_results = [r for r in results if r.success]
         failed_results = [r for r in results if not r.success]
         
-        quality_scores = [r.quality_metrics.get('quality_score', 0) 
-                         for r in successful_results if r.quality_metrics]
-        
-        avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0
+        # Quality columns for the whole batch; statistics are array operations
+        scores = BatchScores.from_results(successful_results)
+        quality = scores.distribution('quality_score')
         
         # Engine usage statistics
         engine_usage = {}
@@ -563,8 +733,10 @@ class OutputManager:
         return {
             'summary': summary,
             'statistics': {
-                'avg_quality_score': avg_quality,
-                'quality_score_range': [min(quality_scores), max(quality_scores)] if quality_scores else [0, 0],
+                'avg_quality_score': quality['average'],
+                'quality_score_range': [quality['min'], quality['max']],
+                'quality_percentiles': quality['percentiles'],
+                'quality_distribution': scores.tier_counts(self._quality_thresholds()) if len(scores) else {},
                 'engine_usage': engine_usage,
                 'file_type_distribution': file_types,
                 'avg_processing_time': summary.get('total_processing_time', 0) / max(summary.get('total_files', 1), 1)
@@ -620,21 +792,16 @@ class OutputManager:
             lines.append("")
         
         # Quality analysis
-        successful_results = report_data['successful_results']
-        if successful_results:
-            high_quality = len([r for r in successful_results 
-                               if r.quality_metrics.get('quality_score', 0) >= 80])
-            medium_quality = len([r for r in successful_results 
-                                 if 50 <= r.quality_metrics.get('quality_score', 0) < 80])
-            low_quality = len([r for r in successful_results 
-                              if r.quality_metrics.get('quality_score', 0) < 50])
-            
+        distribution = stats['quality_distribution']
+        if distribution:
+            percentiles = stats['quality_percentiles']
             lines.extend([
                 "## Quality Distribution",
                 "",
-                f"- **High Quality (≥80):** {high_quality} documents",
-                f"- **Medium Quality (50-79):** {medium_quality} documents", 
-                f"- **Low Quality (<50):** {low_quality} documents",
+                f"- **High Quality (≥80):** {distribution['high_quality_count']} documents",
+                f"- **Medium Quality (50-79):** {distribution['medium_quality_count']} documents", 
+                f"- **Low Quality (<50):** {distribution['low_quality_count']} documents",
+                f"- **Percentiles (P10 / P50 / P90):** {percentiles['p10']:.1f} / {percentiles['p50']:.1f} / {percentiles['p90']:.1f}",
                 ""
             ])
         
@@ -669,45 +836,17 @@ class OutputManager:
         
         return '\n'.join(lines)
     
+    def _quality_thresholds(self):
+        """Quality thresholds from the configuration, if one was given"""
+        return getattr(self.config, 'quality', None)
+    
     def _analyze_quality_metrics(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze quality metrics across results"""
-        # Extract quality metrics
-        quality_data = []
-        for result in results:
-            if result.get('quality_metrics'):
-                quality_data.append(result['quality_metrics'])
-        
-        if not quality_data:
+        scores = BatchScores.from_results(results)
+        if not len(scores):
             return {'error': 'No quality metrics to analyze'}
         
-        # Calculate statistics
-        scores = [q.get('quality_score', 0) for q in quality_data]
-        compression_ratios = [q.get('compression_ratio', 0) for q in quality_data]
-        text_lengths = [q.get('text_length', 0) for q in quality_data]
-        
-        return {
-            'total_documents': len(quality_data),
-            'score_statistics': {
-                'average': sum(scores) / len(scores),
-                'min': min(scores),
-                'max': max(scores),
-                'high_quality_count': len([s for s in scores if s >= 80]),
-                'medium_quality_count': len([s for s in scores if 50 <= s < 80]),
-                'low_quality_count': len([s for s in scores if s < 50])
-            },
-            'compression_statistics': {
-                'average': sum(compression_ratios) / len(compression_ratios),
-                'min': min(compression_ratios),
-                'max': max(compression_ratios),
-                'optimal_count': len([r for r in compression_ratios if 0.002 <= r <= 0.05])
-            },
-            'text_length_statistics': {
-                'average': sum(text_lengths) / len(text_lengths),
-                'min': min(text_lengths),
-                'max': max(text_lengths),
-                'total_characters': sum(text_lengths)
-            }
-        }
+        return scores.report(self._quality_thresholds())
     
     def _format_quality_report(self, analysis: Dict[str, Any]) -> str:
         """Format quality analysis as markdown report"""
@@ -732,6 +871,39 @@ class OutputManager:
             f"- **High Quality (≥80):** {score_stats['high_quality_count']} documents",
             f"- **Medium Quality (50-79):** {score_stats['medium_quality_count']} documents",
             f"- **Low Quality (<50):** {score_stats['low_quality_count']} documents",
+            f"- **Percentiles (P10 / P50 / P90):** {score_stats['percentiles']['p10']:.1f} / "
+            f"{score_stats['percentiles']['p50']:.1f} / {score_stats['percentiles']['p90']:.1f}",
+            f"- **Passed Quality Threshold:** {analysis['passes_threshold_count']}/{analysis['total_documents']}",
+            ""
+        ])
+        
+        # Score histogram, 10-point buckets
+        histogram = score_stats['histogram']
+        lines.extend(["### Score Histogram", ""])
+        for low, count in zip(histogram['bins'], histogram['counts']):
+            lines.append(f"- {low:.0f}-{low + 10:.0f}: {count}")
+        lines.append("")
+        
+        # Readiness analysis
+        readiness_stats = analysis['readiness_statistics']
+        lines.extend([
+            "## Readiness Score Analysis",
+            "",
+            f"- **Average Readiness:** {readiness_stats['average']:.1f}/100",
+            f"- **Median Readiness:** {readiness_stats['percentiles']['p50']:.1f}/100",
+            ""
+        ])
+        
+        # Legal indicator analysis
+        legal = analysis['legal_indicators']
+        lines.extend([
+            "## Legal Indicator Analysis",
+            "",
+            f"- **Court Documents Identified:** {legal['court_documents']}",
+            f"- **Case Numbers Found:** {legal['case_numbers_found']}",
+            f"- **Summons Documents:** {legal['summons_detected']}",
+            f"- **Complaint Documents:** {legal['complaints_detected']}",
+            f"- **Total Addresses Extracted:** {legal['addresses_extracted']}",
             ""
         ])
         